@@ -0,0 +1,107 @@
+"""Schema and ATTACH handling for the cold invoice archive (SQLite only).
+
+Archived invoices live in a second SQLite file that is attached to every
+pooled connection of the main engine as schema ``archive``.  Its ``invoices``
+table mirrors the hot table's columns (without foreign keys, which SQLite
+cannot enforce across databases) plus an ``archived_at`` timestamp.
+Archived invoices keep their ids, so the hot table's ``AUTOINCREMENT``
+counter is kept above the highest archived id.
+"""
+
+import logging
+import os
+import threading
+
+from sqlalchemy import Column, DateTime, Index, MetaData, Table, event, func, select, text
+
+from .models import Invoice, add_missing_columns
+from .money import convert_money_columns
+
+ARCHIVE_SCHEMA = "archive"
+
+archive_metadata = MetaData()
+
+archived_invoices = Table(
+    "invoices",
+    archive_metadata,
+    *[
+        Column(c.name, c.type, primary_key=c.primary_key, nullable=c.nullable)
+        for c in Invoice.__table__.columns
+    ],
+    Column("archived_at", DateTime),
+    Index("ix_archive_invoices_user_created", "user_id", "created_at"),
+    Index("ix_archive_invoices_number", "invoice_number"),
+    Index("ix_archive_invoices_user_updated_at", "user_id", "updated_at"),
+    # Customer deletes and merges look up a customer's archived invoices
+    Index("ix_archive_invoices_customer", "customer_id"),
+    schema=ARCHIVE_SCHEMA,
+)
+
+_attached = {}
+_lock = threading.Lock()
+
+
+def default_archive_path(engine) -> str:
+    """Return ``<main db stem>_archive<suffix>`` next to the main database."""
+    database = engine.url.database
+    if not database or database == ":memory:":
+        raise ValueError("An archive path is required for in-memory databases")
+    stem, suffix = os.path.splitext(os.path.abspath(database))
+    return f"{stem}_archive{suffix or '.db'}"
+
+
+def attach_archive(engine, path=None) -> str:
+    """ATTACH the archive file to all connections of ``engine``.
+
+    Safe to call repeatedly; returns the archive path in use.
+    """
+    if engine.dialect.name != "sqlite":
+        raise ValueError("Invoice archiving requires a SQLite database")
+    with _lock:
+        if engine in _attached:
+            return _attached[engine]
+        path = os.path.abspath(path or default_archive_path(engine))
+
+        @event.listens_for(engine, "connect")
+        def _attach(dbapi_connection, _connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute(f"ATTACH DATABASE ? AS {ARCHIVE_SCHEMA}", (path,))
+            cursor.close()
+
+        # Pooled connections opened before the listener lack the attachment
+        engine.dispose()
+        archive_metadata.create_all(bind=engine)
+        add_missing_columns(engine, archive_metadata, schema=ARCHIVE_SCHEMA)
+        convert_money_columns(engine, archive_metadata, schema=ARCHIVE_SCHEMA)
+        for index in archived_invoices.indexes:
+            index.create(bind=engine, checkfirst=True)
+        reserve_archived_ids(engine)
+        _attached[engine] = path
+    logging.info(f"Invoice archive attached from {path}")
+    return path
+
+
+def reserve_archived_ids(engine) -> None:
+    """Raise the hot ``invoices`` id counter to at least the highest archived id.
+
+    Archives filled before the hot table used ``AUTOINCREMENT`` may hold ids
+    above every hot one; without this they would be reused.
+    """
+    with engine.begin() as conn:
+        archived_max = conn.execute(select(func.max(archived_invoices.c.id))).scalar()
+        if not archived_max:
+            return
+        seq = conn.execute(text("SELECT seq FROM main.sqlite_sequence WHERE name = 'invoices'")).first()
+        if seq is None:
+            conn.execute(
+                text("INSERT INTO main.sqlite_sequence (name, seq) VALUES ('invoices', :seq)"), {"seq": archived_max}
+            )
+        elif seq[0] < archived_max:
+            conn.execute(
+                text("UPDATE main.sqlite_sequence SET seq = :seq WHERE name = 'invoices'"), {"seq": archived_max}
+            )
+
+
+def is_archive_attached(engine) -> bool:
+    """Return True if ``engine``'s connections see the archive schema."""
+    return engine in _attached
@@ -2,19 +2,42 @@
 """Database connection utilities using SQLAlchemy with FIXED session management."""
 
 from contextlib import contextmanager
+from contextvars import ContextVar
 from sqlalchemy import create_engine
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import sessionmaker
 
 from automotive_invoice_manager.config.database import DatabaseConfig
 
+# Sessions of the units of work active in the current thread/context,
+# keyed by DatabaseManager.
+_active_sessions: ContextVar[dict] = ContextVar("active_sessions", default={})
+
+# session.info key of the error that left a unit of work's session unusable
+_FAILED = "unit_of_work_failed"
+
+
+def savepoint(session):
+    """Return ``session.begin_nested()``, making sure an outer transaction is open.
+
+    pysqlite only opens a transaction before DML, so a SAVEPOINT issued
+    first would itself start the transaction and its RELEASE would commit
+    everything so far.  An explicit BEGIN keeps it nested.
+    """
+    if session.get_bind().dialect.name == "sqlite":
+        conn = session.connection()
+        if not conn.connection.dbapi_connection.in_transaction:
+            conn.exec_driver_sql("BEGIN")
+    return session.begin_nested()
+
 
 class DatabaseManager:
     """Singleton class managing the SQLAlchemy engine and sessions with FIXED session management."""
 
     _instance = None
 
-    def __init__(self) -> None:
-        db_config = DatabaseConfig()
+    def __init__(self, db_config: DatabaseConfig | None = None) -> None:
+        db_config = db_config or DatabaseConfig()
         self.engine = create_engine(db_config.normalized_url, echo=False)
         
         # CRITICAL FIX: Set expire_on_commit=False to prevent DetachedInstanceError
@@ -33,7 +56,28 @@ class DatabaseManager:
 
     @contextmanager
     def get_session(self):
-        """Provide a transactional session scope."""
+        """Provide a transactional session scope.
+
+        Inside :meth:`unit_of_work` the active session is returned instead;
+        it is committed (or rolled back) once, when the unit of work ends.
+        A database error (or failed flush) escaping a joined session leaves
+        the shared transaction unusable: the error is raised again by every
+        later :meth:`get_session` of the unit of work and when it ends, even
+        if a caller caught it.  Work that may fail and be retried belongs in
+        a :func:`savepoint`.
+        """
+        active = _active_sessions.get().get(self)
+        if active is not None:
+            failed = active.info.get(_FAILED)
+            if failed is not None:
+                raise failed
+            try:
+                yield active
+            except Exception as e:
+                if isinstance(e, DBAPIError) or not active.is_active:
+                    active.info[_FAILED] = e
+                raise
+            return
         session = self.SessionLocal()
         try:
             yield session
@@ -44,3 +88,24 @@ class DatabaseManager:
         finally:
             session.close()
 
+    @contextmanager
+    def unit_of_work(self):
+        """Run every :meth:`get_session` in this block on one session and commit.
+
+        Nested units of work join the outermost one.  The scope follows the
+        current context, so work handed to other threads is not included.
+        """
+        active = _active_sessions.get()
+        if self in active:
+            yield active[self]
+            return
+        with self.get_session() as session:
+            token = _active_sessions.set({**active, self: session})
+            try:
+                yield session
+                failed = session.info.pop(_FAILED, None)
+                if failed is not None:
+                    raise failed
+            finally:
+                session.info.pop(_FAILED, None)
+                _active_sessions.reset(token)
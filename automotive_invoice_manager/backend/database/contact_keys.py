@@ -0,0 +1,115 @@
+"""Normalized copies of each customer's name, email and phone.
+
+The raw columns keep what was typed.  Next to them every customer stores
+the phone's digits, the lowercased email and the case- and
+punctuation-folded name, indexed together with ``user_id``, so the CSV
+import and the duplicate scan compare stored keys, and a phone search
+matches whatever the formatting (``"555-1234"`` finds ``"(555) 1234"``).
+
+The keys are filled by column defaults on every insert (ORM, bulk and
+Core ``insert()`` alike) and recomputed by an ORM ``before_update`` hook
+when their source attribute changes.  Core ``update(Customer)``
+statements that change a name, email or phone must set the key too.
+"""
+
+import logging
+import re
+
+from sqlalchemy import bindparam, inspect, select, update
+
+# Digits in a search term from which it is taken for a phone number
+PHONE_SEARCH_DIGITS = 7
+
+_PHONE_TERM = re.compile(r"[0-9\s\-+().]+")
+
+
+def normalize_email(email: str | None) -> str | None:
+    """Return ``email`` trimmed and lowercased, or None when blank."""
+    email = (email or "").strip().lower()
+    return email or None
+
+
+def normalize_phone(phone: str | None) -> str | None:
+    """Return the digits of ``phone`` without a leading ``1`` country code, or None.
+
+    ``"+1 (555) 123-4567"`` and ``"555.123.4567"`` both become ``"5551234567"``.
+    """
+    digits = re.sub(r"[^0-9]", "", phone or "")
+    if len(digits) == 11 and digits.startswith("1"):
+        digits = digits[1:]
+    return digits or None
+
+
+def fold_name(name: str | None) -> str | None:
+    """Return ``name`` casefolded, without apostrophes and with other punctuation as single spaces.
+
+    ``"Bob's  Garage"`` and ``"BOBS GARAGE."`` both become ``"bobs garage"``.
+    """
+    words = re.sub(r"['\u2019]", "", (name or "").casefold())
+    return " ".join(re.split(r"[\W_]+", words)).strip() or None
+
+
+# Shadow column -> (source column, normalizer)
+CONTACT_KEYS = {
+    "name_folded": ("name", fold_name),
+    "email_normalized": ("email", normalize_email),
+    "phone_digits": ("phone", normalize_phone),
+}
+
+
+def contact_key_default(key: str):
+    """Column default computing shadow column ``key`` from the inserted row."""
+    source, normalize = CONTACT_KEYS[key]
+    return lambda context: normalize(context.get_current_parameters().get(source))
+
+
+def refresh_contact_keys(_mapper, _connection, target) -> None:
+    """``before_update`` hook: recompute the keys whose source attribute changed."""
+    attrs = inspect(target).attrs
+    for key, (source, normalize) in CONTACT_KEYS.items():
+        if attrs[source].history.has_changes():
+            setattr(target, key, normalize(getattr(target, source)))
+
+
+def phone_search_digits(term: str) -> str | None:
+    """Return the digits to look for in ``phone_digits`` when ``term`` looks like a phone number.
+
+    That is a term made only of digits, spaces and ``-+().`` with at least
+    :data:`PHONE_SEARCH_DIGITS` digits once the country code is dropped; a
+    ``+1`` prefix is dropped even from a partial number.  Anything else
+    (names, emails, short numbers) returns None.
+    """
+    term = (term or "").strip()
+    if not _PHONE_TERM.fullmatch(term):
+        return None
+    digits = normalize_phone(term) or ""
+    if term.startswith("+") and len(digits) < 11 and digits.startswith("1"):
+        digits = digits[1:]
+    return digits if len(digits) >= PHONE_SEARCH_DIGITS else None
+
+
+def fill_contact_keys(bind, table) -> int:
+    """Compute the keys of rows written before the shadow columns existed."""
+    statement = (
+        update(table)
+        .where(table.c.id == bindparam("row_id"))
+        .values({key: bindparam(f"new_{key}") for key in CONTACT_KEYS})
+    )
+    with bind.begin() as conn:
+        rows = conn.execute(select(table.c.id, *(table.c[source] for source, _ in CONTACT_KEYS.values()))).all()
+        if rows:
+            conn.execute(
+                statement,
+                [
+                    {
+                        "row_id": row[0],
+                        **{
+                            f"new_{key}": normalize(value)
+                            for (key, (_, normalize)), value in zip(CONTACT_KEYS.items(), row[1:])
+                        },
+                    }
+                    for row in rows
+                ],
+            )
+    logging.info(f"Filled contact keys of {len(rows)} {table.name}")
+    return len(rows)
@@ -0,0 +1,283 @@
+"""Compact binary storage for ``Invoice.line_items``.
+
+Line items are a list of dicts that nearly always share the same keys in
+the same order with one value type per key.  :func:`encode_line_items`
+stores them column-wise behind a one-byte format version:
+
+``FORMAT_COLUMNAR`` (1)
+    ``<B version><H line count><B key table size>``, then the key table
+    (per key: an index into :data:`KNOWN_KEYS` or 0 + length + UTF-8 name,
+    followed by a kind byte), one packed block holding every numeric column
+    (hundredths columns first, then ``<I text size>``) and one UTF-8 block
+    holding every text column joined by ``\\x1f``.  Floats with at most two decimals are stored as
+    int32 hundredths, and a column whose lines all hold the same value is
+    stored once.
+``FORMAT_JSON`` (0)
+    Compact JSON, for lists the columnar layout cannot represent exactly
+    (mixed keys or types, ``None``, nested values, ...).
+
+Values decode to the exact objects that were encoded, ints and floats
+included.  Rows written before this type hold JSON text and are still
+read; ``python -m automotive_invoice_manager.cli line-items`` rewrites them.
+:func:`line_item_columns` reads selected keys of every line without
+building the dicts.
+"""
+
+import json
+import struct
+from math import copysign
+
+from sqlalchemy import LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+FORMAT_JSON = 0
+FORMAT_COLUMNAR = 1
+
+# Keys stored as a one-byte index; append only, the index is on disk
+KNOWN_KEYS = ("description", "hours", "rate", "parts", "tax", "quantity")
+_KEY_IDS = {key: index + 1 for index, key in enumerate(KNOWN_KEYS)}
+
+# Column kinds; CONSTANT marks a column stored once for all lines
+INT32, INT64, CENTS, FLOAT64, TEXT = 1, 2, 3, 4, 5
+CONSTANT = 0x80
+_FORMATS = {INT32: "i", INT64: "q", CENTS: "i", FLOAT64: "d"}
+
+_HEADER = struct.Struct("<BHB")
+_SEPARATOR = "\x1f"
+_INT32 = 2 ** 31
+# Larger floats may not survive the x100 round trip through int32
+_CENTS_LIMIT = 2 ** 31 / 100
+
+# Decoding plans keyed by header bytes (line count + key table)
+_plans = {}
+_MAX_PLANS = 1024
+
+
+class _Irregular(Exception):
+    """The line items need the JSON fallback."""
+
+
+def _column(values):
+    """Return ``(kind, stored values)`` for one key's values across all lines."""
+    kinds = set(map(type, values))
+    if kinds == {int}:
+        low, high = min(values), max(values)
+        if -_INT32 <= low and high < _INT32:
+            return INT32, values
+        if -(2 ** 63) <= low and high < 2 ** 63:
+            return INT64, values
+    elif kinds == {float}:
+        if all(-_CENTS_LIMIT < value < _CENTS_LIMIT for value in values):
+            hundredths = [round(value * 100) for value in values]
+            # -0.0 would come back as 0.0
+            if all(h / 100 == value and (h or copysign(1, value) > 0) for h, value in zip(hundredths, values)):
+                return CENTS, hundredths
+        return FLOAT64, values
+    elif kinds == {str}:
+        if not any(_SEPARATOR in value for value in values):
+            return TEXT, values
+    raise _Irregular
+
+
+def _encode_columnar(items) -> bytes:
+    count = len(items)
+    keys = tuple(items[0]) if items else ()
+    if count > 0xFFFF or any(tuple(item) != keys for item in items):
+        raise _Irregular
+    table, hundredths, numbers, formats, texts = [], [], [], [], []
+    for key in keys:
+        kind, values = _column([item[key] for item in items])
+        if count > 1 and values.count(values[0]) == count:
+            kind, values = kind | CONSTANT, values[:1]
+        if key in _KEY_IDS:
+            table.append(bytes((_KEY_IDS[key], kind)))
+        else:
+            name = key.encode() if isinstance(key, str) else b""
+            if not 0 < len(name) < 0x80:
+                raise _Irregular
+            table.append(bytes((0, len(name))) + name + bytes((kind,)))
+        if kind & ~CONSTANT == TEXT:
+            texts.extend(values)
+        elif kind & ~CONSTANT == CENTS:
+            hundredths.extend(values)
+        else:
+            formats.append(f"{len(values)}{_FORMATS[kind & ~CONSTANT]}")
+            numbers.extend(values)
+    table = b"".join(table)
+    if len(table) > 0xFF:
+        raise _Irregular
+    text = _SEPARATOR.join(texts).encode()
+    return b"".join(
+        (
+            _HEADER.pack(FORMAT_COLUMNAR, count, len(table)),
+            table,
+            struct.pack(f"<{len(hundredths)}i{''.join(formats)}I", *hundredths, *numbers, len(text)),
+            text,
+        )
+    )
+
+
+def encode_line_items(items) -> bytes:
+    """Return the stored form of a list of line-item dicts."""
+    try:
+        return _encode_columnar(items)
+    except (_Irregular, AttributeError, TypeError, KeyError, struct.error):
+        return bytes((FORMAT_JSON,)) + json.dumps(items, separators=(",", ":")).encode()
+
+
+def _plan(header: bytes):
+    """Compile a header into ``(numeric Struct, row builder, column layout)``.
+
+    The Struct unpacks the numeric block followed by the text size.  The
+    builder is generated once per header, like ``namedtuple`` does, so a
+    decode is one unpack, one split and one comprehension of dict literals.
+    Keys enter the source only through ``repr``.  The layout maps each key
+    to ``(kind, start, stored count)`` in the numeric tuple or text list.
+    """
+    _version, count, _size = _HEADER.unpack_from(header)
+    keys, kinds = [], []
+    pos = _HEADER.size
+    while pos < len(header):
+        key_id = header[pos]
+        if key_id:
+            key = KNOWN_KEYS[key_id - 1]
+            pos += 1
+        else:
+            size = header[pos + 1]
+            key = header[pos + 2:pos + 2 + size].decode()
+            pos += 2 + size
+        keys.append(key)
+        kinds.append(header[pos])
+        pos += 1
+    stored = [1 if kind & CONSTANT else count for kind in kinds]
+    # Offsets into the numeric tuple (hundredths first) and the text list
+    hundredths = sum(n for n, kind in zip(stored, kinds) if kind & ~CONSTANT == CENTS)
+    number_at, cents_at, text_at = hundredths, 0, 0
+    formats, constants, loops, entries, layout = [], [], [], [], {}
+    for index, (key, kind, n) in enumerate(zip(keys, kinds, stored)):
+        base = kind & ~CONSTANT
+        if base == TEXT:
+            source, start = "t", text_at
+            text_at += n
+        elif base == CENTS:
+            source, start = "n", cents_at
+            cents_at += n
+        else:
+            source, start = "n", number_at
+            number_at += n
+            formats.append(f"{n}{_FORMATS[base]}")
+        layout[key] = (kind, start, n)
+        scale = " / 100" if base == CENTS else ""
+        if kind & CONSTANT:
+            constants.append(f"c{index} = {source}[{start}]{scale}")
+            value = f"c{index}"
+        else:
+            loops.append((f"v{index}", f"{source}[{start}:{start + n}]"))
+            value = f"v{index}{scale}"
+        entries.append(f"{key!r}: {value}")
+    if loops:
+        names = ", ".join(name for name, _ in loops)
+        clause = f"for ({names},) in zip({', '.join(part for _, part in loops)})"
+    else:
+        clause = f"for _ in range({count})"
+    source = "".join(f"{line}; " for line in constants)
+    source = f"def rows(n, t):\n    {source}return [{{{', '.join(entries)}}} {clause}]\n"
+    namespace = {}
+    exec(source, {"__builtins__": {"zip": zip, "range": range}}, namespace)
+    return struct.Struct(f"<{hundredths}i{''.join(formats)}I"), namespace["rows"], layout
+
+
+def _cached_plan(header: bytes):
+    plan = _plans.get(header)
+    if plan is None:
+        if len(_plans) >= _MAX_PLANS:
+            _plans.clear()
+        plan = _plans[header] = _plan(header)
+    return plan
+
+
+def _decode_columnar(data: bytes):
+    header = data[:_HEADER.size + data[3]]
+    numbers_struct, rows, _layout = _cached_plan(header)
+    numbers = numbers_struct.unpack_from(data, len(header))
+    text_at = len(header) + numbers_struct.size
+    return rows(numbers, data[text_at:text_at + numbers[-1]].decode().split(_SEPARATOR))
+
+
+def line_item_columns(data, keys):
+    """Return one list per key of ``keys`` holding that value of every line.
+
+    Lines without the key hold None.  Numeric columns of the binary format
+    are read straight from the packed block, without building the dicts.
+    """
+    if isinstance(data, memoryview):
+        data = bytes(data)
+    if type(data) is not bytes or data[:1] != bytes((FORMAT_COLUMNAR,)):
+        items = decode_line_items(data) if data is not None else []
+        return [[item.get(key) for item in items] for key in keys]
+    count = _HEADER.unpack_from(data)[1]
+    header = data[:_HEADER.size + data[3]]
+    numbers_struct, _rows, layout = _cached_plan(header)
+    numbers = numbers_struct.unpack_from(data, len(header))
+    texts = None
+    columns = []
+    for key in keys:
+        if key not in layout:
+            columns.append([None] * count)
+            continue
+        kind, start, n = layout[key]
+        base = kind & ~CONSTANT
+        if base == TEXT:
+            if texts is None:
+                text_at = len(header) + numbers_struct.size
+                texts = data[text_at:text_at + numbers[-1]].decode().split(_SEPARATOR)
+            values = texts[start:start + n]
+        else:
+            values = numbers[start:start + n]
+            if base == CENTS:
+                values = [value / 100 for value in values]
+        columns.append(list(values) * count if kind & CONSTANT else list(values))
+    return columns
+
+
+def decode_line_items(data):
+    """Return line-item dicts from any stored form, legacy JSON included."""
+    if type(data) is not bytes:
+        if isinstance(data, str):
+            return json.loads(data)
+        if isinstance(data, (list, tuple)):
+            # Drivers that decode JSON columns themselves
+            return list(data)
+        data = bytes(data)
+    version = data[0] if data else None
+    if version == FORMAT_COLUMNAR:
+        return _decode_columnar(data)
+    if version == FORMAT_JSON:
+        return json.loads(data[1:])
+    return json.loads(data)
+
+
+def is_current_format(data) -> bool:
+    """True if a raw stored value needs no rewriting."""
+    return isinstance(data, (bytes, memoryview)) and bytes(data[:1]) in (
+        bytes((FORMAT_COLUMNAR,)),
+        bytes((FORMAT_JSON,)),
+    )
+
+
+class LineItems(TypeDecorator):
+    """``line_items`` list stored with :func:`encode_line_items`."""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else encode_line_items(value)
+
+    def result_processor(self, dialect, coltype):
+        # Legacy rows come back as JSON text, which LargeBinary's own
+        # processor would reject, so the stored value is decoded directly
+        def process(value):
+            return None if value is None else decode_line_items(value)
+
+        return process
@@ -6,25 +6,32 @@ from sqlalchemy import (
     Text,
     DateTime,
     Date,
-    Numeric,
     Boolean,
     ForeignKey,
-    JSON,
     text,
     UniqueConstraint,
+    Index,
+    event,
+    inspect,
 )
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime, date
-from decimal import Decimal
 from contextlib import contextmanager
 import logging
 
 from .connection import DatabaseManager
+from .contact_keys import CONTACT_KEYS, contact_key_default, fill_contact_keys, refresh_contact_keys
+from .line_items import LineItems
+from .money import Money, convert_money_columns, from_cents, invoice_cents
 
 Base = declarative_base()
 
+# Deferred column group loaded only by detail, form and PDF code paths
+# (``undefer_group(DETAIL_GROUP)``); lists and lookups never read it.
+DETAIL_GROUP = "detail"
+
 # Singleton database manager
 _db_manager = DatabaseManager.get_instance()
 engine = _db_manager.engine
@@ -78,17 +85,28 @@ class Customer(Base):
     """Customer model."""
 
     __tablename__ = "customers"
+    __table_args__ = (
+        # Exact and prefix lookups by phone, email and name (see contact_keys)
+        Index("ix_customers_user_phone_digits", "user_id", "phone_digits"),
+        Index("ix_customers_user_email_normalized", "user_id", "email_normalized"),
+        Index("ix_customers_user_name_folded", "user_id", "name_folded"),
+    )
 
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     name = Column(String(100), nullable=False, index=True)
     email = Column(String(100), index=True)
     phone = Column(String(20))
-    address = Column(Text)
-    notes = Column(Text)
+    address = deferred(Column(Text), group=DETAIL_GROUP)
+    notes = deferred(Column(Text), group=DETAIL_GROUP)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Normalized name, email and phone, maintained on every write
+    name_folded = Column(String(100), default=contact_key_default("name_folded"))
+    email_normalized = Column(String(100), default=contact_key_default("email_normalized"))
+    phone_digits = Column(String(20), default=contact_key_default("phone_digits"))
+
     # Relationships
     user = relationship("User", back_populates="customers")
     invoices = relationship(
@@ -99,11 +117,27 @@ class Customer(Base):
         return f"<Customer {self.name}>"
 
 
+event.listen(Customer, "before_update", refresh_contact_keys)
+
+
 class Invoice(Base):
     """Invoice model."""
 
     __tablename__ = "invoices"
-    __table_args__ = (UniqueConstraint("invoice_number"),)
+    __table_args__ = (
+        # Each user has their own number series (see invoice_numbers)
+        UniqueConstraint("user_id", "invoice_number", name="uq_invoices_user_invoice_number"),
+        # Overdue transition job: status IN (...) AND due_date < today
+        Index("ix_invoices_status_due_date", "status", "due_date"),
+        # Per-user status counts and filters
+        Index("ix_invoices_user_status_due_date", "user_id", "status", "due_date"),
+        # Period sums for reports (revenue, tax collected)
+        Index("ix_invoices_user_issued_date", "user_id", "issued_date"),
+        # Incremental refresh of the report analytics
+        Index("ix_invoices_user_updated_at", "user_id", "updated_at"),
+        # Ids of archived invoices must never be handed out again
+        {"sqlite_autoincrement": True},
+    )
 
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -113,10 +147,17 @@ class Invoice(Base):
     invoice_number = Column(String(50), nullable=False, index=True)
     issued_date = Column(Date, default=date.today, nullable=False)
     due_date = Column(Date, nullable=False)
-    line_items = Column(JSON, default=list)
-    total = Column(Numeric(12, 2), default=0, nullable=False)
+    line_items = deferred(Column(LineItems, default=list), group=DETAIL_GROUP)
+    total = Column(Money, default=0, nullable=False)
+    # Breakdown of ``total`` kept in step by ``update_totals``.  NULL on rows
+    # written before the columns existed until the subtotal backfill runs.
+    labor_subtotal = Column(Money)
+    parts_subtotal = Column(Money)
+    tax_amount = Column(Money)
     template = Column(String(50), default="standard")
     status = Column(String(20), default="draft", nullable=False, index=True)
+    # Day the status became "paid"; NULL on invoices paid before the column existed
+    paid_date = Column(Date)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -124,29 +165,159 @@ class Invoice(Base):
     user = relationship("User", back_populates="invoices")
     customer = relationship("Customer", back_populates="invoices")
 
+    def calculate_cents(self):
+        """Return ``(total, labor, parts, tax)`` from line items as integer cents.
+
+        Labor is hours x rate, tax is charged on labor plus parts and is
+        derived as total minus labor and parts, so the three parts always
+        add up to the total exactly.  See :func:`money.invoice_cents`.
+        """
+        return invoice_cents(self.line_items)
+
+    def calculate_breakdown(self):
+        """Return ``(labor, parts, tax)`` from line items as Decimals."""
+        return self.calculate_totals()[1:]
+
     def calculate_total(self):
         """Calculate total from line items."""
-        total = Decimal("0")
-        for item in self.line_items or []:
-            try:
-                hours = Decimal(str(item.get("hours", item.get("quantity", 0))))
-                rate = Decimal(str(item.get("rate", 0)))
-                parts = Decimal(str(item.get("parts", 0)))
-                tax = Decimal(str(item.get("tax", 0)))
-                line = (hours * rate + parts) * (Decimal("1") + tax / Decimal("100"))
-                total += line
-            except (ValueError, TypeError, ArithmeticError):
-                continue
-        return total
+        return from_cents(self.calculate_cents()[0])
+
+    def calculate_totals(self):
+        """Return ``(total, labor, parts, tax)`` as Decimals rounded to cents."""
+        return tuple(map(from_cents, self.calculate_cents()))
+
+    def update_totals(self):
+        """Set ``total`` and its breakdown columns from the line items."""
+        self.total, self.labor_subtotal, self.parts_subtotal, self.tax_amount = self.calculate_totals()
 
     def __repr__(self):
         return f"<Invoice {self.invoice_number}>"
 
 
+class InvoiceSequence(Base):
+    """Per-user invoice number counter and format."""
+
+    __tablename__ = "invoice_sequences"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, unique=True
+    )
+    prefix = Column(String(20), default="INV-", nullable=False)
+    number_format = Column(String(50), default="{prefix}{seq:06d}", nullable=False)
+    # First value not yet handed out to any process
+    next_value = Column(Integer, default=1, nullable=False)
+
+    def __repr__(self):
+        return f"<InvoiceSequence user={self.user_id} next={self.next_value}>"
+
+
+class JobRun(Base):
+    """Bookkeeping for periodic maintenance jobs."""
+
+    __tablename__ = "job_runs"
+
+    name = Column(String(50), primary_key=True)
+    # Business date the job last brought the data up to
+    last_run_for = Column(Date)
+    last_run_at = Column(DateTime)
+    rows_affected = Column(Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return f"<JobRun {self.name} {self.last_run_for}>"
+
+
 # Database initialization functions
-def create_tables():
-    """Create all database tables."""
-    Base.metadata.create_all(bind=engine)
+def add_missing_columns(bind, metadata, schema=None):
+    """``ALTER TABLE ... ADD COLUMN`` for nullable columns older databases lack.
+
+    Returns the added columns.
+    """
+    added = []
+    inspector = inspect(bind)
+    for table in metadata.sorted_tables:
+        if not inspector.has_table(table.name, schema=schema):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name, schema=schema)}
+        for column in table.columns:
+            if column.name in existing or not column.nullable:
+                continue
+            column_type = column.type.compile(dialect=bind.dialect)
+            table_name = f"{schema}.{table.name}" if schema else table.name
+            with bind.begin() as conn:
+                conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column.name} {column_type}"))
+            logging.info(f"Added column {table.name}.{column.name}")
+            added.append(column)
+    return added
+
+
+def upgrade_invoices_table(bind):
+    """Bring an older ``invoices`` table up to the current constraints.
+
+    Databases created before per-user number series made ``invoice_number``
+    unique across all users, so a second user's series collided with the
+    first's.  On SQLite the table also lacked ``AUTOINCREMENT``, so the ids
+    of archived invoices were handed out again.  SQLite can change neither
+    in place, so the table is rebuilt inside one transaction (rename,
+    create, copy, drop); other databases swap the constraint.
+    """
+    inspector = inspect(bind)
+    if not inspector.has_table(Invoice.__tablename__):
+        return
+    legacy = [
+        constraint
+        for constraint in inspector.get_unique_constraints(Invoice.__tablename__)
+        if constraint["column_names"] == ["invoice_number"]
+    ]
+    table = Invoice.__table__
+    if bind.dialect.name == "sqlite":
+        with bind.connect() as conn:
+            ddl = conn.execute(
+                text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": table.name}
+            ).scalar()
+        if not legacy and "AUTOINCREMENT" in ddl.upper():
+            return
+        old_name = f"{table.name}_old"
+        declared = {column["name"] for column in inspector.get_columns(table.name)}
+        columns = ", ".join(column.name for column in table.columns if column.name in declared)
+        with bind.connect() as conn:
+            # pysqlite leaves DDL outside transactions unless one is open
+            conn.exec_driver_sql("BEGIN")
+            for index in inspector.get_indexes(table.name):
+                conn.execute(text(f"DROP INDEX {index['name']}"))
+            conn.execute(text(f"ALTER TABLE {table.name} RENAME TO {old_name}"))
+            table.create(conn)
+            conn.execute(text(f"INSERT INTO {table.name} ({columns}) SELECT {columns} FROM {old_name}"))
+            conn.execute(text(f"DROP TABLE {old_name}"))
+            conn.commit()
+    elif legacy:
+        with bind.begin() as conn:
+            for constraint in legacy:
+                conn.execute(text(f"ALTER TABLE {table.name} DROP CONSTRAINT {constraint['name']}"))
+            conn.execute(
+                text(
+                    f"ALTER TABLE {table.name} ADD CONSTRAINT uq_invoices_user_invoice_number "
+                    f"UNIQUE (user_id, invoice_number)"
+                )
+            )
+    else:
+        return
+    logging.info("Upgraded the invoices table constraints")
+
+
+def create_tables(bind=None):
+    """Create all database tables and any columns or indexes missing from older databases."""
+    bind = bind or engine
+    Base.metadata.create_all(bind=bind)
+    # create_all only builds tables it creates; add new columns and indexes to old ones
+    added = add_missing_columns(bind, Base.metadata)
+    if any(column.table is Customer.__table__ and column.name in CONTACT_KEYS for column in added):
+        fill_contact_keys(bind, Customer.__table__)
+    convert_money_columns(bind, Base.metadata)
+    upgrade_invoices_table(bind)
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=bind, checkfirst=True)
 
 
 def init_database():
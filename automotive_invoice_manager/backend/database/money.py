@@ -0,0 +1,200 @@
+"""Money stored as integer cents.
+
+:class:`Money` columns hold whole cents in an integer column, so SQL sums
+are exact integer arithmetic, while Python code keeps seeing two-place
+Decimals.  The helpers below do the invoice arithmetic on plain integers:
+line-item quantities are read as fixed-point numbers with
+:data:`INPUT_DIGITS` decimals (floats to the nearest such number) and
+amounts are carried unrounded until they are rounded (half up) to cents
+once per invoice.
+"""
+
+import logging
+from decimal import ROUND_HALF_UP, Decimal
+
+from sqlalchemy import BigInteger, Integer, inspect, text, type_coerce
+from sqlalchemy.types import TypeDecorator
+
+# Decimals kept from hours, rates, parts and tax percentages
+INPUT_DIGITS = 4
+_INPUT_SCALE = 10 ** INPUT_DIGITS
+
+# Unrounded amounts are in 10**-14 dollars: hours x rate has 8 decimals and
+# applying a 4-decimal percentage adds 6 more.
+_PER_CENT = 10 ** 12
+_FROM_8_DIGITS = 10 ** 6
+
+
+def _fixed(value, digits: int) -> int:
+    """Return ``value * 10**digits`` as an int, rounded half away from zero.
+
+    Accepts ints, floats (by their shortest repr), Decimals and numeric
+    strings; raises ``ValueError`` or ``ArithmeticError`` for anything else.
+    """
+    if type(value) is int:
+        return value * 10 ** digits
+    if isinstance(value, float):
+        text_value = repr(value)
+    elif isinstance(value, str):
+        text_value = value.strip()
+    elif isinstance(value, Decimal):
+        text_value = str(value)
+    else:
+        raise TypeError(f"Not a money amount: {value!r}")
+    negative = text_value.startswith("-")
+    unsigned = text_value[1:] if text_value[:1] in ("-", "+") else text_value
+    whole, _, fraction = unsigned.partition(".")
+    if (whole or fraction) and (whole + fraction).isascii() and (whole + fraction).isdigit():
+        number = int((whole or "0") + fraction[:digits].ljust(digits, "0"))
+        if len(fraction) > digits and fraction[digits] >= "5":
+            number += 1
+        return -number if negative else number
+    # Exponents ("1e-05"), "Infinity" and the like
+    return int(Decimal(text_value).scaleb(digits).to_integral_value(ROUND_HALF_UP))
+
+
+def _input(value) -> int:
+    """Return a line-item value as an integer with :data:`INPUT_DIGITS` decimals."""
+    kind = type(value)
+    if kind is float:
+        return round(value * _INPUT_SCALE)
+    if kind is int:
+        return value * _INPUT_SCALE
+    return _fixed(value, INPUT_DIGITS)
+
+
+def _round_cents(units: int) -> int:
+    cents, rest = divmod(abs(units), _PER_CENT)
+    if rest * 2 >= _PER_CENT:
+        cents += 1
+    return cents if units >= 0 else -cents
+
+
+def to_cents(value) -> int:
+    """Return a dollar amount as whole cents (``Decimal("12.345")`` -> 1235)."""
+    return _fixed(value, 2)
+
+
+def from_cents(cents: int) -> Decimal:
+    """Return whole cents as a two-place Decimal (1235 -> ``Decimal("12.35")``)."""
+    return Decimal(cents).scaleb(-2)
+
+
+def format_cents(cents: int, symbol: str = "$") -> str:
+    """Format whole cents for display, e.g. ``-123456`` -> ``"-$1,234.56"``."""
+    dollars, rest = divmod(abs(cents), 100)
+    return f"{'-' if cents < 0 else ''}{symbol}{dollars:,}.{rest:02d}"
+
+
+def _line_item(item) -> tuple[int, int, int]:
+    """Return ``(labor, parts, tax)`` of a line item, unrounded.
+
+    Labor is hours (or quantity) x rate and parts are in 10**-8 dollars;
+    tax is charged on labor plus parts and is in 10**-14 dollars.
+    """
+    hours = item.get("hours")
+    if hours is None:
+        hours = item.get("quantity", 0)
+    labor = _input(hours) * _input(item.get("rate", 0))
+    parts = _input(item.get("parts", 0)) * _INPUT_SCALE
+    return labor, parts, (labor + parts) * _input(item.get("tax", 0))
+
+
+def line_item_cents(item) -> int:
+    """Return one line's amount (labor + parts + tax) rounded to cents."""
+    labor, parts, tax = _line_item(item)
+    return _round_cents((labor + parts) * _FROM_8_DIGITS + tax)
+
+
+def invoice_cents(line_items) -> tuple[int, int, int, int]:
+    """Return ``(total, labor, parts, tax)`` in cents for a list of line items.
+
+    Each sum is rounded once; tax is total minus labor and parts, so the
+    three parts always add up to the total exactly.  Lines with
+    unparseable values are skipped as a whole.
+    """
+    labor = parts = tax = 0
+    for item in line_items or ():
+        try:
+            line_labor, line_parts, line_tax = _line_item(item)
+        except (ValueError, TypeError, ArithmeticError, AttributeError):
+            continue
+        labor += line_labor
+        parts += line_parts
+        tax += line_tax
+    total = _round_cents((labor + parts) * _FROM_8_DIGITS + tax)
+    labor = _round_cents(labor * _FROM_8_DIGITS)
+    parts = _round_cents(parts * _FROM_8_DIGITS)
+    return total, labor, parts, total - labor - parts
+
+
+class Money(TypeDecorator):
+    """Dollar amount stored as integer cents, read and written as Decimals.
+
+    Bound values may be ints, floats, Decimals or numeric strings in
+    dollars.  Arithmetic between money columns in SQL yields plain integer
+    cents; use :func:`cents` to read or write the stored integers directly.
+    """
+
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else to_cents(value)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else from_cents(int(value))
+
+
+def cents(expression):
+    """``expression`` typed as its stored integer cents instead of :class:`Money`."""
+    return type_coerce(expression, BigInteger)
+
+
+def convert_money_columns(bind, metadata, schema=None):
+    """Convert :class:`Money` columns still declared with a non-integer type.
+
+    Older databases kept amounts in ``NUMERIC(12, 2)`` columns.  SQLite
+    cannot change a column's type, so the table is rebuilt inside one
+    transaction (rename, create, copy with ``ROUND(x * 100)``, drop); other
+    databases use ``ALTER COLUMN ... TYPE``.
+    """
+    inspector = inspect(bind)
+    for table in metadata.sorted_tables:
+        money = [column.name for column in table.columns if isinstance(column.type, Money)]
+        if not money or not inspector.has_table(table.name, schema=schema):
+            continue
+        declared = {column["name"]: column["type"] for column in inspector.get_columns(table.name, schema=schema)}
+        legacy = [name for name in money if name in declared and not isinstance(declared[name], Integer)]
+        if not legacy:
+            continue
+        prefix = f"{schema}." if schema else ""
+        if bind.dialect.name == "sqlite":
+            old_name = f"{table.name}_numeric"
+            columns = [column.name for column in table.columns if column.name in declared]
+            values = [f"CAST(ROUND({name} * 100) AS INTEGER)" if name in legacy else name for name in columns]
+            with bind.connect() as conn:
+                # pysqlite leaves DDL outside transactions unless one is open
+                conn.exec_driver_sql("BEGIN")
+                for index in inspector.get_indexes(table.name, schema=schema):
+                    conn.execute(text(f"DROP INDEX {prefix}{index['name']}"))
+                conn.execute(text(f"ALTER TABLE {prefix}{table.name} RENAME TO {old_name}"))
+                table.create(conn)
+                conn.execute(
+                    text(
+                        f"INSERT INTO {prefix}{table.name} ({', '.join(columns)}) "
+                        f"SELECT {', '.join(values)} FROM {prefix}{old_name}"
+                    )
+                )
+                conn.execute(text(f"DROP TABLE {prefix}{old_name}"))
+                conn.commit()
+        else:
+            with bind.begin() as conn:
+                for name in legacy:
+                    conn.execute(
+                        text(
+                            f"ALTER TABLE {prefix}{table.name} ALTER COLUMN {name} "
+                            f"TYPE BIGINT USING CAST(ROUND({name} * 100) AS BIGINT)"
+                        )
+                    )
+        logging.info(f"Converted {table.name}.{', '.join(legacy)} to integer cents")
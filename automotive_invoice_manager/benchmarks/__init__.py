@@ -0,0 +1,30 @@
+"""Synthetic data generation and performance benchmarks.
+
+Run the suite with ``python -m automotive_invoice_manager.benchmarks``; see
+``--help`` for scales and output options.
+"""
+
+from .datagen import SCALES, Dataset, DatasetSpec, generate_dataset
+from .harness import (
+    BENCHMARKS,
+    BenchmarkContext,
+    BenchmarkResult,
+    BenchmarkSkipped,
+    benchmark,
+    compare_results,
+    measure,
+)
+
+__all__ = [
+    "SCALES",
+    "Dataset",
+    "DatasetSpec",
+    "generate_dataset",
+    "BENCHMARKS",
+    "BenchmarkContext",
+    "BenchmarkResult",
+    "BenchmarkSkipped",
+    "benchmark",
+    "compare_results",
+    "measure",
+]
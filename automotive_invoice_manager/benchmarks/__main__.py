@@ -0,0 +1,130 @@
+"""Command line entry point: ``python -m automotive_invoice_manager.benchmarks``.
+
+Examples
+--------
+Generate (or reuse) the 100k dataset and write results::
+
+    python -m automotive_invoice_manager.benchmarks --scale 100k --output before.json
+
+Compare a new run against a previous one::
+
+    python -m automotive_invoice_manager.benchmarks --scale 100k --output after.json --compare before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+from dataclasses import asdict
+from pathlib import Path
+
+from automotive_invoice_manager.backend.database.connection import DatabaseManager
+from automotive_invoice_manager.backend.database.models import User, create_tables
+from automotive_invoice_manager.config.database import DatabaseConfig
+from automotive_invoice_manager.services import CustomerService, InvoiceService
+
+from . import auth_benchmarks, image_benchmarks, report_benchmarks, service_benchmarks  # noqa: F401  (registers benchmarks)
+from .datagen import SCALES, DatasetSpec, generate_dataset, load_metadata, save_metadata
+from .harness import (
+    BenchmarkContext,
+    compare_results,
+    load_results,
+    run_benchmarks,
+    write_results,
+)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m automotive_invoice_manager.benchmarks",
+        description="Generate a synthetic dataset and benchmark the services layer.",
+    )
+    parser.add_argument("--scale", default="1k", choices=sorted(SCALES), help="named dataset size")
+    parser.add_argument("--invoices", type=int, help="explicit invoice count (overrides --scale)")
+    parser.add_argument("--seed", type=int, default=42, help="random seed for the generator")
+    parser.add_argument("--anchor", help="ISO date treated as 'today' by the generator")
+    parser.add_argument("--db", help="SQLite file for the dataset (default: temp dir, reused)")
+    parser.add_argument("--regenerate", action="store_true", help="rebuild the dataset even if cached")
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per benchmark")
+    parser.add_argument("--only", help="run only benchmarks whose name contains this text")
+    parser.add_argument("--output", default="benchmark_results.json", help="results JSON path")
+    parser.add_argument("--label", help="free-form label stored in the results file")
+    parser.add_argument("--compare", help="previous results JSON to compare against")
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="exit with status 1 if --compare finds a regression",
+    )
+    return parser.parse_args(argv)
+
+
+def prepare_dataset(args):
+    """Return ``(db_manager, dataset)``, generating the data when needed."""
+    overrides = {"seed": args.seed}
+    if args.anchor:
+        overrides["anchor"] = args.anchor
+    if args.invoices:
+        spec = DatasetSpec(invoices=args.invoices, **overrides)
+        name = f"{args.invoices}"
+    else:
+        spec = DatasetSpec.for_scale(args.scale, **overrides)
+        name = args.scale
+    db_path = Path(args.db or Path(tempfile.gettempdir()) / f"aim_bench_{name}_{args.seed}.db")
+    meta_path = db_path.with_suffix(db_path.suffix + ".json")
+
+    cached = load_metadata(meta_path)
+    if args.regenerate or cached is None or asdict(cached.spec) != asdict(spec) or not db_path.exists():
+        db_path.unlink(missing_ok=True)
+        meta_path.unlink(missing_ok=True)
+        db_manager = DatabaseManager(DatabaseConfig(url=f"sqlite:///{db_path}"))
+        print(f"Generating dataset ({spec.invoices} invoices) in {db_path} ...")
+        dataset = generate_dataset(db_manager, spec)
+        save_metadata(dataset, meta_path)
+    else:
+        db_manager = DatabaseManager(DatabaseConfig(url=f"sqlite:///{db_path}"))
+        create_tables(db_manager.engine)  # schema additions since the data was generated
+        dataset = cached
+        print(f"Reusing dataset in {db_path}")
+    return db_manager, dataset
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s - %(message)s")
+
+    db_manager, dataset = prepare_dataset(args)
+    with db_manager.get_session() as session:
+        user = session.get(User, dataset.primary_user_id)
+
+    print(f"Running benchmarks (repeat={args.repeat}) ...")
+    with tempfile.TemporaryDirectory(prefix="aim_bench_") as workdir:
+        ctx = BenchmarkContext(
+            db_manager=db_manager,
+            dataset=dataset,
+            user=user,
+            invoice_service=InvoiceService(db_manager.get_session),
+            customer_service=CustomerService(db_manager.get_session),
+            workdir=Path(workdir),
+            repeat=args.repeat,
+        )
+        results = run_benchmarks(ctx, only=args.only)
+    document = write_results(args.output, results, dataset.to_dict(), label=args.label)
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        rows = compare_results(load_results(args.compare), document)
+        print(f"\nComparison against {args.compare}:")
+        for row in rows:
+            print(
+                f"  {row['name']:<34} {row['old_ms']:>10.3f} -> {row['new_ms']:>10.3f} ms"
+                f"   x{row['ratio']:<6} {row['status']}"
+            )
+        if args.fail_on_regression and any(row["status"] == "regressed" for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""Login cost at several PBKDF2 work factors, plus the host-calibrated one."""
+
+from __future__ import annotations
+
+from sqlalchemy import delete
+
+from automotive_invoice_manager.backend.database.models import User
+from automotive_invoice_manager.config.security import PasswordHashConfig
+from automotive_invoice_manager.services.auth_service import AuthManager
+from automotive_invoice_manager.services.password_hasher import PasswordHasher
+
+from .datagen import DEFAULT_PASSWORD
+from .harness import BenchmarkResult, benchmark, measure
+
+ITERATION_LEVELS = (100_000, 200_000, 600_000, 1_000_000)
+
+# Each login costs up to a second at the top level; keep the run short.
+MAX_REPEAT = 5
+
+
+def _time_login(ctx, name: str, hasher: PasswordHasher) -> BenchmarkResult:
+    email = f"bench-{name}@example.com"
+    auth = AuthManager(ctx.db_manager.get_session, hasher=hasher)
+    with ctx.db_manager.get_session() as session:
+        session.execute(delete(User).where(User.email == email))
+        session.add(User(email=email, password_hash=hasher.hash(DEFAULT_PASSWORD)))
+    try:
+        timings = measure(lambda: auth.login(email, DEFAULT_PASSWORD), min(ctx.repeat, MAX_REPEAT))
+    finally:
+        with ctx.db_manager.get_session() as session:
+            session.execute(delete(User).where(User.email == email))
+    return BenchmarkResult(name, "auth", timings, metrics={"iterations": hasher.iterations})
+
+
+def _register_level(iterations: int) -> None:
+    @benchmark(f"auth.login@{iterations // 1000}k", "auth")
+    def bench(ctx):
+        hasher = PasswordHasher(PasswordHashConfig(iterations=iterations))
+        return _time_login(ctx, f"{iterations // 1000}k", hasher)
+
+
+for _level in ITERATION_LEVELS:
+    _register_level(_level)
+
+
+@benchmark("auth.login@calibrated", "auth")
+def bench_login_calibrated(ctx):
+    return _time_login(ctx, "calibrated", PasswordHasher(PasswordHashConfig(iterations=0)))
@@ -0,0 +1,391 @@
+"""Deterministic synthetic dataset generator for benchmarks.
+
+The generator writes users, customers and invoices straight into a database
+using chunked bulk inserts, so even the 1M invoice scale can be built in a few
+minutes.  Every value is drawn from a seeded :class:`random.Random`; the same
+``DatasetSpec`` (seed and anchor date included) always yields the same rows.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import random
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from sqlalchemy import insert
+
+from automotive_invoice_manager.backend.database.models import (
+    Customer,
+    Invoice,
+    User,
+    create_tables,
+)
+
+logger = logging.getLogger(__name__)
+
+# Named scales accepted by the benchmark CLI (number of invoices).
+SCALES = {
+    "1k": 1_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+}
+
+# Password used for every generated account.  Hashing runs once per dataset
+# because the KDF is deliberately slow.
+DEFAULT_PASSWORD = "Bench1234"
+
+CHUNK_SIZE = 5_000
+
+FIRST_NAMES = [
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael",
+    "Linda", "David", "Elizabeth", "William", "Barbara", "Richard", "Susan",
+    "Joseph", "Jessica", "Thomas", "Sarah", "Carlos", "Maria", "Wei", "Aisha",
+    "Ivan", "Olga", "Kenji", "Fatima", "Liam", "Emma", "Noah", "Olivia",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller",
+    "Davis", "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez",
+    "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin",
+    "Lee", "Perez", "Thompson", "White", "Harris", "Sanchez", "Clark",
+    "Hrinko", "Nguyen", "Kowalski",
+]
+BUSINESS_SUFFIXES = [
+    "Garage", "Auto Body", "Towing", "Fleet Services", "Motors", "Logistics",
+    "Delivery", "Rentals", "Transport", "Limo",
+]
+STREETS = [
+    "Main St", "Oak Ave", "Maple Dr", "Cedar Ln", "Elm St", "Pine Rd",
+    "Washington Blvd", "Lake Shore Dr", "Industrial Pkwy", "Route 9",
+]
+CITIES = [
+    "Springfield", "Riverton", "Fairview", "Franklin", "Greenville",
+    "Bristol", "Clinton", "Madison", "Georgetown", "Salem",
+]
+EMAIL_DOMAINS = [
+    "gmail.com", "yahoo.com", "outlook.com", "hotmail.com", "icloud.com",
+    "aol.com", "comcast.net", "example.com",
+]
+PHONE_FORMATS = [
+    "({a}) {b}-{c}",
+    "{a}-{b}-{c}",
+    "{a}.{b}.{c}",
+    "{a}{b}{c}",
+    "+1 {a} {b} {c}",
+]
+AREA_CODES = ["201", "212", "312", "415", "512", "555", "617", "702", "808", "917"]
+
+# (description, typical hours, typical parts cost)
+SERVICES = [
+    ("Oil and filter change", 0.5, 45.0),
+    ("Brake pad replacement", 1.5, 120.0),
+    ("Rotor resurfacing", 1.0, 0.0),
+    ("Tire rotation", 0.5, 0.0),
+    ("Wheel alignment", 1.0, 0.0),
+    ("Battery replacement", 0.5, 180.0),
+    ("Coolant flush", 1.0, 35.0),
+    ("Transmission service", 2.0, 90.0),
+    ("Spark plug replacement", 1.5, 60.0),
+    ("Diagnostic scan", 1.0, 0.0),
+    ("Timing belt replacement", 4.0, 260.0),
+    ("Alternator replacement", 2.5, 340.0),
+    ("Suspension inspection", 0.75, 0.0),
+    ("Air filter replacement", 0.25, 25.0),
+    ("A/C recharge", 1.0, 55.0),
+    ("Exhaust repair", 2.0, 150.0),
+    ("Windshield wiper replacement", 0.25, 30.0),
+    ("State inspection", 0.5, 0.0),
+]
+LABOR_RATES = [85, 95, 110, 125, 140]
+TAX_RATES = [0, 6, 6.25, 7, 8.25]
+DUE_TERMS = [15, 30, 30, 30, 45, 60]
+
+
+@dataclass
+class DatasetSpec:
+    """Parameters describing a generated dataset."""
+
+    invoices: int = 1_000
+    customers: int | None = None
+    users: int | None = None
+    seed: int = 42
+    years: int = 5
+    anchor: str | None = None  # ISO date; defaults to today
+
+    def __post_init__(self) -> None:
+        if self.customers is None:
+            self.customers = max(10, self.invoices // 8)
+        if self.users is None:
+            self.users = max(1, self.invoices // 100_000)
+        if self.anchor is None:
+            self.anchor = date.today().isoformat()
+
+    @classmethod
+    def for_scale(cls, scale: str, **overrides) -> "DatasetSpec":
+        """Build a spec for one of the named :data:`SCALES`."""
+        try:
+            invoices = SCALES[scale.lower()]
+        except KeyError as exc:
+            raise ValueError(
+                f"Unknown scale '{scale}'. Choose from: {', '.join(SCALES)}"
+            ) from exc
+        return cls(invoices=invoices, **overrides)
+
+    @property
+    def anchor_date(self) -> date:
+        return date.fromisoformat(self.anchor)
+
+
+@dataclass
+class Dataset:
+    """Summary of a generated dataset and handy values for benchmarks."""
+
+    spec: DatasetSpec
+    primary_user_id: int
+    primary_user_email: str
+    counts: dict = field(default_factory=dict)
+    customer_terms: list = field(default_factory=list)
+    invoice_terms: list = field(default_factory=list)
+    heavy_invoice_number: str = ""
+    elapsed: float = 0.0
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["spec"] = asdict(self.spec)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Dataset":
+        data = dict(data)
+        data["spec"] = DatasetSpec(**data["spec"])
+        return cls(**data)
+
+
+def _customer_name(rng: random.Random) -> str:
+    first = rng.choice(FIRST_NAMES)
+    last = rng.choice(LAST_NAMES)
+    roll = rng.random()
+    if roll < 0.25:
+        return f"{last}'s {rng.choice(BUSINESS_SUFFIXES)}"
+    if roll < 0.35:
+        return f"{first} {last} {rng.choice(BUSINESS_SUFFIXES)}"
+    return f"{first} {last}"
+
+
+def _phone(rng: random.Random) -> str:
+    fmt = rng.choice(PHONE_FORMATS)
+    return fmt.format(
+        a=rng.choice(AREA_CODES),
+        b=f"{rng.randrange(200, 1000)}",
+        c=f"{rng.randrange(0, 10000):04d}",
+    )
+
+
+def _line_items(rng: random.Random) -> list[dict]:
+    count = min(1 + int(rng.expovariate(1 / 2.5)), 30)
+    rate = rng.choice(LABOR_RATES)
+    tax = rng.choice(TAX_RATES)
+    items = []
+    for _ in range(count):
+        description, hours, parts = rng.choice(SERVICES)
+        hours = max(0.25, round(hours * rng.uniform(0.6, 1.6) * 4) / 4)
+        parts = round(parts * rng.uniform(0.8, 1.3), 2) if parts else 0.0
+        items.append(
+            {
+                "description": description,
+                "hours": hours,
+                "rate": rate,
+                "parts": parts,
+                "tax": tax,
+            }
+        )
+    return items
+
+
+def _status(rng: random.Random, due: date, anchor: date) -> str:
+    roll = rng.random()
+    if due >= anchor:
+        return "draft" if roll < 0.35 else "sent"
+    if roll < 0.88:
+        return "paid"
+    return "sent" if roll < 0.96 else "draft"
+
+
+def generate_dataset(db_manager, spec: DatasetSpec) -> Dataset:
+    """Create tables on ``db_manager.engine`` and fill them per ``spec``.
+
+    The database is expected to be empty.  The first generated user owns at
+    least half of all customers (and therefore invoices); benchmarks run
+    against that user.
+    """
+    started = time.perf_counter()
+    rng = random.Random(spec.seed)
+    # Separate stream so payment days leave the other generated values as they were
+    pay_rng = random.Random(spec.seed + 2)
+    anchor = spec.anchor_date
+    span_days = spec.years * 365
+
+    create_tables(db_manager.engine)
+
+    probe = User(email="probe@bench.local")
+    probe.set_password(DEFAULT_PASSWORD)
+    password_hash = probe.password_hash
+
+    with db_manager.get_session() as session:
+        user_rows = [
+            {
+                "email": f"bench{i + 1}@bench.local",
+                "password_hash": password_hash,
+                "created_at": datetime.combine(
+                    anchor - timedelta(days=span_days), datetime.min.time()
+                ),
+            }
+            for i in range(spec.users)
+        ]
+        session.execute(insert(User), user_rows)
+        user_ids = [
+            uid
+            for (uid,) in session.query(User.id)
+            .filter(User.email.in_([row["email"] for row in user_rows]))
+            .order_by(User.id)
+        ]
+
+    # Customers: the primary user gets half when there are several users.
+    customer_owner = []
+    customer_rows = []
+    for i in range(spec.customers):
+        if len(user_ids) == 1 or rng.random() < 0.5:
+            owner = user_ids[0]
+        else:
+            owner = rng.choice(user_ids[1:])
+        name = _customer_name(rng)
+        slug = name.lower().replace("'", "").replace(" ", ".")
+        created = anchor - timedelta(days=rng.randrange(span_days))
+        customer_rows.append(
+            {
+                "user_id": owner,
+                "name": name,
+                "email": (
+                    f"{slug}{i}@{rng.choice(EMAIL_DOMAINS)}"
+                    if rng.random() < 0.85
+                    else None
+                ),
+                "phone": _phone(rng) if rng.random() < 0.9 else None,
+                "address": (
+                    f"{rng.randrange(1, 9999)} {rng.choice(STREETS)}, "
+                    f"{rng.choice(CITIES)}"
+                ),
+                "notes": (
+                    f"Prefers {rng.choice(['text', 'email', 'phone'])} contact"
+                    if rng.random() < 0.3
+                    else None
+                ),
+                "created_at": datetime.combine(created, datetime.min.time()),
+                "updated_at": datetime.combine(created, datetime.min.time()),
+            }
+        )
+        customer_owner.append(owner)
+
+    with db_manager.get_session() as session:
+        for start in range(0, len(customer_rows), CHUNK_SIZE):
+            session.execute(insert(Customer), customer_rows[start:start + CHUNK_SIZE])
+        customer_ids = [
+            cid
+            for (cid,) in session.query(Customer.id)
+            .filter(Customer.user_id.in_(user_ids))
+            .order_by(Customer.id)
+        ]
+
+    # Invoices: skewed towards recent dates and towards "regular" customers.
+    mean_age = span_days / 4
+    heavy = ("", -1)
+    number = 0
+    pending = []
+    with db_manager.get_session() as session:
+        for _ in range(spec.invoices):
+            number += 1
+            idx = int(len(customer_ids) * rng.random() ** 2)
+            age = min(int(rng.expovariate(1 / mean_age)), span_days)
+            issued = anchor - timedelta(days=age)
+            due = issued + timedelta(days=rng.choice(DUE_TERMS))
+            items = _line_items(rng)
+            invoice_number = f"INV-{number:07d}"
+            if len(items) > heavy[1]:
+                heavy = (invoice_number, len(items))
+            created = datetime.combine(issued, datetime.min.time()) + timedelta(
+                seconds=rng.randrange(8 * 3600, 18 * 3600)
+            )
+            total, labor, parts, tax = Invoice(line_items=items).calculate_totals()
+            status = _status(rng, due, anchor)
+            paid = None
+            if status == "paid":
+                paid = min(issued + timedelta(days=int(pay_rng.expovariate(1 / 20))), anchor)
+            pending.append(
+                {
+                    "user_id": customer_owner[idx],
+                    "customer_id": customer_ids[idx],
+                    "invoice_number": invoice_number,
+                    "issued_date": issued,
+                    "due_date": due,
+                    "line_items": items,
+                    "total": total,
+                    "labor_subtotal": labor,
+                    "parts_subtotal": parts,
+                    "tax_amount": tax,
+                    "template": "standard",
+                    "status": status,
+                    "paid_date": paid,
+                    "created_at": created,
+                    "updated_at": created,
+                }
+            )
+            if len(pending) >= CHUNK_SIZE:
+                session.execute(insert(Invoice), pending)
+                pending = []
+                logger.info(f"Generated {number}/{spec.invoices} invoices")
+        if pending:
+            session.execute(insert(Invoice), pending)
+
+    primary_names = [
+        row["name"] for row in customer_rows if row["user_id"] == user_ids[0]
+    ]
+    name_pick = random.Random(spec.seed + 1)
+    dataset = Dataset(
+        spec=spec,
+        primary_user_id=user_ids[0],
+        primary_user_email=user_rows[0]["email"],
+        counts={
+            "users": spec.users,
+            "customers": spec.customers,
+            "invoices": spec.invoices,
+        },
+        customer_terms=[
+            name_pick.choice(primary_names).split()[-1][:4].lower()
+            for _ in range(3)
+        ],
+        invoice_terms=["INV-00001", f"INV-{spec.invoices // 2:07d}"],
+        heavy_invoice_number=heavy[0],
+        elapsed=round(time.perf_counter() - started, 3),
+    )
+    logger.info(
+        f"Dataset generated in {dataset.elapsed:.1f}s: "
+        f"{spec.users} users, {spec.customers} customers, {spec.invoices} invoices"
+    )
+    return dataset
+
+
+def save_metadata(dataset: Dataset, path: str | Path) -> None:
+    """Write the dataset summary next to the generated database."""
+    Path(path).write_text(json.dumps(dataset.to_dict(), indent=2), encoding="utf-8")
+
+
+def load_metadata(path: str | Path) -> Dataset | None:
+    """Return a previously saved dataset summary, or ``None``."""
+    try:
+        return Dataset.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+
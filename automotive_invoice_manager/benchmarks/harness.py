@@ -0,0 +1,209 @@
+"""Timing, registration and result files for the benchmark suite."""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+# Version of the results file layout.  Bump when keys change meaning so that
+# ``compare_results`` can refuse to diff incompatible files.
+RESULTS_FORMAT = 1
+
+# Median slowdown (new / old) above which a benchmark is reported as regressed.
+REGRESSION_THRESHOLD = 1.10
+
+
+class BenchmarkSkipped(Exception):
+    """Raised by a benchmark that cannot run in the current environment."""
+
+
+@dataclass
+class BenchmarkContext:
+    """Everything a benchmark needs: services bound to the benchmark DB."""
+
+    db_manager: object
+    dataset: object
+    user: object
+    invoice_service: object
+    customer_service: object
+    workdir: Path
+    repeat: int = 20
+    extra: dict = field(default_factory=dict)
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings (seconds) for one benchmark plus optional extra metrics."""
+
+    name: str
+    group: str
+    timings: list[float] = field(default_factory=list)
+    metrics: dict = field(default_factory=dict)
+    skipped: str | None = None
+
+    def summary(self) -> dict:
+        """Return a JSON-friendly summary in milliseconds."""
+        if self.skipped is not None:
+            return {"group": self.group, "skipped": self.skipped}
+        ms = sorted(t * 1000 for t in self.timings)
+        p95_index = min(len(ms) - 1, int(round(0.95 * (len(ms) - 1))))
+        data = {
+            "group": self.group,
+            "runs": len(ms),
+            "min_ms": round(ms[0], 3),
+            "median_ms": round(statistics.median(ms), 3),
+            "mean_ms": round(statistics.fmean(ms), 3),
+            "p95_ms": round(ms[p95_index], 3),
+            "max_ms": round(ms[-1], 3),
+        }
+        if self.metrics:
+            data["metrics"] = self.metrics
+        return data
+
+
+# name -> (group, function)
+BENCHMARKS: dict[str, tuple[str, Callable]] = {}
+
+
+def benchmark(name: str, group: str = "services"):
+    """Register ``func(ctx) -> BenchmarkResult | list[float]`` under ``name``."""
+
+    def decorator(func):
+        BENCHMARKS[name] = (group, func)
+        return func
+
+    return decorator
+
+
+def measure(func: Callable, repeat: int, warmup: int = 1) -> list[float]:
+    """Call ``func`` ``warmup`` + ``repeat`` times and return the timed runs."""
+    for _ in range(warmup):
+        func()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def run_benchmarks(ctx: BenchmarkContext, only: str | None = None, log=print) -> dict:
+    """Run registered benchmarks (optionally filtered by substring)."""
+    results = {}
+    for name, (group, func) in BENCHMARKS.items():
+        if only and only not in name:
+            continue
+        try:
+            outcome = func(ctx)
+            if isinstance(outcome, BenchmarkResult):
+                result = outcome
+            else:
+                result = BenchmarkResult(name, group, list(outcome))
+            result.name, result.group = name, group
+        except BenchmarkSkipped as exc:
+            result = BenchmarkResult(name, group, skipped=str(exc))
+        results[name] = result.summary()
+        summary = results[name]
+        if "skipped" in summary:
+            log(f"  {name:<34} skipped: {summary['skipped']}")
+        else:
+            log(
+                f"  {name:<34} median {summary['median_ms']:>10.3f} ms"
+                f"   p95 {summary['p95_ms']:>10.3f} ms   runs {summary['runs']}"
+            )
+    return results
+
+
+def _git_revision() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            cwd=Path(__file__).resolve().parent,
+        )
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def environment_info() -> dict:
+    """Describe the interpreter and library versions used for a run."""
+    info = {
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "git_revision": _git_revision(),
+    }
+    try:
+        import sqlalchemy
+
+        info["sqlalchemy"] = sqlalchemy.__version__
+    except ImportError:
+        pass
+    return info
+
+
+def write_results(path: str | Path, results: dict, dataset: dict, label: str | None = None) -> dict:
+    """Write a results document and return it."""
+    document = {
+        "format": RESULTS_FORMAT,
+        "label": label,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "environment": environment_info(),
+        "dataset": dataset,
+        "results": results,
+    }
+    Path(path).write_text(json.dumps(document, indent=2, sort_keys=True), encoding="utf-8")
+    return document
+
+
+def load_results(path: str | Path) -> dict:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def compare_results(old: dict, new: dict, threshold: float = REGRESSION_THRESHOLD) -> list[dict]:
+    """Compare two result documents benchmark by benchmark.
+
+    Returns one row per benchmark present in both runs with the median ratio
+    (``new / old``) and a ``status`` of ``regressed``, ``improved`` or ``same``.
+    """
+    if old.get("format") != new.get("format"):
+        raise ValueError("Benchmark result files use different formats")
+
+    old_spec = (old.get("dataset") or {}).get("spec")
+    new_spec = (new.get("dataset") or {}).get("spec")
+    if old_spec and new_spec and old_spec.get("invoices") != new_spec.get("invoices"):
+        raise ValueError("Benchmark result files were produced at different scales")
+
+    rows = []
+    for name, new_summary in sorted(new.get("results", {}).items()):
+        old_summary = old.get("results", {}).get(name)
+        if not old_summary or "median_ms" not in old_summary or "median_ms" not in new_summary:
+            continue
+        ratio = new_summary["median_ms"] / max(old_summary["median_ms"], 1e-9)
+        if ratio > threshold:
+            status = "regressed"
+        elif ratio < 1 / threshold:
+            status = "improved"
+        else:
+            status = "same"
+        rows.append(
+            {
+                "name": name,
+                "old_ms": old_summary["median_ms"],
+                "new_ms": new_summary["median_ms"],
+                "ratio": round(ratio, 3),
+                "status": status,
+            }
+        )
+    return rows
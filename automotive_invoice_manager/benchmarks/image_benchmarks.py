@@ -0,0 +1,43 @@
+"""Login/logo image loading: full decode + resize versus the variant cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from .harness import BenchmarkSkipped, benchmark, measure
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+LOGO_SIZE = (400, 400)
+
+
+def _logo():
+    try:
+        from automotive_invoice_manager.ui.image_cache import ImageCache
+    except ImportError as exc:
+        raise BenchmarkSkipped(f"Pillow unavailable: {exc}")
+    logo = ASSETS_DIR / "logo.png"
+    if not logo.exists():
+        raise BenchmarkSkipped("assets/logo.png not found")
+    return ImageCache, logo
+
+
+@benchmark("images.logo_decode_resize", "images")
+def bench_logo_uncached(ctx):
+    from PIL import Image
+
+    _cache_cls, logo = _logo()
+
+    def load():
+        with Image.open(logo) as image:
+            image.resize(LOGO_SIZE, Image.Resampling.LANCZOS)
+
+    return measure(load, ctx.repeat)
+
+
+@benchmark("images.logo_disk_cached", "images")
+def bench_logo_disk_cached(ctx):
+    cache_cls, logo = _logo()
+    cache_dir = ctx.workdir / "image_cache"
+    cache_cls(cache_dir).load_image(logo, LOGO_SIZE)
+    # A fresh instance per call models a relaunch: no in-memory level.
+    return measure(lambda: cache_cls(cache_dir).load_image(logo, LOGO_SIZE), ctx.repeat)
@@ -0,0 +1,283 @@
+"""Benchmarks for the Reports tab queries.
+
+The aging report only reads open invoices, which are a small share of the
+generated datasets, so it runs against a dedicated database holding
+:data:`AGING_OPEN_INVOICES` open invoices for one user.  That database is
+built once in the temp directory and reused by later runs.
+"""
+
+from __future__ import annotations
+
+import random
+import statistics
+import tempfile
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+from pathlib import Path
+
+from sqlalchemy import func, insert, select
+
+from automotive_invoice_manager.backend.database.connection import DatabaseManager
+from automotive_invoice_manager.backend.database.models import Customer, Invoice, User, create_tables
+from automotive_invoice_manager.backend.database.money import invoice_cents
+from automotive_invoice_manager.config.database import DatabaseConfig
+from automotive_invoice_manager.services.aging import (
+    BUCKET_LABELS,
+    RECEIVABLE_STATUSES,
+    AgingReportCache,
+    bucket_cutoffs,
+)
+from automotive_invoice_manager.services.invoice_analytics import InvoiceAnalytics
+from automotive_invoice_manager.services.invoice_service import InvoiceService
+from automotive_invoice_manager.services.invoice_subtotals import InvoiceSubtotalBackfill
+
+from .datagen import CHUNK_SIZE
+from .harness import BenchmarkResult, benchmark, measure
+
+AGING_OPEN_INVOICES = 500_000
+AGING_CUSTOMERS = 5_000
+
+# Invoices whose line items are re-totalled by the money benchmarks
+RECOMPUTE_INVOICES = 20_000
+
+
+def _aging_database(ctx):
+    """Return ``(InvoiceService, user_id)`` for the open-invoice database."""
+    if "aging" in ctx.extra:
+        return ctx.extra["aging"]
+    path = Path(tempfile.gettempdir()) / f"aim_bench_aging_{AGING_OPEN_INVOICES}.db"
+    db_manager = DatabaseManager(DatabaseConfig(url=f"sqlite:///{path}"))
+    create_tables(db_manager.engine)
+    with db_manager.get_session() as session:
+        count = session.execute(select(func.count()).select_from(Invoice)).scalar()
+    if count != AGING_OPEN_INVOICES:
+        db_manager.engine.dispose()
+        path.unlink(missing_ok=True)
+        db_manager = DatabaseManager(DatabaseConfig(url=f"sqlite:///{path}"))
+        print(f"Generating aging dataset ({AGING_OPEN_INVOICES} open invoices) in {path} ...")
+        _fill_open_invoices(db_manager)
+    with db_manager.get_session() as session:
+        user_id = session.execute(select(User.id)).scalar()
+    ctx.extra["aging"] = (InvoiceService(db_manager.get_session, aging_cache=AgingReportCache()), user_id)
+    return ctx.extra["aging"]
+
+
+def _fill_open_invoices(db_manager) -> None:
+    rng = random.Random(7)
+    today = date.today()
+    create_tables(db_manager.engine)
+    with db_manager.get_session() as session:
+        user_id = session.execute(
+            insert(User).values(email="aging@bench.local", password_hash="x", created_at=datetime.utcnow())
+        ).inserted_primary_key[0]
+        session.execute(
+            insert(Customer),
+            [
+                {"user_id": user_id, "name": f"Aging Customer {i:05d}", "created_at": datetime.utcnow()}
+                for i in range(AGING_CUSTOMERS)
+            ],
+        )
+        customer_ids = session.execute(select(Customer.id)).scalars().all()
+        rows = []
+        for n in range(AGING_OPEN_INVOICES):
+            due = today - timedelta(days=int(rng.expovariate(1 / 45)) - 30)
+            rows.append(
+                {
+                    "user_id": user_id,
+                    "customer_id": rng.choice(customer_ids),
+                    "invoice_number": f"AGE-{n:07d}",
+                    "issued_date": due - timedelta(days=30),
+                    "due_date": due,
+                    "line_items": [],
+                    "total": Decimal(rng.randrange(2_000, 250_000)) / 100,
+                    "status": "overdue" if due < today else rng.choice(RECEIVABLE_STATUSES[:2]),
+                    "created_at": datetime.utcnow(),
+                }
+            )
+            if len(rows) >= CHUNK_SIZE:
+                session.execute(insert(Invoice), rows)
+                rows = []
+        if rows:
+            session.execute(insert(Invoice), rows)
+
+
+@benchmark("aging.sql_500k_open", "reports")
+def bench_aging_sql(ctx):
+    """Aging report bucketed in SQL, cache cleared before every run."""
+    service, user_id = _aging_database(ctx)
+
+    def report():
+        service.aging_cache.invalidate()
+        return service.get_aging_report(user_id)
+
+    timings = measure(report, max(3, ctx.repeat // 4))
+    return BenchmarkResult("", "", timings, metrics={"customers": len(report().rows)})
+
+
+@benchmark("aging.cached_500k_open", "reports")
+def bench_aging_cached(ctx):
+    """Reopening the Reports tab with no invoice written in between."""
+    service, user_id = _aging_database(ctx)
+    return measure(lambda: service.get_aging_report(user_id), ctx.repeat)
+
+
+@benchmark("aging.python_500k_open", "reports")
+def bench_aging_python(ctx):
+    """Baseline: fetch every open invoice and bucket it in Python."""
+    service, user_id = _aging_database(ctx)
+
+    def report():
+        cutoffs = bucket_cutoffs(date.today())
+        customers = {}
+        with service.session_factory() as session:
+            rows = session.execute(
+                select(Invoice.customer_id, Invoice.due_date, Invoice.total).where(
+                    Invoice.user_id == user_id, Invoice.status.in_(RECEIVABLE_STATUSES)
+                )
+            )
+            for customer_id, due_date, total in rows:
+                buckets = customers.setdefault(customer_id, [Decimal("0")] * len(BUCKET_LABELS))
+                index = next((i for i, cutoff in enumerate(cutoffs) if due_date >= cutoff), len(cutoffs))
+                buckets[index] += total
+        return customers
+
+    return measure(report, max(3, ctx.repeat // 4))
+
+
+def _year_start(ctx) -> date:
+    return ctx.dataset.spec.anchor_date.replace(month=1, day=1)
+
+
+@benchmark("breakdown.subtotal_columns", "reports")
+def bench_breakdown_columns(ctx):
+    """Year-to-date labor/parts/tax from the denormalized columns."""
+    InvoiceSubtotalBackfill(ctx.db_manager.get_session).run()  # datasets made before the columns
+    uid, start = ctx.dataset.primary_user_id, _year_start(ctx)
+    return measure(lambda: ctx.invoice_service.get_revenue_breakdown(uid, start=start), ctx.repeat)
+
+
+@benchmark("breakdown.line_item_scan", "reports")
+def bench_breakdown_line_items(ctx):
+    """Baseline: the same sums by decoding every invoice's line items."""
+    uid, start = ctx.dataset.primary_user_id, _year_start(ctx)
+
+    def breakdown():
+        sums = [Decimal("0")] * 3
+        with ctx.db_manager.get_session() as session:
+            rows = session.execute(
+                select(Invoice.line_items).where(
+                    Invoice.user_id == uid, Invoice.issued_date >= start, Invoice.status == "paid"
+                )
+            )
+            for (items,) in rows:
+                sums = [a + b for a, b in zip(sums, Invoice(line_items=items).calculate_breakdown())]
+        return sums
+
+    return measure(breakdown, max(3, ctx.repeat // 4))
+
+
+def _recompute_line_items(ctx) -> list:
+    if "recompute" not in ctx.extra:
+        with ctx.db_manager.get_session() as session:
+            ctx.extra["recompute"] = (
+                session.execute(select(Invoice.line_items).order_by(Invoice.id).limit(RECOMPUTE_INVOICES))
+                .scalars()
+                .all()
+            )
+    return ctx.extra["recompute"]
+
+
+@benchmark("money.recompute_cents", "money")
+def bench_recompute_cents(ctx):
+    """Total and breakdown of each invoice in integer cents (``recompute-totals``)."""
+    batch = _recompute_line_items(ctx)
+    timings = measure(lambda: [invoice_cents(items) for items in batch], max(3, ctx.repeat // 4))
+    return BenchmarkResult("", "", timings, metrics={"invoices": len(batch)})
+
+
+@benchmark("money.recompute_decimal", "money")
+def bench_recompute_decimal(ctx):
+    """Baseline: the same totals through ``Decimal(str(x))`` per value."""
+    batch = _recompute_line_items(ctx)
+    cent = Decimal("0.01")
+
+    def totals(items):
+        labor = parts = tax = Decimal("0")
+        for item in items or []:
+            line_labor = Decimal(str(item.get("hours", item.get("quantity", 0)))) * Decimal(str(item.get("rate", 0)))
+            line_parts = Decimal(str(item.get("parts", 0)))
+            labor += line_labor
+            parts += line_parts
+            tax += (line_labor + line_parts) * Decimal(str(item.get("tax", 0))) / Decimal("100")
+        total = (labor + parts + tax).quantize(cent, ROUND_HALF_UP)
+        labor, parts = labor.quantize(cent, ROUND_HALF_UP), parts.quantize(cent, ROUND_HALF_UP)
+        return total, labor, parts, total - labor - parts
+
+    timings = measure(lambda: [totals(items) for items in batch], max(3, ctx.repeat // 4))
+    return BenchmarkResult("", "", timings, metrics={"invoices": len(batch)})
+
+
+def _analytics_reports(facts):
+    """The reports the Reports tab derives from a user's invoice facts."""
+    return (
+        facts.revenue_trend(),
+        facts.customer_totals(limit=20),
+        facts.days_to_pay(),
+        facts.labor_rates(),
+    )
+
+
+@benchmark("analytics.numpy_load", "reports")
+def bench_analytics_load(ctx):
+    """First Reports tab visit: every invoice of the user into arrays, then the reports."""
+    analytics = InvoiceAnalytics(ctx.db_manager.get_session)
+    uid = ctx.dataset.primary_user_id
+
+    def load():
+        analytics.invalidate()
+        return _analytics_reports(analytics.facts(uid))
+
+    timings = measure(load, max(3, ctx.repeat // 4))
+    return BenchmarkResult("", "", timings, metrics={"invoices": len(analytics.facts(uid))})
+
+
+@benchmark("analytics.numpy_refresh", "reports")
+def bench_analytics_refresh(ctx):
+    """Later visits: watermark refresh with nothing changed, then the reports."""
+    analytics = InvoiceAnalytics(ctx.db_manager.get_session)
+    uid = ctx.dataset.primary_user_id
+    analytics.facts(uid)
+    return measure(lambda: _analytics_reports(analytics.facts(uid)), ctx.repeat)
+
+
+@benchmark("analytics.python_scan", "reports")
+def bench_analytics_python(ctx):
+    """Baseline: the same reports from one pass over freshly fetched rows."""
+    uid = ctx.dataset.primary_user_id
+
+    def reports():
+        months, customers = defaultdict(Decimal), defaultdict(Decimal)
+        days, rates = [], []
+        with ctx.db_manager.get_session() as session:
+            rows = session.execute(
+                select(
+                    Invoice.customer_id,
+                    Invoice.issued_date,
+                    Invoice.paid_date,
+                    Invoice.total,
+                    Invoice.status,
+                    Invoice.line_items,
+                ).where(Invoice.user_id == uid)
+            )
+            for customer_id, issued, paid, total, status, items in rows:
+                if status == "paid":
+                    months[issued.replace(day=1)] += total
+                    customers[customer_id] += total
+                    if paid is not None:
+                        days.append((paid - issued).days)
+                rates.extend(item["rate"] for item in items or () if item.get("hours", 0) > 0 and item.get("rate", 0) > 0)
+        top = sorted(customers.items(), key=lambda entry: entry[1], reverse=True)[:20]
+        return sorted(months.items()), top, statistics.quantiles(days, n=4), statistics.quantiles(rates, n=4)
+
+    return measure(reports, max(3, ctx.repeat // 4))
@@ -0,0 +1,694 @@
+"""Benchmarks for the services layer and both PDF rendering paths."""
+
+from __future__ import annotations
+
+import csv
+import json
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import delete, insert, select
+
+from automotive_invoice_manager.backend.database.line_items import decode_line_items, encode_line_items
+from automotive_invoice_manager.backend.database.models import Customer, Invoice, User
+from automotive_invoice_manager.services.customer_duplicates import DuplicateFinder
+from automotive_invoice_manager.services.customer_import import CustomerImport
+from automotive_invoice_manager.services.customer_sort import CustomerColumnStore
+from automotive_invoice_manager.services.invoice_prefetch import InvoicePrefetcher
+from automotive_invoice_manager.services.invoice_search import InvoiceSearchCache
+from automotive_invoice_manager.services.validators import CustomerValidator
+
+from .harness import BenchmarkResult, BenchmarkSkipped, benchmark, measure
+
+
+def _uid(ctx) -> int:
+    return ctx.dataset.primary_user_id
+
+
+@benchmark("invoices.page_first", "invoices")
+def bench_invoice_first_page(ctx):
+    return measure(lambda: ctx.invoice_service.get_invoices(_uid(ctx), page=1, per_page=10), ctx.repeat)
+
+
+@benchmark("invoices.page_deep", "invoices")
+def bench_invoice_deep_page(ctx):
+    _items, total_pages = ctx.invoice_service.get_invoices(_uid(ctx), page=1, per_page=10)
+    page = max(1, total_pages // 2)
+    return measure(lambda: ctx.invoice_service.get_invoices(_uid(ctx), page=page, per_page=10), ctx.repeat)
+
+
+@benchmark("invoices.search_customer", "invoices")
+def bench_invoice_search_customer(ctx):
+    term = ctx.dataset.customer_terms[0]
+    return measure(lambda: ctx.invoice_service.get_invoices(_uid(ctx), search=term), ctx.repeat)
+
+
+@benchmark("invoices.search_number", "invoices")
+def bench_invoice_search_number(ctx):
+    term = ctx.dataset.invoice_terms[-1]
+    return measure(lambda: ctx.invoice_service.get_invoices(_uid(ctx), search=term), ctx.repeat)
+
+
+@benchmark("invoices.filter_status", "invoices")
+def bench_invoice_filter_status(ctx):
+    return measure(lambda: ctx.invoice_service.get_invoices(_uid(ctx), status="sent"), ctx.repeat)
+
+
+@benchmark("invoices.filter_overdue", "invoices")
+def bench_invoice_filter_overdue(ctx):
+    return measure(lambda: ctx.invoice_service.get_invoices(_uid(ctx), status="overdue"), ctx.repeat)
+
+
+@benchmark("customers.search_all", "customers")
+def bench_customer_search_all(ctx):
+    return measure(lambda: ctx.customer_service.search_customers(_uid(ctx), ""), ctx.repeat)
+
+
+@benchmark("customers.search_term", "customers")
+def bench_customer_search_term(ctx):
+    term = ctx.dataset.customer_terms[1]
+    return measure(lambda: ctx.customer_service.search_customers(_uid(ctx), term), ctx.repeat)
+
+
+def _front_desk_phone(ctx) -> tuple[str, str]:
+    """A stored phone number of the primary user, and the digits typed as ``555-123-4567``."""
+    with ctx.db_manager.get_session() as session:
+        phone = session.scalar(
+            select(Customer.phone).where(Customer.user_id == _uid(ctx), Customer.phone.is_not(None)).limit(1)
+        )
+    if phone is None:
+        raise BenchmarkSkipped("no customer has a phone number")
+    digits = "".join(c for c in phone if c.isdigit())[-10:]
+    return phone, f"{digits[:3]}-{digits[3:6]}-{digits[6:]}"
+
+
+@benchmark("customers.search_phone", "customers")
+def bench_customer_search_phone(ctx):
+    """Phone lookup typed in another format, matched against ``phone_digits``."""
+    _, typed = _front_desk_phone(ctx)
+    return measure(lambda: ctx.customer_service.search_customers(_uid(ctx), typed), ctx.repeat)
+
+
+@benchmark("customers.search_phone_scan", "customers")
+def bench_customer_search_phone_scan(ctx):
+    """Baseline: the ``phone ILIKE '%...%'`` scan, given the number exactly as stored."""
+    stored, _ = _front_desk_phone(ctx)
+    uid = _uid(ctx)
+
+    def scan():
+        with ctx.db_manager.get_session() as session:
+            return session.scalars(
+                select(Customer).where(Customer.user_id == uid, Customer.phone.ilike(f"%{stored}%"))
+            ).all()
+
+    return measure(scan, ctx.repeat)
+
+
+def _list_read(ctx, func):
+    """Time ``func`` and record the rows it returns and its peak heap use."""
+    timings = measure(func, max(3, ctx.repeat // 4))
+    tracemalloc.start()
+    try:
+        rows = func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return BenchmarkResult("", "", timings, metrics={"rows": len(rows), "peak_kib": peak // 1024})
+
+
+@benchmark("lists.invoice_entities_10k", "lists")
+def bench_list_invoice_entities(ctx):
+    """10k invoices as ORM entities (``get_invoices``)."""
+    return _list_read(ctx, lambda: ctx.invoice_service.get_invoices(_uid(ctx), per_page=10_000)[0])
+
+
+@benchmark("lists.invoice_rows_10k", "lists")
+def bench_list_invoice_rows(ctx):
+    """10k invoices as ``InvoiceRow`` tuples (``get_invoice_rows``)."""
+    return _list_read(ctx, lambda: ctx.invoice_service.get_invoice_rows(_uid(ctx), per_page=10_000)[0])
+
+
+@benchmark("lists.customer_entities_with_stats", "lists")
+def bench_list_customer_entities(ctx):
+    """Customer list as before: entities plus one stats query per customer."""
+    uid = _uid(ctx)
+
+    def load():
+        customers = ctx.customer_service.search_customers(uid, "")
+        return [(c, ctx.customer_service.get_customer_stats(c.id)) for c in customers]
+
+    return _list_read(ctx, load)
+
+
+@benchmark("lists.customer_rows", "lists")
+def bench_list_customer_rows(ctx):
+    """Customer list as ``CustomerRow`` tuples with aggregated stats."""
+    return _list_read(ctx, lambda: ctx.customer_service.search_customer_rows(_uid(ctx), ""))
+
+
+_SORT_CLICKS = ("name", "total_billed", "total_billed", "invoices", "created", "email", "name")
+
+
+@benchmark("sort.customer_header_query", "sort")
+def bench_sort_customer_header_query(ctx):
+    """Customer header clicks that re-run ``search_customer_rows`` each time."""
+    uid = _uid(ctx)
+    timings = []
+    for _ in range(max(1, ctx.repeat // 5)):
+        for column in _SORT_CLICKS:
+            started = time.perf_counter()
+            ctx.customer_service.search_customer_rows(uid, "", sort_by=column)
+            timings.append(time.perf_counter() - started)
+    return BenchmarkResult("", "", timings)
+
+
+@benchmark("sort.customer_header_memory", "sort")
+def bench_sort_customer_header_memory(ctx):
+    """Customer header clicks reordered from a :class:`CustomerColumnStore`.
+
+    Building the store is part of the initial load and is not counted.
+    """
+    store = CustomerColumnStore(ctx.customer_service.search_customer_rows(_uid(ctx), ""))
+    timings = []
+    for _ in range(max(1, ctx.repeat // 5)):
+        for index, column in enumerate(_SORT_CLICKS):
+            started = time.perf_counter()
+            store.order(column, reverse=index % 2 == 1)
+            timings.append(time.perf_counter() - started)
+    return BenchmarkResult("", "", timings, metrics={"rows": len(store)})
+
+
+def _keystrokes(term: str) -> list[str]:
+    """Successive search box contents while typing ``term``, one backspace and retyping it."""
+    typed = [term[:i] for i in range(1, len(term) + 1)]
+    return typed + [term[:-1], term]
+
+
+def _per_keystroke(ctx, search) -> BenchmarkResult:
+    """Time ``search(text)`` for every keystroke of the dataset's customer terms."""
+    timings, db_hits = [], 0
+    for _ in range(max(1, ctx.repeat // 5)):
+        for term in ctx.dataset.customer_terms:
+            for text in _keystrokes(term):
+                started = time.perf_counter()
+                db_hits += search(text)
+                timings.append(time.perf_counter() - started)
+    return BenchmarkResult("", "", timings, metrics={"db_queries": db_hits})
+
+
+@benchmark("search.keystroke_query", "search")
+def bench_search_keystroke_query(ctx):
+    """Live search that re-queries (page + count) on every keystroke."""
+    uid = _uid(ctx)
+
+    def search(text):
+        ctx.invoice_service.get_invoice_rows(uid, page=1, per_page=10, search=text)
+        return 1
+
+    return _per_keystroke(ctx, search)
+
+
+@benchmark("search.keystroke_narrowing", "search")
+def bench_search_keystroke_narrowing(ctx):
+    """Live search as ``InvoiceListFrame`` does it, narrowing in memory when possible."""
+    uid = _uid(ctx)
+    cache = InvoiceSearchCache()
+    filters = (None, False)
+
+    def search(text):
+        if cache.narrow(text, filters) is not None:
+            return 0
+        rows, truncated = ctx.invoice_service.search_invoice_rows(uid, text)
+        cache.store(text, filters, rows, truncated)
+        if truncated:
+            ctx.invoice_service.get_invoice_rows(uid, page=1, per_page=10, search=text)
+        return 1
+
+    return _per_keystroke(ctx, search)
+
+
+@benchmark("prefetch.page_turns", "prefetch")
+def bench_prefetch_page_turns(ctx):
+    """Blocking time per Next/Prev click with neighbour pages prefetched.
+
+    Between clicks the prefetches are allowed to finish (user think time),
+    which is not counted.
+    """
+    uid = _uid(ctx)
+    filters = ("", None, False)
+    prefetcher = InvoicePrefetcher(ctx.invoice_service)
+    _rows, total_pages = ctx.invoice_service.get_invoice_rows(uid, page=1, per_page=10)
+    pages = list(range(2, min(total_pages, ctx.repeat + 2) + 1))
+    pages += pages[-2::-1]  # forward, then back again
+    timings = []
+    for page in pages:
+        started = time.perf_counter()
+        result = prefetcher.get_page(uid, filters, page, 10)
+        if result is None:
+            result = ctx.invoice_service.get_invoice_rows(uid, page=page, per_page=10)
+        prefetcher.prefetch_pages(uid, filters, page, result[1], 10)
+        timings.append(time.perf_counter() - started)
+        prefetcher.wait()
+    return BenchmarkResult("", "", timings, metrics=prefetcher.hit_rate())
+
+
+@benchmark("dashboard.counts", "dashboard")
+def bench_dashboard_counts(ctx):
+    """The calls made by ``DashboardView.gather_statistics`` on each refresh."""
+    uid = _uid(ctx)
+
+    def refresh():
+        ctx.customer_service.get_customer_count(uid)
+        ctx.invoice_service.get_invoice_count(uid)
+        ctx.invoice_service.get_pending_count(uid)
+        ctx.invoice_service.get_overdue_count(uid)
+
+    return measure(refresh, ctx.repeat)
+
+
+@benchmark("dashboard.overdue_count", "dashboard")
+def bench_dashboard_overdue_count(ctx):
+    return measure(lambda: ctx.invoice_service.get_overdue_count(_uid(ctx)), ctx.repeat)
+
+
+@benchmark("dashboard.revenue", "dashboard")
+def bench_dashboard_revenue(ctx):
+    return measure(lambda: ctx.invoice_service.get_total_revenue(_uid(ctx)), ctx.repeat)
+
+
+@benchmark("invoices.create", "invoices")
+def bench_invoice_create(ctx):
+    customer = ctx.customer_service.search_customers(_uid(ctx), "")[0]
+    today = date.today()
+    counter = iter(range(1_000_000))
+
+    def create():
+        ctx.invoice_service.create_invoice(
+            ctx.user,
+            {
+                "customer": customer.name,
+                "invoice_number": f"BENCH-{next(counter):07d}",
+                "issued_date": today,
+                "due_date": today + timedelta(days=30),
+                "line_items": [
+                    {"description": "Diagnostic scan", "hours": 1, "rate": 110, "parts": 0, "tax": 7},
+                    {"description": "Brake pad replacement", "hours": 1.5, "rate": 110, "parts": 129.5, "tax": 7},
+                ],
+            },
+        )
+
+    try:
+        return measure(create, ctx.repeat)
+    finally:
+        with ctx.db_manager.get_session() as session:
+            session.execute(delete(Invoice).where(Invoice.invoice_number.like("BENCH-%")))
+
+
+@benchmark("invoices.create_autonumber", "invoices")
+def bench_invoice_create_autonumber(ctx):
+    """Create with a generated number (hi-lo allocator, no pre-check)."""
+    customer = ctx.customer_service.search_customers(_uid(ctx), "")[0]
+    today = date.today()
+    created = []
+
+    def create():
+        invoice = ctx.invoice_service.create_invoice(
+            ctx.user,
+            {
+                "customer": customer.name,
+                "issued_date": today,
+                "due_date": today + timedelta(days=30),
+                "line_items": [{"description": "Oil change", "hours": 0.5, "rate": 110, "parts": 39, "tax": 7}],
+            },
+        )
+        created.append(invoice.id)
+
+    try:
+        return measure(create, ctx.repeat)
+    finally:
+        with ctx.db_manager.get_session() as session:
+            session.execute(delete(Invoice).where(Invoice.id.in_(created)))
+
+
+def _new_invoice_action(ctx, unit_of_work: bool):
+    """``new_invoice`` + save + dashboard refresh, as one UI action performs it."""
+    uid = _uid(ctx)
+    today = date.today()
+    created = []
+
+    def action():
+        names = ctx.invoice_service.customer_index.names(uid)
+        invoice = ctx.invoice_service.create_invoice(
+            ctx.user,
+            {
+                "customer": names[0],
+                "issued_date": today,
+                "due_date": today + timedelta(days=30),
+                "line_items": [{"description": "Oil change", "hours": 0.5, "rate": 110, "parts": 39, "tax": 7}],
+            },
+        )
+        created.append(invoice.id)
+        ctx.customer_service.get_customer_count(uid)
+        ctx.invoice_service.get_invoice_count(uid)
+        ctx.invoice_service.get_pending_count(uid)
+        ctx.invoice_service.get_overdue_count(uid)
+
+    def run():
+        if unit_of_work:
+            with ctx.db_manager.unit_of_work():
+                action()
+        else:
+            action()
+
+    try:
+        return measure(run, ctx.repeat)
+    finally:
+        with ctx.db_manager.get_session() as session:
+            session.execute(delete(Invoice).where(Invoice.id.in_(created)))
+
+
+@benchmark("action.new_invoice", "action")
+def bench_action_new_invoice(ctx):
+    return _new_invoice_action(ctx, unit_of_work=False)
+
+
+@benchmark("action.new_invoice_unit_of_work", "action")
+def bench_action_new_invoice_unit_of_work(ctx):
+    return _new_invoice_action(ctx, unit_of_work=True)
+
+
+def _heavy_invoice(ctx):
+    invoice = ctx.invoice_service.get_invoice_by_number(_uid(ctx), ctx.dataset.heavy_invoice_number)
+    if invoice is None:
+        raise BenchmarkSkipped("dataset has no invoices")
+    return ctx.invoice_service.get_invoice(invoice.id)  # with line items
+
+
+def _reportlab_pdf(ctx, name, logo):
+    try:
+        import reportlab  # noqa: F401
+    except ImportError as exc:
+        raise BenchmarkSkipped(f"ReportLab unavailable: {exc}")
+    from automotive_invoice_manager.services.pdf_service import PDFService
+
+    invoice = _heavy_invoice(ctx)
+    service = PDFService(ctx.db_manager, logo=logo)
+    output = ctx.workdir / "bench_reportlab.pdf"
+    timings = measure(lambda: service.generate_invoice_pdf(invoice.id, str(output)), max(3, ctx.repeat // 4))
+    return BenchmarkResult(
+        name,
+        "pdf",
+        timings,
+        metrics={"line_items": len(invoice.line_items or []), "pdf_bytes": output.stat().st_size},
+    )
+
+
+def _print_logo(ctx):
+    from automotive_invoice_manager.utils.logo_assets import LOGO_PATH, prepare_logo
+
+    if not LOGO_PATH.exists():
+        raise BenchmarkSkipped("assets/logo.png not found")
+    return LOGO_PATH, prepare_logo(LOGO_PATH, ctx.workdir / "print")
+
+
+@benchmark("pdf.reportlab", "pdf")
+def bench_pdf_reportlab(ctx):
+    """Invoice PDF with the pre-scaled, palette print logo."""
+    _source, prepared = _print_logo(ctx)
+    return _reportlab_pdf(ctx, "pdf.reportlab", prepared)
+
+
+@benchmark("pdf.reportlab_raw_logo", "pdf")
+def bench_pdf_reportlab_raw_logo(ctx):
+    """Same PDF embedding the uploaded original at the same drawn size."""
+    from PIL import Image
+
+    from automotive_invoice_manager.utils.logo_assets import LogoAsset
+
+    source, prepared = _print_logo(ctx)
+    with Image.open(source) as img:
+        width, height = img.size
+    raw = LogoAsset(str(source), width, height, dpi=round(width * prepared.dpi / prepared.width_px))
+    return _reportlab_pdf(ctx, "pdf.reportlab_raw_logo", raw)
+
+
+@benchmark("pdf.weasyprint", "pdf")
+def bench_pdf_weasyprint(ctx):
+    try:
+        from automotive_invoice_manager.utils import pdf_generator
+    except (ImportError, OSError) as exc:
+        # WeasyPrint raises OSError when its native Pango libraries are missing.
+        raise BenchmarkSkipped(f"WeasyPrint unavailable: {exc}")
+    from automotive_invoice_manager.utils.config import Config
+
+    invoice = ctx.invoice_service.get_invoice(_heavy_invoice(ctx).id)
+    previous_dir = Config.PDF_OUTPUT_DIR
+    Config.PDF_OUTPUT_DIR = str(ctx.workdir)
+    try:
+        output = ctx.workdir / "bench_weasyprint.pdf"
+        timings = measure(
+            lambda: pdf_generator.generate_pdf(invoice, "standard", str(output)),
+            max(3, ctx.repeat // 4),
+        )
+    finally:
+        Config.PDF_OUTPUT_DIR = previous_dir
+    return BenchmarkResult(
+        "pdf.weasyprint",
+        "pdf",
+        timings,
+        metrics={"line_items": len(invoice.line_items or []), "pdf_bytes": output.stat().st_size},
+    )
+
+
+# Invoices whose stored line items are decoded by the line_items benchmarks
+DECODE_INVOICES = 20_000
+
+
+def _stored_line_items(ctx) -> list:
+    """Line items of the first invoices, each as legacy JSON and binary."""
+    if "line_items" not in ctx.extra:
+        with ctx.db_manager.get_session() as session:
+            batch = (
+                session.execute(select(Invoice.line_items).order_by(Invoice.id).limit(DECODE_INVOICES))
+                .scalars()
+                .all()
+            )
+        ctx.extra["line_items"] = (
+            [json.dumps(items) for items in batch],
+            [encode_line_items(items) for items in batch],
+        )
+    return ctx.extra["line_items"]
+
+
+@benchmark("line_items.decode_json", "line_items")
+def bench_line_items_decode_json(ctx):
+    """Baseline: ``json.loads`` of the JSON text column."""
+    stored, _encoded = _stored_line_items(ctx)
+    timings = measure(lambda: [json.loads(value) for value in stored], max(3, ctx.repeat // 4))
+    return BenchmarkResult("", "", timings, metrics={"bytes": sum(len(value.encode()) for value in stored)})
+
+
+@benchmark("line_items.decode_binary", "line_items")
+def bench_line_items_decode_binary(ctx):
+    """Decoding the same line items from the binary column format."""
+    _stored, encoded = _stored_line_items(ctx)
+    timings = measure(lambda: [decode_line_items(value) for value in encoded], max(3, ctx.repeat // 4))
+    return BenchmarkResult("", "", timings, metrics={"bytes": sum(map(len, encoded))})
+
+
+# Rows in the generated customer CSV; the one-by-one baseline creates fewer
+IMPORT_ROWS = 50_000
+IMPORT_BASELINE_ROWS = 2_000
+
+
+def _import_csv(ctx):
+    """A customer CSV with every tenth row invalid or a duplicate."""
+    path = ctx.workdir / f"customers_{IMPORT_ROWS}.csv"
+    if not path.exists():
+        with open(path, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(("Name", "Email", "Phone", "Address", "Notes"))
+            for n in range(IMPORT_ROWS):
+                number = n - 1 if n % 20 == 10 else n
+                email = "broken-address" if n % 20 == 0 else f"customer{number}@import.bench"
+                writer.writerow(
+                    (f"Import Customer {n:06d}", email, f"555-{number // 10000:03d}-{number % 10000:04d}", "", "")
+                )
+    return path
+
+
+def _import_user(ctx, label: str) -> int:
+    with ctx.db_manager.get_session() as session:
+        return session.execute(
+            insert(User).values(
+                email=f"{label}-{time.time_ns()}@bench.local", password_hash="x", created_at=datetime.utcnow()
+            )
+        ).inserted_primary_key[0]
+
+
+def _drop_import_users(ctx, user_ids) -> None:
+    with ctx.db_manager.get_session() as session:
+        session.execute(delete(Customer).where(Customer.user_id.in_(user_ids)))
+        session.execute(delete(User).where(User.id.in_(user_ids)))
+
+
+@benchmark("customers.import_csv", "customers")
+def bench_customer_import(ctx):
+    """Streaming import: batched validation, hash de-duplication, 1000-row inserts."""
+    path = _import_csv(ctx)
+    importer = CustomerImport(ctx.db_manager.get_session)
+    users, reports = [], []
+
+    def run():
+        users.append(_import_user(ctx, "import"))
+        reports.append(importer.run(users[-1], path))
+
+    try:
+        timings = measure(run, max(3, ctx.repeat // 4))
+    finally:
+        _drop_import_users(ctx, users)
+    report = reports[-1]
+    return BenchmarkResult(
+        "",
+        "",
+        timings,
+        metrics={
+            "rows": report.rows,
+            "imported": report.imported,
+            "rows_per_s": round(report.rows / min(timings)),
+        },
+    )
+
+
+@benchmark("customers.import_one_by_one", "customers")
+def bench_customer_import_one_by_one(ctx):
+    """Baseline: validate and ``create_customer`` each row in its own transaction."""
+    path = _import_csv(ctx)
+    with open(path, newline="", encoding="utf-8") as handle:
+        rows = [
+            {key.lower(): value or None for key, value in row.items()}
+            for _, row in zip(range(IMPORT_BASELINE_ROWS), csv.DictReader(handle))
+        ]
+    validator = CustomerImport().validator
+    users = []
+
+    def run():
+        users.append(_import_user(ctx, "import-baseline"))
+        for row in rows:
+            if validator.validate_customer_data(row)[0]:
+                ctx.customer_service.create_customer(row, users[-1])
+
+    try:
+        timings = measure(run, 3, warmup=0)
+    finally:
+        _drop_import_users(ctx, users)
+    return BenchmarkResult(
+        "", "", timings, metrics={"rows": len(rows), "rows_per_s": round(len(rows) / min(timings))}
+    )
+
+
+# Rows validated by the validation benchmarks (no database involved)
+VALIDATE_ROWS = 1_000_000
+
+
+def _validation_rows() -> dict:
+    """Column-wise customers drawn from a few shops' domains and area codes, 1 in 50 invalid."""
+    domains = ("gmail.com", "yahoo.com", "outlook.com", "shop-mail.net", "example.org")
+    columns = {"name": [], "email": [], "phone": [], "address": [], "notes": []}
+    for n in range(VALIDATE_ROWS):
+        columns["name"].append(f"Customer {n}" if n % 50 else " ")
+        columns["email"].append(f"customer.{n}@{domains[n % 5]}" if n % 50 != 25 else f"customer {n}@x")
+        columns["phone"].append(f"({555 + n % 7}) {n // 10000 % 1000:03d}-{n % 10000:04d}" if n % 3 else None)
+        columns["address"].append(f"{n} Main St" if n % 2 else None)
+        columns["notes"].append(None)
+    return columns
+
+
+def _cached_validation_rows(ctx) -> dict:
+    if "validation_rows" not in ctx.extra:
+        ctx.extra["validation_rows"] = _validation_rows()
+    return ctx.extra["validation_rows"]
+
+
+@benchmark("customers.validate_per_dict", "customers")
+def bench_customer_validate_per_dict(ctx):
+    """Baseline: ``validate_customer_data`` on one dict per row."""
+    columns = _cached_validation_rows(ctx)
+    rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+    validator = CustomerValidator()
+    invalid = []
+
+    def run():
+        invalid.append(sum(not validator.validate_customer_data(row)[0] for row in rows))
+
+    timings = measure(run, 3, warmup=0)
+    return BenchmarkResult(
+        "",
+        "",
+        timings,
+        metrics={"rows": len(rows), "invalid": invalid[-1], "rows_per_s": round(len(rows) / min(timings))},
+    )
+
+
+@benchmark("customers.validate_many", "customers")
+def bench_customer_validate_many(ctx):
+    """Column-wise ``validate_many`` returning an error byte per row."""
+    columns = _cached_validation_rows(ctx)
+    validator = CustomerValidator()
+    invalid = []
+
+    def run():
+        invalid.append(len(columns["name"]) - validator.validate_many(columns).count(0))
+
+    timings = measure(run, 3)
+    return BenchmarkResult(
+        "",
+        "",
+        timings,
+        metrics={"rows": VALIDATE_ROWS, "invalid": invalid[-1], "rows_per_s": round(VALIDATE_ROWS / min(timings))},
+    )
+
+
+# Customers scored pair by pair in the all-pairs baseline
+DUPLICATE_BASELINE_CUSTOMERS = 2_000
+
+
+@benchmark("customers.duplicates_blocked", "customers")
+def bench_customer_duplicates_blocked(ctx):
+    """Duplicate scan of every customer: blocking keys plus sorted neighbourhood."""
+    finder = DuplicateFinder(ctx.db_manager.get_session)
+    scans = []
+    timings = measure(lambda: scans.append(finder.scan(_uid(ctx))), 3)
+    scan = scans[-1]
+    return BenchmarkResult(
+        "",
+        "",
+        timings,
+        metrics={
+            "customers": scan.customers,
+            "compared": scan.compared,
+            "all_pairs": scan.all_pairs,
+            "duplicates": len(scan.pairs),
+        },
+    )
+
+
+@benchmark("customers.duplicates_all_pairs", "customers")
+def bench_customer_duplicates_all_pairs(ctx):
+    """Baseline: score every pair of the first customers, without blocking."""
+    finder = DuplicateFinder(ctx.db_manager.get_session, blocking=False)
+    scans = []
+    timings = measure(lambda: scans.append(finder.scan(_uid(ctx), limit=DUPLICATE_BASELINE_CUSTOMERS)), 3, warmup=0)
+    scan = scans[-1]
+    return BenchmarkResult(
+        "",
+        "",
+        timings,
+        metrics={
+            "customers": scan.customers,
+            "compared": scan.compared,
+            "pairs_per_s": round(scan.compared / min(timings)),
+            "duplicates": len(scan.pairs),
+        },
+    )
@@ -0,0 +1,4 @@
+"""Headless command suite: ``python -m automotive_invoice_manager.cli``.
+
+Nothing here imports Tk, so the commands run from cron or a plain shell.
+"""
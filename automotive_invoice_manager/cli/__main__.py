@@ -0,0 +1,123 @@
+"""Command line entry point: ``python -m automotive_invoice_manager.cli``.
+
+Examples
+--------
+Render March's invoices with four worker processes::
+
+    python -m automotive_invoice_manager.cli pdfs --user shop@example.com \
+        --since 2024-03-01 --until 2024-03-31 --out pdfs/2024-03 --workers 4
+
+Export to CSV with JSON-lines progress for a cron log::
+
+    python -m automotive_invoice_manager.cli --json export --user shop@example.com --out invoices.csv
+
+Check a customer list from another system, then import it::
+
+    python -m automotive_invoice_manager.cli import-customers --user shop@example.com \
+        --file customers.csv --dry-run --errors import_errors.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import logging
+import os
+import sys
+
+from .common import CommandError, parse_date
+
+# Subcommand -> "module:function"; modules are imported only when used.
+COMMANDS = {
+    "pdfs": "pdfs:run",
+    "export": "export:run",
+    "import-customers": "imports:run_customers",
+    "recompute-totals": "totals:run",
+    "subtotals": "totals:run_subtotals",
+    "line-items": "storage:run_line_items",
+    "mark-overdue": "jobs:run_overdue",
+    "archive": "jobs:run_archive",
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m automotive_invoice_manager.cli",
+        description="Run bulk invoice operations without the desktop UI.",
+    )
+    parser.add_argument("--db", help="database URL or SQLite file (default: DATABASE_URL)")
+    parser.add_argument("--json", action="store_true", help="emit progress and summary as JSON lines")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log at INFO level")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    pdfs = sub.add_parser("pdfs", help="generate invoice PDFs")
+    pdfs.add_argument("--user", required=True, help="owner's email")
+    pdfs.add_argument("--status", help="only invoices with this status")
+    pdfs.add_argument("--since", type=parse_date, help="issued on or after (YYYY-MM-DD)")
+    pdfs.add_argument("--until", type=parse_date, help="issued on or before (YYYY-MM-DD)")
+    pdfs.add_argument("--out", default="generated_pdfs", help="output directory")
+    pdfs.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes")
+
+    export = sub.add_parser("export", help="export invoices to CSV")
+    export.add_argument("--user", required=True, help="owner's email")
+    export.add_argument("--since", type=parse_date, help="issued on or after (YYYY-MM-DD)")
+    export.add_argument("--until", type=parse_date, help="issued on or before (YYYY-MM-DD)")
+    export.add_argument("--include-archive", action="store_true", help="include archived invoices")
+    export.add_argument("--out", required=True, help="CSV file to write")
+
+    customers = sub.add_parser("import-customers", help="import customers from CSV")
+    customers.add_argument("--user", required=True, help="owner's email")
+    customers.add_argument("--file", required=True, help="CSV file with a Name column")
+    customers.add_argument("--dry-run", action="store_true", help="validate and de-duplicate without writing")
+    customers.add_argument("--errors", help="write the rejected rows to this CSV file")
+    customers.add_argument("--batch-size", type=int, default=1000, help="rows per insert transaction")
+
+    totals = sub.add_parser("recompute-totals", help="recompute invoice totals from line items")
+    totals.add_argument("--user", help="only this owner's invoices")
+    totals.add_argument("--dry-run", action="store_true", help="report changes without writing")
+
+    subtotals = sub.add_parser("subtotals", help="backfill and check the labor/parts/tax columns")
+    subtotals.add_argument("--user", help="only this owner's invoices")
+    subtotals.add_argument("--check", action="store_true", help="only report missing or inconsistent rows")
+    subtotals.add_argument("--deep", action="store_true", help="also recompute every row from its line items")
+
+    line_items = sub.add_parser("line-items", help="rewrite JSON line items in the binary format")
+    line_items.add_argument("--check", action="store_true", help="only count rows still stored as JSON")
+    line_items.add_argument("--vacuum", action="store_true", help="VACUUM the SQLite file afterwards")
+
+    overdue = sub.add_parser("mark-overdue", help="run the overdue status job")
+    overdue.add_argument("--today", type=parse_date, help="business date (default: today)")
+
+    archive = sub.add_parser("archive", help="move old paid invoices to the archive")
+    archive.add_argument("--user", help="only this owner's invoices")
+    archive.add_argument("--before", type=parse_date, help="archive paid invoices issued before this date")
+    archive.add_argument("--after-days", type=int, help="override INVOICE_ARCHIVE_AFTER_DAYS")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+    if args.db:
+        # Must happen before any module creates the DatabaseManager singleton
+        url = args.db if "://" in args.db else f"sqlite:///{os.path.abspath(args.db)}"
+        os.environ["DATABASE_URL"] = url
+
+    from automotive_invoice_manager.backend.database.models import init_database
+
+    from .reporting import Reporter
+
+    init_database()  # creates tables and indexes added since the file was made
+
+    module_name, func_name = COMMANDS[args.command].split(":")
+    command = getattr(importlib.import_module(f".{module_name}", __package__), func_name)
+    reporter = Reporter(args.command, json_mode=args.json)
+    try:
+        return command(args, reporter)
+    except CommandError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,25 @@
+"""Helpers shared by several CLI commands."""
+
+from __future__ import annotations
+
+from datetime import date
+
+
+class CommandError(Exception):
+    """A user-facing CLI error; printed without a traceback."""
+
+
+def parse_date(value: str) -> date:
+    """argparse ``type`` for ISO dates."""
+    return date.fromisoformat(value)
+
+
+def resolve_user_id(session_factory, email: str) -> int:
+    """Return the id of the user with ``email`` or raise :class:`CommandError`."""
+    from automotive_invoice_manager.backend.database.models import User
+
+    with session_factory() as session:
+        user = session.query(User.id).filter_by(email=email.strip().lower()).first()
+    if user is None:
+        raise CommandError(f"No user with email {email}")
+    return user.id
@@ -0,0 +1,74 @@
+"""``export``: stream a user's invoices to CSV without loading them all."""
+
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+from .common import resolve_user_id
+
+FIELDS = ("invoice_number", "customer", "issued_date", "due_date", "status", "total")
+BATCH_SIZE = 1000
+
+
+def invoice_rows(user_id, since=None, until=None, include_archive=False):
+    """Core SELECT of the exported columns (UNIONed with the archive if asked)."""
+    from sqlalchemy import select, union_all
+
+    from automotive_invoice_manager.backend.database.models import Customer, Invoice
+
+    def rows_from(table):
+        query = (
+            select(
+                table.c.invoice_number,
+                Customer.name.label("customer"),
+                table.c.issued_date,
+                table.c.due_date,
+                table.c.status,
+                table.c.total,
+            )
+            .join(Customer, Customer.id == table.c.customer_id)
+            .where(table.c.user_id == user_id)
+        )
+        if since:
+            query = query.where(table.c.issued_date >= since)
+        if until:
+            query = query.where(table.c.issued_date <= until)
+        return query
+
+    query = rows_from(Invoice.__table__)
+    if include_archive:
+        from automotive_invoice_manager.backend.database.archive import archived_invoices
+
+        query = union_all(query, rows_from(archived_invoices))
+    return query.order_by("issued_date", "invoice_number")
+
+
+def run(args, reporter) -> int:
+    from automotive_invoice_manager.backend.database.connection import DatabaseManager
+
+    db_manager = DatabaseManager.get_instance()
+    user_id = resolve_user_id(db_manager.get_session, args.user)
+    if args.include_archive:
+        from automotive_invoice_manager.services.archive_service import InvoiceArchiver
+
+        InvoiceArchiver(db_manager).attach()
+
+    path = Path(args.out)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    with db_manager.engine.connect() as conn, open(path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(FIELDS)
+        result = conn.execution_options(yield_per=BATCH_SIZE).execute(
+            invoice_rows(user_id, args.since, args.until, args.include_archive)
+        )
+        for batch in result.partitions():
+            writer.writerows(
+                (r.invoice_number, r.customer, r.issued_date, r.due_date, r.status, f"{r.total:.2f}")
+                for r in batch
+            )
+            written += len(batch)
+            reporter.progress(written)
+    reporter.summary(written, output=str(path))
+    return 0
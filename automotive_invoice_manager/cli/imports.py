@@ -0,0 +1,31 @@
+"""``import-customers``: stream customers from a CSV file into the database."""
+
+from __future__ import annotations
+
+from .common import CommandError, resolve_user_id
+
+
+def run_customers(args, reporter) -> int:
+    from automotive_invoice_manager.backend.database.connection import DatabaseManager
+    from automotive_invoice_manager.services.customer_import import CustomerImport
+
+    db_manager = DatabaseManager.get_instance()
+    user_id = resolve_user_id(db_manager.get_session, args.user)
+    importer = CustomerImport(db_manager.get_session, batch_size=args.batch_size)
+    try:
+        report = importer.run(
+            user_id, args.file, dry_run=args.dry_run, progress=lambda report: reporter.progress(report.rows)
+        )
+    except (OSError, ValueError) as e:
+        raise CommandError(str(e)) from e
+    if args.errors:
+        report.write_errors(args.errors)
+    reporter.summary(
+        report.rows,
+        imported=report.imported,
+        duplicates=report.duplicates,
+        invalid=report.invalid,
+        dry_run=report.dry_run,
+        errors=args.errors,
+    )
+    return 1 if report.invalid else 0
@@ -0,0 +1,26 @@
+"""``mark-overdue`` and ``archive``: the app's daily jobs, on demand."""
+
+from __future__ import annotations
+
+
+def run_overdue(args, reporter) -> int:
+    from automotive_invoice_manager.services.overdue_job import OverdueStatusJob
+
+    changed = OverdueStatusJob().run(args.today)
+    reporter.summary(changed)
+    return 0
+
+
+def run_archive(args, reporter) -> int:
+    from automotive_invoice_manager.services.archive_service import InvoiceArchiver
+
+    from .common import resolve_user_id
+
+    archiver = InvoiceArchiver()
+    if args.after_days is not None:
+        archiver.config.after_days = args.after_days
+    user_id = resolve_user_id(archiver.db_manager.get_session, args.user) if args.user else None
+    before = args.before or archiver.cutoff()
+    moved = archiver.archive_paid_invoices(before, user_id)
+    reporter.summary(moved, before=before.isoformat(), archive=archiver.attach())
+    return 0
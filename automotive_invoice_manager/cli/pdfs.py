@@ -0,0 +1,76 @@
+"""``pdfs``: render invoice PDFs in bulk, optionally across worker processes."""
+
+from __future__ import annotations
+
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from .common import resolve_user_id
+
+
+def select_invoices(session_factory, user_id, status=None, since=None, until=None):
+    """Return ``[(id, invoice_number)]`` of the invoices to render."""
+    from automotive_invoice_manager.backend.database.models import Invoice
+
+    with session_factory() as session:
+        query = session.query(Invoice.id, Invoice.invoice_number).filter(Invoice.user_id == user_id)
+        if status:
+            query = query.filter(Invoice.status == status)
+        if since:
+            query = query.filter(Invoice.issued_date >= since)
+        if until:
+            query = query.filter(Invoice.issued_date <= until)
+        return [tuple(row) for row in query.order_by(Invoice.id)]
+
+
+def render(invoice_id: int, output_path: str) -> float:
+    """Render one invoice; returns the seconds taken.  Runs in worker processes."""
+    from automotive_invoice_manager.services.pdf_service import PDFService
+
+    started = time.perf_counter()
+    PDFService().generate_invoice_pdf(invoice_id, output_path)
+    return time.perf_counter() - started
+
+
+def run(args, reporter) -> int:
+    from automotive_invoice_manager.backend.database.connection import DatabaseManager
+
+    session_factory = DatabaseManager.get_instance().get_session
+    user_id = resolve_user_id(session_factory, args.user)
+    invoices = select_invoices(session_factory, user_id, args.status, args.since, args.until)
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    jobs = {invoice_id: str(out_dir / f"invoice_{number}.pdf") for invoice_id, number in invoices}
+
+    timings, failures = [], []
+    if args.workers <= 1:
+        for invoice_id, path in jobs.items():
+            try:
+                timings.append(render(invoice_id, path))
+            except Exception as e:
+                failures.append({"invoice_id": invoice_id, "error": str(e)})
+            reporter.progress(len(timings) + len(failures), len(jobs))
+    else:
+        # spawn: workers open their own database connections (and it is
+        # the only start method on Windows anyway)
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(args.workers, mp_context=context) as pool:
+            futures = {pool.submit(render, invoice_id, path): invoice_id for invoice_id, path in jobs.items()}
+            for future in as_completed(futures):
+                try:
+                    timings.append(future.result())
+                except Exception as e:
+                    failures.append({"invoice_id": futures[future], "error": str(e)})
+                reporter.progress(len(timings) + len(failures), len(jobs))
+
+    reporter.summary(
+        len(timings),
+        timings,
+        failed=len(failures),
+        workers=args.workers,
+        output_dir=str(out_dir),
+        failures=failures[:20],
+    )
+    return 1 if failures else 0
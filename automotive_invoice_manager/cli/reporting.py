@@ -0,0 +1,78 @@
+"""Progress and timing output shared by the CLI commands."""
+
+from __future__ import annotations
+
+import json
+import statistics
+import sys
+import time
+
+
+class Reporter:
+    """Stream progress lines and a final summary to ``stream``.
+
+    In JSON mode every line is a JSON object (``"event": "progress"`` or
+    ``"event": "summary"``) so the output can be piped into other tools.
+    """
+
+    def __init__(self, command: str, json_mode: bool = False, stream=None, interval: float = 0.5) -> None:
+        self.command = command
+        self.json_mode = json_mode
+        self.stream = stream or sys.stdout
+        self.interval = interval
+        self.started = time.perf_counter()
+        self._last_progress = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def _emit(self, event: dict) -> None:
+        if self.json_mode:
+            line = json.dumps(event, default=str)
+        elif event["event"] == "progress":
+            total = f"/{event['total']}" if event.get("total") is not None else ""
+            line = f"[{self.command}] {event['done']}{total} ({event['rate_per_s']:.1f}/s)"
+        else:
+            fields = ", ".join(f"{k}={v}" for k, v in event.items() if k not in ("event", "command"))
+            line = f"[{self.command}] done: {fields}"
+        print(line, file=self.stream, flush=True)
+
+    def progress(self, done: int, total: int | None = None, force: bool = False) -> None:
+        """Report ``done`` of ``total`` items, at most once per ``interval``."""
+        now = time.perf_counter()
+        if not force and now - self._last_progress < self.interval:
+            return
+        self._last_progress = now
+        elapsed = self.elapsed
+        self._emit({
+            "event": "progress",
+            "command": self.command,
+            "done": done,
+            "total": total,
+            "elapsed_s": round(elapsed, 3),
+            "rate_per_s": done / elapsed if elapsed else 0.0,
+        })
+
+    def summary(
+        self, items: int, timings: list[float] | None = None, timings_label: str = "item_ms", **fields
+    ) -> dict:
+        """Emit and return the final summary (``timings`` in seconds)."""
+        elapsed = self.elapsed
+        event = {
+            "event": "summary",
+            "command": self.command,
+            "items": items,
+            "elapsed_s": round(elapsed, 3),
+            "rate_per_s": round(items / elapsed, 1) if elapsed else 0.0,
+        }
+        if timings:
+            ms = sorted(t * 1000 for t in timings)
+            event[timings_label] = {
+                "median": round(statistics.median(ms), 3),
+                "p95": round(ms[min(len(ms) - 1, int(round(0.95 * (len(ms) - 1))))], 3),
+                "max": round(ms[-1], 3),
+            }
+        event.update(fields)
+        self._emit(event)
+        return event
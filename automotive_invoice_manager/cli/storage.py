@@ -0,0 +1,33 @@
+"""``line-items``: rewrite JSON line items in the binary column format."""
+
+from __future__ import annotations
+
+import os
+
+
+def _file_size(session_factory) -> int | None:
+    with session_factory() as session:
+        database = session.get_bind().url.database
+    return os.path.getsize(database) if database and os.path.exists(database) else None
+
+
+def run_line_items(args, reporter) -> int:
+    from automotive_invoice_manager.services.line_item_storage import LineItemRewrite
+
+    rewrite = LineItemRewrite()
+    if args.check:
+        pending = rewrite.pending()
+        reporter.summary(0, pending=pending)
+        return 1 if pending else 0
+    size_before = _file_size(rewrite.session_factory)
+    rewritten = rewrite.run(progress=reporter.progress)
+    if args.vacuum:
+        rewrite.vacuum()
+    reporter.summary(
+        rewritten,
+        pending=rewrite.pending(),
+        vacuumed=args.vacuum,
+        db_bytes_before=size_before,
+        db_bytes_after=_file_size(rewrite.session_factory),
+    )
+    return 0
@@ -0,0 +1,82 @@
+"""``recompute-totals``: re-derive ``Invoice.total`` and its breakdown from line items in chunks.
+
+Amounts are compared and written as integer cents, without building
+Decimals or ORM objects.
+"""
+
+from __future__ import annotations
+
+import time
+
+CHUNK_SIZE = 500
+
+
+def run(args, reporter) -> int:
+    from sqlalchemy import BigInteger, bindparam, update
+
+    from automotive_invoice_manager.backend.database.connection import DatabaseManager
+    from automotive_invoice_manager.backend.database.models import Invoice
+    from automotive_invoice_manager.backend.database.money import cents, invoice_cents
+
+    from .common import resolve_user_id
+
+    session_factory = DatabaseManager.get_instance().get_session
+    user_id = resolve_user_id(session_factory, args.user) if args.user else None
+    amounts = ("total", "labor_subtotal", "parts_subtotal", "tax_amount")
+    statement = (
+        update(Invoice.__table__)
+        .where(Invoice.id == bindparam("row_id"))
+        .values({name: bindparam(f"new_{name}", type_=BigInteger) for name in amounts})
+    )
+
+    scanned = changed = 0
+    last_id = 0
+    timings = []
+    while True:
+        started = time.perf_counter()
+        with session_factory() as session:
+            query = session.query(
+                Invoice.id,
+                Invoice.line_items,
+                *(cents(getattr(Invoice, name)) for name in amounts),
+            ).filter(Invoice.id > last_id)
+            if user_id is not None:
+                query = query.filter(Invoice.user_id == user_id)
+            rows = query.order_by(Invoice.id).limit(CHUNK_SIZE).all()
+            if not rows:
+                break
+            updates = []
+            for row in rows:
+                computed = invoice_cents(row.line_items)
+                if computed != tuple(row[2:]):
+                    updates.append({"row_id": row.id, **{f"new_{name}": value for name, value in zip(amounts, computed)}})
+            if updates and not args.dry_run:
+                session.execute(statement, updates)
+        scanned += len(rows)
+        changed += len(updates)
+        last_id = rows[-1].id
+        timings.append(time.perf_counter() - started)
+        reporter.progress(scanned)
+
+    reporter.summary(scanned, timings, "chunk_ms", changed=changed, dry_run=args.dry_run, chunk_size=CHUNK_SIZE)
+    return 0
+
+
+def run_subtotals(args, reporter) -> int:
+    from automotive_invoice_manager.services.invoice_subtotals import InvoiceSubtotalBackfill
+
+    from .common import resolve_user_id
+
+    backfill = InvoiceSubtotalBackfill()
+    user_id = resolve_user_id(backfill.session_factory, args.user) if args.user else None
+    filled = 0 if args.check else backfill.run(user_id, progress=reporter.progress)
+    check = backfill.check(user_id, deep=args.deep, progress=reporter.progress)
+    reporter.summary(
+        check.checked,
+        filled=filled,
+        missing=check.missing,
+        unbalanced=check.unbalanced,
+        stale=check.stale,
+        examples=check.examples[:10],
+    )
+    return 0 if check.ok else 1
@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+import os
+
+@dataclass
+class ArchiveConfig:
+    """Hot/cold invoice archival options.
+
+    Paid invoices issued more than ``after_days`` ago are moved into a
+    separate SQLite file (``path``; empty means ``<main db>_archive.db`` next
+    to the main database) in transactions of ``chunk_size`` rows.  Archiving
+    is opt-in (``INVOICE_ARCHIVE_ENABLED=1``); archived invoices are read-only.
+    """
+    enabled: bool = os.environ.get("INVOICE_ARCHIVE_ENABLED", "0") not in ("0", "false", "no", "")
+    path: str = os.environ.get("INVOICE_ARCHIVE_PATH", "")
+    after_days: int = int(os.environ.get("INVOICE_ARCHIVE_AFTER_DAYS", "730"))
+    chunk_size: int = 500
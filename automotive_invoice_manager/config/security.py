@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+import os
+
+@dataclass
+class PasswordHashConfig:
+    """Password hashing (PBKDF2-SHA256) options.
+
+    ``iterations`` of 0 means "calibrate on this host": the iteration count is
+    chosen so that one hash takes roughly ``target_ms`` milliseconds, clamped
+    to ``min_iterations``..``max_iterations``.  The floor defaults to the
+    OWASP recommendation for PBKDF2-SHA256.
+    """
+    iterations: int = int(os.environ.get("AUTH_PBKDF2_ITERATIONS", "0"))
+    target_ms: float = float(os.environ.get("AUTH_HASH_TARGET_MS", "300"))
+    min_iterations: int = int(os.environ.get("AUTH_PBKDF2_MIN_ITERATIONS", "600000"))
+    max_iterations: int = 2_000_000
+    salt_length: int = 16
+    # Stored hashes at most this fraction below the calibrated target are
+    # left alone, so timing noise does not rehash on every login.  Stronger
+    # hashes are never rewritten.
+    rehash_tolerance: float = 0.25
@@ -1,14 +1,30 @@
-from .base_service import BaseService
-from .auth_service import AuthManager, AuthService
-from .customer_service import CustomerService
-from .invoice_service import InvoiceService
-from .pdf_service import PDFService
-
-__all__ = [
-    "BaseService",
-    "AuthManager",
-    "AuthService",
-    "CustomerService",
-    "InvoiceService",
-    "PDFService",
-]
+"""Application services.
+
+The classes below are imported on first access, so importing one service
+module (as the headless CLI does) does not load the PDF, imaging and
+analytics dependencies of all the others.
+"""
+
+import importlib
+
+# Public name -> defining module
+_EXPORTS = {
+    "BaseService": "base_service",
+    "AuthManager": "auth_service",
+    "AuthService": "auth_service",
+    "CustomerService": "customer_service",
+    "InvoiceService": "invoice_service",
+    "InvoiceArchiver": "archive_service",
+    "PDFService": "pdf_service",
+    "PasswordHasher": "password_hasher",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,147 @@
+"""Accounts-receivable aging: open invoice balances per customer by days past due.
+
+The bucketing is done by the database: one ``CASE`` on ``due_date`` turns
+each open invoice into a bucket index and ``GROUP BY customer, bucket``
+sums them, reading the ``(user_id, status, due_date)`` index.  Reports are
+cached per user until the next committed invoice write or day rollover.
+
+Invoice writes are noticed through session events, so every in-process
+writer (services, CLI jobs, bulk ``update(Invoice)`` statements) bumps
+:func:`invoice_write_generation`.  Writes by other processes are only
+picked up on the next day or after :meth:`AgingReportCache.invalidate`.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from decimal import Decimal
+from itertools import chain
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from automotive_invoice_manager.backend.database.connection import DatabaseManager
+from automotive_invoice_manager.backend.database.models import Invoice
+
+from .overdue_job import OPEN_STATUSES, OVERDUE
+from .rows import AgingRow
+
+# Statuses whose balance is still owed
+RECEIVABLE_STATUSES = OPEN_STATUSES + (OVERDUE,)
+
+# Upper bound (days past due, inclusive) of every bucket but the last.
+# Invoices not yet due count as 0 days past due.
+BUCKET_LIMITS = (30, 60, 90)
+BUCKET_LABELS = ("0-30", "31-60", "61-90", "90+")
+
+
+def bucket_cutoffs(today: date) -> list[date]:
+    """Earliest ``due_date`` of each bucket but the last, newest first."""
+    return [today - timedelta(days=days) for days in BUCKET_LIMITS]
+
+
+@dataclass
+class AgingReport:
+    """Open balances of one user's customers as of ``as_of``."""
+
+    as_of: date
+    rows: list[AgingRow] = field(default_factory=list)
+
+    @property
+    def totals(self) -> AgingRow:
+        """All customers summed into one row (``customer_id`` is None)."""
+        buckets = [sum((row.buckets[i] for row in self.rows), Decimal("0")) for i in range(len(BUCKET_LABELS))]
+        return AgingRow(
+            None,
+            "Total",
+            sum(row.invoice_count for row in self.rows),
+            tuple(buckets),
+            sum(buckets, Decimal("0")),
+        )
+
+
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+def invoice_write_generation() -> int:
+    """Counter bumped whenever a session that wrote invoices commits."""
+    return _generation
+
+
+def _bump_generation() -> None:
+    global _generation
+    with _generation_lock:
+        _generation += 1
+
+
+@event.listens_for(Session, "after_flush")
+def _note_invoice_flush(session, _flush_context) -> None:
+    if any(isinstance(obj, Invoice) for obj in chain(session.new, session.dirty, session.deleted)):
+        session.info["invoices_written"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _note_invoice_dml(state) -> None:
+    if (state.is_update or state.is_delete or state.is_insert) and any(
+        mapper.class_ is Invoice for mapper in state.all_mappers
+    ):
+        state.session.info["invoices_written"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invoice_writes_committed(session) -> None:
+    if session.info.pop("invoices_written", False):
+        _bump_generation()
+
+
+@event.listens_for(Session, "after_rollback")
+def _invoice_writes_rolled_back(session) -> None:
+    session.info.pop("invoices_written", None)
+
+
+class AgingReportCache:
+    """Per-user aging reports, valid for one day and one write generation."""
+
+    def __init__(self) -> None:
+        self._reports: dict[int, tuple[int, AgingReport]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int, as_of: date) -> AgingReport | None:
+        """Return the cached report for ``as_of`` unless invoices changed since."""
+        with self._lock:
+            entry = self._reports.get(user_id)
+        if entry is None:
+            return None
+        generation, report = entry
+        if generation != invoice_write_generation() or report.as_of != as_of:
+            return None
+        return report
+
+    def put(self, user_id: int, generation: int, report: AgingReport) -> None:
+        """Store ``report``, computed from data as of write ``generation``."""
+        with self._lock:
+            self._reports[user_id] = (generation, report)
+
+    def invalidate(self, user_id: int | None = None) -> None:
+        """Drop the report of ``user_id`` (or of every user)."""
+        with self._lock:
+            if user_id is None:
+                self._reports.clear()
+            else:
+                self._reports.pop(user_id, None)
+
+
+_caches: dict[object, AgingReportCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_aging_cache(session_factory=DatabaseManager.get_instance().get_session) -> AgingReportCache:
+    """Return the cache shared by all services using ``session_factory``."""
+    with _caches_lock:
+        cache = _caches.get(session_factory)
+        if cache is None:
+            cache = _caches[session_factory] = AgingReportCache()
+        return cache
@@ -0,0 +1,89 @@
+"""Move old paid invoices out of the hot ``invoices`` table."""
+
+from __future__ import annotations
+
+import logging
+import os
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import delete, func, literal, select
+
+from automotive_invoice_manager.backend.database.archive import archived_invoices, attach_archive, default_archive_path
+from automotive_invoice_manager.backend.database.connection import DatabaseManager
+from automotive_invoice_manager.backend.database.models import Invoice
+from automotive_invoice_manager.config.archive import ArchiveConfig
+
+
+class InvoiceArchiver:
+    """Chunked hot-to-cold transfer of paid invoices into the archive database."""
+
+    def __init__(self, db_manager: DatabaseManager | None = None, config: ArchiveConfig | None = None) -> None:
+        self.db_manager = db_manager or DatabaseManager.get_instance()
+        self.config = config or ArchiveConfig()
+
+    def attach(self) -> str:
+        """Attach the archive database and return its path."""
+        return attach_archive(self.db_manager.engine, self.config.path or None)
+
+    def cutoff(self, today: date | None = None) -> date:
+        """Paid invoices issued before this date are archived."""
+        return (today or date.today()) - timedelta(days=self.config.after_days)
+
+    def archive_paid_invoices(self, before: date | None = None, user_id: int | None = None) -> int:
+        """Move paid invoices issued before ``before``; returns the number moved.
+
+        Each chunk is copied and deleted in its own transaction, so the main
+        database is never locked for long and an interrupted run loses nothing.
+        """
+        self.attach()
+        before = before or self.cutoff()
+        hot = Invoice.__table__
+        names = [c.name for c in hot.columns]
+        eligible = select(hot.c.id).where(hot.c.status == "paid", hot.c.issued_date < before)
+        if user_id is not None:
+            eligible = eligible.where(hot.c.user_id == user_id)
+        eligible = eligible.order_by(hot.c.id).limit(self.config.chunk_size)
+
+        moved = 0
+        while True:
+            with self.db_manager.engine.begin() as conn:
+                ids = conn.execute(eligible).scalars().all()
+                if not ids:
+                    break
+                conn.execute(
+                    archived_invoices.insert().from_select(
+                        names + ["archived_at"],
+                        select(*hot.columns, literal(datetime.utcnow(), archived_invoices.c.archived_at.type))
+                        .where(hot.c.id.in_(ids)),
+                    )
+                )
+                conn.execute(delete(hot).where(hot.c.id.in_(ids)))
+            moved += len(ids)
+        if moved:
+            logging.info(f"Archived {moved} paid invoices issued before {before}")
+        return moved
+
+    def archived_count(self, user_id: int) -> int:
+        """Number of ``user_id``'s invoices in the archive."""
+        self.attach()
+        with self.db_manager.engine.connect() as conn:
+            return conn.execute(
+                select(func.count()).select_from(archived_invoices)
+                .where(archived_invoices.c.user_id == user_id)
+            ).scalar()
+
+    def run(self) -> int:
+        """Archive according to the configuration; errors are logged, not raised.
+
+        With archiving disabled an existing archive is still attached, so
+        invoices archived earlier stay visible and their numbers and ids taken.
+        """
+        try:
+            if not self.config.enabled:
+                if os.path.exists(self.config.path or default_archive_path(self.db_manager.engine)):
+                    self.attach()
+                return 0
+            return self.archive_paid_invoices()
+        except Exception as e:
+            logging.error(f"Error archiving invoices: {e}")
+            return 0
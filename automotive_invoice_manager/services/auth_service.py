@@ -4,6 +4,7 @@ from automotive_invoice_manager.backend.database.models import User
 from automotive_invoice_manager.backend.database.connection import DatabaseManager
 from .validators import validate_password
 from .base_service import BaseService
+from .password_hasher import PasswordHasher
 
 
 class AuthService(BaseService):
@@ -32,21 +33,33 @@ class AuthService(BaseService):
         pass
 
 
-class AuthManager:
-    """Simple in-memory authentication manager."""
+class AuthManager(BaseService):
+    """Simple in-memory authentication manager.
+
+    Password hashing is CPU bound (hundreds of milliseconds by design), so the
+    UI should call :meth:`login_async` / :meth:`register_async` and wait on
+    the returned future instead of blocking the Tk event loop.
+    """
 
     def __init__(
-        self, session_factory=DatabaseManager.get_instance().get_session
+        self,
+        session_factory=DatabaseManager.get_instance().get_session,
+        hasher: PasswordHasher | None = None,
     ) -> None:
+        super().__init__()
         self.current_user = None
         self.session_factory = session_factory
+        self.hasher = hasher or PasswordHasher()
 
     def login(self, email, password):
         """Validate credentials and set current user."""
         try:
             with self.session_factory() as session:
                 user = session.query(User).filter_by(email=email.lower().strip()).first()
-                if user and user.check_password(password):
+                if user and self.hasher.verify(user.password_hash, password):
+                    if self.hasher.needs_rehash(user.password_hash):
+                        user.password_hash = self.hasher.hash(password)
+                        logging.info(f"Upgraded password hash for: {email}")
                     self.current_user = user
                     logging.info(f"User logged in: {email}")
                     return user
@@ -74,7 +87,7 @@ class AuthManager:
                     return None, "Email already registered"
 
                 user = User(email=email.lower().strip())
-                user.set_password(password)
+                user.password_hash = self.hasher.hash(password)
 
                 session.add(user)
 
@@ -85,6 +98,14 @@ class AuthManager:
             logging.error(f"Registration error: {e}")
             return None, str(e)
 
+    def login_async(self, email, password):
+        """Run :meth:`login` on a worker thread and return its future."""
+        return self.run_async(self.login, email, password)
+
+    def register_async(self, email, password):
+        """Run :meth:`register` on a worker thread and return its future."""
+        return self.run_async(self.register, email, password)
+
     def is_authenticated(self):
         """Check if user is authenticated."""
         return self.current_user is not None
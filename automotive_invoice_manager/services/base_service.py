@@ -1,7 +1,24 @@
 """Base service with shared database utilities."""
 
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
 from automotive_invoice_manager.backend.database.connection import DatabaseManager
 
+# Worker pool shared by all services for blocking work kept off the UI thread.
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the shared service worker pool, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="service")
+        return _executor
+
+
 class BaseService:
     """Base class for all services using :class:`DatabaseManager` for DB access."""
 
@@ -19,3 +36,11 @@ class BaseService:
     def session_scope(self):
         """Return the context manager for a database session."""
         return self.db_manager.get_session()
+
+    def unit_of_work(self):
+        """Return a scope in which all service calls share one session and commit."""
+        return self.db_manager.unit_of_work()
+
+    def run_async(self, func, *args, **kwargs) -> Future:
+        """Run ``func(*args, **kwargs)`` on the shared worker pool."""
+        return get_executor().submit(func, *args, **kwargs)
@@ -0,0 +1,203 @@
+"""Detection of customers that were entered more than once.
+
+Comparing every pair of customers is quadratic, so candidate pairs are
+found by blocking first and only those pairs are scored.  Two customers
+are candidates when they share
+
+* the normalized phone number, email address or email domain,
+* one of the two rarest trigrams of their folded names (so a typo
+  elsewhere in the name still lands them in the same block), or
+* a sorted-neighbourhood window: the customers are sorted by folded name
+  and by its words in alphabetical order, and each is paired with the
+  next ``window - 1`` of both orders.
+
+Blocks with more than ``max_block`` customers (a big mail provider's
+domain, a fleet's shared phone, a trigram like ``"aut"``) are skipped, as
+their pairs are mostly unrelated; members that really are duplicates are
+still found through their other keys.
+
+A candidate's score is the Dice coefficient of the two names' trigram
+sets, lowered by :data:`CONFLICT_PENALTY` for each of phone and email that
+both customers have but that differ (namesakes are common), and raised to
+at least :data:`CONTACT_SCORE` when the phone numbers or emails match
+exactly.  Pairs scoring :data:`THRESHOLD` or more are reported, best
+first.
+
+``DuplicateFinder(blocking=False)`` scores every pair instead, as a
+reference for what blocking misses and what it saves.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from itertools import combinations
+from typing import NamedTuple
+
+from sqlalchemy import select
+
+from automotive_invoice_manager.backend.database.connection import DatabaseManager
+from automotive_invoice_manager.backend.database.models import Customer
+
+
+# Lowest score reported as a possible duplicate
+THRESHOLD = 0.75
+# Lowest score of a pair whose phone numbers or emails match exactly
+CONTACT_SCORE = 0.8
+# Taken off for each contact field present on both sides but different
+CONFLICT_PENALTY = 0.15
+# Neighbours compared in each sort order, including the customer itself
+WINDOW = 4
+# Larger blocks are too unspecific to pair up
+MAX_BLOCK = 50
+# Rarest name trigrams used as blocking keys
+RARE_TRIGRAMS = 2
+
+
+class DuplicatePair(NamedTuple):
+    """Two customers that look like the same one; ``first_id`` is the older."""
+
+    score: float
+    first_id: int
+    first_name: str
+    second_id: int
+    second_name: str
+    # Exact matches among "phone" and "email"; empty for name-only pairs
+    reasons: tuple[str, ...]
+
+
+@dataclass
+class DuplicateScan:
+    """Outcome of one duplicate scan."""
+
+    customers: int = 0
+    compared: int = 0
+    pairs: list[DuplicatePair] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def all_pairs(self) -> int:
+        """Pairs a comparison of every customer with every other would score."""
+        return self.customers * (self.customers - 1) // 2
+
+
+# The stored normalized keys (see contact_keys) are read as they are
+_COLUMNS = (Customer.id, Customer.name, Customer.name_folded, Customer.email_normalized, Customer.phone_digits)
+
+
+class _Record(NamedTuple):
+    id: int
+    name: str
+    folded: str
+    trigrams: frozenset
+    phone: str | None
+    email: str | None
+
+
+def _trigrams(folded: str) -> frozenset:
+    padded = f" {folded} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+def _records(rows) -> list[_Record]:
+    """Records from rows of :data:`_COLUMNS`."""
+    return [
+        _Record(customer_id, name, folded or "", _trigrams(folded or ""), phone, email)
+        for customer_id, name, folded, email, phone in rows
+    ]
+
+
+def _blocks(records: list[_Record]) -> dict[tuple[str, str], list[int]]:
+    """Blocking key -> positions in ``records`` of the customers having it."""
+    frequency = Counter(gram for record in records for gram in record.trigrams)
+    blocks = defaultdict(list)
+    for position, record in enumerate(records):
+        if record.phone:
+            blocks["phone", record.phone].append(position)
+        if record.email:
+            blocks["email", record.email].append(position)
+            blocks["domain", record.email.rpartition("@")[2]].append(position)
+        for gram in sorted(record.trigrams, key=lambda gram: (frequency[gram], gram))[:RARE_TRIGRAMS]:
+            blocks["trigram", gram].append(position)
+    return blocks
+
+
+def _candidate_pairs(records: list[_Record], window: int, max_block: int) -> set[tuple[int, int]]:
+    """Positions ``(i, j)``, ``i < j``, of the pairs worth scoring."""
+    pairs = set()
+    for members in _blocks(records).values():
+        if 1 < len(members) <= max_block:
+            pairs.update(combinations(members, 2))
+    for key in (lambda p: records[p].folded, lambda p: " ".join(sorted(records[p].folded.split()))):
+        order = sorted(range(len(records)), key=key)
+        for offset in range(1, window):
+            pairs.update((min(a, b), max(a, b)) for a, b in zip(order, order[offset:]))
+    return pairs
+
+
+def _score_pair(first: _Record, second: _Record) -> tuple[float, tuple[str, ...]]:
+    """Similarity of two customers in [0, 1] and the contact fields that match."""
+    size = len(first.trigrams) + len(second.trigrams)
+    score = 2 * len(first.trigrams & second.trigrams) / size if size else 0.0
+    reasons = []
+    for name, a, b in (("phone", first.phone, second.phone), ("email", first.email, second.email)):
+        if a is None or b is None:
+            continue
+        if a == b:
+            reasons.append(name)
+        else:
+            score -= CONFLICT_PENALTY
+    if reasons:
+        score = max(score, CONTACT_SCORE)
+    return max(score, 0.0), tuple(reasons)
+
+
+class DuplicateFinder:
+    """Blocked duplicate detection over one user's customers."""
+
+    def __init__(
+        self,
+        session_factory=DatabaseManager.get_instance().get_session,
+        threshold: float = THRESHOLD,
+        window: int = WINDOW,
+        max_block: int = MAX_BLOCK,
+        blocking: bool = True,
+    ) -> None:
+        self.session_factory = session_factory
+        self.threshold = threshold
+        self.window = window
+        self.max_block = max_block
+        self.blocking = blocking
+
+    def scan(self, user_id: int, limit: int | None = None) -> DuplicateScan:
+        """Return ``user_id``'s likely duplicate pairs, best first.
+
+        ``limit`` restricts the scan to that many of the oldest customers.
+        """
+        started = time.perf_counter()
+        with self.session_factory() as session:
+            rows = session.execute(
+                select(*_COLUMNS).where(Customer.user_id == user_id).order_by(Customer.id).limit(limit)
+            ).all()
+        records = _records(rows)
+        if self.blocking:
+            candidates = _candidate_pairs(records, self.window, self.max_block)
+            compared = len(candidates)
+        else:
+            candidates = combinations(range(len(records)), 2)
+            compared = len(records) * (len(records) - 1) // 2
+        pairs = []
+        for i, j in candidates:
+            first, second = records[i], records[j]
+            score, reasons = _score_pair(first, second)
+            if score >= self.threshold:
+                pairs.append(DuplicatePair(round(score, 3), first.id, first.name, second.id, second.name, reasons))
+        pairs.sort(key=lambda pair: (-pair.score, pair.first_id, pair.second_id))
+        scan = DuplicateScan(len(records), compared, pairs, time.perf_counter() - started)
+        logging.info(
+            f"Duplicate scan for user {user_id}: {scan.customers} customers, "
+            f"{scan.compared} pairs compared, {len(pairs)} possible duplicates"
+        )
+        return scan
@@ -0,0 +1,214 @@
+"""Streaming CSV import of customers.
+
+The file is read row by row and handled in batches of :data:`BATCH_SIZE`:
+each batch is validated with :class:`CustomerValidator`, checked against a
+hash index of the user's normalized emails and phone numbers (loaded once,
+then extended with every accepted row, so duplicates inside the file are
+caught too) and inserted with one multi-row ``INSERT`` in its own
+transaction.  An interrupted import keeps the batches already committed;
+running it again skips them as duplicates unless they have neither an
+email nor a phone.
+
+The columns are matched by header, case-insensitively: ``Name`` is
+required, ``Email``, ``Phone``, ``Address`` and ``Notes`` are optional and
+anything else (such as ``Created`` in the customer export) is ignored.
+"""
+
+from __future__ import annotations
+
+import csv
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple
+
+from sqlalchemy import insert, select
+
+from automotive_invoice_manager.backend.database.connection import DatabaseManager
+from automotive_invoice_manager.backend.database.models import Customer
+
+from .customer_index import CustomerNameIndex, get_customer_index
+from .validators import CustomerValidator, error_messages, normalize_email, normalize_phone
+
+BATCH_SIZE = 1000
+
+FIELDS = ("name", "email", "phone", "address", "notes")
+
+
+class RowError(NamedTuple):
+    """One problem with one CSV row; ``line`` is the row's line in the file."""
+
+    line: int
+    field: str
+    message: str
+
+
+@dataclass
+class ImportReport:
+    """Outcome (or progress so far) of a customer import.
+
+    ``imported`` counts the rows inserted, or in a dry run the rows that
+    would have been.
+    """
+
+    dry_run: bool = False
+    rows: int = 0
+    imported: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    errors: list[RowError] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def write_errors(self, path) -> None:
+        """Write the per-row errors to a CSV file."""
+        with open(path, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(("line", "field", "message"))
+            writer.writerows(self.errors)
+
+
+class _ContactIndex:
+    """Normalized email/phone -> where it was first seen (customer id or CSV line)."""
+
+    def __init__(self, rows) -> None:
+        """``rows`` are ``(id, normalized email, normalized phone)`` of existing customers."""
+        self.emails: dict[str, str] = {}
+        self.phones: dict[str, str] = {}
+        for customer_id, email, phone in rows:
+            self.add(email, phone, f"customer #{customer_id}")
+
+    def find(self, email: str | None, phone: str | None) -> tuple[str, str] | None:
+        """Return ``(field, owner)`` of the first key already present."""
+        if email is not None and email in self.emails:
+            return "email", self.emails[email]
+        if phone is not None and phone in self.phones:
+            return "phone", self.phones[phone]
+        return None
+
+    def add(self, email: str | None, phone: str | None, owner: str) -> None:
+        if email is not None:
+            self.emails.setdefault(email, owner)
+        if phone is not None:
+            self.phones.setdefault(phone, owner)
+
+
+def _columns(header) -> dict[str, str]:
+    """Map each known field to its header in the file."""
+    columns = {}
+    for name in header or ():
+        key = (name or "").strip().lower()
+        if key in FIELDS and key not in columns:
+            columns[key] = name
+    if "name" not in columns:
+        raise ValueError("The CSV file needs a 'Name' column")
+    return columns
+
+
+def _row_data(record, columns) -> dict:
+    """Customer fields of one CSV record; blank optional fields become None."""
+    data = {key: (record.get(header) or "").strip() for key, header in columns.items()}
+    return {"name": data["name"], **{key: data.get(key) or None for key in FIELDS[1:]}}
+
+
+class CustomerImport:
+    """Batched, de-duplicating import of customers from CSV."""
+
+    def __init__(
+        self,
+        session_factory=DatabaseManager.get_instance().get_session,
+        customer_index: CustomerNameIndex | None = None,
+        validator: CustomerValidator | None = None,
+        batch_size: int = BATCH_SIZE,
+    ) -> None:
+        self.session_factory = session_factory
+        self.customer_index = customer_index or get_customer_index(session_factory)
+        self.validator = validator or CustomerValidator()
+        self.batch_size = batch_size
+
+    def _contact_index(self, user_id: int) -> _ContactIndex:
+        with self.session_factory() as session:
+            return _ContactIndex(
+                session.execute(
+                    select(Customer.id, Customer.email_normalized, Customer.phone_digits).where(
+                        Customer.user_id == user_id
+                    )
+                )
+            )
+
+    def _check_batch(self, batch, contacts: _ContactIndex, report: ImportReport) -> list[dict]:
+        """Return the insertable rows of ``batch``, recording every rejected one."""
+        accepted = []
+        failed = self.validator.validate_many({key: [data[key] for _, data in batch] for key in FIELDS})
+        for (line, data), bits in zip(batch, failed):
+            if bits:
+                report.invalid += 1
+                report.errors.extend(RowError(line, name, message) for name, message in error_messages(bits).items())
+                continue
+            email, phone = normalize_email(data["email"]), normalize_phone(data["phone"])
+            duplicate = contacts.find(email, phone)
+            if duplicate is not None:
+                name, owner = duplicate
+                report.duplicates += 1
+                report.errors.append(RowError(line, name, f"Duplicate of {owner}"))
+                continue
+            contacts.add(email, phone, f"line {line}")
+            accepted.append(data)
+        return accepted
+
+    def _insert(self, user_id: int, rows: list[dict]) -> None:
+        now = datetime.utcnow()
+        with self.session_factory() as session:
+            session.execute(
+                insert(Customer),
+                [{**row, "user_id": user_id, "created_at": now, "updated_at": now} for row in rows],
+            )
+
+    def run(self, user_id: int, source, dry_run: bool = False, progress=None) -> ImportReport:
+        """Import the customers in ``source`` (a path or an open text file).
+
+        With ``dry_run`` every check runs but nothing is written.
+        ``progress(report)`` is called after each batch.
+        """
+        if isinstance(source, (str, Path)):
+            with open(source, newline="", encoding="utf-8-sig") as handle:
+                return self.run(user_id, handle, dry_run, progress)
+        started = time.perf_counter()
+        report = ImportReport(dry_run=dry_run)
+        reader = csv.DictReader(source)
+        columns = _columns(reader.fieldnames)
+        contacts = self._contact_index(user_id)
+        batch = []
+        try:
+            for record in reader:
+                batch.append((reader.line_num, _row_data(record, columns)))
+                if len(batch) >= self.batch_size:
+                    self._flush(user_id, batch, contacts, report, started, progress)
+                    batch = []
+            if batch:
+                self._flush(user_id, batch, contacts, report, started, progress)
+        finally:
+            if report.imported and not dry_run:
+                # New names are picked up on the next lookup
+                self.customer_index.invalidate(user_id)
+        report.elapsed = time.perf_counter() - started
+        logging.info(
+            f"Customer import{' (dry run)' if dry_run else ''}: {report.rows} rows, {report.imported} imported, "
+            f"{report.duplicates} duplicates, {report.invalid} invalid"
+        )
+        return report
+
+    def _flush(self, user_id, batch, contacts, report, started, progress) -> None:
+        rows = self._check_batch(batch, contacts, report)
+        if rows and not report.dry_run:
+            self._insert(user_id, rows)
+        report.imported += len(rows)
+        report.rows += len(batch)
+        report.elapsed = time.perf_counter() - started
+        if progress is not None:
+            progress(report)
@@ -0,0 +1,142 @@
+"""Per-user customer name -> id index shared by the invoice paths.
+
+Invoice writes (the form, bulk import, ``InvoiceService``) identify the
+customer by name.  Rather than a ``SELECT ... WHERE name = ?`` per write,
+each user's names are loaded once and then kept current by
+``CustomerService`` on create, update and delete.  A name that is not in
+the map (e.g. created by another process) falls back to one query and is
+cached from then on.
+
+Like the old ``.first()`` lookup, a name shared by several customers
+resolves to one of them (the lowest id).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+
+from sqlalchemy import event, select
+
+from automotive_invoice_manager.backend.database.connection import DatabaseManager
+from automotive_invoice_manager.backend.database.models import Customer
+
+
+class CustomerNameIndex:
+    """Thread-safe in-memory map of ``user_id -> {customer name: id}``."""
+
+    def __init__(self, session_factory=DatabaseManager.get_instance().get_session) -> None:
+        self.session_factory = session_factory
+        self._names: dict[int, dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, user_id: int, name: str, session=None) -> int | None:
+        """Return the id of ``user_id``'s customer called ``name``, or None.
+
+        Pass ``session`` to run any load/fallback query inside the caller's
+        transaction (so customers it created are visible).
+        """
+        with self._lock:
+            names = self._names.get(user_id)
+            if names is not None and name in names:
+                return names[name]
+        if session is None:
+            with self.session_factory() as session:
+                return self._resolve_miss(session, user_id, name, names is None)
+        return self._resolve_miss(session, user_id, name, names is None)
+
+    def _resolve_miss(self, session, user_id: int, name: str, load_all: bool) -> int | None:
+        if load_all:
+            rows = session.execute(
+                select(Customer.id, Customer.name)
+                .where(Customer.user_id == user_id)
+                .order_by(Customer.id)
+            ).all()
+            names: dict[str, int] = {}
+            for customer_id, customer_name in rows:
+                names.setdefault(customer_name, customer_id)
+            self._watch_rollback(session, user_id)
+            with self._lock:
+                self._names[user_id] = names
+            logging.debug(f"Loaded {len(names)} customer names for user {user_id}")
+            return names.get(name)
+        customer_id = session.execute(
+            select(Customer.id)
+            .where(Customer.user_id == user_id, Customer.name == name)
+            .order_by(Customer.id)
+            .limit(1)
+        ).scalar()
+        if customer_id is not None:
+            self.add(user_id, name, customer_id, session)
+        return customer_id
+
+    def names(self, user_id: int) -> list[str]:
+        """Return ``user_id``'s customer names, loading them if needed."""
+        with self._lock:
+            loaded = user_id in self._names
+        if not loaded:
+            self.resolve(user_id, "")
+        with self._lock:
+            return sorted(self._names.get(user_id, {}))
+
+    def add(self, user_id: int, name: str, customer_id: int, session=None) -> None:
+        """Record a new customer (only affects users whose map is loaded)."""
+        with self._lock:
+            names = self._names.get(user_id)
+            if names is None:
+                return
+            names.setdefault(name, customer_id)
+        self._watch_rollback(session, user_id)
+
+    def rename(self, user_id: int, customer_id: int, old_name: str, new_name: str, session=None) -> None:
+        """Move ``customer_id`` from ``old_name`` to ``new_name``."""
+        self.remove(user_id, customer_id, old_name, session)
+        self.add(user_id, new_name, customer_id, session)
+
+    def remove(self, user_id: int, customer_id: int, name: str, session=None) -> None:
+        """Forget ``name`` if it points at ``customer_id``.
+
+        Another customer with the same name is picked up by the fallback
+        query on the next lookup.
+        """
+        with self._lock:
+            names = self._names.get(user_id)
+            if names is not None and names.get(name) == customer_id:
+                del names[name]
+        self._watch_rollback(session, user_id)
+
+    def invalidate(self, user_id: int | None = None) -> None:
+        """Drop the map of ``user_id`` (or of every user); it reloads lazily."""
+        with self._lock:
+            if user_id is None:
+                self._names.clear()
+            else:
+                self._names.pop(user_id, None)
+
+    def _watch_rollback(self, session, user_id: int) -> None:
+        # Changes made inside a unit of work only stick if it commits.
+        if session is None:
+            return
+        watched = session.info.setdefault("customer_index_users", set())
+        if (id(self), user_id) in watched:
+            return
+        watched.add((id(self), user_id))
+
+        def forget(_session):
+            watched.discard((id(self), user_id))
+            self.invalidate(user_id)
+
+        event.listen(session, "after_rollback", forget, once=True)
+
+
+_indexes: dict[object, CustomerNameIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_customer_index(session_factory=DatabaseManager.get_instance().get_session) -> CustomerNameIndex:
+    """Return the index shared by all services using ``session_factory``."""
+    with _indexes_lock:
+        index = _indexes.get(session_factory)
+        if index is None:
+            index = _indexes[session_factory] = CustomerNameIndex(session_factory)
+        return index
@@ -3,37 +3,79 @@
 
 import logging
 from datetime import datetime
-from automotive_invoice_manager.backend.database.models import Customer, Invoice
+from decimal import Decimal
+from automotive_invoice_manager.backend.database.archive import archived_invoices, is_archive_attached
+from automotive_invoice_manager.backend.database.contact_keys import fold_name, phone_search_digits
+from automotive_invoice_manager.backend.database.models import DETAIL_GROUP, Customer, Invoice
 from automotive_invoice_manager.backend.database.connection import DatabaseManager
-from sqlalchemy import or_, func, desc
+from sqlalchemy import delete, or_, func, desc, select, update
+from sqlalchemy.orm import undefer_group
 from .base_service import BaseService
+from .customer_duplicates import DuplicateFinder
+from .customer_import import CustomerImport
+from .customer_index import CustomerNameIndex, get_customer_index
+from .rows import CustomerRow
+
+# Customer list column -> sortable expression name in search_customer_rows
+_ROW_SORT_KEYS = {
+    "name": "name",
+    "email": "email",
+    "phone": "phone",
+    "invoices": "invoice_count",
+    "total_billed": "total_billed",
+    "created": "created_at",
+}
+
+
+def _search_filter(search_term):
+    """WHERE clause of a customer search for ``search_term``.
+
+    A substring match on name (as typed or folded), email, phone and
+    notes.  A term that looks like a phone number also matches inside the
+    stored ``phone_digits``, so it finds the customer whatever the
+    formatting on either side.
+    """
+    pattern = f"%{search_term}%"
+    filters = [
+        Customer.name.ilike(pattern),
+        Customer.name_folded.like(f"%{fold_name(search_term) or search_term}%"),
+        Customer.email.ilike(pattern),
+        Customer.phone.ilike(pattern),
+        Customer.notes.ilike(pattern),
+    ]
+    digits = phone_search_digits(search_term)
+    if digits is not None:
+        filters.append(Customer.phone_digits.like(f"%{digits}%"))
+    return or_(*filters)
 
 
 class CustomerService(BaseService):
     """Service for managing customers with all required methods."""
 
     def __init__(
-        self, session_factory=DatabaseManager.get_instance().get_session
+        self,
+        session_factory=DatabaseManager.get_instance().get_session,
+        customer_index: CustomerNameIndex | None = None,
     ) -> None:
         """Initialize service with session factory."""
-        super().__init__()
+        # Units of work must be opened on the manager the sessions come from
+        owner = getattr(session_factory, "__self__", None)
+        super().__init__(owner if isinstance(owner, DatabaseManager) else None)
         self.session_factory = session_factory
+        self.customer_index = customer_index or get_customer_index(session_factory)
 
-    def get_all_customers(self, user_id, search: str | None = None):
-        """Return all customers for a user with optional search."""
+    def get_all_customers(self, user_id, search: str | None = None, include_details: bool = False):
+        """Return all customers for a user with optional search.
+
+        ``address`` and ``notes`` are only loaded with ``include_details``.
+        """
         try:
             with self.session_factory() as session:
                 query = session.query(Customer).filter_by(user_id=user_id)
+                if include_details:
+                    query = query.options(undefer_group(DETAIL_GROUP))
                 if search:
-                    pattern = f"%{search}%"
-                    query = query.filter(
-                        or_(
-                            Customer.name.ilike(pattern),
-                            Customer.email.ilike(pattern),
-                            Customer.phone.ilike(pattern),
-                            Customer.notes.ilike(pattern),
-                        )
-                    )
+                    query = query.filter(_search_filter(search))
                 return query.order_by(Customer.name).all()
         except Exception as e:
             logging.error(f"Error fetching customers: {e}")
@@ -56,6 +98,7 @@ class CustomerService(BaseService):
                 session.add(customer)
                 session.flush()  # Ensure ID is available
                 session.refresh(customer)  # Refresh to get all data
+                self.customer_index.add(user_id, customer.name, customer.id, session)
 
                 logging.info(f"Customer created: {customer.name} (ID: {customer.id})")
                 return customer
@@ -64,11 +107,81 @@ class CustomerService(BaseService):
             logging.error(f"Error creating customer: {e}")
             raise
 
+    def import_customers(self, user_id, source, dry_run=False, progress=None):
+        """Import customers from a CSV file; returns an :class:`ImportReport`.
+
+        See :class:`CustomerImport` for the columns, batching and duplicate
+        checks.
+        """
+        importer = CustomerImport(self.session_factory, self.customer_index)
+        return importer.run(user_id, source, dry_run=dry_run, progress=progress)
+
+    def find_duplicate_customers(self, user_id):
+        """Scan for customers entered more than once; returns a :class:`DuplicateScan`."""
+        return DuplicateFinder(self.session_factory).scan(user_id)
+
+    def merge_customers(self, user_id, keep_id, duplicate_ids):
+        """Merge ``duplicate_ids`` into ``keep_id`` and return the number of invoices moved.
+
+        The duplicates' invoices (archived ones too) are re-pointed with one
+        ``UPDATE`` each, blank contact fields of the kept customer are filled
+        from the duplicates, and the duplicates are deleted.
+        """
+        duplicate_ids = [customer_id for customer_id in dict.fromkeys(duplicate_ids) if customer_id != keep_id]
+        try:
+            with self.session_factory() as session:
+                customers = {
+                    customer.id: customer
+                    for customer in session.query(Customer)
+                    .options(undefer_group(DETAIL_GROUP))
+                    .filter(Customer.user_id == user_id, Customer.id.in_([keep_id, *duplicate_ids]))
+                }
+                if len(customers) != len(duplicate_ids) + 1:
+                    raise ValueError("Customer not found")
+
+                now = datetime.utcnow()
+                moved = session.execute(
+                    update(Invoice)
+                    .where(Invoice.customer_id.in_(duplicate_ids))
+                    .values(customer_id=keep_id, updated_at=now)
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+                if is_archive_attached(session.get_bind()):
+                    # updated_at moves the rows past the analytics cache's watermark
+                    moved += session.execute(
+                        update(archived_invoices)
+                        .where(archived_invoices.c.customer_id.in_(duplicate_ids))
+                        .values(customer_id=keep_id, updated_at=now)
+                    ).rowcount
+
+                kept = customers[keep_id]
+                for field in ("email", "phone", "address", "notes"):
+                    if not getattr(kept, field):
+                        values = (getattr(customers[customer_id], field) for customer_id in duplicate_ids)
+                        setattr(kept, field, next(filter(None, values), None))
+                kept.updated_at = now
+                for customer_id in duplicate_ids:
+                    self.customer_index.remove(user_id, customer_id, customers[customer_id].name, session)
+                    session.expunge(customers[customer_id])
+                session.execute(delete(Customer).where(Customer.id.in_(duplicate_ids)))
+
+                logging.info(f"Merged customers {duplicate_ids} into {keep_id}, {moved} invoices moved")
+                return moved
+
+        except Exception as e:
+            logging.error(f"Error merging customers into {keep_id}: {e}")
+            raise
+
     def get_customer(self, customer_id):
-        """Get customer by ID."""
+        """Get customer by ID, including address and notes."""
         try:
             with self.session_factory() as session:
-                return session.query(Customer).filter_by(id=customer_id).first()
+                return (
+                    session.query(Customer)
+                    .options(undefer_group(DETAIL_GROUP))
+                    .filter_by(id=customer_id)
+                    .first()
+                )
         except Exception as e:
             logging.error(f"Error getting customer {customer_id}: {e}")
             return None
@@ -86,6 +199,11 @@ class CustomerService(BaseService):
                 if not customer:
                     return False
 
+                if customer.name != customer_data["name"]:
+                    self.customer_index.rename(
+                        user_id, customer.id, customer.name, customer_data["name"], session
+                    )
+
                 # Update fields
                 customer.name = customer_data["name"]
                 customer.email = customer_data.get("email")
@@ -102,7 +220,7 @@ class CustomerService(BaseService):
             raise
 
     def delete_customer(self, customer_id, user_id):
-        """Delete customer if no invoices exist."""
+        """Delete customer if no invoices exist, archived ones included."""
         try:
             with self.session_factory() as session:
                 customer = (
@@ -115,12 +233,19 @@ class CustomerService(BaseService):
                     return False
 
                 invoice_count = (
-                    session.query(Invoice).filter_by(customer_id=customer_id).count()
+                    session.query(func.count(Invoice.id)).filter_by(customer_id=customer_id).scalar()
                 )
+                if not invoice_count and is_archive_attached(session.get_bind()):
+                    invoice_count = session.execute(
+                        select(func.count())
+                        .select_from(archived_invoices)
+                        .where(archived_invoices.c.customer_id == customer_id)
+                    ).scalar()
                 if invoice_count > 0:
                     return False
 
                 session.delete(customer)
+                self.customer_index.remove(user_id, customer.id, customer.name, session)
 
                 logging.info(f"Customer deleted: {customer.name} (ID: {customer.id})")
                 return True
@@ -135,15 +260,7 @@ class CustomerService(BaseService):
             with self.session_factory() as session:
                 query = session.query(Customer).filter_by(user_id=user_id)
                 if search_term:
-                    search_pattern = f"%{search_term}%"
-                    query = query.filter(
-                        or_(
-                            Customer.name.ilike(search_pattern),
-                            Customer.email.ilike(search_pattern),
-                            Customer.phone.ilike(search_pattern),
-                            Customer.notes.ilike(search_pattern),
-                        )
-                    )
+                    query = query.filter(_search_filter(search_term))
 
                 sort_column = getattr(Customer, sort_by, Customer.name)
                 if sort_desc:
@@ -157,11 +274,57 @@ class CustomerService(BaseService):
             logging.error(f"Error searching customers: {e}")
             return []
 
+    def search_customer_rows(self, user_id, search_term="", sort_by="name", sort_desc=False, limit=None):
+        """Search customers, returning :class:`CustomerRow` tuples with stats.
+
+        Selects only the listed columns and aggregates invoice counts and
+        totals in the same query, instead of one stats query per customer.
+        At most ``limit`` rows are returned when it is given.
+        """
+        try:
+            with self.session_factory() as session:
+                stats = (
+                    select(
+                        Invoice.customer_id,
+                        func.count(Invoice.id).label("invoice_count"),
+                        func.sum(Invoice.total).label("total_billed"),
+                    )
+                    .where(Invoice.user_id == user_id)
+                    .group_by(Invoice.customer_id)
+                    .subquery()
+                )
+                query = (
+                    select(
+                        Customer.id,
+                        Customer.name,
+                        Customer.email,
+                        Customer.phone,
+                        Customer.created_at,
+                        func.coalesce(stats.c.invoice_count, 0).label("invoice_count"),
+                        func.coalesce(stats.c.total_billed, 0).label("total_billed"),
+                    )
+                    .outerjoin(stats, stats.c.customer_id == Customer.id)
+                    .where(Customer.user_id == user_id)
+                )
+                if search_term:
+                    query = query.where(_search_filter(search_term))
+
+                sort_column = query.selected_columns[_ROW_SORT_KEYS.get(sort_by, "name")]
+                query = query.order_by(desc(sort_column) if sort_desc else sort_column)
+                if limit is not None:
+                    query = query.limit(limit)
+
+                return [CustomerRow(*row) for row in session.execute(query)]
+
+        except Exception as e:
+            logging.error(f"Error searching customer rows: {e}")
+            return []
+
     def get_customer_count(self, user_id):
         """Get total number of customers for user."""
         try:
             with self.session_factory() as session:
-                return session.query(Customer).filter_by(user_id=user_id).count()
+                return session.query(func.count(Customer.id)).filter_by(user_id=user_id).scalar()
         except Exception as e:
             logging.error(f"Error getting customer count: {e}")
             return 0
@@ -181,12 +344,12 @@ class CustomerService(BaseService):
 
                 return {
                     "invoice_count": stats.invoice_count or 0,
-                    "total_billed": float(stats.total_billed or 0),
+                    "total_billed": stats.total_billed or Decimal("0"),
                 }
 
         except Exception as e:
             logging.error(f"Error getting customer stats for {customer_id}: {e}")
-            return {"invoice_count": 0, "total_billed": 0.0}
+            return {"invoice_count": 0, "total_billed": Decimal("0")}
 
     # Async wrapper methods (if needed by other parts of your app)
     def get_all_customers_async(self, user_id, search: str | None = None):
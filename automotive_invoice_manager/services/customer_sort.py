@@ -0,0 +1,81 @@
+"""Client-side sorting of the loaded customer list.
+
+Clicking a column header used to re-run ``search_customer_rows`` just to get
+the rows already on screen in another order.  :class:`CustomerColumnStore`
+keeps the loaded result as columns with precomputed, type-aware sort keys
+(counts and totals as numbers, ``created`` as a datetime, text case-folded)
+so a header click is an in-memory permutation.  The database is only asked
+again when the loaded set is partial, i.e. was cut off at
+:data:`CUSTOMER_ROW_LIMIT`.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from .rows import CustomerRow
+
+# Most customers loaded into the list at once; larger result sets are
+# sorted by the database instead.
+CUSTOMER_ROW_LIMIT = 5000
+
+
+def _text_key(value: str | None) -> str:
+    return (value or "").casefold()
+
+
+# Customer list column -> sort key for one CustomerRow
+_SORT_KEYS = {
+    "name": lambda row: _text_key(row.name),
+    "email": lambda row: _text_key(row.email),
+    "phone": lambda row: _text_key(row.phone),
+    "invoices": lambda row: row.invoice_count or 0,
+    "total_billed": lambda row: row.total_billed or 0,
+    "created": lambda row: row.created_at or datetime.min,
+}
+
+
+def format_row(row: CustomerRow) -> tuple:
+    """Treeview values for one customer row."""
+    return (
+        row.name,
+        row.email or "",
+        row.phone or "",
+        row.invoice_count,
+        f"${row.total_billed:.2f}",
+        row.created_at.strftime("%Y-%m-%d") if row.created_at else "",
+    )
+
+
+class CustomerColumnStore:
+    """The loaded customer rows, stored column-wise for fast re-sorting."""
+
+    def __init__(self, rows: list[CustomerRow], complete: bool = True) -> None:
+        self.complete = complete
+        self.iids = [str(row.id) for row in rows]
+        self.values = [format_row(row) for row in rows]
+        self._keys = {column: [key(row) for row in rows] for column, key in _SORT_KEYS.items()}
+        self._ascending: dict[str, list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.iids)
+
+    def can_sort(self, column: str) -> bool:
+        """Whether ``column`` can be ordered without asking the database."""
+        return self.complete and column in self._keys
+
+    def order(self, column: str, reverse: bool = False) -> list[str]:
+        """Treeview item ids sorted by ``column``.
+
+        The ascending permutation is computed once per column; descending
+        order reuses it reversed.
+        """
+        positions = self._ascending.get(column)
+        if positions is None:
+            keys = self._keys[column]
+            positions = sorted(range(len(keys)), key=keys.__getitem__)
+            self._ascending[column] = positions
+        iids = self.iids
+        if reverse:
+            return [iids[i] for i in reversed(positions)]
+        return [iids[i] for i in positions]
@@ -0,0 +1,342 @@
+"""Columnar invoice facts for the Reports tab analytics.
+
+Revenue trends, per-customer distributions, days to pay and labor-rate
+percentiles each need a pass over all of a user's invoices.
+:class:`InvoiceAnalytics` loads those invoices once into NumPy arrays
+(dates as days since 1970-01-01, amounts as integer cents, statuses as
+small codes) and the reports are vectorized group-bys and percentiles over
+an immutable :class:`InvoiceFacts` snapshot.
+
+Later calls only read invoices whose ``updated_at`` is at or past the
+watermark of the previous read (the newest ``updated_at`` seen before it,
+found through the ``(user_id, updated_at)`` index) and replace those rows.  Deletes do not touch ``updated_at``; they show up
+as a row count below the cached one, which triggers a pass over the ids.
+Archived invoices are included while the archive is attached.
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import date
+from decimal import Decimal
+from typing import NamedTuple
+
+import numpy as np
+from sqlalchemy import String, func, select, type_coerce
+from sqlalchemy.types import NullType
+
+from automotive_invoice_manager.backend.database.archive import archived_invoices, is_archive_attached
+from automotive_invoice_manager.backend.database.connection import DatabaseManager
+from automotive_invoice_manager.backend.database.line_items import line_item_columns
+from automotive_invoice_manager.backend.database.models import Invoice
+from automotive_invoice_manager.backend.database.money import cents, from_cents
+
+from .overdue_job import OPEN_STATUSES, OVERDUE
+
+# Stored status -> code; anything else is OTHER_STATUS
+STATUSES = OPEN_STATUSES + (OVERDUE, "paid")
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+OTHER_STATUS = len(STATUSES)
+
+# Day number of invoices without a paid date
+NO_DATE = np.iinfo(np.int32).min
+
+PERCENTILES = (25, 50, 75, 90)
+
+# ``revenue_trend`` periods -> datetime64 units
+PERIODS = {"day": "D", "month": "M", "year": "Y"}
+
+_FACT_ARRAYS = ("ids", "customer_ids", "issued", "paid", "totals", "statuses")
+_LINE_ARRAYS = ("line_invoices", "line_hours", "line_rates")
+
+
+class Distribution(NamedTuple):
+    """Summary of a set of values; ``mean`` is None when ``count`` is 0."""
+
+    count: int
+    mean: float | None
+    percentiles: dict[int, float]
+
+
+def _distribution(values: np.ndarray, percentiles) -> Distribution:
+    if not len(values):
+        return Distribution(0, None, {})
+    points = np.percentile(values, percentiles)
+    return Distribution(len(values), float(values.mean()), dict(zip(percentiles, map(float, points))))
+
+
+def _day_numbers(dates) -> np.ndarray:
+    """Dates (``date`` objects or ISO strings, None allowed) as int32 days since 1970-01-01."""
+    days = np.array(dates, dtype="datetime64[D]")
+    numbers = days.astype(np.int64)
+    numbers[np.isnat(days)] = NO_DATE
+    return numbers.astype(np.int32)
+
+
+def day_number(day: date) -> int:
+    """Return ``day`` as days since 1970-01-01, as stored in :class:`InvoiceFacts`."""
+    return int(np.datetime64(day, "D").astype(np.int64))
+
+
+def _group_sums(keys: np.ndarray, values: np.ndarray):
+    """Return ``(unique keys, int64 sums, counts)`` of ``values`` grouped by ``keys``."""
+    if not len(keys):
+        return keys, values.astype(np.int64), np.zeros(0, dtype=np.int64)
+    order = np.argsort(keys, kind="stable")
+    keys, values = keys[order], values[order]
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    return keys[starts], np.add.reduceat(values.astype(np.int64), starts), np.diff(np.append(starts, len(keys)))
+
+
+def _line_facts(invoice_id, line_items, owners, hours, rates) -> None:
+    """Append the labor lines (positive hours and rate) of one stored ``line_items`` value."""
+    try:
+        columns = line_item_columns(line_items, ("hours", "quantity", "rate"))
+    except (ValueError, TypeError, AttributeError):
+        return
+    for line_hours, quantity, rate in zip(*columns):
+        try:
+            line_hours = float(quantity or 0 if line_hours is None else line_hours)
+            rate = float(rate or 0)
+        except (ValueError, TypeError):
+            continue
+        if line_hours > 0 and rate > 0:
+            owners.append(invoice_id)
+            hours.append(line_hours)
+            rates.append(rate)
+
+
+class InvoiceFacts:
+    """Read-only column arrays of one user's invoices and the reports over them.
+
+    Invoice arrays share one order: ``ids``, ``customer_ids``, ``issued``
+    and ``paid`` (day numbers, ``paid`` is :data:`NO_DATE` when unknown),
+    ``totals`` (cents) and ``statuses`` (:data:`STATUS_CODES`).  Labor
+    lines are in ``line_invoices``, ``line_hours`` and ``line_rates``.
+    ``watermark`` is the newest ``updated_at`` among the invoices.
+    """
+
+    def __init__(self, watermark=None, **arrays) -> None:
+        self.watermark = watermark
+        for name in _FACT_ARRAYS + _LINE_ARRAYS:
+            array = arrays[name]
+            array.setflags(write=False)
+            setattr(self, name, array)
+
+    @classmethod
+    def empty(cls, watermark=None) -> "InvoiceFacts":
+        return cls(
+            watermark,
+            ids=np.zeros(0, np.int64),
+            customer_ids=np.zeros(0, np.int64),
+            issued=np.zeros(0, np.int32),
+            paid=np.zeros(0, np.int32),
+            totals=np.zeros(0, np.int64),
+            statuses=np.zeros(0, np.int8),
+            line_invoices=np.zeros(0, np.int64),
+            line_hours=np.zeros(0, np.float64),
+            line_rates=np.zeros(0, np.float64),
+        )
+
+    @classmethod
+    def from_rows(cls, rows, watermark=None) -> "InvoiceFacts":
+        """Build facts from ``(id, customer_id, issued_date, paid_date, total cents, status,
+        stored line_items)`` rows."""
+        if not rows:
+            return cls.empty(watermark)
+        ids, customer_ids, issued, paid, totals, statuses, line_items = zip(*rows)
+        owners, hours, rates = [], [], []
+        for invoice_id, items in zip(ids, line_items):
+            _line_facts(invoice_id, items, owners, hours, rates)
+        return cls(
+            watermark,
+            ids=np.array(ids, np.int64),
+            customer_ids=np.array(customer_ids, np.int64),
+            issued=_day_numbers(issued),
+            paid=_day_numbers(paid),
+            totals=np.array(totals, np.int64),
+            statuses=np.array([STATUS_CODES.get(status, OTHER_STATUS) for status in statuses], np.int8),
+            line_invoices=np.array(owners, np.int64),
+            line_hours=np.array(hours, np.float64),
+            line_rates=np.array(rates, np.float64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def without(self, ids: np.ndarray) -> "InvoiceFacts":
+        """Return the facts minus the invoices in ``ids``."""
+        keep = ~np.isin(self.ids, ids)
+        lines = ~np.isin(self.line_invoices, ids)
+        return InvoiceFacts(
+            self.watermark,
+            **{name: getattr(self, name)[keep] for name in _FACT_ARRAYS},
+            **{name: getattr(self, name)[lines] for name in _LINE_ARRAYS},
+        )
+
+    def merged(self, changed: "InvoiceFacts") -> "InvoiceFacts":
+        """Return the facts with ``changed`` invoices replacing or added to these.
+
+        The result takes the watermark of ``changed``.
+        """
+        if not len(changed):
+            if changed.watermark == self.watermark:
+                return self
+            return InvoiceFacts(changed.watermark, **{name: getattr(self, name) for name in _FACT_ARRAYS + _LINE_ARRAYS})
+        base = self.without(changed.ids)
+        return InvoiceFacts(
+            changed.watermark,
+            **{
+                name: np.concatenate((getattr(base, name), getattr(changed, name)))
+                for name in _FACT_ARRAYS + _LINE_ARRAYS
+            },
+        )
+
+    def _mask(self, statuses=("paid",), start=None, end=None) -> np.ndarray:
+        """Invoices with one of ``statuses`` (all when empty) issued in ``[start, end]``."""
+        if statuses:
+            mask = np.isin(self.statuses, [STATUS_CODES.get(status, OTHER_STATUS) for status in statuses])
+        else:
+            mask = np.ones(len(self.ids), dtype=bool)
+        if start is not None:
+            mask &= self.issued >= day_number(start)
+        if end is not None:
+            mask &= self.issued <= day_number(end)
+        return mask
+
+    def revenue_trend(self, period="month", start=None, end=None, statuses=("paid",)):
+        """Return ``(period start, invoice count, total)`` per ``period`` with invoices, oldest first."""
+        mask = self._mask(statuses, start, end)
+        buckets = self.issued[mask].astype("datetime64[D]").astype(f"datetime64[{PERIODS[period]}]")
+        keys, sums, counts = _group_sums(buckets.astype(np.int64), self.totals[mask])
+        starts = keys.astype(f"datetime64[{PERIODS[period]}]").astype("datetime64[D]").tolist()
+        return [(day, int(count), from_cents(int(total))) for day, count, total in zip(starts, counts, sums)]
+
+    def customer_totals(self, statuses=("paid",), start=None, end=None, limit=None):
+        """Return ``(customer_id, invoice count, total)`` per customer, largest total first."""
+        mask = self._mask(statuses, start, end)
+        keys, sums, counts = _group_sums(self.customer_ids[mask], self.totals[mask])
+        order = np.argsort(-sums, kind="stable")[:limit]
+        return [(int(keys[i]), int(counts[i]), from_cents(int(sums[i]))) for i in order]
+
+    def customer_distribution(self, percentiles=PERCENTILES, statuses=("paid",), start=None, end=None):
+        """Distribution of the per-customer totals, in dollars."""
+        mask = self._mask(statuses, start, end)
+        _keys, sums, _counts = _group_sums(self.customer_ids[mask], self.totals[mask])
+        return _distribution(sums / 100, percentiles)
+
+    def days_to_pay(self, percentiles=PERCENTILES, start=None, end=None) -> Distribution:
+        """Days from issue to payment of paid invoices that recorded a paid date."""
+        mask = self._mask(("paid",), start, end) & (self.paid != NO_DATE)
+        return _distribution(self.paid[mask].astype(np.int64) - self.issued[mask], percentiles)
+
+    def labor_rates(self, percentiles=PERCENTILES, statuses=(), start=None, end=None) -> Distribution:
+        """Distribution of the hourly rates on labor lines, in dollars."""
+        if statuses or start is not None or end is not None:
+            ids = self.ids[self._mask(statuses, start, end)]
+            return _distribution(self.line_rates[np.isin(self.line_invoices, ids)], percentiles)
+        return _distribution(self.line_rates, percentiles)
+
+    def total(self, statuses=("paid",)) -> Decimal:
+        """Sum of the totals of invoices with one of ``statuses``."""
+        return from_cents(int(self.totals[self._mask(statuses)].sum()))
+
+
+class InvoiceAnalytics:
+    """Per-user :class:`InvoiceFacts`, refreshed from the ``updated_at`` watermark."""
+
+    def __init__(self, session_factory=DatabaseManager.get_instance().get_session) -> None:
+        self.session_factory = session_factory
+        self._facts: dict[int, InvoiceFacts] = {}
+        self._locks: dict[int, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _tables(session) -> list:
+        tables = [Invoice.__table__]
+        if is_archive_attached(session.get_bind()):
+            tables.append(archived_invoices)
+        return tables
+
+    @staticmethod
+    def _read(session, tables, user_id, since=None) -> InvoiceFacts:
+        """Read the user's invoices updated at or after ``since`` (all when None).
+
+        The watermark is taken before the rows, so a concurrent write lands
+        at or past it and is read again next time.  Dates are read as
+        stored (ISO text on SQLite), which NumPy parses in bulk, and line
+        items undecoded for :func:`line_item_columns`.
+        """
+        stamps = [
+            session.execute(select(func.max(table.c.updated_at)).where(table.c.user_id == user_id)).scalar()
+            for table in tables
+        ]
+        watermark = max((stamp for stamp in stamps if stamp is not None), default=None)
+        rows = []
+        for table in tables:
+            query = select(
+                table.c.id,
+                table.c.customer_id,
+                type_coerce(table.c.issued_date, String),
+                type_coerce(table.c.paid_date, String),
+                cents(table.c.total),
+                table.c.status,
+                type_coerce(table.c.line_items, NullType()),
+            ).where(table.c.user_id == user_id)
+            if since is not None:
+                query = query.where(table.c.updated_at >= since)
+            rows.extend(session.execute(query).all())
+        return InvoiceFacts.from_rows(rows, watermark)
+
+    def _refresh(self, user_id: int, facts: InvoiceFacts | None) -> InvoiceFacts:
+        with self.session_factory() as session:
+            tables = self._tables(session)
+            if facts is None or facts.watermark is None:
+                return self._read(session, tables, user_id)
+            facts = facts.merged(self._read(session, tables, user_id, since=facts.watermark))
+            count = sum(
+                session.execute(select(func.count()).select_from(table).where(table.c.user_id == user_id)).scalar()
+                for table in tables
+            )
+            if count < len(facts):
+                current = np.concatenate(
+                    [
+                        np.array(
+                            session.execute(select(table.c.id).where(table.c.user_id == user_id)).scalars().all(),
+                            np.int64,
+                        )
+                        for table in tables
+                    ]
+                )
+                facts = facts.without(np.setdiff1d(facts.ids, current))
+            return facts
+
+    def facts(self, user_id: int) -> InvoiceFacts:
+        """Return the user's facts, loading them or reading the invoices changed since."""
+        with self._lock:
+            lock = self._locks.setdefault(user_id, threading.Lock())
+        with lock:
+            facts = self._refresh(user_id, self._facts.get(user_id))
+            self._facts[user_id] = facts
+            return facts
+
+    def invalidate(self, user_id: int | None = None) -> None:
+        """Forget the facts of ``user_id`` (or of every user); the next call reloads."""
+        with self._lock:
+            if user_id is None:
+                self._facts.clear()
+            else:
+                self._facts.pop(user_id, None)
+
+
+_analytics: dict[object, InvoiceAnalytics] = {}
+_analytics_lock = threading.Lock()
+
+
+def get_invoice_analytics(session_factory=DatabaseManager.get_instance().get_session) -> InvoiceAnalytics:
+    """Return the analytics shared by all services using ``session_factory``."""
+    with _analytics_lock:
+        analytics = _analytics.get(session_factory)
+        if analytics is None:
+            analytics = _analytics[session_factory] = InvoiceAnalytics(session_factory)
+        return analytics
@@ -0,0 +1,144 @@
+"""Hi-lo invoice number allocator backed by the ``invoice_sequences`` table.
+
+Every user has their own series; invoice numbers are unique per user.
+Each process reserves a block of sequence values with one short UPDATE and
+then hands numbers out from memory.  Blocks that are not used up (process
+exit, a format change) simply leave gaps; numbers are never reused.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy import event, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from automotive_invoice_manager.backend.database.connection import DatabaseManager, savepoint
+from automotive_invoice_manager.backend.database.models import Invoice, InvoiceSequence
+
+DEFAULT_PREFIX = "INV-"
+DEFAULT_FORMAT = "{prefix}{seq:06d}"
+DEFAULT_BLOCK_SIZE = 20
+
+
+def format_invoice_number(number_format: str, prefix: str, seq: int, user_id: int) -> str:
+    """Render ``number_format``; supports prefix, seq, year, month, user_id."""
+    today = date.today()
+    return number_format.format(
+        prefix=prefix, seq=seq, year=today.year, month=today.month, user_id=user_id
+    )
+
+
+@dataclass
+class _Block:
+    next: int
+    limit: int
+    prefix: str
+    number_format: str
+
+
+class InvoiceNumberAllocator:
+    """Hand out per-user invoice numbers from reserved blocks."""
+
+    def __init__(
+        self,
+        session_factory=DatabaseManager.get_instance().get_session,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> None:
+        self.session_factory = session_factory
+        self.block_size = block_size
+        self._blocks: dict[int, _Block] = {}
+        self._lock = threading.RLock()  # release() may run from a rollback inside _reserve
+
+    def next_number(self, user_id: int) -> str:
+        """Return the next invoice number for ``user_id``."""
+        return self.next_numbers(user_id, 1)[0]
+
+    def next_numbers(self, user_id: int, count: int) -> list[str]:
+        """Return ``count`` consecutive-as-possible numbers for bulk creation."""
+        numbers = []
+        with self._lock:
+            while len(numbers) < count:
+                block = self._blocks.get(user_id)
+                if block is None or block.next >= block.limit:
+                    block = self._reserve(user_id, max(self.block_size, count - len(numbers)))
+                    self._blocks[user_id] = block
+                take = min(count - len(numbers), block.limit - block.next)
+                numbers.extend(
+                    format_invoice_number(block.number_format, block.prefix, seq, user_id)
+                    for seq in range(block.next, block.next + take)
+                )
+                block.next += take
+        return numbers
+
+    def configure(self, user_id: int, prefix: str | None = None, number_format: str | None = None) -> None:
+        """Change the prefix and/or format used for ``user_id``'s numbers."""
+        with self.session_factory() as session:
+            sequence = self._get_or_create(session, user_id)
+            new_prefix = sequence.prefix if prefix is None else prefix
+            new_format = sequence.number_format if number_format is None else number_format
+            try:
+                format_invoice_number(new_format, new_prefix, 1, user_id)
+            except (KeyError, IndexError, ValueError) as e:
+                raise ValueError(f"Invalid invoice number format: {e}") from e
+            sequence.prefix = new_prefix
+            sequence.number_format = new_format
+        self.release(user_id)
+
+    def release(self, user_id: int | None = None) -> None:
+        """Forget reserved blocks (the unused values become gaps)."""
+        with self._lock:
+            if user_id is None:
+                self._blocks.clear()
+            else:
+                self._blocks.pop(user_id, None)
+
+    def _reserve(self, user_id: int, size: int) -> _Block:
+        """Atomically advance the counter by ``size`` and return the block."""
+        table = InvoiceSequence.__table__
+        bump = (
+            update(table)
+            .where(table.c.user_id == user_id)
+            .values(next_value=table.c.next_value + size)
+        )
+        with self.session_factory() as session:
+            if session.execute(bump).rowcount == 0:
+                self._get_or_create(session, user_id)
+                session.flush()
+                session.execute(bump)
+            row = session.execute(
+                select(table.c.next_value, table.c.prefix, table.c.number_format)
+                .where(table.c.user_id == user_id)
+            ).one()
+            # Inside a unit of work the bump commits later; if it is rolled
+            # back the block must not be handed out.
+            event.listen(session, "after_rollback", lambda _s: self.release(user_id), once=True)
+        logging.debug(f"Reserved invoice numbers {row.next_value - size}..{row.next_value - 1} for user {user_id}")
+        return _Block(row.next_value - size, row.next_value, row.prefix, row.number_format)
+
+    @staticmethod
+    def _get_or_create(session, user_id: int) -> InvoiceSequence:
+        sequence = session.query(InvoiceSequence).filter_by(user_id=user_id).first()
+        if sequence is not None:
+            return sequence
+        # New sequences start after the user's existing invoices, so numbers
+        # in the default format rarely collide with pre-allocator data.
+        existing = session.execute(
+            select(func.count()).select_from(Invoice).where(Invoice.user_id == user_id)
+        ).scalar()
+        try:
+            with savepoint(session):
+                session.execute(
+                    insert(InvoiceSequence).values(
+                        user_id=user_id,
+                        prefix=DEFAULT_PREFIX,
+                        number_format=DEFAULT_FORMAT,
+                        next_value=existing + 1,
+                    )
+                )
+        except IntegrityError:
+            pass  # created concurrently by another process
+        return session.query(InvoiceSequence).filter_by(user_id=user_id).one()
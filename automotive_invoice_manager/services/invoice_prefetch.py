@@ -0,0 +1,140 @@
+"""Background prefetch of adjacent invoice list pages and invoice details.
+
+After a page renders, pages N-1 and N+1 (with the same filters) are loaded
+on the worker pool into a small LRU so Prev/Next can render without a
+blocking query.  Likewise the full invoice of the selected row is warmed so
+the detail window opens instantly.  Everything is keyed by filters, and
+:meth:`InvoicePrefetcher.cancel` drops pending and finished work when they
+change.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from .base_service import get_executor
+
+DEFAULT_MAX_PAGES = 6
+DEFAULT_MAX_DETAILS = 16
+
+
+class InvoicePrefetcher:
+    """Bounded cache of speculative ``get_invoice_rows``/``get_invoice`` calls."""
+
+    def __init__(
+        self,
+        invoice_service,
+        executor=None,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        max_details: int = DEFAULT_MAX_DETAILS,
+    ) -> None:
+        self.invoice_service = invoice_service
+        self.executor = executor or get_executor()
+        self.max_pages = max_pages
+        self.max_details = max_details
+        self._pages: OrderedDict[tuple, Future] = OrderedDict()
+        self._details: OrderedDict[int, Future] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"page_hits": 0, "page_misses": 0, "detail_hits": 0, "detail_misses": 0}
+
+    # -- pages ---------------------------------------------------------------
+
+    def prefetch_pages(self, user_id, filters: tuple, page: int, total_pages: int, per_page: int) -> None:
+        """Start loading the neighbours of ``page`` unless already cached.
+
+        ``filters`` is ``(search, status, include_archive)``.
+        """
+        for neighbour in (page + 1, page - 1):
+            if 1 <= neighbour <= total_pages:
+                key = (user_id, filters, per_page, neighbour)
+                self._submit(self._pages, self.max_pages, key, self._load_page, key)
+
+    def _load_page(self, key):
+        user_id, (search, status, include_archive), per_page, page = key
+        return self.invoice_service.get_invoice_rows(
+            user_id,
+            page=page,
+            per_page=per_page,
+            search=search,
+            status=status,
+            include_archive=include_archive,
+        )
+
+    def get_page(self, user_id, filters: tuple, page: int, per_page: int):
+        """Return a prefetched ``(rows, total_pages)`` or None if none was started."""
+        result = self._take(self._pages, (user_id, filters, per_page, page))
+        self.stats["page_hits" if result is not None else "page_misses"] += 1
+        return result
+
+    # -- details -------------------------------------------------------------
+
+    def prefetch_detail(self, invoice_id: int) -> None:
+        """Start loading the full invoice (line items, customer) for ``invoice_id``."""
+        self._submit(self._details, self.max_details, invoice_id, self.invoice_service.get_invoice, invoice_id)
+
+    def get_detail(self, invoice_id: int):
+        """Return the full invoice, falling back to ``get_invoice`` on a miss."""
+        invoice = self._take(self._details, invoice_id)
+        if invoice is not None:
+            self.stats["detail_hits"] += 1
+            return invoice
+        self.stats["detail_misses"] += 1
+        return self.invoice_service.get_invoice(invoice_id)
+
+    # -- bookkeeping ---------------------------------------------------------
+
+    def _submit(self, cache: OrderedDict, limit: int, key, func, *args) -> None:
+        with self._lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return
+            cache[key] = self.executor.submit(func, *args)
+            while len(cache) > limit:
+                _old, future = cache.popitem(last=False)
+                future.cancel()
+
+    def _take(self, cache: OrderedDict, key):
+        """Return the prefetched result for ``key`` or None.
+
+        A prefetch that is still running is waited for rather than repeated.
+        """
+        with self._lock:
+            future = cache.get(key)
+        if future is None or future.cancelled():
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            logging.warning(f"Prefetch of {key} failed: {e}")
+            return None
+
+    def wait(self) -> None:
+        """Block until every prefetch started so far has finished."""
+        with self._lock:
+            futures = list(self._pages.values()) + list(self._details.values())
+        for future in futures:
+            if not future.cancelled():
+                future.exception()
+
+    def cancel(self) -> None:
+        """Drop all prefetched pages and details (filters or data changed)."""
+        with self._lock:
+            futures = list(self._pages.values()) + list(self._details.values())
+            self._pages.clear()
+            self._details.clear()
+        for future in futures:
+            future.cancel()
+
+    def hit_rate(self) -> dict:
+        """Return page and detail hit rates (0..1, None before any lookup)."""
+
+        def rate(hits, misses):
+            return round(hits / (hits + misses), 3) if hits + misses else None
+
+        return {
+            "pages": rate(self.stats["page_hits"], self.stats["page_misses"]),
+            "details": rate(self.stats["detail_hits"], self.stats["detail_misses"]),
+        }
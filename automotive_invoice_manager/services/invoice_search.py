@@ -0,0 +1,74 @@
+"""Client-side narrowing of invoice search results for search-as-you-type.
+
+While the user extends a search term (``"sm"`` -> ``"smi"`` -> ``"smith"``)
+every new match set is a subset of the previous one, so it can be filtered
+from the rows already in memory instead of re-running the ``ilike`` query.
+The database is only asked again when the term is broadened, the filters
+change or the cached result was truncated at :data:`SEARCH_ROW_LIMIT`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .rows import InvoiceRow
+
+# Most matching rows kept in memory for local narrowing; larger result
+# sets are paged from the database as before.
+SEARCH_ROW_LIMIT = 2000
+
+
+def _fold(term: str) -> str:
+    return term.lower()
+
+
+def can_match_locally(term: str) -> bool:
+    """Whether Python matching of ``term`` agrees with the SQL ``ilike``.
+
+    ``%``/``_`` are LIKE wildcards and SQLite only case-folds ASCII.
+    """
+    return term.isascii() and "%" not in term and "_" not in term
+
+
+def row_matches(row: InvoiceRow, folded_term: str) -> bool:
+    """Mirror of the ``invoice_number``/``customer_name`` ``ilike`` filter."""
+    return folded_term in row.invoice_number.lower() or folded_term in (row.customer_name or "").lower()
+
+
+@dataclass
+class _Result:
+    term: str
+    filters: tuple
+    rows: list[InvoiceRow]
+    truncated: bool
+
+
+class InvoiceSearchCache:
+    """The last database search result, reused while the term only narrows."""
+
+    def __init__(self) -> None:
+        self._result: _Result | None = None
+
+    def store(self, term: str, filters: tuple, rows: list[InvoiceRow], truncated: bool) -> None:
+        """Remember the rows the database returned for ``term`` and ``filters``."""
+        self._result = _Result(_fold(term), filters, rows, truncated)
+
+    def narrow(self, term: str, filters: tuple) -> list[InvoiceRow] | None:
+        """Return the matches for ``term`` from memory, or None if a query is needed."""
+        result = self._result
+        term = _fold(term)
+        if (
+            result is None
+            or result.truncated
+            or result.filters != filters
+            or result.term not in term
+            or not can_match_locally(term)
+        ):
+            return None
+        if term == result.term:
+            return result.rows
+        return [row for row in result.rows if row_matches(row, term)]
+
+    def clear(self) -> None:
+        """Forget the cached result (call after invoices change)."""
+        self._result = None
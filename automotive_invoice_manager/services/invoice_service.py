@@ -1,20 +1,77 @@
 # services/invoice_service.py - Invoice Service
 import logging
 from datetime import datetime, date
-from automotive_invoice_manager.backend.database.models import Invoice, Customer
-from automotive_invoice_manager.backend.database.connection import DatabaseManager
-from sqlalchemy import func, desc
-from sqlalchemy.orm import joinedload
+from decimal import Decimal
+from automotive_invoice_manager.backend.database.models import DETAIL_GROUP, Invoice, Customer
+from automotive_invoice_manager.backend.database.connection import DatabaseManager, savepoint
+from automotive_invoice_manager.backend.database.archive import archived_invoices, is_archive_attached
+from sqlalchemy import case, func, desc, select, union_all
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased, contains_eager, joinedload, undefer, undefer_group
+from .aging import (
+    BUCKET_LABELS,
+    RECEIVABLE_STATUSES,
+    AgingReport,
+    AgingReportCache,
+    bucket_cutoffs,
+    get_aging_cache,
+    invoice_write_generation,
+)
 from .base_service import BaseService
+from .customer_index import CustomerNameIndex, get_customer_index
+from .invoice_analytics import InvoiceAnalytics, InvoiceFacts, get_invoice_analytics
+from .invoice_numbers import InvoiceNumberAllocator
+from .invoice_search import SEARCH_ROW_LIMIT
+from .overdue_job import OPEN_STATUSES, OVERDUE, OverdueStatusJob, check_status_choice, effective_status
+from .rows import AgingRow, InvoiceRow
+
+# Attempts to find a free generated number when legacy rows collide.
+MAX_NUMBER_ATTEMPTS = 5
 
 
 class InvoiceService:
     """Service for managing invoices."""
 
     def __init__(
-        self, session_factory=DatabaseManager.get_instance().get_session
+        self,
+        session_factory=DatabaseManager.get_instance().get_session,
+        number_allocator: InvoiceNumberAllocator | None = None,
+        status_job: OverdueStatusJob | None = None,
+        customer_index: CustomerNameIndex | None = None,
+        aging_cache: AgingReportCache | None = None,
+        analytics: InvoiceAnalytics | None = None,
     ) -> None:
         self.session_factory = session_factory
+        self.number_allocator = number_allocator or InvoiceNumberAllocator(session_factory)
+        self.status_job = status_job or OverdueStatusJob(session_factory)
+        self.customer_index = customer_index or get_customer_index(session_factory)
+        self.aging_cache = aging_cache or get_aging_cache(session_factory)
+        self.analytics = analytics or get_invoice_analytics(session_factory)
+
+    def _customer_id(self, session, user_id, data):
+        """Return the customer id for an invoice payload (``customer_id`` or ``customer`` name)."""
+        if data.get("customer_id") is not None:
+            return data["customer_id"]
+        return self.customer_index.resolve(user_id, data["customer"], session)
+
+    @staticmethod
+    def _archive_entity(session, user_id=None, include_hot=False):
+        """Return an ``Invoice`` alias over archived rows (optionally UNION the hot ones).
+
+        Returns None when no archive is attached.
+        """
+        if not is_archive_attached(session.get_bind()):
+            return None
+        hot = Invoice.__table__
+        cold = select(*(archived_invoices.c[c.name] for c in hot.columns))
+        if user_id is not None:
+            cold = cold.where(archived_invoices.c.user_id == user_id)
+        if include_hot:
+            current = select(*hot.columns)
+            if user_id is not None:
+                current = current.where(hot.c.user_id == user_id)
+            cold = union_all(current, cold)
+        return aliased(Invoice, cold.subquery("invoices_archived"), adapt_on_names=True)
 
     def get_recent_invoices(self, user_id, limit=10):
         """Get recent invoices for dashboard."""
@@ -34,16 +91,22 @@ class InvoiceService:
             return []
 
     def get_invoice_count(self, user_id):
-        """Get total number of invoices for user."""
+        """Get total number of invoices for user, archived ones included."""
         try:
             with self.session_factory() as session:
-                return session.query(Invoice).options(joinedload(Invoice.customer)).filter_by(user_id=user_id).count()
+                count = session.query(func.count(Invoice.id)).filter_by(user_id=user_id).scalar()
+                if is_archive_attached(session.get_bind()):
+                    count += session.execute(
+                        select(func.count()).select_from(archived_invoices)
+                        .where(archived_invoices.c.user_id == user_id)
+                    ).scalar()
+                return count
         except Exception as e:
             logging.error(f"Error getting invoice count: {e}")
             return 0
 
     def get_total_revenue(self, user_id):
-        """Get total revenue from paid invoices."""
+        """Get total revenue from paid invoices, archived ones included."""
         try:
             with self.session_factory() as session:
                 result = (
@@ -51,25 +114,61 @@ class InvoiceService:
                     .filter(Invoice.user_id == user_id, Invoice.status == "paid")
                     .scalar()
                 )
+                if is_archive_attached(session.get_bind()):
+                    archived = session.execute(
+                        select(func.sum(archived_invoices.c.total))
+                        .where(archived_invoices.c.user_id == user_id)
+                    ).scalar()
+                    return (result or Decimal("0")) + (archived or 0)
 
-                return float(result or 0)
+                return result or Decimal("0")
 
         except Exception as e:
             logging.error(f"Error getting total revenue: {e}")
-            return 0.0
+            return Decimal("0")
+
+    def get_revenue_breakdown(self, user_id, start=None, end=None, status="paid"):
+        """Sum ``labor``, ``parts``, ``tax`` and ``total`` of invoices issued in ``[start, end]``.
+
+        Reads the denormalized subtotal columns through the
+        ``(user_id, issued_date)`` index; archived invoices are included
+        when ``status`` is ``"paid"``.  Returns Decimals keyed by name.
+        """
+        def sums(table):
+            query = select(
+                func.coalesce(func.sum(table.c.labor_subtotal), 0),
+                func.coalesce(func.sum(table.c.parts_subtotal), 0),
+                func.coalesce(func.sum(table.c.tax_amount), 0),
+                func.coalesce(func.sum(table.c.total), 0),
+            ).where(table.c.user_id == user_id)
+            if start is not None:
+                query = query.where(table.c.issued_date >= start)
+            if end is not None:
+                query = query.where(table.c.issued_date <= end)
+            if status:
+                query = query.where(table.c.status == status)
+            return session.execute(query).one()
+
+        names = ("labor", "parts", "tax", "total")
+        try:
+            with self.session_factory() as session:
+                totals = sums(Invoice.__table__)
+                if status == "paid" and is_archive_attached(session.get_bind()):
+                    totals = [a + b for a, b in zip(totals, sums(archived_invoices))]
+                return dict(zip(names, totals))
+        except Exception as e:
+            logging.error(f"Error getting revenue breakdown: {e}")
+            return dict.fromkeys(names, Decimal("0"))
 
     def get_overdue_count(self, user_id):
         """Get count of overdue invoices."""
         try:
+            self.status_job.ensure_current()
             with self.session_factory() as session:
                 return (
-                    session.query(Invoice).options(joinedload(Invoice.customer))
-                    .filter(
-                        Invoice.user_id == user_id,
-                        Invoice.due_date < date.today(),
-                        Invoice.status.in_(["sent", "draft"]),
-                    )
-                    .count()
+                    session.query(func.count(Invoice.id))
+                    .filter(Invoice.user_id == user_id, Invoice.status == OVERDUE)
+                    .scalar()
                 )
 
         except Exception as e:
@@ -79,42 +178,113 @@ class InvoiceService:
     def get_pending_count(self, user_id):
         """Get count of invoices that are pending payment."""
         try:
+            self.status_job.ensure_current()
             with self.session_factory() as session:
                 return (
-                    session.query(Invoice)
-                    .filter(
-                        Invoice.user_id == user_id,
-                        Invoice.status.in_(["draft", "sent"]),
-                        Invoice.due_date >= date.today(),
-                    )
-                    .count()
+                    session.query(func.count(Invoice.id))
+                    .filter(Invoice.user_id == user_id, Invoice.status.in_(OPEN_STATUSES))
+                    .scalar()
                 )
         except Exception as e:
             logging.error(f"Error getting pending count: {e}")
             return 0
 
-    def get_invoices(self, user_id, page=1, per_page=10, search=None, status=None):
-        """Return paginated invoices with optional search and status filter."""
+    def get_aging_report(self, user_id, today=None):
+        """Return the accounts-receivable :class:`AgingReport` for a user.
+
+        Open invoices are bucketed by days past ``due_date`` in one grouped
+        query.  The result is cached until an invoice is written or the day
+        changes.
+        """
+        today = today or date.today()
+        cached = self.aging_cache.get(user_id, today)
+        if cached is not None:
+            return cached
+        # Taken before reading so a concurrent write makes the entry stale
+        generation = invoice_write_generation()
         try:
             with self.session_factory() as session:
+                cutoffs = bucket_cutoffs(today)
+                bucket = case(
+                    *((Invoice.due_date >= cutoff, index) for index, cutoff in enumerate(cutoffs)),
+                    else_=len(cutoffs),
+                ).label("bucket")
+                grouped = (
+                    select(
+                        Invoice.customer_id,
+                        bucket,
+                        func.count(Invoice.id).label("invoice_count"),
+                        func.sum(Invoice.total).label("amount"),
+                    )
+                    .where(Invoice.user_id == user_id, Invoice.status.in_(RECEIVABLE_STATUSES))
+                    .group_by(Invoice.customer_id, bucket)
+                    .subquery()
+                )
+                rows = session.execute(
+                    select(grouped, Customer.name)
+                    .join(Customer, Customer.id == grouped.c.customer_id)
+                    .order_by(Customer.name, grouped.c.customer_id)
+                )
+                customers = {}
+                for customer_id, index, count, amount, name in rows:
+                    entry = customers.setdefault(customer_id, [name, 0, [Decimal("0")] * len(BUCKET_LABELS)])
+                    entry[1] += count
+                    entry[2][index] += amount or 0
+                report = AgingReport(
+                    today,
+                    [
+                        AgingRow(customer_id, name, count, tuple(buckets), sum(buckets, Decimal("0")))
+                        for customer_id, (name, count, buckets) in customers.items()
+                    ],
+                )
+        except Exception as e:
+            logging.error(f"Error computing aging report: {e}")
+            return AgingReport(today)
+        self.aging_cache.put(user_id, generation, report)
+        return report
+
+    def get_invoice_facts(self, user_id):
+        """Return the user's :class:`InvoiceFacts` for trend and distribution reports.
+
+        The first call loads every invoice of the user; later calls only
+        read the invoices changed since.
+        """
+        try:
+            return self.analytics.facts(user_id)
+        except Exception as e:
+            logging.error(f"Error loading invoice analytics: {e}")
+            return InvoiceFacts.empty()
+
+    def get_invoices(self, user_id, page=1, per_page=10, search=None, status=None, include_archive=False):
+        """Return paginated invoices with optional search and status filter.
+
+        Only the hot table is read unless ``include_archive`` is set, in which
+        case archived invoices are UNIONed in.
+        """
+        try:
+            self.status_job.ensure_current()
+            with self.session_factory() as session:
+                inv = Invoice
+                if include_archive:
+                    inv = self._archive_entity(session, user_id, include_hot=True) or Invoice
                 query = (
-                    session.query(Invoice).options(joinedload(Invoice.customer))
-                    .join(Customer)
-                    .filter(Invoice.user_id == user_id)
+                    session.query(inv).options(joinedload(inv.customer))
+                    .join(Customer, inv.customer_id == Customer.id)
+                    .filter(inv.user_id == user_id)
                 )
                 if search:
                     pattern = f"%{search}%"
                     query = query.filter(
-                        (Invoice.invoice_number.ilike(pattern))
+                        (inv.invoice_number.ilike(pattern))
                         | (Customer.name.ilike(pattern))
                     )
                 if status:
-                    query = query.filter(Invoice.status == status)
+                    query = query.filter(inv.status == status)
 
-                total = query.count()
+                total = query.with_entities(func.count(inv.id)).scalar()
                 total_pages = max(1, (total + per_page - 1) // per_page)
                 invoices = (
-                    query.order_by(desc(Invoice.created_at))
+                    query.order_by(desc(inv.created_at))
                     .offset((page - 1) * per_page)
                     .limit(per_page)
                     .all()
@@ -124,11 +294,107 @@ class InvoiceService:
             logging.error(f"Error fetching invoices: {e}")
             return [], 1
 
+    @staticmethod
+    def _row_select(table, user_id, search=None, status=None):
+        query = (
+            select(
+                table.c.id,
+                table.c.invoice_number,
+                Customer.name.label("customer_name"),
+                table.c.issued_date,
+                table.c.due_date,
+                table.c.status,
+                table.c.total,
+                table.c.created_at,
+            )
+            .join(Customer, Customer.id == table.c.customer_id)
+            .where(table.c.user_id == user_id)
+        )
+        if search:
+            pattern = f"%{search}%"
+            query = query.where(table.c.invoice_number.ilike(pattern) | Customer.name.ilike(pattern))
+        if status:
+            query = query.where(table.c.status == status)
+        return query
+
+    def get_invoice_rows(self, user_id, page=1, per_page=10, search=None, status=None, include_archive=False):
+        """Like :meth:`get_invoices` but returns :class:`InvoiceRow` tuples.
+
+        Only the columns shown in the list are selected (no ``line_items``)
+        and no ORM entities are created.
+        """
+        try:
+            self.status_job.ensure_current()
+            with self.session_factory() as session:
+                selects = [self._row_select(Invoice.__table__, user_id, search, status)]
+                if include_archive and is_archive_attached(session.get_bind()):
+                    selects.append(self._row_select(archived_invoices, user_id, search, status))
+                rows = (union_all(*selects) if len(selects) > 1 else selects[0]).subquery()
+
+                total = session.execute(select(func.count()).select_from(rows)).scalar()
+                total_pages = max(1, (total + per_page - 1) // per_page)
+                page_rows = session.execute(
+                    select(*(rows.c[name] for name in InvoiceRow._fields))
+                    .order_by(desc(rows.c.created_at))
+                    .offset((page - 1) * per_page)
+                    .limit(per_page)
+                )
+                return [InvoiceRow(*row) for row in page_rows], total_pages
+        except Exception as e:
+            logging.error(f"Error fetching invoice rows: {e}")
+            return [], 1
+
+    def search_invoice_rows(self, user_id, search=None, status=None, include_archive=False, limit=SEARCH_ROW_LIMIT):
+        """Return ``(rows, truncated)``: up to ``limit`` matching rows, newest first.
+
+        One query without a count; ``truncated`` is set when more rows match.
+        Used to seed :class:`InvoiceSearchCache` for search-as-you-type.
+        """
+        try:
+            self.status_job.ensure_current()
+            with self.session_factory() as session:
+                selects = [self._row_select(Invoice.__table__, user_id, search, status)]
+                if include_archive and is_archive_attached(session.get_bind()):
+                    selects.append(self._row_select(archived_invoices, user_id, search, status))
+                rows = (union_all(*selects) if len(selects) > 1 else selects[0]).subquery()
+                result = [
+                    InvoiceRow(*row)
+                    for row in session.execute(
+                        select(*(rows.c[name] for name in InvoiceRow._fields))
+                        .order_by(desc(rows.c.created_at))
+                        .limit(limit + 1)
+                    )
+                ]
+                return result[:limit], len(result) > limit
+        except Exception as e:
+            logging.error(f"Error searching invoice rows: {e}")
+            return [], False
+
     def get_invoice(self, invoice_id):
-        """Get invoice by ID."""
+        """Get invoice by ID with line items and full customer, falling back to the archive."""
         try:
             with self.session_factory() as session:
-                return session.query(Invoice).options(joinedload(Invoice.customer)).get(invoice_id)
+                invoice = (
+                    session.query(Invoice)
+                    .options(
+                        joinedload(Invoice.customer).undefer_group(DETAIL_GROUP),
+                        undefer_group(DETAIL_GROUP),
+                    )
+                    .get(invoice_id)
+                )
+                archived = None if invoice else self._archive_entity(session)
+                if archived is not None:
+                    invoice = (
+                        session.query(archived)
+                        .join(Customer, archived.customer_id == Customer.id)
+                        .options(
+                            contains_eager(archived.customer).undefer_group(DETAIL_GROUP),
+                            undefer(archived.line_items),
+                        )
+                        .filter(archived.id == invoice_id)
+                        .first()
+                    )
+                return invoice
         except Exception as e:
             logging.error(f"Error fetching invoice {invoice_id}: {e}")
             return None
@@ -137,11 +403,21 @@ class InvoiceService:
         """Get invoice for a user by invoice number."""
         try:
             with self.session_factory() as session:
-                return (
+                invoice = (
                     session.query(Invoice).options(joinedload(Invoice.customer))
                     .filter_by(user_id=user_id, invoice_number=invoice_number)
                     .first()
                 )
+                archived = None if invoice else self._archive_entity(session, user_id)
+                if archived is not None:
+                    invoice = (
+                        session.query(archived)
+                        .join(Customer, archived.customer_id == Customer.id)
+                        .options(contains_eager(archived.customer))
+                        .filter(archived.invoice_number == invoice_number)
+                        .first()
+                    )
+                return invoice
         except Exception as e:
             logging.error(
                 f"Error fetching invoice {invoice_number} for user {user_id}: {e}"
@@ -149,65 +425,119 @@ class InvoiceService:
             return None
 
     def create_invoice(self, user, data):
-        """Create a new invoice for a user."""
-        try:
-            with self.session_factory() as session:
-                customer = (
-                    session.query(Customer)
-                    .filter_by(user_id=user.id, name=data["customer"])
-                    .first()
-                )
-                if not customer:
-                    raise ValueError("Customer not found")
-
-                number = data.get("invoice_number") or str(int(datetime.utcnow().timestamp()))
-                existing = session.query(Invoice).options(joinedload(Invoice.customer)).filter_by(invoice_number=number).first()
-                if existing:
-                    raise ValueError("Invoice number already exists")
+        """Create a new invoice for a user.
 
-                if data["due_date"] < data["issued_date"]:
-                    raise ValueError("Due date cannot be before issued date")
+        The customer is given as ``customer_id`` or by ``customer`` name,
+        which is resolved through the shared :class:`CustomerNameIndex`.
+        Without an explicit ``invoice_number`` one is taken from the user's
+        sequence.  Uniqueness is enforced by the database constraint rather
+        than a pre-check query; numbers of archived invoices, which the
+        constraint cannot see, are checked against the archive.
+        """
+        if data["due_date"] < data["issued_date"]:
+            logging.error("Error creating invoice: Due date cannot be before issued date")
+            raise ValueError("Due date cannot be before issued date")
+        check_status_choice(data.get("status", "draft"), data["due_date"])
 
-                invoice = Invoice(
-                    user_id=user.id,
-                    customer_id=customer.id,
-                    invoice_number=number,
-                    issued_date=data["issued_date"],
-                    due_date=data["due_date"],
-                    line_items=data.get("line_items", []),
-                    status=data.get("status", "draft"),
-                    template=data.get("template", "standard"),
-                )
-                invoice.total = invoice.calculate_total()
-                session.add(invoice)
+        supplied = data.get("invoice_number")
+        number = supplied or self.number_allocator.next_number(user.id)
+        for _attempt in range(MAX_NUMBER_ATTEMPTS):
+            try:
+                invoice = self._insert_invoice(user, data, number)
+            except Exception as e:
+                logging.error(f"Error creating invoice: {e}")
+                raise
+            if invoice is not None:
                 return invoice
-        except Exception as e:
-            logging.error(f"Error creating invoice: {e}")
-            raise
+            if supplied:
+                raise ValueError("Invoice number already exists")
+            logging.warning(f"Generated invoice number {number} already taken, retrying")
+            number = self.number_allocator.next_number(user.id)
+        raise ValueError("Could not allocate a free invoice number")
+
+    def _insert_invoice(self, user, data, number):
+        """Insert the invoice; returns None if ``number`` is taken, archived invoices included.
+
+        The insert runs in a savepoint, so a taken number rolls back only this
+        attempt and leaves a surrounding unit of work usable for the retry.
+        """
+        with self.session_factory() as session:
+            customer_id = self._customer_id(session, user.id, data)
+            if customer_id is None:
+                raise ValueError("Customer not found")
+            if is_archive_attached(session.get_bind()) and session.execute(
+                select(archived_invoices.c.id)
+                .where(archived_invoices.c.user_id == user.id, archived_invoices.c.invoice_number == number)
+                .limit(1)
+            ).first():
+                return None
+
+            status = effective_status(data.get("status", "draft"), data["due_date"])
+            invoice = Invoice(
+                user_id=user.id,
+                customer_id=customer_id,
+                invoice_number=number,
+                issued_date=data["issued_date"],
+                due_date=data["due_date"],
+                line_items=data.get("line_items", []),
+                status=status,
+                paid_date=date.today() if status == "paid" else None,
+                template=data.get("template", "standard"),
+            )
+            invoice.update_totals()
+            try:
+                with savepoint(session):
+                    session.add(invoice)
+                    session.flush()
+            except IntegrityError as e:
+                if "invoice_number" not in str(e.orig):
+                    raise
+                return None
+            return invoice
+
+    def set_invoice_number_format(self, user_id, prefix=None, number_format=None):
+        """Set the prefix/format for a user's generated invoice numbers.
+
+        ``number_format`` is a ``str.format`` pattern with ``prefix``, ``seq``,
+        ``year``, ``month`` and ``user_id`` fields, e.g.
+        ``"{prefix}{year}-{seq:05d}"``.
+        """
+        self.number_allocator.configure(user_id, prefix, number_format)
+
+    @staticmethod
+    def _check_not_archived(session, invoice_id):
+        """Raise ValueError if ``invoice_id`` is an archived (read-only) invoice."""
+        if is_archive_attached(session.get_bind()) and session.execute(
+            select(archived_invoices.c.id).where(archived_invoices.c.id == invoice_id)
+        ).first():
+            raise ValueError("Archived invoices are read-only and cannot be changed or deleted")
 
     def update_invoice(self, invoice_id, data):
-        """Update an existing invoice."""
+        """Update an existing invoice; raises ValueError for archived ones."""
         try:
             with self.session_factory() as session:
                 invoice = session.query(Invoice).options(joinedload(Invoice.customer)).get(invoice_id)
                 if not invoice:
+                    self._check_not_archived(session, invoice_id)
                     return False
-                if "customer" in data:
-                    customer = (
-                        session.query(Customer)
-                        .filter_by(user_id=invoice.user_id, name=data["customer"])
-                        .first()
-                    )
-                    if customer:
-                        invoice.customer_id = customer.id
+                if "customer" in data or "customer_id" in data:
+                    customer_id = self._customer_id(session, invoice.user_id, data)
+                    if customer_id is not None:
+                        invoice.customer_id = customer_id
                 invoice.issued_date = data.get("issued_date", invoice.issued_date)
                 invoice.due_date = data.get("due_date", invoice.due_date)
                 if invoice.due_date < invoice.issued_date:
                     raise ValueError("Due date cannot be before issued date")
                 if "line_items" in data:
                     invoice.line_items = data["line_items"]
-                    invoice.total = invoice.calculate_total()
-                invoice.status = data.get("status", invoice.status)
+                    invoice.update_totals()
+                requested = data.get("status", invoice.status)
+                if requested != invoice.status:
+                    check_status_choice(requested, invoice.due_date)
+                status = effective_status(requested, invoice.due_date)
+                if status != invoice.status:
+                    invoice.paid_date = date.today() if status == "paid" else None
+                invoice.status = status
                 invoice.template = data.get("template", invoice.template)
                 invoice.updated_at = datetime.utcnow()
                 return True
@@ -216,11 +546,12 @@ class InvoiceService:
             raise
 
     def delete_invoice(self, invoice_id):
-        """Delete invoice by ID."""
+        """Delete invoice by ID; raises ValueError for archived ones."""
         try:
             with self.session_factory() as session:
                 invoice = session.query(Invoice).options(joinedload(Invoice.customer)).get(invoice_id)
                 if not invoice:
+                    self._check_not_archived(session, invoice_id)
                     return False
                 session.delete(invoice)
                 return True
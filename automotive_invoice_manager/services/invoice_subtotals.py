@@ -0,0 +1,166 @@
+"""Backfill and consistency checks for the invoice subtotal columns.
+
+``labor_subtotal``, ``parts_subtotal`` and ``tax_amount`` are written with
+``total`` by :meth:`Invoice.update_totals`.  Rows from before the columns
+existed hold NULLs; :meth:`InvoiceSubtotalBackfill.run` fills them from the
+line items in short, id-ordered chunks (hot table and, when attached, the
+archive), so it can be interrupted and resumed at any time.  Amounts are
+read, compared and written as integer cents.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+
+from sqlalchemy import BigInteger, and_, bindparam, func, or_, select, true, update
+
+from automotive_invoice_manager.backend.database.archive import archived_invoices, is_archive_attached
+from automotive_invoice_manager.backend.database.connection import DatabaseManager
+from automotive_invoice_manager.backend.database.models import Invoice
+from automotive_invoice_manager.backend.database.money import cents, invoice_cents
+
+CHUNK_SIZE = 1000
+
+# Most offending invoice ids listed in a SubtotalCheck
+MAX_EXAMPLES = 100
+
+
+def _missing(table):
+    return or_(table.c.labor_subtotal.is_(None), table.c.parts_subtotal.is_(None), table.c.tax_amount.is_(None))
+
+
+def _user_filter(table, user_id):
+    return table.c.user_id == user_id if user_id is not None else true()
+
+
+@dataclass
+class SubtotalCheck:
+    """Outcome of :meth:`InvoiceSubtotalBackfill.check`."""
+
+    checked: int = 0
+    # Breakdown not filled in yet
+    missing: int = 0
+    # labor + parts + tax differs from total
+    unbalanced: int = 0
+    # Breakdown differs from the line items (deep check only)
+    stale: int = 0
+    examples: list[int] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not (self.missing or self.unbalanced or self.stale)
+
+    def _example(self, invoice_id: int) -> None:
+        if len(self.examples) < MAX_EXAMPLES:
+            self.examples.append(invoice_id)
+
+
+class InvoiceSubtotalBackfill:
+    """Chunked fill-in and verification of the invoice subtotal columns."""
+
+    def __init__(
+        self, session_factory=DatabaseManager.get_instance().get_session, chunk_size: int = CHUNK_SIZE
+    ) -> None:
+        self.session_factory = session_factory
+        self.chunk_size = chunk_size
+
+    def _tables(self, session):
+        tables = [Invoice.__table__]
+        if is_archive_attached(session.get_bind()):
+            tables.append(archived_invoices)
+        return tables
+
+    def _chunks(self, table, where):
+        """Yield ``(session, rows)`` per id-ordered chunk; each chunk commits on its own."""
+        last_id = 0
+        while True:
+            with self.session_factory() as session:
+                rows = session.execute(
+                    select(
+                        table.c.id,
+                        table.c.line_items,
+                        cents(table.c.total),
+                        cents(table.c.labor_subtotal),
+                        cents(table.c.parts_subtotal),
+                        cents(table.c.tax_amount),
+                    )
+                    .where(table.c.id > last_id, where)
+                    .order_by(table.c.id)
+                    .limit(self.chunk_size)
+                ).all()
+                if not rows:
+                    return
+                yield session, rows
+            last_id = rows[-1].id
+
+    def run(self, user_id: int | None = None, progress=None) -> int:
+        """Fill in missing breakdowns; returns the number of rows updated.
+
+        ``total`` is left alone: rows whose line items disagree with it are
+        reported by :meth:`check` and fixed by ``recompute-totals``.
+        """
+        with self.session_factory() as session:
+            tables = self._tables(session)
+        filled = 0
+        for table in tables:
+            statement = (
+                update(table)
+                .where(table.c.id == bindparam("row_id"))
+                .values(
+                    labor_subtotal=bindparam("labor", type_=BigInteger),
+                    parts_subtotal=bindparam("parts", type_=BigInteger),
+                    tax_amount=bindparam("tax", type_=BigInteger),
+                )
+            )
+            for session, rows in self._chunks(table, and_(_missing(table), _user_filter(table, user_id))):
+                values = []
+                for row in rows:
+                    _total, labor, parts, tax = invoice_cents(row.line_items)
+                    values.append({"row_id": row.id, "labor": labor, "parts": parts, "tax": tax})
+                session.execute(statement, values)
+                filled += len(values)
+                if progress is not None:
+                    progress(filled)
+        if filled:
+            logging.info(f"Backfilled subtotals of {filled} invoices")
+        return filled
+
+    def check(self, user_id: int | None = None, deep: bool = False, progress=None) -> SubtotalCheck:
+        """Count rows with missing or unbalanced breakdowns.
+
+        With ``deep`` every row's breakdown is also recomputed from its line
+        items (a chunked full scan); otherwise only SQL aggregates are used.
+        """
+        result = SubtotalCheck()
+        with self.session_factory() as session:
+            tables = self._tables(session)
+            for table in tables:
+                scope = _user_filter(table, user_id)
+                unbalanced = and_(
+                    scope,
+                    ~_missing(table),
+                    cents(table.c.total) != table.c.labor_subtotal + table.c.parts_subtotal + table.c.tax_amount,
+                )
+                result.checked += session.execute(select(func.count()).select_from(table).where(scope)).scalar()
+                result.missing += session.execute(
+                    select(func.count()).select_from(table).where(scope, _missing(table))
+                ).scalar()
+                result.unbalanced += session.execute(
+                    select(func.count()).select_from(table).where(unbalanced)
+                ).scalar()
+                for invoice_id in session.execute(
+                    select(table.c.id).where(unbalanced).order_by(table.c.id).limit(MAX_EXAMPLES)
+                ).scalars():
+                    result._example(invoice_id)
+        if deep:
+            for table in tables:
+                for _session, rows in self._chunks(table, and_(_user_filter(table, user_id), ~_missing(table))):
+                    for row in rows:
+                        _total, labor, parts, tax = invoice_cents(row.line_items)
+                        if (labor, parts, tax) != (row.labor_subtotal, row.parts_subtotal, row.tax_amount):
+                            result.stale += 1
+                            result._example(row.id)
+                    if progress is not None:
+                        progress(rows[-1].id)
+        return result
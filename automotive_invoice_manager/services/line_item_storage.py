@@ -0,0 +1,110 @@
+"""Rewrite of legacy JSON line items into the binary column format.
+
+:class:`LineItems` reads rows written as JSON text as well as its own
+format, so the rewrite is optional and can run at any time.  It works in
+short, id-ordered chunks (hot table and, when attached, the archive) that
+each commit on their own, so it can be interrupted and resumed.  SQLite
+only returns the freed pages to the file system on ``VACUUM``.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from sqlalchemy import LargeBinary, bindparam, func, select, text, true, type_coerce, update
+from sqlalchemy.types import NullType
+
+from automotive_invoice_manager.backend.database.archive import archived_invoices, is_archive_attached
+from automotive_invoice_manager.backend.database.connection import DatabaseManager
+from automotive_invoice_manager.backend.database.line_items import (
+    decode_line_items,
+    encode_line_items,
+    is_current_format,
+)
+from automotive_invoice_manager.backend.database.models import Invoice
+
+CHUNK_SIZE = 1000
+
+
+class LineItemRewrite:
+    """Chunked conversion of JSON ``line_items`` rows to the binary format."""
+
+    def __init__(
+        self, session_factory=DatabaseManager.get_instance().get_session, chunk_size: int = CHUNK_SIZE
+    ) -> None:
+        self.session_factory = session_factory
+        self.chunk_size = chunk_size
+
+    def _tables(self):
+        with self.session_factory() as session:
+            bind = session.get_bind()
+            tables = [Invoice.__table__]
+            if is_archive_attached(bind):
+                tables.append(archived_invoices)
+            return tables, bind.dialect.name == "sqlite"
+
+    def _legacy_chunks(self, table, sqlite: bool):
+        """Yield ``(session, rows)`` of not yet converted rows per id-ordered chunk.
+
+        SQLite filters on the storage class; elsewhere every row is read
+        and checked here.
+        """
+        legacy = func.typeof(table.c.line_items) == "text" if sqlite else true()
+        raw = type_coerce(table.c.line_items, NullType()).label("raw")
+        last_id = 0
+        while True:
+            with self.session_factory() as session:
+                rows = session.execute(
+                    select(table.c.id, raw)
+                    .where(table.c.id > last_id, legacy)
+                    .order_by(table.c.id)
+                    .limit(self.chunk_size)
+                ).all()
+                if not rows:
+                    return
+                yield session, [row for row in rows if row.raw is not None and not is_current_format(row.raw)]
+            last_id = rows[-1].id
+
+    def pending(self) -> int:
+        """Count rows still holding JSON text."""
+        tables, sqlite = self._tables()
+        if sqlite:
+            with self.session_factory() as session:
+                return sum(
+                    session.execute(
+                        select(func.count()).select_from(table).where(func.typeof(table.c.line_items) == "text")
+                    ).scalar()
+                    for table in tables
+                )
+        return sum(len(rows) for table in tables for _session, rows in self._legacy_chunks(table, sqlite))
+
+    def run(self, progress=None) -> int:
+        """Re-encode legacy rows; returns the number of rows rewritten."""
+        tables, sqlite = self._tables()
+        rewritten = 0
+        for table in tables:
+            statement = (
+                update(table)
+                .where(table.c.id == bindparam("row_id"))
+                .values(line_items=bindparam("encoded", type_=LargeBinary))
+            )
+            for session, rows in self._legacy_chunks(table, sqlite):
+                if rows:
+                    session.execute(
+                        statement,
+                        [{"row_id": row.id, "encoded": encode_line_items(decode_line_items(row.raw))} for row in rows],
+                    )
+                rewritten += len(rows)
+                if progress is not None:
+                    progress(rewritten)
+        if rewritten:
+            logging.info(f"Rewrote line items of {rewritten} invoices in the binary format")
+        return rewritten
+
+    def vacuum(self) -> None:
+        """Return free pages to the file system (SQLite; blocks other writers)."""
+        with self.session_factory() as session:
+            bind = session.get_bind()
+        if bind.dialect.name == "sqlite":
+            with bind.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                conn.execute(text("VACUUM"))
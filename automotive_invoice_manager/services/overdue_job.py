@@ -0,0 +1,109 @@
+"""Materialize the ``overdue`` invoice status with one bulk UPDATE per day.
+
+Instead of every count and filter re-deriving overdue-ness from
+``due_date < today``, sent invoices that pass their due date are flipped to
+``status = 'overdue'`` once per business day.  Reads can then use plain
+indexed equality on ``status``.  Drafts were never sent and keep their
+status; "overdue" is not offered as a manual choice, so every overdue
+status is one this transition set.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import date, datetime
+
+from sqlalchemy import event, update
+
+from automotive_invoice_manager.backend.database.connection import DatabaseManager
+from automotive_invoice_manager.backend.database.models import Invoice, JobRun
+
+JOB_NAME = "invoice_overdue_status"
+OPEN_STATUSES = ("draft", "sent")
+SENT = "sent"
+OVERDUE = "overdue"
+
+
+def effective_status(status: str, due_date: date | None, today: date | None = None) -> str:
+    """Return the status an invoice should be stored with on ``today``.
+
+    A sent invoice past its due date is overdue; an overdue one whose due
+    date moved to today or later is sent again.  Other statuses are kept.
+    """
+    today = today or date.today()
+    if due_date is None:
+        return status
+    if status == SENT and due_date < today:
+        return OVERDUE
+    if status == OVERDUE and due_date >= today:
+        return SENT
+    return status
+
+
+def check_status_choice(status: str, due_date: date | None, today: date | None = None) -> None:
+    """Raise ValueError if ``status`` is "overdue" for an invoice that is not past due."""
+    today = today or date.today()
+    if status == OVERDUE and due_date is not None and due_date >= today:
+        raise ValueError("Only invoices past their due date can be overdue")
+
+
+class OverdueStatusJob:
+    """Idempotent daily transition of past-due sent invoices to overdue."""
+
+    def __init__(self, session_factory=DatabaseManager.get_instance().get_session) -> None:
+        self.session_factory = session_factory
+        self._current_for: date | None = None
+        self._lock = threading.Lock()
+
+    def run(self, today: date | None = None) -> int:
+        """Flip eligible invoices to overdue and record the run; returns rows changed."""
+        today = today or date.today()
+        with self._lock:
+            with self.session_factory() as session:
+                result = session.execute(
+                    update(Invoice)
+                    .where(Invoice.status == SENT, Invoice.due_date < today)
+                    .values(status=OVERDUE, updated_at=datetime.utcnow())
+                    .execution_options(synchronize_session=False)
+                )
+                session.merge(
+                    JobRun(
+                        name=JOB_NAME,
+                        last_run_for=today,
+                        last_run_at=datetime.utcnow(),
+                        rows_affected=result.rowcount,
+                    )
+                )
+                event.listen(session, "after_rollback", lambda _s: self._forget_run(), once=True)
+            self._current_for = today
+        if result.rowcount:
+            logging.info(f"Marked {result.rowcount} invoices overdue for {today}")
+        return result.rowcount
+
+    def _forget_run(self) -> None:
+        self._current_for = None
+
+    def last_run(self) -> JobRun | None:
+        """Return the bookkeeping row of the most recent run, if any."""
+        with self.session_factory() as session:
+            return session.get(JobRun, JOB_NAME)
+
+    def ensure_current(self, today: date | None = None) -> int:
+        """Run the job unless it already ran for ``today``.
+
+        After the first call each day this is an in-memory date comparison,
+        so it is cheap enough to call before every status read.
+        """
+        today = today or date.today()
+        if self._current_for == today:
+            return 0
+        try:
+            last = self.last_run()
+            if last is not None and last.last_run_for is not None and last.last_run_for >= today:
+                self._current_for = today
+                return 0
+            return self.run(today)
+        except Exception as e:
+            logging.error(f"Error running overdue status job: {e}")
+            return 0
@@ -0,0 +1,117 @@
+"""PBKDF2 password hashing with a host-calibrated work factor."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import time
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+from automotive_invoice_manager.config.security import PasswordHashConfig
+
+logger = logging.getLogger(__name__)
+
+HASH_NAME = "sha256"
+
+# Iterations used by the calibration probe; large enough to time reliably.
+_PROBE_ITERATIONS = 20_000
+
+_calibration_lock = threading.Lock()
+_calibrated: dict[float, int] = {}
+
+
+def calibrate_iterations(
+    target_ms: float,
+    min_iterations: int = 1,
+    max_iterations: int = 10_000_000,
+    probes: int = 3,
+) -> int:
+    """Return the PBKDF2 iteration count that takes about ``target_ms`` here.
+
+    The fastest of ``probes`` timing runs is used and the result is rounded to
+    the nearest 10,000 before clamping.
+    """
+    salt = os.urandom(16)
+    best = float("inf")
+    for _ in range(probes):
+        started = time.perf_counter()
+        hashlib.pbkdf2_hmac(HASH_NAME, b"calibration-probe", salt, _PROBE_ITERATIONS)
+        best = min(best, time.perf_counter() - started)
+    per_iteration = best / _PROBE_ITERATIONS
+    iterations = int(round(target_ms / 1000 / per_iteration, -4))
+    return max(min_iterations, min(max_iterations, iterations))
+
+
+def parse_hash_method(password_hash: str) -> tuple[str, str | None, int | None]:
+    """Split a Werkzeug hash into ``(algorithm, hash_name, iterations)``."""
+    method = (password_hash or "").split("$", 1)[0]
+    algorithm, *args = method.split(":")
+    if algorithm != "pbkdf2":
+        return algorithm, None, None
+    hash_name = args[0] if args else HASH_NAME
+    try:
+        iterations = int(args[1]) if len(args) > 1 else None
+    except ValueError:
+        iterations = None
+    return algorithm, hash_name, iterations
+
+
+class PasswordHasher:
+    """Hash and verify passwords with a configurable PBKDF2 cost."""
+
+    def __init__(self, config: PasswordHashConfig | None = None) -> None:
+        self.config = config or PasswordHashConfig()
+
+    @property
+    def calibrated(self) -> bool:
+        """True when the cost comes from host calibration, not configuration."""
+        return not self.config.iterations
+
+    @property
+    def iterations(self) -> int:
+        """Iteration count for new hashes (calibrated once per process)."""
+        if self.config.iterations:
+            return self.config.iterations
+        target = self.config.target_ms
+        with _calibration_lock:
+            if target not in _calibrated:
+                _calibrated[target] = calibrate_iterations(
+                    target, self.config.min_iterations, self.config.max_iterations
+                )
+                logger.info(
+                    f"Calibrated PBKDF2 to {_calibrated[target]} iterations "
+                    f"for a {target:.0f} ms target"
+                )
+            iterations = _calibrated[target]
+        return max(self.config.min_iterations, min(self.config.max_iterations, iterations))
+
+    @property
+    def method(self) -> str:
+        """Werkzeug method string, e.g. ``pbkdf2:sha256:600000``."""
+        return f"pbkdf2:{HASH_NAME}:{self.iterations}"
+
+    def hash(self, password: str) -> str:
+        return generate_password_hash(
+            password, method=self.method, salt_length=self.config.salt_length
+        )
+
+    def verify(self, password_hash: str, password: str) -> bool:
+        """Check ``password``; the cost is read from the stored hash."""
+        return check_password_hash(password_hash, password)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Return True if ``password_hash`` is another scheme or weaker than the target.
+
+        A hash with more iterations than the target is never rewritten, so a
+        slow host calibrating low cannot downgrade existing hashes.
+        """
+        algorithm, hash_name, iterations = parse_hash_method(password_hash)
+        if algorithm != "pbkdf2" or hash_name != HASH_NAME or not iterations:
+            return True
+        target = self.iterations
+        if not self.calibrated:
+            return iterations < target
+        return iterations < target * (1 - self.config.rehash_tolerance)
@@ -2,18 +2,31 @@
 
 import os
 import logging
-from decimal import Decimal
 from pathlib import Path
 from datetime import datetime
 
+from automotive_invoice_manager.backend.database.money import (
+    format_cents,
+    invoice_cents,
+    line_item_cents,
+    to_cents,
+)
+from automotive_invoice_manager.utils.logo_assets import get_logo_asset
+
 logger = logging.getLogger(__name__)
 
 class PDFService:
     """Simple PDF service for generating invoice PDFs."""
 
-    def __init__(self):
-        """Initialize PDF service."""
-        pass
+    def __init__(self, db_manager=None, logo=None):
+        """Initialize PDF service.
+
+        ``db_manager`` defaults to the global :class:`DatabaseManager`.
+        ``logo`` is a :class:`LogoAsset`; by default the print derivative of
+        the uploaded logo is used (if there is one).
+        """
+        self.db_manager = db_manager
+        self.logo = logo
 
     def generate_invoice_pdf(self, invoice_id: int, output_path: str = None) -> str:
         """Generate PDF for an invoice using ReportLab."""
@@ -21,19 +34,28 @@ class PDFService:
             # Import ReportLab components
             from reportlab.lib.pagesizes import letter
             from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+            from reportlab.platypus import Image as RLImage
             from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
             from reportlab.lib.units import inch
             from reportlab.lib import colors
             
             # Get database connection
             from automotive_invoice_manager.backend.database.connection import DatabaseManager
-            from automotive_invoice_manager.backend.database.models import Invoice
+            from automotive_invoice_manager.backend.database.models import DETAIL_GROUP, Invoice
+            from sqlalchemy.orm import joinedload, undefer_group
             
-            db_manager = DatabaseManager.get_instance()
+            db_manager = self.db_manager or DatabaseManager.get_instance()
             
             # Get invoice data
             with db_manager.get_session() as session:
-                invoice = session.query(Invoice).get(invoice_id)
+                invoice = (
+                    session.query(Invoice)
+                    .options(
+                        undefer_group(DETAIL_GROUP),
+                        joinedload(Invoice.customer).undefer_group(DETAIL_GROUP),
+                    )
+                    .get(invoice_id)
+                )
                 if not invoice:
                     raise ValueError(f"Invoice {invoice_id} not found")
                 
@@ -48,7 +70,7 @@ class PDFService:
                     'due_date': invoice.due_date,
                     'status': invoice.status,
                     'line_items': invoice.line_items or [],
-                    'total': float(invoice.total)
+                    'total': invoice.total
                 }
             
             # Set output path
@@ -67,6 +89,12 @@ class PDFService:
             styles = getSampleStyleSheet()
             story = []
             
+            # Logo - small pre-scaled derivative, never the uploaded original
+            logo = self.logo or get_logo_asset()
+            if logo:
+                story.append(RLImage(logo.path, width=logo.width_pt, height=logo.height_pt))
+                story.append(Spacer(1, 10))
+            
             # Title
             title_style = ParagraphStyle(
                 'CustomTitle',
@@ -115,29 +143,22 @@ class PDFService:
                 # Table headers
                 line_data = [['Description', 'Hours', 'Rate', 'Parts', 'Tax', 'Amount']]
                 
-                # Add line items
-                total_amount = Decimal('0')
+                # Add line items (amounts in integer cents)
                 for item in invoice_data['line_items']:
-                    hours = Decimal(str(item.get('hours', item.get('quantity', 0))))
-                    rate = Decimal(str(item.get('rate', 0)))
-                    parts = Decimal(str(item.get('parts', 0)))
-                    tax = Decimal(str(item.get('tax', 0)))
-                    amount = (hours * rate + parts) * (Decimal('1') + tax / Decimal('100'))
-                    total_amount += amount
-
                     line_data.append([
                         item.get('description', 'Item'),
-                        str(hours),
-                        f"${rate:.2f}",
-                        f"${parts:.2f}",
-                        f"{tax}%",
-                        f"${amount:.2f}"
+                        str(item.get('hours', item.get('quantity', 0))),
+                        format_cents(to_cents(item.get('rate', 0))),
+                        format_cents(to_cents(item.get('parts', 0))),
+                        f"{item.get('tax', 0)}%",
+                        format_cents(line_item_cents(item))
                     ])
                 
                 # Add subtotal and total
+                total_amount = format_cents(invoice_cents(invoice_data['line_items'])[0])
                 line_data.append([''] * 6)  # Spacer
-                line_data.append(['', '', '', '', 'Subtotal:', f"${total_amount:.2f}"])
-                line_data.append(['', '', '', '', 'TOTAL:', f"${total_amount:.2f}"])
+                line_data.append(['', '', '', '', 'Subtotal:', total_amount])
+                line_data.append(['', '', '', '', 'TOTAL:', total_amount])
                 
                 # Create table
                 line_table = Table(line_data, colWidths=[2.5*inch, 0.7*inch, 0.8*inch, 0.8*inch, 0.7*inch, 1*inch])
@@ -0,0 +1,47 @@
+"""Tuple-backed read models for list views.
+
+These are built straight from Core ``select()`` rows containing only the
+displayed columns, so no ORM identity map, change tracking or JSON/Text
+deserialization is involved.  They are read-only snapshots.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import NamedTuple
+
+
+class InvoiceRow(NamedTuple):
+    """One line of the invoice list."""
+
+    id: int
+    invoice_number: str
+    customer_name: str
+    issued_date: date
+    due_date: date
+    status: str
+    total: Decimal
+
+
+class CustomerRow(NamedTuple):
+    """One line of the customer list, with its invoice statistics."""
+
+    id: int
+    name: str
+    email: str | None
+    phone: str | None
+    created_at: datetime
+    invoice_count: int
+    total_billed: Decimal
+
+
+class AgingRow(NamedTuple):
+    """One customer of the accounts-receivable aging report."""
+
+    customer_id: int | None
+    customer_name: str
+    invoice_count: int
+    # Open balance per bucket, in ``BUCKET_LABELS`` order
+    buckets: tuple[Decimal, ...]
+    total: Decimal
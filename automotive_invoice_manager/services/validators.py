@@ -5,6 +5,44 @@ from __future__ import annotations
 import re
 import logging
 
+# Contact normalizers live with the customer model, which stores their output
+from automotive_invoice_manager.backend.database.contact_keys import (  # noqa: F401
+    fold_name,
+    normalize_email,
+    normalize_phone,
+)
+
+# One bit per failed check in the bitmap returned by ``validate_many``
+NAME_REQUIRED = 0x01
+NAME_TOO_LONG = 0x02
+EMAIL_TOO_LONG = 0x04
+EMAIL_INVALID = 0x08
+PHONE_TOO_LONG = 0x10
+PHONE_INVALID = 0x20
+ADDRESS_TOO_LONG = 0x40
+NOTES_TOO_LONG = 0x80
+
+# Bit -> (field, message), the same messages as ``validate_customer_data``
+ERROR_MESSAGES = {
+    NAME_REQUIRED: ("name", "Name is required"),
+    NAME_TOO_LONG: ("name", "Name cannot exceed 100 characters"),
+    EMAIL_TOO_LONG: ("email", "Email cannot exceed 100 characters"),
+    EMAIL_INVALID: ("email", "Please enter a valid email address"),
+    PHONE_TOO_LONG: ("phone", "Phone number cannot exceed 20 characters"),
+    PHONE_INVALID: ("phone", "Please enter a valid phone number"),
+    ADDRESS_TOO_LONG: ("address", "Address cannot exceed 500 characters"),
+    NOTES_TOO_LONG: ("notes", "Notes cannot exceed 1000 characters"),
+}
+
+# The ASCII characters of ``phone_pattern``'s class (it also allows any
+# Unicode digit or space)
+_PHONE_CHARS = "0123456789 \t\n\r\f\v-+()."
+
+
+def error_messages(bits: int) -> dict[str, str]:
+    """Expand one row of a ``validate_many`` bitmap into ``{field: message}``."""
+    return dict(message for bit, message in ERROR_MESSAGES.items() if bits & bit)
+
 
 class CustomerValidator:
     """Validator for customer data."""
@@ -84,6 +122,56 @@ class CustomerValidator:
 
         return len(errors) == 0, errors
 
+    def validate_many(self, columns: dict, count: int | None = None) -> bytearray:
+        """Validate many customers given column-wise; returns one error byte per row.
+
+        ``columns`` maps field names to sequences of ``count`` values (a
+        missing field counts as empty).  A row's byte is 0 when it is valid,
+        otherwise the OR of the failed checks' bits; :func:`error_messages`
+        turns it into the ``validate_customer_data`` errors.  Each column is
+        checked in one tight loop that skips empty values, without the
+        per-row method calls, tuples and error dicts.
+        """
+        if count is None:
+            count = max(map(len, columns.values()), default=0)
+        names = columns.get("name")
+        if names is None:
+            return bytearray((NAME_REQUIRED,)) * count
+        errors = bytearray(count)
+
+        for index, name in enumerate(names):
+            if not name:
+                errors[index] = NAME_REQUIRED
+            elif len(name) > 100 or name[0].isspace() or name[-1].isspace():
+                name = name.strip()
+                if not name:
+                    errors[index] = NAME_REQUIRED
+                elif len(name) > 100:
+                    errors[index] = NAME_TOO_LONG
+
+        match = self.email_pattern.match
+        for index, email in enumerate(columns.get("email") or ()):
+            if email:
+                if len(email) > 100:
+                    errors[index] |= EMAIL_TOO_LONG
+                elif not match(email):
+                    errors[index] |= EMAIL_INVALID
+
+        # A phone made only of _PHONE_CHARS just needs its length checked
+        match = self.phone_pattern.match
+        for index, phone in enumerate(columns.get("phone") or ()):
+            if phone:
+                if len(phone) > 20:
+                    errors[index] |= PHONE_TOO_LONG
+                elif len(phone) < 10 or (phone.strip(_PHONE_CHARS) and not match(phone)):
+                    errors[index] |= PHONE_INVALID
+
+        for field, limit, bit in (("address", 500, ADDRESS_TOO_LONG), ("notes", 1000, NOTES_TOO_LONG)):
+            for index, value in enumerate(columns.get(field) or ()):
+                if value and len(value) > limit:
+                    errors[index] |= bit
+        return errors
+
 
 def validate_password(password: str) -> tuple[bool, str]:
     """Validate password length and complexity."""
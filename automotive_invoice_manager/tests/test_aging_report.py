@@ -0,0 +1,102 @@
+import os
+import sys
+from datetime import date, timedelta
+from decimal import Decimal
+
+from sqlalchemy import event, update
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from automotive_invoice_manager.backend.database.connection import DatabaseManager
+from automotive_invoice_manager.database import models
+from automotive_invoice_manager.services.invoice_service import InvoiceService
+
+service = InvoiceService(models.session_scope)
+TODAY = date(2024, 6, 30)
+
+
+def setup_module(module):
+    models.create_tables()
+    with models.session_scope() as session:
+        user = models.User(email="aging@test.com", password_hash="x")
+        session.add(user)
+        session.flush()
+        acme = models.Customer(user_id=user.id, name="Aging Acme")
+        zeta = models.Customer(user_id=user.id, name="Aging Zeta")
+        session.add_all([acme, zeta])
+        session.flush()
+        # (customer, days past due, status, total)
+        invoices = [
+            (acme, -10, "sent", 10),     # not yet due -> 0-30
+            (acme, 30, "overdue", 20),   # 0-30
+            (acme, 31, "overdue", 40),   # 31-60
+            (acme, 90, "draft", 80),     # 61-90
+            (acme, 91, "overdue", 160),  # 90+
+            (acme, 45, "paid", 999),     # not receivable
+            (zeta, 200, "overdue", 5),   # 90+
+        ]
+        for i, (customer, days, status, total) in enumerate(invoices):
+            session.add(
+                models.Invoice(
+                    user_id=user.id,
+                    customer_id=customer.id,
+                    invoice_number=f"AGE-{i:03d}",
+                    issued_date=TODAY - timedelta(days=days + 30),
+                    due_date=TODAY - timedelta(days=days),
+                    line_items=[],
+                    total=total,
+                    status=status,
+                )
+            )
+
+
+def _user_id():
+    with models.session_scope() as session:
+        return session.query(models.User).filter_by(email="aging@test.com").one().id
+
+
+def _count_queries():
+    queries = []
+    engine = DatabaseManager.get_instance().engine
+    listener = lambda *args: queries.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    return queries, lambda: event.remove(engine, "before_cursor_execute", listener)
+
+
+def test_open_balances_are_bucketed_by_days_past_due():
+    service.aging_cache.invalidate()
+    report = service.get_aging_report(_user_id(), today=TODAY)
+    acme, zeta = report.rows
+    assert acme.customer_name == "Aging Acme"
+    assert acme.invoice_count == 5
+    assert acme.buckets == (Decimal("30"), Decimal("40"), Decimal("80"), Decimal("160"))
+    assert acme.total == Decimal("310")
+    assert zeta.buckets == (0, 0, 0, Decimal("5"))
+    assert report.totals.buckets == (Decimal("30"), Decimal("40"), Decimal("80"), Decimal("165"))
+    assert report.totals.invoice_count == 6
+
+
+def test_report_is_cached_until_an_invoice_write_or_new_day():
+    user_id = _user_id()
+    service.aging_cache.invalidate()
+    first = service.get_aging_report(user_id, today=TODAY)
+
+    queries, stop = _count_queries()
+    try:
+        assert service.get_aging_report(user_id, today=TODAY) is first
+        assert queries == []
+    finally:
+        stop()
+
+    assert service.get_aging_report(user_id, today=TODAY + timedelta(days=1)) is not first
+
+    current = service.get_aging_report(user_id, today=TODAY)
+    with models.session_scope() as session:
+        session.execute(
+            update(models.Invoice)
+            .where(models.Invoice.invoice_number == "AGE-006")
+            .values(status="paid")
+        )
+    refreshed = service.get_aging_report(user_id, today=TODAY)
+    assert refreshed is not current
+    assert [row.customer_name for row in refreshed.rows] == ["Aging Acme"]
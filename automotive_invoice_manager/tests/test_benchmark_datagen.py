@@ -0,0 +1,63 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from automotive_invoice_manager.backend.database.connection import DatabaseManager
+from automotive_invoice_manager.config.database import DatabaseConfig
+from automotive_invoice_manager.database import models
+from automotive_invoice_manager.benchmarks.datagen import DatasetSpec, generate_dataset
+from automotive_invoice_manager.benchmarks.harness import compare_results
+
+
+def _generate(spec):
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    db = DatabaseManager(DatabaseConfig(url=f"sqlite:///{path}"))
+    return db, generate_dataset(db, spec)
+
+
+def _invoice_rows(db):
+    with db.get_session() as session:
+        return [
+            (inv.invoice_number, inv.customer_id, inv.issued_date, inv.status, inv.total, inv.line_items)
+            for inv in session.query(models.Invoice).order_by(models.Invoice.id)
+        ]
+
+
+def test_generation_is_deterministic_for_a_seed():
+    spec = DatasetSpec(invoices=150, seed=7, anchor="2024-06-30")
+    db_a, _ = _generate(spec)
+    db_b, _ = _generate(DatasetSpec(invoices=150, seed=7, anchor="2024-06-30"))
+    assert _invoice_rows(db_a) == _invoice_rows(db_b)
+
+    db_c, _ = _generate(DatasetSpec(invoices=150, seed=8, anchor="2024-06-30"))
+    assert _invoice_rows(db_a) != _invoice_rows(db_c)
+
+
+def test_generated_totals_and_counts_match_spec():
+    db, dataset = _generate(DatasetSpec(invoices=200, seed=1, anchor="2024-06-30"))
+    with db.get_session() as session:
+        assert session.query(models.Invoice).count() == 200
+        assert session.query(models.Customer).count() == dataset.spec.customers
+        heavy = (
+            session.query(models.Invoice)
+            .filter_by(invoice_number=dataset.heavy_invoice_number)
+            .one()
+        )
+        assert heavy.total == heavy.calculate_total().quantize(heavy.total)
+        statuses = {status for (status,) in session.query(models.Invoice.status).distinct()}
+    assert statuses <= {"draft", "sent", "paid"}
+    assert "paid" in statuses
+
+
+def test_compare_results_flags_regressions():
+    old = {"format": 1, "results": {"a": {"median_ms": 10.0}, "b": {"median_ms": 10.0}}}
+    new = {"format": 1, "results": {"a": {"median_ms": 20.0}, "b": {"median_ms": 5.0}}}
+    rows = {row["name"]: row["status"] for row in compare_results(old, new)}
+    assert rows == {"a": "regressed", "b": "improved"}
+
+    with pytest.raises(ValueError):
+        compare_results(old, dict(new, format=2))
@@ -0,0 +1,95 @@
+import csv
+import io
+import json
+import os
+import subprocess
+import sys
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from automotive_invoice_manager.cli.__main__ import main
+from automotive_invoice_manager.cli.reporting import Reporter
+from automotive_invoice_manager.database import models
+
+
+def setup_module(module):
+    models.create_tables()
+    with models.session_scope() as session:
+        user = models.User(email="cli@test.com", password_hash="x")
+        session.add(user)
+        session.flush()
+        customer = models.Customer(user_id=user.id, name="CLI Cust")
+        session.add(customer)
+        session.flush()
+        for i in range(3):
+            session.add(
+                models.Invoice(
+                    user_id=user.id,
+                    customer_id=customer.id,
+                    invoice_number=f"CLI-{i}",
+                    issued_date=date.today() - timedelta(days=i),
+                    due_date=date.today() + timedelta(days=30),
+                    line_items=[{"description": "Labor", "hours": 1, "rate": 50}],
+                    total=0,
+                )
+            )
+
+
+def test_reporter_json_summary():
+    stream = io.StringIO()
+    reporter = Reporter("demo", json_mode=True, stream=stream)
+    reporter.progress(1, 2, force=True)
+    summary = reporter.summary(2, [0.001, 0.003], extra="x")
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["event"] for line in lines] == ["progress", "summary"]
+    assert summary["items"] == 2 and summary["extra"] == "x"
+    assert summary["item_ms"]["max"] == 3.0
+
+
+def test_recompute_then_export(tmp_path):
+    assert main(["recompute-totals", "--user", "cli@test.com"]) == 0
+    out = tmp_path / "invoices.csv"
+    assert main(["export", "--user", "cli@test.com", "--out", str(out)]) == 0
+
+    with open(out, newline="") as handle:
+        rows = list(csv.DictReader(handle))
+    assert [row["invoice_number"] for row in rows] == ["CLI-2", "CLI-1", "CLI-0"]
+    assert {row["total"] for row in rows} == {"50.00"}
+
+
+def test_subtotals_check_after_recompute(capsys):
+    assert main(["--json", "subtotals", "--user", "cli@test.com", "--check", "--deep"]) == 0
+    summary = json.loads(capsys.readouterr().out.splitlines()[-1])
+    assert (summary["missing"], summary["unbalanced"], summary["stale"]) == (0, 0, 0)
+
+
+def test_unknown_user_is_reported(capsys):
+    assert main(["export", "--user", "nobody@test.com", "--out", "unused.csv"]) == 2
+    assert "No user" in capsys.readouterr().err
+
+
+def test_import_customers_dry_run_writes_error_report(tmp_path, capsys):
+    source = tmp_path / "customers.csv"
+    source.write_text("Name,Email\nCLI Import,cli-import@test.com\n,missing@test.com\n", encoding="utf-8")
+    errors = tmp_path / "errors.csv"
+    args = ["--json", "import-customers", "--user", "cli@test.com", "--file", str(source), "--dry-run"]
+    assert main(args + ["--errors", str(errors)]) == 1
+    summary = json.loads(capsys.readouterr().out.splitlines()[-1])
+    assert (summary["items"], summary["imported"], summary["invalid"], summary["dry_run"]) == (2, 1, 1, True)
+    assert errors.read_text(encoding="utf-8").splitlines()[1] == "3,name,Name is required"
+
+
+def test_headless_commands_skip_pdf_and_analytics_dependencies(tmp_path):
+    script = (
+        "import sys\n"
+        "from automotive_invoice_manager.cli.__main__ import main\n"
+        f"for command in (['mark-overdue'], ['subtotals', '--check'], ['line-items', '--check']):\n"
+        f"    main(['--db', {str(tmp_path / 'cron.db')!r}, *command])\n"
+        "print(sorted(m for m in ('PIL', 'numpy', 'reportlab', 'tkinter') if m in sys.modules))\n"
+    )
+    root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+    result = subprocess.run(
+        [sys.executable, "-c", script], cwd=root, capture_output=True, text=True, timeout=120, check=True
+    )
+    assert result.stdout.splitlines()[-1] == "[]"
@@ -0,0 +1,114 @@
+import os
+import sys
+from datetime import datetime
+
+from sqlalchemy import create_engine, insert, select, text
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from automotive_invoice_manager.backend.database.contact_keys import phone_search_digits
+from automotive_invoice_manager.database import models
+from automotive_invoice_manager.services.customer_service import CustomerService
+
+service = CustomerService(models.session_scope)
+
+
+def setup_module(module):
+    models.create_tables()
+    with models.session_scope() as session:
+        session.add(models.User(email="contact-keys@test.com", password_hash="x"))
+
+
+def _user_id():
+    with models.session_scope() as session:
+        return session.query(models.User).filter_by(email="contact-keys@test.com").one().id
+
+
+def _keys(customer_id):
+    with models.session_scope() as session:
+        return session.execute(
+            select(models.Customer.name_folded, models.Customer.email_normalized, models.Customer.phone_digits).where(
+                models.Customer.id == customer_id
+            )
+        ).one()
+
+
+def test_search_terms_that_look_like_phone_numbers():
+    assert phone_search_digits(" 555-1234 ") == "5551234"
+    assert phone_search_digits("+1 (555) 301-2000") == "5553012000"
+    assert phone_search_digits("+1 (555) 301-20") == "55530120"
+    assert phone_search_digits("1234567") == "1234567"
+    assert phone_search_digits("Bob@Garage") is None
+    assert phone_search_digits("2024") is None
+    assert phone_search_digits("Bob's Garage") is None
+
+
+def test_keys_are_maintained_on_every_write():
+    user_id = _user_id()
+    customer = service.create_customer(
+        {"name": "Bob's  Garage", "email": " Bob@Garage.TEST", "phone": "(555) 1234"}, user_id
+    )
+    assert tuple(_keys(customer.id)) == ("bobs garage", "bob@garage.test", "5551234")
+
+    with models.session_scope() as session:
+        core_id = session.execute(
+            insert(models.Customer).values(user_id=user_id, name="Core-Inserted", created_at=datetime.utcnow())
+        ).inserted_primary_key[0]
+    assert tuple(_keys(core_id)) == ("core inserted", None, None)
+
+    service.update_customer(customer.id, {"name": "Bob's Garage", "phone": "555.301.2000"}, user_id)
+    assert tuple(_keys(customer.id)) == ("bobs garage", None, "5553012000")
+
+
+def test_contact_searches_match_any_formatting():
+    user_id = _user_id()
+    service.create_customer({"name": "Front Desk", "email": "Desk@Shop.test", "phone": "(555) 1234"}, user_id)
+
+    def names(term):
+        return {customer.name for customer in service.search_customers(user_id, term)}
+
+    assert names("555-1234") == {"Front Desk"}
+    assert names("5553012000") == {"Bob's Garage"}
+    assert names("+1 (555) 301-20") == {"Bob's Garage"}
+    assert names("bobs garage") == {"Bob's Garage"}
+    assert [row.name for row in service.search_customer_rows(user_id, "desk@SHOP")] == ["Front Desk"]
+    assert [row.name for row in service.search_customer_rows(user_id, "@shop.test")] == ["Front Desk"]
+
+
+def test_phone_like_searches_keep_substring_matches():
+    user_id = _user_id()
+    service.create_customer(
+        {"name": "Harbor Fleet", "phone": "(555) 301-2000", "notes": "fleet acct 1234567"}, user_id
+    )
+
+    def names(term):
+        return {customer.name for customer in service.search_customers(user_id, term)}
+
+    assert names("301-2000") == {"Bob's Garage", "Harbor Fleet"}
+    assert names("1234567") == {"Harbor Fleet"}
+    assert names("+1 (555) 301-20") == {"Bob's Garage", "Harbor Fleet"}
+
+
+def test_create_tables_fills_keys_of_old_customers(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE customers (id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL, "
+                "name VARCHAR(100) NOT NULL, email VARCHAR(100), phone VARCHAR(20), address TEXT, "
+                "notes TEXT, created_at DATETIME NOT NULL, updated_at DATETIME)"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO customers (user_id, name, email, phone, created_at) "
+                "VALUES (1, 'O''Brien Tires', 'Tires@OBrien.test', '1-555-301-3000', '2024-01-01')"
+            )
+        )
+    models.create_tables(engine)
+    with engine.connect() as conn:
+        assert conn.execute(
+            text("SELECT name_folded, email_normalized, phone_digits FROM customers")
+        ).one() == ("obrien tires", "tires@obrien.test", "5553013000")
+        indexes = {row[1] for row in conn.execute(text("PRAGMA index_list(customers)"))}
+    assert "ix_customers_user_phone_digits" in indexes
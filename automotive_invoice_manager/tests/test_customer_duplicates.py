@@ -0,0 +1,107 @@
+import os
+import sys
+from datetime import date
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from automotive_invoice_manager.database import models
+from automotive_invoice_manager.services.customer_duplicates import DuplicateFinder
+from automotive_invoice_manager.services.customer_service import CustomerService
+from automotive_invoice_manager.services.validators import fold_name
+
+service = CustomerService(models.session_scope)
+
+# (name, email, phone, invoices)
+CUSTOMERS = [
+    ("Bob's Garage", None, "(555) 301-0001", 2),
+    ("Bobs Garage", "bob@garage.test", "555.301.0001", 1),
+    ("Smith Auto Repair", "office@smithauto.test", None, 0),
+    ("Smith Auto Repairs", None, None, 1),
+    ("Repair Smith Auto", "Office@SmithAuto.test", None, 0),
+    ("Zed's Tires", "zed@tires.test", "555-301-0009", 0),
+]
+
+
+def setup_module(module):
+    models.create_tables()
+    with models.session_scope() as session:
+        user = models.User(email="duplicates@test.com", password_hash="x")
+        session.add(user)
+        session.flush()
+        for n, (name, email, phone, invoices) in enumerate(CUSTOMERS):
+            customer = models.Customer(user_id=user.id, name=name, email=email, phone=phone)
+            session.add(customer)
+            session.flush()
+            for i in range(invoices):
+                session.add(
+                    models.Invoice(
+                        user_id=user.id,
+                        customer_id=customer.id,
+                        invoice_number=f"DUP-{n}-{i}",
+                        issued_date=date(2024, 1, 1),
+                        due_date=date(2024, 1, 31),
+                        line_items=[],
+                    )
+                )
+
+
+def _ids():
+    with models.session_scope() as session:
+        user = session.query(models.User).filter_by(email="duplicates@test.com").one()
+        return user.id, {c.name: c.id for c in session.query(models.Customer).filter_by(user_id=user.id)}
+
+
+def test_fold_name():
+    assert fold_name("Bob's  Garage") == fold_name("BOBS GARAGE.") == "bobs garage"
+    assert fold_name(" - ") is None
+
+
+def test_scan_finds_duplicates_by_contact_and_name():
+    user_id, ids = _ids()
+    scan = service.find_duplicate_customers(user_id)
+    found = {(pair.first_name, pair.second_name): pair for pair in scan.pairs}
+    assert set(found) == {
+        ("Bob's Garage", "Bobs Garage"),
+        ("Smith Auto Repair", "Smith Auto Repairs"),
+        ("Smith Auto Repair", "Repair Smith Auto"),
+        ("Smith Auto Repairs", "Repair Smith Auto"),
+    }
+    bobs = found["Bob's Garage", "Bobs Garage"]
+    assert (bobs.first_id, bobs.second_id, bobs.score, bobs.reasons) == (
+        ids["Bob's Garage"],
+        ids["Bobs Garage"],
+        1.0,
+        ("phone",),
+    )
+    assert found["Smith Auto Repair", "Repair Smith Auto"].reasons == ("email",)
+    assert scan.pairs[0] == bobs
+    assert scan.customers == 6 and scan.compared <= scan.all_pairs
+
+    # Without blocks or neighbours nothing is compared
+    assert DuplicateFinder(models.session_scope, window=1, max_block=1).scan(user_id).compared == 0
+
+    # Scoring every pair finds nothing that blocking missed
+    everything = DuplicateFinder(models.session_scope, blocking=False).scan(user_id)
+    assert everything.pairs == scan.pairs and everything.compared == everything.all_pairs == 15
+    assert DuplicateFinder(models.session_scope, blocking=False).scan(user_id, limit=2).compared == 1
+
+
+def test_merge_moves_invoices_and_fills_blank_fields():
+    user_id, ids = _ids()
+    assert service.customer_index.resolve(user_id, "Bobs Garage") == ids["Bobs Garage"]
+
+    assert service.merge_customers(user_id, ids["Bob's Garage"], [ids["Bobs Garage"]]) == 1
+
+    kept = service.get_customer(ids["Bob's Garage"])
+    assert (kept.email, kept.phone) == ("bob@garage.test", "(555) 301-0001")
+    assert service.get_customer(ids["Bobs Garage"]) is None
+    assert service.get_customer_stats(kept.id)["invoice_count"] == 3
+    assert service.customer_index.resolve(user_id, "Bobs Garage") is None
+    assert ("Bob's Garage", "Bobs Garage") not in {
+        (pair.first_name, pair.second_name) for pair in service.find_duplicate_customers(user_id).pairs
+    }
+
+    with pytest.raises(ValueError, match="not found"):
+        service.merge_customers(user_id, ids["Zed's Tires"], [ids["Zed's Tires"] + 1000])
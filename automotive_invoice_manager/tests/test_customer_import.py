@@ -0,0 +1,112 @@
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from automotive_invoice_manager.database import models
+from automotive_invoice_manager.services.customer_import import CustomerImport
+from automotive_invoice_manager.services.customer_service import CustomerService
+from automotive_invoice_manager.services.validators import (
+    CustomerValidator,
+    error_messages,
+    normalize_email,
+    normalize_phone,
+)
+
+service = CustomerService(models.session_scope)
+
+CSV = """\
+Name,EMAIL,Phone,Address,Created
+New One,one@import.test,555-201-0001,1 Main St,2024-01-01
+Existing By Email,Known@Import.test ,,,
+Existing By Phone,,+1 (555) 201-0000,,
+,nameless@import.test,,,
+Bad Email,not-an-email,,,
+Twin A,twin@import.test,,,
+Twin B,TWIN@import.test,,,
+New Two,,555.201.0002,,
+"""
+
+
+def setup_module(module):
+    models.create_tables()
+    with models.session_scope() as session:
+        user = models.User(email="import@test.com", password_hash="x")
+        session.add(user)
+        session.flush()
+        session.add(models.Customer(user_id=user.id, name="Known", email="known@import.test", phone="5552010000"))
+
+
+def _user_id():
+    with models.session_scope() as session:
+        return session.query(models.User).filter_by(email="import@test.com").one().id
+
+
+def _names(user_id):
+    with models.session_scope() as session:
+        return sorted(c.name for c in session.query(models.Customer).filter_by(user_id=user_id))
+
+
+def test_normalized_contact_keys():
+    assert normalize_email("  Shop@Example.COM ") == "shop@example.com"
+    assert normalize_email(" ") is None
+    assert normalize_phone("+1 (555) 123-4567") == normalize_phone("555.123.4567") == "5551234567"
+    assert normalize_phone(None) is None
+
+
+def test_validate_many_matches_validate_customer_data():
+    validator = CustomerValidator()
+    rows = [
+        {"name": "Bob", "email": "bob@shop.com", "phone": "+1 (555) 123-4567", "address": None, "notes": None},
+        {"name": "  ", "email": "ab\n@shop.com", "phone": "1" * 21, "address": "x" * 501, "notes": "y" * 1001},
+        {"name": " " + "x" * 100, "email": "bob@shop.com\n", "phone": "12345", "address": "", "notes": ""},
+        {"name": "x" * 101, "email": "a@@shop.com", "phone": "555 123 4567", "address": None, "notes": None},
+        {"name": "", "email": "x" * 95 + "@shop.com", "phone": "", "address": "x" * 500, "notes": None},
+        {"name": "Al", "email": "al@shop.com", "phone": "555-abc-4567", "address": None, "notes": None},
+    ]
+    columns = {key: [row[key] for row in rows] for key in rows[0]}
+    bits = validator.validate_many(columns)
+    assert [error_messages(b) for b in bits] == [validator.validate_customer_data(row)[1] for row in rows]
+    assert bits[0] == 0 and all(bits[1:])
+
+    del columns["name"]  # a missing column counts as empty
+    assert [error_messages(b).get("name") for b in validator.validate_many(columns)] == ["Name is required"] * 6
+
+
+def test_dry_run_then_import_in_batches(tmp_path):
+    user_id = _user_id()
+    batches = []
+
+    dry = service.import_customers(user_id, io.StringIO(CSV), dry_run=True)
+    assert (dry.rows, dry.imported, dry.duplicates, dry.invalid) == (8, 3, 3, 2)
+    assert _names(user_id) == ["Known"]
+
+    service.customer_index.names(user_id)  # loaded map must see the new names afterwards
+    importer = CustomerImport(models.session_scope, service.customer_index, batch_size=3)
+    report = importer.run(user_id, io.StringIO(CSV), progress=lambda report: batches.append(report.rows))
+    assert batches == [3, 6, 8]
+    assert report.imported == 3
+    assert _names(user_id) == ["Known", "New One", "New Two", "Twin A"]
+    assert service.customer_index.resolve(user_id, "Twin A") is not None
+    assert [(e.line, e.field) for e in report.errors] == [
+        (3, "email"),
+        (4, "phone"),
+        (5, "name"),
+        (6, "email"),
+        (8, "email"),
+    ]
+    assert report.errors[4].message == "Duplicate of line 7"
+
+    # Everything with an email or phone is now a duplicate
+    again = service.import_customers(user_id, io.StringIO(CSV))
+    assert (again.imported, again.duplicates) == (0, 6)
+
+    path = tmp_path / "errors.csv"
+    report.write_errors(path)
+    with models.session_scope() as session:
+        known_id = session.query(models.Customer).filter_by(email="known@import.test").one().id
+    assert path.read_text(encoding="utf-8").splitlines()[:2] == [
+        "line,field,message",
+        f"3,email,Duplicate of customer #{known_id}",
+    ]
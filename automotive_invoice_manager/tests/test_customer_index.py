@@ -0,0 +1,104 @@
+import os
+import sys
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from automotive_invoice_manager.backend.database.connection import DatabaseManager
+from automotive_invoice_manager.database import models
+from automotive_invoice_manager.services.customer_index import get_customer_index
+from automotive_invoice_manager.services.customer_service import CustomerService
+from automotive_invoice_manager.services.invoice_service import InvoiceService
+
+TODAY = date.today()
+
+
+def setup_module(module):
+    models.create_tables()
+    with models.session_scope() as session:
+        session.add(models.User(email="index@test.com", password_hash="x"))
+
+
+def _user():
+    with models.session_scope() as session:
+        return session.query(models.User).filter_by(email="index@test.com").one()
+
+
+def _count_selects(engine):
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT") and "customers" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    return statements, lambda: event.remove(engine, "before_cursor_execute", record)
+
+
+def test_services_share_index_and_writes_skip_customer_lookup():
+    user = _user()
+    customers = CustomerService(models.session_scope)
+    invoices = InvoiceService(models.session_scope)
+    assert customers.customer_index is invoices.customer_index is get_customer_index(models.session_scope)
+
+    cust = customers.create_customer({"name": "Indexed Garage"}, user.id)
+    assert "Indexed Garage" in customers.customer_index.names(user.id)
+
+    statements, stop = _count_selects(models.engine)
+    try:
+        for i in range(3):
+            invoices.create_invoice(
+                user,
+                {
+                    "customer": "Indexed Garage",
+                    "invoice_number": f"IDX-{i}",
+                    "issued_date": TODAY,
+                    "due_date": TODAY,
+                    "line_items": [],
+                },
+            )
+    finally:
+        stop()
+    assert statements == []
+    assert invoices.get_invoice_by_number(user.id, "IDX-0").customer_id == cust.id
+
+
+def test_index_follows_rename_and_delete():
+    user = _user()
+    customers = CustomerService(models.session_scope)
+    index = customers.customer_index
+
+    cust = customers.create_customer({"name": "Before Rename"}, user.id)
+    assert index.resolve(user.id, "Before Rename") == cust.id
+    customers.update_customer(cust.id, {"name": "After Rename"}, user.id)
+    assert "Before Rename" not in index.names(user.id)
+    assert index.resolve(user.id, "After Rename") == cust.id
+
+    assert customers.delete_customer(cust.id, user.id)
+    assert index.resolve(user.id, "After Rename") is None
+
+
+def test_miss_falls_back_to_database():
+    user = _user()
+    index = get_customer_index(models.session_scope)
+    index.names(user.id)  # loaded before the row exists
+    with models.session_scope() as session:
+        session.add(models.Customer(user_id=user.id, name="Other Process"))
+    assert index.resolve(user.id, "Other Process") is not None
+    assert "Other Process" in index.names(user.id)
+
+
+def test_rolled_back_customer_is_forgotten():
+    db = DatabaseManager.get_instance()
+    user = _user()
+    customers = CustomerService(db.get_session)
+    customers.customer_index.names(user.id)
+
+    with pytest.raises(RuntimeError):
+        with customers.unit_of_work():
+            customers.create_customer({"name": "Never Committed"}, user.id)
+            raise RuntimeError("abort")
+    assert customers.customer_index.resolve(user.id, "Never Committed") is None
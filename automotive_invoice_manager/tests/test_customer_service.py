@@ -66,3 +66,26 @@ def test_get_customer_stats():
     stats = service.get_customer_stats(cust.id)
     assert stats['invoice_count'] == 1
     assert stats['total_billed'] == 10.0
+
+
+def test_search_customer_rows_include_stats():
+    cust = service.create_customer({'name': 'Rows Cust', 'notes': 'long notes'}, user.id)
+    with models.session_scope() as session:
+        for number, total in (('R1', 10), ('R2', 15)):
+            session.add(
+                models.Invoice(
+                    user_id=user.id,
+                    customer_id=cust.id,
+                    invoice_number=number,
+                    issued_date=date.today(),
+                    due_date=date.today(),
+                    line_items=[],
+                    total=total,
+                )
+            )
+    rows = service.search_customer_rows(user.id, 'Rows Cust')
+    assert [(r.id, r.invoice_count, float(r.total_billed)) for r in rows] == [(cust.id, 2, 25.0)]
+    assert not hasattr(rows[0], 'notes')
+
+    ordered = service.search_customer_rows(user.id, sort_by='invoices', sort_desc=True)
+    assert ordered[0].invoice_count == max(r.invoice_count for r in ordered)
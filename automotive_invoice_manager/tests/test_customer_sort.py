@@ -0,0 +1,78 @@
+import os
+import sys
+from datetime import date, datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from automotive_invoice_manager.database import models
+from automotive_invoice_manager.services.customer_service import CustomerService
+from automotive_invoice_manager.services.customer_sort import CustomerColumnStore
+
+service = CustomerService(models.session_scope)
+
+
+def setup_module(module):
+    models.create_tables()
+    with models.session_scope() as session:
+        user = models.User(email="sort@test.com", password_hash="x")
+        session.add(user)
+        session.flush()
+        customers = [
+            models.Customer(user_id=user.id, name="sort delta", email="d@x.com",
+                            created_at=datetime(2024, 3, 1)),
+            models.Customer(user_id=user.id, name="Sort Alpha", phone="555-0100",
+                            created_at=datetime(2024, 1, 1)),
+            models.Customer(user_id=user.id, name="Sort Charlie", email="c@x.com",
+                            created_at=datetime(2024, 2, 1)),
+        ]
+        session.add_all(customers)
+        session.flush()
+        # 9 > 10 > 100 as strings; the totals must sort numerically
+        for i, (customer, total) in enumerate(zip(customers, (9, 100, 10))):
+            for n in range(i + 1):
+                session.add(
+                    models.Invoice(
+                        user_id=user.id,
+                        customer_id=customer.id,
+                        invoice_number=f"SORT-{i}-{n}",
+                        issued_date=date.today(),
+                        due_date=date.today(),
+                        line_items=[],
+                        total=total,
+                    )
+                )
+
+
+def _user_id():
+    with models.session_scope() as session:
+        return session.query(models.User).filter_by(email="sort@test.com").one().id
+
+
+def _ids(rows):
+    return [str(row.id) for row in rows]
+
+
+def test_in_memory_order_matches_database_order():
+    user_id = _user_id()
+    store = CustomerColumnStore(service.search_customer_rows(user_id, "sort"))
+    for column in ("invoices", "total_billed", "created"):
+        for reverse in (False, True):
+            expected = service.search_customer_rows(user_id, "sort", sort_by=column, sort_desc=reverse)
+            assert store.order(column, reverse) == _ids(expected)
+
+
+def test_text_columns_sort_case_insensitively():
+    store = CustomerColumnStore(service.search_customer_rows(_user_id(), "sort"))
+    names = dict(zip(store.iids, (values[0] for values in store.values)))
+    assert [names[iid] for iid in store.order("name")] == ["Sort Alpha", "Sort Charlie", "sort delta"]
+    # Missing emails sort first, like NULLs in SQLite
+    assert [names[iid] for iid in store.order("email")][0] == "Sort Alpha"
+
+
+def test_partial_store_defers_to_the_database():
+    rows = service.search_customer_rows(_user_id(), "sort", limit=2)
+    assert len(rows) == 2
+    store = CustomerColumnStore(rows, complete=False)
+    assert not store.can_sort("name")
+    assert CustomerColumnStore(rows).can_sort("name")
+    assert not CustomerColumnStore(rows).can_sort("unknown")
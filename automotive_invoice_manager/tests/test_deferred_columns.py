@@ -0,0 +1,87 @@
+import os
+import re
+import sys
+from contextlib import contextmanager
+from datetime import date
+
+from sqlalchemy import event
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from automotive_invoice_manager.database import models
+from automotive_invoice_manager.services.customer_service import CustomerService
+from automotive_invoice_manager.services.invoice_service import InvoiceService
+
+HEAVY = re.compile(r"\b(line_items|address|notes)\b")
+
+invoice_service = InvoiceService(models.session_scope)
+customer_service = CustomerService(models.session_scope)
+
+
+def setup_module(module):
+    models.create_tables()
+    with models.session_scope() as session:
+        user = models.User(email="deferred@test.com", password_hash="x")
+        session.add(user)
+        session.flush()
+        customer = models.Customer(user_id=user.id, name="Deferred Cust", address="1 Road", notes="VIP")
+        session.add(customer)
+        session.flush()
+        session.add(
+            models.Invoice(
+                user_id=user.id,
+                customer_id=customer.id,
+                invoice_number="DEF-1",
+                issued_date=date.today(),
+                due_date=date.today(),
+                line_items=[{"description": "Labor", "hours": 1, "rate": 10}],
+                total=10,
+            )
+        )
+
+
+def _user_id():
+    with models.session_scope() as session:
+        return session.query(models.User.id).filter_by(email="deferred@test.com").scalar()
+
+
+@contextmanager
+def selected_columns():
+    """Collect the select lists (text between SELECT and FROM) of executed queries."""
+    columns = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        for match in re.finditer(r"SELECT(.*?)\bFROM\b", statement, re.S):
+            columns.append(match.group(1))
+
+    event.listen(models.engine, "before_cursor_execute", record)
+    try:
+        yield columns
+    finally:
+        event.remove(models.engine, "before_cursor_execute", record)
+
+
+def test_list_and_search_queries_skip_heavy_columns():
+    user_id = _user_id()
+    with selected_columns() as columns:
+        invoice_service.get_invoices(user_id, search="DEF")
+        invoice_service.get_invoice_rows(user_id, search="DEF")
+        invoice_service.get_recent_invoices(user_id)
+        invoice_service.get_invoice_by_number(user_id, "DEF-1")
+        customer_service.search_customers(user_id, "Deferred")
+        customer_service.search_customer_rows(user_id, "Deferred")
+        customer_service.get_all_customers(user_id)
+    assert columns
+    assert [c for c in columns if HEAVY.search(c)] == []
+
+
+def test_detail_paths_load_heavy_columns():
+    user_id = _user_id()
+    found = invoice_service.get_invoice_by_number(user_id, "DEF-1")
+    invoice = invoice_service.get_invoice(found.id)
+    assert invoice.line_items[0]["description"] == "Labor"
+
+    customer = customer_service.get_customer(invoice.customer_id)
+    assert (customer.address, customer.notes) == ("1 Road", "VIP")
+    exported = customer_service.get_all_customers(user_id, include_details=True)
+    assert exported[0].notes == "VIP"
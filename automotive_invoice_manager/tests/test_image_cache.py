@@ -0,0 +1,81 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+import pytest
+from PIL import Image
+
+from automotive_invoice_manager.ui.image_cache import ImageCache
+
+
+def _source(tmp_path, color="red"):
+    path = tmp_path / "logo.png"
+    Image.new("RGBA", (200, 100), color).save(path)
+    return path
+
+
+def test_scaled_variant_is_reused_from_disk(tmp_path):
+    source = _source(tmp_path)
+    cache_dir = tmp_path / "cache"
+
+    first = ImageCache(cache_dir)
+    assert first.load_image(source, (50, 25)).size == (50, 25)
+    assert first.stats["decodes"] == 1
+    assert len(list(cache_dir.glob("*.png"))) == 1
+
+    relaunched = ImageCache(cache_dir)
+    image = relaunched.load_image(source, (50, 25))
+    assert image.size == (50, 25)
+    assert relaunched.stats == {"memory_hits": 0, "disk_hits": 1, "decodes": 0}
+
+
+def test_changed_source_invalidates_variants(tmp_path):
+    source = _source(tmp_path)
+    cache = ImageCache(tmp_path / "cache")
+    old_key = cache.key(source, (50, 25))
+    cache.load_image(source, (50, 25))
+
+    Image.new("RGBA", (200, 100), "blue").save(source)
+    os.utime(source, ns=(old_key.mtime_ns + 10**9, old_key.mtime_ns + 10**9))
+    assert cache.key(source, (50, 25)) != old_key
+
+    image = cache.load_image(source, (50, 25))
+    assert image.getpixel((0, 0))[:3] == (0, 0, 255)
+    assert [p.name for p in (tmp_path / "cache").glob("*.png")] == [
+        cache.key(source, (50, 25)).variant_name
+    ]
+
+
+def test_missing_file_has_no_key(tmp_path):
+    assert ImageCache(tmp_path).key(tmp_path / "missing.png", (10, 10)) is None
+
+
+def test_thumbnail_is_cached_per_content_digest(tmp_path):
+    photo = tmp_path / "photo.jpg"
+    Image.new("RGB", (4000, 3000), "green").save(photo, quality=80)
+    copy = tmp_path / "copy.jpg"
+    copy.write_bytes(photo.read_bytes())
+
+    cache = ImageCache(tmp_path / "cache")
+    digest, thumb = cache.load_thumbnail(photo, 250)
+    assert max(thumb.size) == 250
+    assert cache.stats["decodes"] == 1
+
+    assert cache.load_thumbnail(copy, 250)[0] == digest
+    assert cache.stats == {"memory_hits": 0, "disk_hits": 1, "decodes": 1}
+
+
+def test_validate_image_reads_headers_only(tmp_path):
+    from automotive_invoice_manager.utils.images import inspect_image, validate_image
+
+    path = _source(tmp_path)
+    assert inspect_image(path).dimensions == "200x100"
+    assert validate_image(path).format == "PNG"
+
+    bogus = tmp_path / "bogus.png"
+    bogus.write_bytes(b"not an image")
+    with pytest.raises(ValueError, match="not a valid image"):
+        validate_image(bogus)
+    with pytest.raises(ValueError, match="less than"):
+        validate_image(path, max_bytes=10)
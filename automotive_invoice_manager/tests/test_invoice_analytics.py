@@ -0,0 +1,104 @@
+import os
+import sys
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import event
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from automotive_invoice_manager.backend.database.connection import DatabaseManager
+from automotive_invoice_manager.database import models
+from automotive_invoice_manager.services.invoice_analytics import InvoiceAnalytics
+from automotive_invoice_manager.services.invoice_service import InvoiceService
+
+service = InvoiceService(models.session_scope, analytics=InvoiceAnalytics(models.session_scope))
+
+
+def _labor(hours, rate):
+    return [{"description": "Labor", "hours": hours, "rate": rate, "parts": 0, "tax": 0}]
+
+
+def setup_module(module):
+    models.create_tables()
+    with models.session_scope() as session:
+        user = models.User(email="analytics@test.com", password_hash="x")
+        session.add(user)
+        session.flush()
+        acme = models.Customer(user_id=user.id, name="Analytics Acme")
+        zeta = models.Customer(user_id=user.id, name="Analytics Zeta")
+        session.add_all([acme, zeta])
+        session.flush()
+        # (customer, issued, paid, status, hours, rate)
+        invoices = [
+            (acme, date(2024, 1, 5), date(2024, 1, 15), "paid", 2, 100),
+            (acme, date(2024, 1, 20), date(2024, 2, 19), "paid", 1, 80),
+            (zeta, date(2024, 2, 10), date(2024, 2, 15), "paid", 4, 120),
+            (zeta, date(2024, 2, 11), None, "paid", 1, 90),  # paid before paid_date existed
+            (zeta, date(2024, 3, 1), None, "sent", 3, 100),
+        ]
+        for i, (customer, issued, paid, status, hours, rate) in enumerate(invoices):
+            invoice = models.Invoice(
+                user_id=user.id,
+                customer_id=customer.id,
+                invoice_number=f"ANA-{i:03d}",
+                issued_date=issued,
+                due_date=issued,
+                paid_date=paid,
+                line_items=_labor(hours, rate),
+                status=status,
+            )
+            invoice.update_totals()
+            session.add(invoice)
+
+
+def _ids():
+    with models.session_scope() as session:
+        user = session.query(models.User).filter_by(email="analytics@test.com").one()
+        customers = {c.name: c.id for c in session.query(models.Customer).filter_by(user_id=user.id)}
+        invoices = {i.invoice_number: i.id for i in session.query(models.Invoice).filter_by(user_id=user.id)}
+        return user, customers, invoices
+
+
+def test_reports_group_and_rank_the_loaded_invoices():
+    user, customers, _invoices = _ids()
+    facts = service.get_invoice_facts(user.id)
+    assert len(facts) == 5
+    assert facts.revenue_trend() == [
+        (date(2024, 1, 1), 2, Decimal("280.00")),
+        (date(2024, 2, 1), 2, Decimal("570.00")),
+    ]
+    assert facts.revenue_trend("year", statuses=()) == [(date(2024, 1, 1), 5, Decimal("1150.00"))]
+    assert facts.customer_totals() == [
+        (customers["Analytics Zeta"], 2, Decimal("570.00")),
+        (customers["Analytics Acme"], 2, Decimal("280.00")),
+    ]
+    assert facts.customer_distribution((50,)).percentiles == {50: 425.0}
+    days = facts.days_to_pay()
+    assert (days.count, days.mean, days.percentiles[50]) == (3, 15.0, 10.0)
+    assert facts.labor_rates((0, 100)).percentiles == {0: 80.0, 100: 120.0}
+    assert facts.total() == Decimal("850.00")
+
+
+def test_refresh_reads_changed_invoices_and_drops_deleted_ones():
+    user, _customers, invoices = _ids()
+    service.get_invoice_facts(user.id)
+
+    statements = []
+    engine = DatabaseManager.get_instance().engine
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        assert service.update_invoice(invoices["ANA-004"], {"status": "paid"})
+        assert service.delete_invoice(invoices["ANA-000"])
+        facts = service.get_invoice_facts(user.id)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert any("updated_at >=" in statement for statement in statements)
+    assert len(facts) == 4 and invoices["ANA-000"] not in facts.ids.tolist()
+    assert facts.total() == Decimal("950.00")
+    days = facts.days_to_pay((100,))
+    assert days.count == 3
+    assert days.percentiles == {100: float((date.today() - date(2024, 3, 1)).days)}
+    assert facts.watermark <= datetime.utcnow()
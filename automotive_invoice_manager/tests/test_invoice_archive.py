@@ -0,0 +1,201 @@
+import os
+import sys
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import create_engine, text
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from automotive_invoice_manager.backend.database.connection import DatabaseManager
+from automotive_invoice_manager.config.archive import ArchiveConfig
+from automotive_invoice_manager.config.database import DatabaseConfig
+from automotive_invoice_manager.database import models
+from automotive_invoice_manager.services.archive_service import InvoiceArchiver
+from automotive_invoice_manager.services.customer_service import CustomerService
+from automotive_invoice_manager.services.invoice_analytics import InvoiceAnalytics
+from automotive_invoice_manager.services.invoice_service import InvoiceService
+
+TODAY = date.today()
+
+
+def _setup(tmp_path):
+    db = DatabaseManager(DatabaseConfig(url=f"sqlite:///{tmp_path / 'hot.db'}"))
+    models.create_tables(db.engine)
+    with db.get_session() as session:
+        user = models.User(email="archive@test.com", password_hash="x")
+        session.add(user)
+        session.flush()
+        customer = models.Customer(user_id=user.id, name="Archive Cust")
+        session.add(customer)
+        session.flush()
+        for i, (status, age) in enumerate(
+            [("paid", 900), ("paid", 1000), ("paid", 30), ("sent", 900), ("paid", 800)]
+        ):
+            session.add(
+                models.Invoice(
+                    user_id=user.id,
+                    customer_id=customer.id,
+                    invoice_number=f"ARC-{i}",
+                    issued_date=TODAY - timedelta(days=age),
+                    due_date=TODAY - timedelta(days=age - 10),
+                    status=status,
+                    line_items=[],
+                    total=100,
+                )
+            )
+        user_id = user.id
+    config = ArchiveConfig(path=str(tmp_path / "cold.db"), after_days=365, chunk_size=2)
+    return db, InvoiceArchiver(db, config), user_id
+
+
+def test_archive_moves_old_paid_invoices_in_chunks(tmp_path):
+    db, archiver, user_id = _setup(tmp_path)
+
+    assert archiver.archive_paid_invoices() == 3
+    assert archiver.archive_paid_invoices() == 0
+    assert archiver.archived_count(user_id) == 3
+
+    service = InvoiceService(db.get_session)
+    hot, _pages = service.get_invoices(user_id, per_page=50)
+    assert {inv.invoice_number for inv in hot} == {"ARC-2", "ARC-3"}
+    assert service.get_invoice_count(user_id) == 5
+    assert service.get_total_revenue(user_id) == 400.0
+
+
+def test_include_archive_unions_hot_and_cold(tmp_path):
+    db, archiver, user_id = _setup(tmp_path)
+    archiver.archive_paid_invoices()
+    service = InvoiceService(db.get_session)
+
+    both, _pages = service.get_invoices(user_id, per_page=50, include_archive=True)
+    assert len(both) == 5
+    assert all(inv.customer.name == "Archive Cust" for inv in both)
+
+    found, _pages = service.get_invoices(user_id, search="ARC-1", include_archive=True)
+    assert [inv.invoice_number for inv in found] == ["ARC-1"]
+    archived = service.get_invoice_by_number(user_id, "ARC-0")
+    assert archived is not None and service.get_invoice(archived.id).invoice_number == "ARC-0"
+
+
+def test_archiving_is_opt_in(tmp_path):
+    db, archiver, user_id = _setup(tmp_path)
+    assert not ArchiveConfig().enabled
+    assert archiver.run() == 0
+
+    archiver.config.enabled = True
+    assert archiver.run() == 3
+
+
+def test_archived_invoices_keep_their_identity(tmp_path):
+    db, archiver, user_id = _setup(tmp_path)
+    service = InvoiceService(db.get_session)
+    # ARC-4 has the highest id; SQLite would hand it out again without AUTOINCREMENT
+    archived_ids = {service.get_invoice_by_number(user_id, f"ARC-{i}").id for i in (0, 1, 4)}
+    archiver.archive_paid_invoices()
+
+    with db.get_session() as session:
+        user = session.get(models.User, user_id)
+        customer_id = session.query(models.Customer.id).filter_by(user_id=user_id).scalar()
+    created = service.create_invoice(user, dict(customer="Archive Cust", issued_date=TODAY, due_date=TODAY))
+    assert created.id > max(archived_ids)
+    both, _pages = service.get_invoices(user_id, per_page=50, include_archive=True)
+    assert len(both) == len({inv.id for inv in both}) == 6
+    rows, _pages = service.get_invoice_rows(user_id, per_page=50, include_archive=True)
+    assert len({row.id for row in rows}) == 6
+
+    # Archived numbers stay taken and archived invoices are read-only
+    with pytest.raises(ValueError, match="already exists"):
+        service.create_invoice(
+            user, dict(customer="Archive Cust", issued_date=TODAY, due_date=TODAY, invoice_number="ARC-0")
+        )
+    for archived_id in archived_ids:
+        with pytest.raises(ValueError, match="read-only"):
+            service.update_invoice(archived_id, {"status": "sent"})
+        with pytest.raises(ValueError, match="read-only"):
+            service.delete_invoice(archived_id)
+    assert service.delete_invoice(created.id + 1000) is False
+
+    # A customer with only archived invoices is not deleted
+    for invoice in service.get_invoices(user_id, per_page=50)[0]:
+        service.delete_invoice(invoice.id)
+    customers = CustomerService(db.get_session)
+    assert customers.delete_customer(customer_id, user_id) is False
+    assert customers.get_customer(customer_id) is not None
+
+
+def test_attach_keeps_new_ids_above_archived_ones(tmp_path):
+    db, archiver, user_id = _setup(tmp_path)
+    archiver.archive_paid_invoices()
+
+    # An archive filled before AUTOINCREMENT, next to a hot table that forgot its ids
+    engine = create_engine(f"sqlite:///{tmp_path / 'hot.db'}")
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM sqlite_sequence WHERE name = 'invoices'"))
+    fresh = DatabaseManager(DatabaseConfig(url=f"sqlite:///{tmp_path / 'hot.db'}"))
+    InvoiceArchiver(fresh, archiver.config).attach()
+    with fresh.engine.connect() as conn:
+        seq = conn.execute(text("SELECT seq FROM sqlite_sequence WHERE name = 'invoices'")).scalar()
+        archived_max = conn.execute(text("SELECT MAX(id) FROM archive.invoices")).scalar()
+    assert seq == archived_max == 5
+
+
+def test_create_tables_adds_autoincrement_to_invoices(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE invoices (id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL, "
+                "customer_id INTEGER NOT NULL, invoice_number VARCHAR(50) NOT NULL, issued_date DATE NOT NULL, "
+                "due_date DATE NOT NULL, total INTEGER NOT NULL, status VARCHAR(20) NOT NULL, "
+                "created_at DATETIME NOT NULL, CONSTRAINT uq_invoices_user_invoice_number "
+                "UNIQUE (user_id, invoice_number))"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO invoices (id, user_id, customer_id, invoice_number, issued_date, due_date, total, "
+                "status, created_at) VALUES (7, 1, 1, 'OLD-7', '2024-01-01', '2024-01-31', 0, 'paid', '2024-01-01')"
+            )
+        )
+    models.create_tables(engine)
+    with engine.connect() as conn:
+        ddl = conn.execute(text("SELECT sql FROM sqlite_master WHERE name = 'invoices'")).scalar()
+        assert "AUTOINCREMENT" in ddl
+        assert conn.execute(text("SELECT id, invoice_number FROM invoices")).all() == [(7, "OLD-7")]
+        assert conn.execute(text("SELECT seq FROM sqlite_sequence WHERE name = 'invoices'")).scalar() == 7
+
+
+def test_merge_moves_archived_invoices_and_refreshes_analytics(tmp_path):
+    db, archiver, user_id = _setup(tmp_path)
+    with db.get_session() as session:
+        kept_id = session.query(models.Customer.id).filter_by(user_id=user_id).scalar()
+        duplicate = models.Customer(user_id=user_id, name="Archive Cust.")
+        session.add(duplicate)
+        session.flush()
+        session.add(
+            models.Invoice(
+                user_id=user_id,
+                customer_id=duplicate.id,
+                invoice_number="ARC-DUP",
+                issued_date=TODAY - timedelta(days=900),
+                due_date=TODAY - timedelta(days=890),
+                status="paid",
+                line_items=[],
+                total=100,
+            )
+        )
+        duplicate_id = duplicate.id
+    archiver.archive_paid_invoices()
+
+    service = InvoiceService(db.get_session)
+    analytics = InvoiceAnalytics(db.get_session)
+    with db.get_session() as session:
+        user = session.get(models.User, user_id)
+    service.create_invoice(user, dict(customer_id=kept_id, issued_date=TODAY, due_date=TODAY, status="paid"))
+    before = {customer_id: count for customer_id, count, _total in analytics.facts(user_id).customer_totals()}
+    assert before[duplicate_id] == 1
+
+    assert CustomerService(db.get_session).merge_customers(user_id, kept_id, [duplicate_id]) == 1
+    after = {customer_id: count for customer_id, count, _total in analytics.facts(user_id).customer_totals()}
+    assert after == {kept_id: before[kept_id] + 1}
@@ -0,0 +1,142 @@
+import os
+import sys
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, event, inspect, text
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from automotive_invoice_manager.database import models
+from automotive_invoice_manager.services.invoice_numbers import InvoiceNumberAllocator
+from automotive_invoice_manager.services.invoice_service import InvoiceService
+
+
+def setup_module(module):
+    models.create_tables()
+    with models.session_scope() as session:
+        for email in ("numbers-a@test.com", "numbers-b@test.com", "numbers-c@test.com", "numbers-d@test.com"):
+            user = models.User(email=email, password_hash="x")
+            session.add(user)
+            session.flush()
+            session.add(models.Customer(user_id=user.id, name="Numbers Cust"))
+
+
+def _user(email):
+    with models.session_scope() as session:
+        return session.query(models.User).filter_by(email=email).one()
+
+
+def _data(**extra):
+    return dict(customer="Numbers Cust", issued_date=date.today(), due_date=date.today(), **extra)
+
+
+def test_blocks_do_not_overlap_between_allocators():
+    user = _user("numbers-a@test.com")
+    first = InvoiceNumberAllocator(models.session_scope, block_size=3)
+    second = InvoiceNumberAllocator(models.session_scope, block_size=3)
+
+    numbers = [first.next_number(user.id) for _ in range(4)] + second.next_numbers(user.id, 5)
+    assert len(set(numbers)) == 9
+    assert numbers[0].startswith("INV-")
+
+
+def test_custom_format_is_applied():
+    user = _user("numbers-b@test.com")
+    allocator = InvoiceNumberAllocator(models.session_scope)
+    allocator.configure(user.id, prefix="SHOP", number_format="{prefix}-{year}-{seq:04d}")
+    assert allocator.next_number(user.id).startswith(f"SHOP-{date.today().year}-")
+
+    with pytest.raises(ValueError):
+        allocator.configure(user.id, number_format="{nope}")
+
+
+def test_create_invoice_generates_unique_numbers_without_precheck():
+    user = _user("numbers-a@test.com")
+    service = InvoiceService(models.session_scope)
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(models.engine, "before_cursor_execute", record)
+    try:
+        created = [service.create_invoice(user, _data()) for _ in range(5)]
+    finally:
+        event.remove(models.engine, "before_cursor_execute", record)
+
+    assert len({inv.invoice_number for inv in created}) == 5
+    assert not [s for s in statements if s.lstrip().upper().startswith("SELECT") and "FROM invoices" in s]
+
+
+def test_generated_number_skips_existing_rows():
+    user = _user("numbers-a@test.com")
+    allocator = InvoiceNumberAllocator(models.session_scope, block_size=2)
+    taken = allocator.next_numbers(user.id, 2)
+    allocator.release(user.id)
+
+    class Replay(InvoiceNumberAllocator):
+        """Hands out an already used number first, like legacy data would."""
+
+        def __init__(self):
+            super().__init__(models.session_scope)
+            self.queue = [taken[0]]
+
+        def next_number(self, user_id):
+            return self.queue.pop() if self.queue else super().next_number(user_id)
+
+    service = InvoiceService(models.session_scope)
+    service.create_invoice(user, _data(invoice_number=taken[0]))
+    replay = InvoiceService(models.session_scope, number_allocator=Replay())
+    assert replay.create_invoice(user, _data()).invoice_number != taken[0]
+
+    with pytest.raises(ValueError):
+        service.create_invoice(user, _data(invoice_number=taken[0]))
+
+
+def test_each_user_has_their_own_series():
+    first, second = _user("numbers-c@test.com"), _user("numbers-d@test.com")
+    service = InvoiceService(models.session_scope)
+    numbers = [service.create_invoice(first, _data()).invoice_number for _ in range(8)]
+    assert numbers[0] == "INV-000001"
+
+    # The second user's series starts over and may reuse the first user's numbers
+    assert [service.create_invoice(second, _data()).invoice_number for _ in range(8)] == numbers
+    assert service.get_invoice_by_number(second.id, "INV-000001").user_id == second.id
+
+    with pytest.raises(ValueError):
+        service.create_invoice(second, _data(invoice_number="INV-000001"))
+
+
+def test_create_tables_scopes_legacy_global_numbers(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE invoices (id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL, "
+                "customer_id INTEGER NOT NULL, invoice_number VARCHAR(50) NOT NULL, issued_date DATE NOT NULL, "
+                "due_date DATE NOT NULL, line_items JSON, total INTEGER NOT NULL, template VARCHAR(50), "
+                "status VARCHAR(20) NOT NULL, created_at DATETIME NOT NULL, updated_at DATETIME, "
+                "UNIQUE (invoice_number))"
+            )
+        )
+        conn.execute(
+            text(
+                "INSERT INTO invoices (user_id, customer_id, invoice_number, issued_date, due_date, total, status, "
+                "created_at) VALUES (1, 1, 'INV-000001', '2024-01-01', '2024-01-31', 1250, 'paid', '2024-01-01')"
+            )
+        )
+    models.create_tables(engine)
+
+    assert [c["column_names"] for c in inspect(engine).get_unique_constraints("invoices")] == [
+        ["user_id", "invoice_number"]
+    ]
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO invoices (user_id, customer_id, invoice_number, issued_date, due_date, total, status, "
+                "created_at) VALUES (2, 2, 'INV-000001', '2024-01-01', '2024-01-31', 0, 'draft', '2024-01-01')"
+            )
+        )
+        rows = conn.execute(text("SELECT user_id, total FROM invoices ORDER BY id")).all()
+    assert rows == [(1, 1250), (2, 0)]
@@ -0,0 +1,85 @@
+import os
+import sys
+from datetime import date
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from automotive_invoice_manager.database import models
+from automotive_invoice_manager.services.invoice_prefetch import InvoicePrefetcher
+from automotive_invoice_manager.services.invoice_service import InvoiceService
+
+FILTERS = ("PREF", None, False)
+
+
+def setup_module(module):
+    models.create_tables()
+    with models.session_scope() as session:
+        user = models.User(email="prefetch@test.com", password_hash="x")
+        session.add(user)
+        session.flush()
+        customer = models.Customer(user_id=user.id, name="Prefetch Cust", address="2 Lane")
+        session.add(customer)
+        session.flush()
+        for i in range(5):
+            session.add(
+                models.Invoice(
+                    user_id=user.id,
+                    customer_id=customer.id,
+                    invoice_number=f"PREF-{i}",
+                    issued_date=date.today(),
+                    due_date=date.today(),
+                    line_items=[{"description": "x", "hours": 1, "rate": 1, "parts": 0, "tax": 0}],
+                )
+            )
+
+
+def _user_id():
+    with models.session_scope() as session:
+        return session.query(models.User).filter_by(email="prefetch@test.com").one().id
+
+
+def test_adjacent_pages_are_served_from_prefetch():
+    user_id = _user_id()
+    service = InvoiceService(models.session_scope)
+    prefetcher = InvoicePrefetcher(service)
+
+    rows, total_pages = service.get_invoice_rows(user_id, page=2, per_page=2, search="PREF")
+    prefetcher.prefetch_pages(user_id, FILTERS, 2, total_pages, 2)
+
+    for page in (1, 3):
+        expected = service.get_invoice_rows(user_id, page=page, per_page=2, search="PREF")
+        assert prefetcher.get_page(user_id, FILTERS, page, 2) == expected
+    assert prefetcher.get_page(user_id, ("other", None, False), 1, 2) is None
+    assert prefetcher.hit_rate()["pages"] == round(2 / 3, 3)
+
+    prefetcher.cancel()
+    assert prefetcher.get_page(user_id, FILTERS, 1, 2) is None
+
+
+def test_detail_prefetch_loads_full_invoice_once():
+    user_id = _user_id()
+    service = InvoiceService(models.session_scope)
+    invoice_id = service.get_invoice_by_number(user_id, "PREF-0").id
+    spy = MagicMock(wraps=service.get_invoice)
+    service.get_invoice = spy
+    prefetcher = InvoicePrefetcher(service)
+
+    prefetcher.prefetch_detail(invoice_id)
+    prefetcher.prefetch_detail(invoice_id)
+    prefetcher.wait()
+    assert spy.call_count == 1
+    invoice = prefetcher.get_detail(invoice_id)
+
+    assert spy.call_count == 1
+    assert invoice.line_items[0]["description"] == "x"
+    assert invoice.customer.address == "2 Lane"
+    assert prefetcher.hit_rate()["details"] == 1.0
+
+
+def test_cache_is_bounded():
+    service = MagicMock()
+    prefetcher = InvoicePrefetcher(service, max_pages=2)
+    for page in range(1, 6):
+        prefetcher.prefetch_pages(1, FILTERS, page, 10, 10)
+    assert len(prefetcher._pages) == 2
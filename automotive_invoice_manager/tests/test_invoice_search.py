@@ -0,0 +1,74 @@
+import os
+import sys
+from datetime import date
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from automotive_invoice_manager.database import models
+from automotive_invoice_manager.services.invoice_search import InvoiceSearchCache
+from automotive_invoice_manager.services.invoice_service import InvoiceService
+
+service = InvoiceService(models.session_scope)
+FILTERS = (None, False)
+
+
+def setup_module(module):
+    models.create_tables()
+    with models.session_scope() as session:
+        user = models.User(email="search@test.com", password_hash="x")
+        session.add(user)
+        session.flush()
+        smith = models.Customer(user_id=user.id, name="Smithson Motors")
+        jones = models.Customer(user_id=user.id, name="Jones Garage")
+        session.add_all([smith, jones])
+        session.flush()
+        for i, customer in enumerate([smith, smith, jones, jones, jones]):
+            session.add(
+                models.Invoice(
+                    user_id=user.id,
+                    customer_id=customer.id,
+                    invoice_number=f"SRCH-{i:03d}",
+                    issued_date=date.today(),
+                    due_date=date.today(),
+                    line_items=[],
+                    total=10 * i,
+                )
+            )
+
+
+def _user_id():
+    with models.session_scope() as session:
+        return session.query(models.User).filter_by(email="search@test.com").one().id
+
+
+def test_narrowing_matches_database_results():
+    user_id = _user_id()
+    cache = InvoiceSearchCache()
+    rows, truncated = service.search_invoice_rows(user_id, "s")
+    assert not truncated
+    cache.store("s", FILTERS, rows, truncated)
+
+    for term in ("sm", "SMITH", "srch-00", "Jones"):
+        local = cache.narrow(term, FILTERS)
+        expected, _ = service.search_invoice_rows(user_id, term)
+        assert local is not None
+        assert sorted(r.id for r in local) == sorted(r.id for r in expected)
+
+
+def test_broadened_changed_or_truncated_searches_need_the_database():
+    user_id = _user_id()
+    cache = InvoiceSearchCache()
+    rows, truncated = service.search_invoice_rows(user_id, "smith")
+    cache.store("smith", FILTERS, rows, truncated)
+
+    assert cache.narrow("smit", FILTERS) is None  # broadened
+    assert cache.narrow("smithson", ("paid", False)) is None  # other filters
+    assert cache.narrow("smith%", FILTERS) is None  # LIKE wildcard
+
+    rows, truncated = service.search_invoice_rows(user_id, "srch", limit=3)
+    assert len(rows) == 3 and truncated
+    cache.store("srch", FILTERS, rows, truncated)
+    assert cache.narrow("srch-00", FILTERS) is None
+
+    cache.clear()
+    assert cache.narrow("smith", FILTERS) is None
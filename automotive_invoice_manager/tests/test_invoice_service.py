@@ -67,3 +67,12 @@ def test_due_date_validation_on_update():
     )
     with pytest.raises(ValueError):
         service.update_invoice(inv.id, {'due_date': date.today() - timedelta(days=1)})
+
+
+def test_get_invoice_rows_match_entities():
+    invoices, pages = service.get_invoices(user.id, per_page=50)
+    rows, row_pages = service.get_invoice_rows(user.id, per_page=50)
+    assert row_pages == pages
+    assert [r.invoice_number for r in rows] == [i.invoice_number for i in invoices]
+    assert rows[0].customer_name == 'Cust'
+    assert not hasattr(rows[0], 'line_items')
@@ -0,0 +1,122 @@
+import os
+import sys
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import create_engine, inspect, text, update
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from automotive_invoice_manager.database import models
+from automotive_invoice_manager.services.invoice_service import InvoiceService
+from automotive_invoice_manager.services.invoice_subtotals import InvoiceSubtotalBackfill
+
+service = InvoiceService(models.session_scope)
+ITEMS = [
+    {"description": "Brakes", "hours": 2, "rate": 100, "parts": 50, "tax": 10},
+    {"description": "Wipers", "hours": 0, "rate": 0, "parts": 19.99, "tax": 0},
+]
+
+
+def setup_module(module):
+    models.create_tables()
+    with models.session_scope() as session:
+        user = models.User(email="subtotals@test.com", password_hash="x")
+        session.add(user)
+        session.flush()
+        customer = models.Customer(user_id=user.id, name="Subtotal Cust")
+        session.add(customer)
+        session.flush()
+        # Written before the breakdown columns existed
+        for i in range(3):
+            session.add(
+                models.Invoice(
+                    user_id=user.id,
+                    customer_id=customer.id,
+                    invoice_number=f"SUB-LEGACY-{i}",
+                    issued_date=date(2024, 1, 10),
+                    due_date=date(2024, 2, 10),
+                    line_items=ITEMS,
+                    total=Decimal("294.99"),
+                    status="paid",
+                )
+            )
+
+
+def _user():
+    with models.session_scope() as session:
+        return session.query(models.User).filter_by(email="subtotals@test.com").one()
+
+
+def test_invoice_writes_maintain_the_breakdown():
+    invoice = service.create_invoice(
+        _user(),
+        {
+            "customer": "Subtotal Cust",
+            "invoice_number": "SUB-NEW",
+            "issued_date": date(2024, 3, 1),
+            "due_date": date(2024, 3, 31),
+            "line_items": ITEMS,
+            "status": "paid",
+        },
+    )
+    stored = service.get_invoice(invoice.id)
+    assert (stored.labor_subtotal, stored.parts_subtotal, stored.tax_amount) == (
+        Decimal("200.00"),
+        Decimal("69.99"),
+        Decimal("25.00"),
+    )
+    assert stored.total == Decimal("294.99")
+
+    service.update_invoice(invoice.id, {"line_items": ITEMS[:1]})
+    stored = service.get_invoice(invoice.id)
+    assert stored.parts_subtotal == Decimal("50.00")
+    assert stored.labor_subtotal + stored.parts_subtotal + stored.tax_amount == stored.total
+
+
+def test_backfill_fills_legacy_rows_and_check_finds_drift():
+    user_id = _user().id
+    backfill = InvoiceSubtotalBackfill(models.session_scope, chunk_size=2)
+    assert backfill.check(user_id).missing == 3
+
+    assert backfill.run(user_id) == 3
+    assert backfill.run(user_id) == 0
+    check = backfill.check(user_id, deep=True)
+    assert check.ok and check.checked == 4
+
+    with models.session_scope() as session:
+        session.execute(
+            update(models.Invoice)
+            .where(models.Invoice.invoice_number == "SUB-LEGACY-0")
+            .values(tax_amount=1)
+        )
+    check = backfill.check(user_id, deep=True)
+    assert check.unbalanced == 1 and check.stale == 1
+    assert len(check.examples) == 2
+
+
+def test_revenue_breakdown_sums_the_period():
+    breakdown = service.get_revenue_breakdown(_user().id, start=date(2024, 3, 1), end=date(2024, 3, 31))
+    assert breakdown == {
+        "labor": Decimal("200.00"),
+        "parts": Decimal("50.00"),
+        "tax": Decimal("25.00"),
+        "total": Decimal("275.00"),
+    }
+
+
+def test_create_tables_adds_columns_to_old_databases(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE invoices (id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL, "
+                "customer_id INTEGER NOT NULL, invoice_number VARCHAR(50) NOT NULL, "
+                "issued_date DATE NOT NULL, due_date DATE NOT NULL, line_items JSON, "
+                "total NUMERIC(12, 2) NOT NULL, template VARCHAR(50), status VARCHAR(20) NOT NULL, "
+                "created_at DATETIME NOT NULL, updated_at DATETIME)"
+            )
+        )
+    models.create_tables(engine)
+    columns = {column["name"] for column in inspect(engine).get_columns("invoices")}
+    assert {"labor_subtotal", "parts_subtotal", "tax_amount"} <= columns
@@ -53,14 +53,15 @@ class InvoiceWorkflowTestCase(unittest.TestCase):
         invoice = self.service.get_invoice(invoice.id)
         self.assertEqual(invoice.status, "paid")
 
-        # Mark as overdue
-        self.service.update_invoice(invoice.id, {"status": "overdue"})
+        # Overdue is automatic; an invoice that is not past due cannot be marked overdue
+        with self.assertRaises(ValueError):
+            self.service.update_invoice(invoice.id, {"status": "overdue"})
         invoice = self.service.get_invoice(invoice.id)
-        self.assertEqual(invoice.status, "overdue")
+        self.assertEqual(invoice.status, "paid")
 
         # Generate PDF
         with patch(
-            "automotive_invoice_manager.services.invoice_service.pdf_generator.generate_pdf",
+            "automotive_invoice_manager.services.pdf_service.PDFService.generate_invoice_pdf",
             return_value="/tmp/test.pdf",
         ) as mock_gen:
             pdf_path = self.service.generate_pdf(invoice.id)
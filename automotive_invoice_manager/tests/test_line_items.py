@@ -0,0 +1,83 @@
+import os
+import sys
+from datetime import date
+
+from sqlalchemy import text
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from automotive_invoice_manager.backend.database.line_items import (
+    FORMAT_COLUMNAR,
+    FORMAT_JSON,
+    decode_line_items,
+    encode_line_items,
+)
+from automotive_invoice_manager.database import models
+from automotive_invoice_manager.services.invoice_service import InvoiceService
+from automotive_invoice_manager.services.line_item_storage import LineItemRewrite
+
+service = InvoiceService(models.session_scope)
+ITEMS = [
+    {"description": "Brakes", "hours": 1.5, "rate": 110, "parts": 89.99, "tax": 8.25},
+    {"description": "Wipers ✓", "hours": 0.25, "rate": 110, "parts": 19.0, "tax": 8.25},
+]
+
+
+def _types(items):
+    return [[type(value) for value in item.values()] for item in items]
+
+
+def test_round_trip_keeps_values_and_types():
+    cases = [
+        ITEMS,
+        [],
+        [{"description": "", "quantity": 3, "rate": 1 / 3, "note": "x"}],
+        [{"description": "a", "rate": 2 ** 40}, {"description": "b", "rate": -3}],
+        # Need the JSON fallback: mixed types, None, separator in text
+        [{"hours": 1}, {"hours": 1.5}],
+        [{"description": None, "hours": 1.0}],
+        [{"description": "a\x1fb"}],
+    ]
+    for items in cases:
+        decoded = decode_line_items(encode_line_items(items))
+        assert decoded == items and _types(decoded) == _types(items)
+    assert encode_line_items(ITEMS)[0] == FORMAT_COLUMNAR
+    assert encode_line_items([{"hours": 1}, {"hours": 1.5}])[0] == FORMAT_JSON
+    assert len(encode_line_items(ITEMS)) < len(str(ITEMS)) / 2
+
+
+def test_legacy_json_rows_are_read_and_rewritten():
+    models.create_tables()
+    with models.session_scope() as session:
+        user = models.User(email="lineitems@test.com", password_hash="x")
+        session.add(user)
+        session.flush()
+        customer = models.Customer(user_id=user.id, name="Line Item Cust")
+        session.add(customer)
+        session.flush()
+        invoice = models.Invoice(
+            user_id=user.id,
+            customer_id=customer.id,
+            invoice_number="LI-LEGACY",
+            issued_date=date(2024, 1, 10),
+            due_date=date(2024, 2, 10),
+            total=0,
+        )
+        session.add(invoice)
+        session.flush()
+        # As written by the old JSON column
+        session.execute(
+            text("UPDATE invoices SET line_items = :items WHERE id = :id"),
+            {"items": '[{"description": "Brakes", "hours": 1.5, "rate": 110, "parts": 89.99, "tax": 8.25}]', "id": invoice.id},
+        )
+        invoice_id = invoice.id
+
+    assert service.get_invoice(invoice_id).line_items == ITEMS[:1]
+    rewrite = LineItemRewrite(models.session_scope, chunk_size=2)
+    assert rewrite.pending() >= 1
+    assert rewrite.run() >= 1
+    assert rewrite.pending() == 0
+    with models.session_scope() as session:
+        stored = session.execute(text("SELECT typeof(line_items) FROM invoices WHERE id = :id"), {"id": invoice_id}).scalar()
+    assert stored == "blob"
+    assert service.get_invoice(invoice_id).line_items == ITEMS[:1]
@@ -0,0 +1,34 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from PIL import Image
+
+from automotive_invoice_manager.utils.logo_assets import PRINT_BOX_IN, get_logo_asset, prepare_logo
+
+
+def test_prepare_logo_builds_small_palette_derivative(tmp_path):
+    source = tmp_path / "logo.png"
+    Image.radial_gradient("L").resize((3000, 3000)).convert("RGBA").save(source)
+
+    asset = prepare_logo(source, tmp_path / "print", dpi=150)
+    assert max(asset.width_px, asset.height_px) <= PRINT_BOX_IN[1] * 150
+    assert asset.height_pt == PRINT_BOX_IN[1] * 72
+    with Image.open(asset.path) as derivative:
+        assert derivative.mode == "P"
+    assert os.path.getsize(asset.path) < os.path.getsize(source)
+
+    mtime = os.path.getmtime(asset.path)
+    assert prepare_logo(source, tmp_path / "print", dpi=150) == asset
+    assert os.path.getmtime(asset.path) == mtime
+
+
+def test_get_logo_asset_without_logo(tmp_path):
+    assert get_logo_asset(tmp_path / "missing.png", tmp_path) is None
+
+    source = tmp_path / "logo.png"
+    Image.new("RGB", (100, 50), "navy").save(source)
+    asset = get_logo_asset(source, tmp_path / "print")
+    assert (asset.width_px, asset.height_px) == (100, 50)
+    assert get_logo_asset(source, tmp_path / "print") is asset
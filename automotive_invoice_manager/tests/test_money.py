@@ -0,0 +1,103 @@
+import os
+import sys
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Integer, create_engine, func, inspect, select, text
+from sqlalchemy.orm import Session
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from automotive_invoice_manager.backend.database.money import (
+    format_cents,
+    from_cents,
+    invoice_cents,
+    line_item_cents,
+    to_cents,
+)
+from automotive_invoice_manager.database import models
+
+
+def test_conversions_round_half_up():
+    assert to_cents("12.345") == 1235
+    assert to_cents(Decimal("-1.005")) == -101
+    assert to_cents(1.005) == 101
+    assert to_cents(7) == 700
+    assert to_cents("1e2") == 10000
+    assert from_cents(29499) == Decimal("294.99")
+    assert str(from_cents(0)) == "0.00"
+    assert format_cents(-123456) == "-$1,234.56"
+    assert format_cents(5, symbol="") == "0.05"
+
+
+def test_invoice_cents_rounds_each_sum_once():
+    items = [
+        {"hours": 1.5, "rate": 99.99, "parts": "10.10", "tax": 8.875},
+        {"quantity": 3, "rate": "0.333", "parts": 0, "tax": 0},
+        {"hours": "n/a", "rate": 50, "parts": 5, "tax": 0},  # skipped
+    ]
+    # labor 149.985 + 0.999, parts 10.10, tax 14.2043...
+    assert invoice_cents(items) == (17529, 15098, 1010, 1421)
+    assert line_item_cents(items[0]) == 17429
+    assert invoice_cents(None) == (0, 0, 0, 0)
+
+
+def test_amounts_are_stored_and_summed_as_integer_cents(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'money.db'}")
+    models.create_tables(engine)
+    with Session(engine) as session, session.begin():
+        user = models.User(email="money@test.com", password_hash="x")
+        session.add(user)
+        session.flush()
+        customer = models.Customer(user_id=user.id, name="Money Cust")
+        session.add(customer)
+        session.flush()
+        for i, total in enumerate(("0.10", 0.2, Decimal("1000"))):
+            session.add(
+                models.Invoice(
+                    user_id=user.id,
+                    customer_id=customer.id,
+                    invoice_number=f"MONEY-{i}",
+                    due_date=date(2024, 1, 31),
+                    total=total,
+                )
+            )
+    with engine.connect() as conn:
+        stored = conn.execute(text("SELECT typeof(total), total FROM invoices ORDER BY id")).all()
+        assert stored == [("integer", 10), ("integer", 20), ("integer", 100000)]
+        assert conn.execute(select(func.sum(models.Invoice.total))).scalar() == Decimal("1000.30")
+
+
+def test_create_tables_converts_numeric_columns(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'numeric.db'}")
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE invoices (id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL, "
+                "customer_id INTEGER NOT NULL, invoice_number VARCHAR(50) NOT NULL, "
+                "issued_date DATE NOT NULL, due_date DATE NOT NULL, line_items JSON, "
+                "total NUMERIC(12, 2) NOT NULL, labor_subtotal NUMERIC(12, 2), "
+                "template VARCHAR(50), status VARCHAR(20) NOT NULL, "
+                "created_at DATETIME NOT NULL, updated_at DATETIME)"
+            )
+        )
+        conn.execute(text("CREATE INDEX ix_invoices_status ON invoices (status)"))
+        conn.execute(
+            text(
+                "INSERT INTO invoices VALUES (1, 1, 1, 'OLD-1', '2024-01-01', '2024-01-31', '[]', "
+                "294.99, 200, 'standard', 'paid', '2024-01-01 00:00:00', NULL)"
+            )
+        )
+
+    models.create_tables(engine)
+    columns = {column["name"]: column["type"] for column in inspect(engine).get_columns("invoices")}
+    assert all(isinstance(columns[name], Integer) for name in ("total", "labor_subtotal", "tax_amount"))
+    assert "ix_invoices_status_due_date" in {index["name"] for index in inspect(engine).get_indexes("invoices")}
+    with engine.connect() as conn:
+        row = conn.execute(text("SELECT invoice_number, total, labor_subtotal, tax_amount FROM invoices")).one()
+    assert tuple(row) == ("OLD-1", 29499, 20000, None)
+
+    # Already converted: nothing to do
+    models.create_tables(engine)
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT total FROM invoices")).scalar() == 29499
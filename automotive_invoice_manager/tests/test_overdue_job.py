@@ -0,0 +1,108 @@
+import os
+import sys
+from datetime import date, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from automotive_invoice_manager.database import models
+from automotive_invoice_manager.services.invoice_service import InvoiceService
+from automotive_invoice_manager.services.overdue_job import OverdueStatusJob, effective_status
+
+TODAY = date.today()
+
+
+def setup_module(module):
+    models.create_tables()
+    with models.session_scope() as session:
+        user = models.User(email="overdue@test.com", password_hash="x")
+        session.add(user)
+        session.flush()
+        customer = models.Customer(user_id=user.id, name="Overdue Cust")
+        session.add(customer)
+        session.flush()
+        for i, (status, days) in enumerate(
+            [("sent", -10), ("draft", -1), ("sent", 5), ("paid", -30)]
+        ):
+            session.add(
+                models.Invoice(
+                    user_id=user.id,
+                    customer_id=customer.id,
+                    invoice_number=f"OVERDUE-{i}",
+                    issued_date=TODAY - timedelta(days=40),
+                    due_date=TODAY + timedelta(days=days),
+                    status=status,
+                    line_items=[],
+                    total=0,
+                )
+            )
+
+
+def _user_id():
+    with models.session_scope() as session:
+        return session.query(models.User).filter_by(email="overdue@test.com").one().id
+
+
+def _statuses(user_id):
+    with models.session_scope() as session:
+        rows = session.query(models.Invoice).filter_by(user_id=user_id).all()
+        return {inv.invoice_number: inv.status for inv in rows}
+
+
+def test_job_flips_open_past_due_invoices_once():
+    user_id = _user_id()
+    job = OverdueStatusJob(models.session_scope)
+
+    job.run(TODAY)
+    statuses = _statuses(user_id)
+    assert statuses["OVERDUE-0"] == "overdue"
+    assert statuses["OVERDUE-1"] == "draft"
+    assert statuses["OVERDUE-2"] == "sent"
+    assert statuses["OVERDUE-3"] == "paid"
+
+    assert job.run(TODAY) == 0
+    assert job.last_run().last_run_for == TODAY
+    assert OverdueStatusJob(models.session_scope).ensure_current(TODAY) == 0
+
+
+def test_counts_and_filter_use_materialized_status():
+    user_id = _user_id()
+    service = InvoiceService(models.session_scope)
+
+    assert service.get_overdue_count(user_id) == 1
+    assert service.get_pending_count(user_id) == 2
+    invoices, _pages = service.get_invoices(user_id, status="overdue")
+    assert {inv.invoice_number for inv in invoices} == {"OVERDUE-0"}
+
+
+def test_effective_status_on_write():
+    assert effective_status("sent", TODAY - timedelta(days=1), TODAY) == "overdue"
+    assert effective_status("overdue", TODAY + timedelta(days=7), TODAY) == "sent"
+    assert effective_status("paid", TODAY - timedelta(days=1), TODAY) == "paid"
+    assert effective_status("draft", TODAY - timedelta(days=1), TODAY) == "draft"
+
+
+def test_drafts_and_explicit_choices_are_kept():
+    user_id = _user_id()
+    service = InvoiceService(models.session_scope)
+    with models.session_scope() as session:
+        user = session.get(models.User, user_id)
+    data = dict(customer="Overdue Cust", issued_date=TODAY - timedelta(days=20))
+
+    # A draft past its due date stays a draft, also when the due date moves later
+    draft = service.create_invoice(user, dict(data, due_date=TODAY - timedelta(days=5)))
+    assert draft.status == "draft"
+    service.update_invoice(draft.id, {"due_date": TODAY + timedelta(days=5)})
+    assert service.get_invoice(draft.id).status == "draft"
+
+    # Marking an invoice overdue before its due date is refused, not rewritten
+    with pytest.raises(ValueError, match="past their due date"):
+        service.update_invoice(draft.id, {"status": "overdue"})
+    with pytest.raises(ValueError, match="past their due date"):
+        service.create_invoice(user, dict(data, due_date=TODAY, status="overdue"))
+    assert service.get_invoice(draft.id).status == "draft"
+
+    # Past due, the choice is kept
+    late = service.create_invoice(user, dict(data, due_date=TODAY - timedelta(days=1), status="overdue"))
+    assert late.status == "overdue"
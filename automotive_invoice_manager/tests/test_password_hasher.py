@@ -0,0 +1,75 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from automotive_invoice_manager.config.security import PasswordHashConfig
+from automotive_invoice_manager.database.models import Base, User, engine, session_scope
+from automotive_invoice_manager.services.auth_service import AuthManager
+from automotive_invoice_manager.services.password_hasher import (
+    PasswordHasher,
+    calibrate_iterations,
+)
+
+
+def setup_module(module):
+    Base.metadata.create_all(bind=engine)
+
+
+def _hasher(iterations):
+    return PasswordHasher(PasswordHashConfig(iterations=iterations))
+
+
+def test_hash_uses_configured_iterations():
+    hasher = _hasher(1000)
+    pwhash = hasher.hash("Secret123")
+    assert pwhash.startswith("pbkdf2:sha256:1000$")
+    assert hasher.verify(pwhash, "Secret123")
+    assert not hasher.verify(pwhash, "Wrong1234")
+
+
+def test_needs_rehash():
+    hasher = _hasher(2000)
+    assert not hasher.needs_rehash(hasher.hash("Secret123"))
+    assert hasher.needs_rehash(_hasher(1000).hash("Secret123"))
+    assert hasher.needs_rehash("scrypt:32768:8:1$salt$abc")
+
+
+def test_stronger_hash_is_never_rehashed():
+    stored = "pbkdf2:sha256:1000000$salt$abc"
+    assert not _hasher(600_000).needs_rehash(stored)
+
+    # A slow host calibrating far below the stored cost keeps it too
+    calibrated = PasswordHasher(PasswordHashConfig(iterations=0, min_iterations=1000, max_iterations=1000))
+    assert calibrated.calibrated and calibrated.iterations == 1000
+    assert not calibrated.needs_rehash(stored)
+    assert calibrated.needs_rehash("pbkdf2:sha256:500$salt$abc")
+    assert not calibrated.needs_rehash("pbkdf2:sha256:800$salt$abc")
+
+
+def test_calibration_is_clamped():
+    assert calibrate_iterations(10_000, min_iterations=1, max_iterations=5000) == 5000
+    assert calibrate_iterations(0.001, min_iterations=3000, max_iterations=5000) == 3000
+
+
+def test_login_upgrades_outdated_hash():
+    email = "rehash@example.com"
+    with session_scope() as session:
+        session.add(User(email=email, password_hash=_hasher(1000).hash("Secret123")))
+
+    auth = AuthManager(session_scope, hasher=_hasher(2000))
+    assert auth.login(email, "Secret123") is not None
+
+    with session_scope() as session:
+        stored = session.query(User).filter_by(email=email).one().password_hash
+    assert stored.startswith("pbkdf2:sha256:2000$")
+    assert auth.login(email, "Secret123") is not None
+
+
+def test_login_async_returns_future():
+    email = "async@example.com"
+    auth = AuthManager(session_scope, hasher=_hasher(1000))
+    user, error = auth.register_async(email, "Secret123").result(timeout=30)
+    assert error is None
+    assert auth.login_async(email, "Secret123").result(timeout=30).email == email
+    assert auth.login_async(email, "Wrong1234").result(timeout=30) is None
@@ -0,0 +1,130 @@
+import os
+import sys
+from datetime import date
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.exc import OperationalError
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from automotive_invoice_manager.backend.database.connection import DatabaseManager
+from automotive_invoice_manager.database import models
+from automotive_invoice_manager.services.customer_service import CustomerService
+from automotive_invoice_manager.services.invoice_service import InvoiceService
+
+
+def setup_module(module):
+    models.create_tables()
+    with models.session_scope() as session:
+        session.add(models.User(email="uow@test.com", password_hash="x"))
+
+
+def _user():
+    with models.session_scope() as session:
+        return session.query(models.User).filter_by(email="uow@test.com").one()
+
+
+def test_service_calls_share_one_session_and_commit():
+    db = DatabaseManager.get_instance()
+    user = _user()
+    customers = CustomerService(db.get_session)
+    invoices = InvoiceService(db.get_session)
+    commits = []
+
+    def record(conn):
+        commits.append(conn)
+
+    event.listen(db.engine, "commit", record)
+    try:
+        with customers.unit_of_work() as session:
+            customers.create_customer({"name": "UoW Cust"}, user.id)
+            invoice = invoices.create_invoice(
+                user, {"customer": "UoW Cust", "issued_date": date.today(), "due_date": date.today()}
+            )
+            assert invoices.get_invoice(invoice.id) is invoice
+            with db.get_session() as inner:
+                assert inner is session
+            assert commits == []
+    finally:
+        event.remove(db.engine, "commit", record)
+    assert len(commits) == 1
+
+
+def test_unit_of_work_rolls_back_everything():
+    db = DatabaseManager.get_instance()
+    user = _user()
+    customers = CustomerService(db.get_session)
+    with pytest.raises(RuntimeError):
+        with db.unit_of_work():
+            customers.create_customer({"name": "UoW Rollback"}, user.id)
+            raise RuntimeError("abort")
+    assert all(c.name != "UoW Rollback" for c in customers.get_all_customers(user.id))
+
+
+def test_number_retry_inside_unit_of_work():
+    db = DatabaseManager.get_instance()
+    user = _user()
+    customers = CustomerService(db.get_session)
+    invoices = InvoiceService(db.get_session)
+    customers.create_customer({"name": "UoW Legacy"}, user.id)
+    data = {"customer": "UoW Legacy", "issued_date": date.today(), "due_date": date.today()}
+    first = invoices.create_invoice(user, data)
+
+    # A legacy invoice holds the number the sequence hands out next
+    invoices.number_allocator.release(user.id)
+    with models.session_scope() as session:
+        next_value = session.query(models.InvoiceSequence.next_value).filter_by(user_id=user.id).scalar()
+        legacy = f"INV-{next_value:06d}"
+        session.add(
+            models.Invoice(
+                user_id=user.id,
+                customer_id=first.customer_id,
+                invoice_number=legacy,
+                issued_date=date.today(),
+                due_date=date.today(),
+                line_items=[],
+            )
+        )
+
+    with db.unit_of_work():
+        customers.create_customer({"name": "UoW After Retry"}, user.id)
+        invoice = invoices.create_invoice(user, data)
+    assert invoice.invoice_number not in (legacy, first.invoice_number)
+    assert invoices.get_invoice_by_number(user.id, invoice.invoice_number) is not None
+    assert "UoW After Retry" in {c.name for c in customers.get_all_customers(user.id)}
+
+
+def test_database_error_fails_the_whole_unit_of_work():
+    db = DatabaseManager.get_instance()
+    user = _user()
+    customers = CustomerService(db.get_session)
+    with pytest.raises(OperationalError):
+        with db.unit_of_work():
+            customers.create_customer({"name": "UoW Broken"}, user.id)
+            try:
+                with db.get_session() as session:
+                    session.execute(text("SELECT * FROM no_such_table"))
+            except OperationalError:
+                pass  # swallowed, as read methods returning a default do
+            with pytest.raises(OperationalError):
+                with db.get_session():
+                    pass
+    assert all(c.name != "UoW Broken" for c in customers.get_all_customers(user.id))
+
+
+def test_rolled_back_unit_of_work_leaves_no_number_sequence():
+    db = DatabaseManager.get_instance()
+    with models.session_scope() as session:
+        user = models.User(email="uow-sequence@test.com", password_hash="x")
+        session.add(user)
+        session.flush()
+        user_id = user.id
+    invoices = InvoiceService(db.get_session)
+    with pytest.raises(RuntimeError):
+        with db.unit_of_work():
+            # Creates the user's sequence with no DML before it in the unit of work
+            invoices.set_invoice_number_format(user_id, prefix="UOW-")
+            raise RuntimeError("abort")
+    with models.session_scope() as session:
+        assert session.query(models.InvoiceSequence).filter_by(user_id=user_id).count() == 0
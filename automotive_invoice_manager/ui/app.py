@@ -5,16 +5,19 @@ from pathlib import Path
 import sys
 import logging
 import platform
+from datetime import datetime, timedelta
 
 # Base directory for bundled assets
 ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
 
 from automotive_invoice_manager.ui.theme import COLORS, setup_styles
 from automotive_invoice_manager.ui.main_interface import TabbedMainInterface
+from automotive_invoice_manager.ui.components.background import when_done
 
 # Try to import PIL for logo support
 try:
     from PIL import Image, ImageTk
+    from automotive_invoice_manager.ui.image_cache import get_image_cache
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
@@ -24,6 +27,10 @@ try:
     from ..services import AuthManager, CustomerService, InvoiceService
     from ..backend.database.models import init_database
     from ..backend.database.connection import DatabaseManager
+    from ..services.base_service import get_executor
+    from ..services.archive_service import InvoiceArchiver
+    from ..services.invoice_subtotals import InvoiceSubtotalBackfill
+    from ..services.line_item_storage import LineItemRewrite
 except ImportError as e:
     print(f"Import error: {e}")
     print("Please ensure you're running from the correct directory")
@@ -154,6 +161,7 @@ class FullScreenLoginApp:
         setup_styles()
         self.current_user = None
         self.password_visible = False  # Track password visibility
+        self._login_pending = False
         
         # Initialize responsive window manager
         self.window_manager = ResponsiveWindowManager(self.root)
@@ -166,6 +174,8 @@ class FullScreenLoginApp:
         self.login_pressed_image = None
         self.create_image = None
         self.create_pressed_image = None
+        # Scaled images survive logout and (on disk) relaunches
+        self.image_cache = get_image_cache() if PIL_AVAILABLE else None
         
         # Initialize services
         try:
@@ -174,18 +184,45 @@ class FullScreenLoginApp:
             self.auth_service = AuthManager()
             self.customer_service = CustomerService()
             self.invoice_service = InvoiceService()
+            self.archiver = InvoiceArchiver(self.db_manager)
+            self.subtotal_backfill = InvoiceSubtotalBackfill(self.db_manager.get_session)
+            self.line_item_rewrite = LineItemRewrite(self.db_manager.get_session)
         except Exception as e:
             print(f"Error initializing services: {e}")
             messagebox.showerror("Initialization Error", 
                                f"Could not initialize application services: {e}")
             return
         
+        # Materialize overdue statuses, archive old invoices and backfill
+        # invoice subtotals now and after each midnight
+        self.run_daily_jobs()
+        
         # Setup window with responsive management
         self.setup_window()
         
         # Show login interface
         self.show_login_interface()
     
+    def run_daily_jobs(self):
+        """Run the overdue status, archival, subtotal and line-item jobs off the UI thread and schedule the next run."""
+        def jobs():
+            self.invoice_service.status_job.ensure_current()
+            self.archiver.run()
+            try:
+                self.subtotal_backfill.run()
+            except Exception as e:
+                logging.error(f"Error backfilling invoice subtotals: {e}")
+            try:
+                self.line_item_rewrite.run()
+            except Exception as e:
+                logging.error(f"Error rewriting invoice line items: {e}")
+
+        get_executor().submit(jobs)
+        now = datetime.now()
+        next_midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        delay_ms = int((next_midnight - now).total_seconds() * 1000) + 1000
+        self.root.after(delay_ms, self.run_daily_jobs)
+    
     def setup_window(self):
         """Setup the main window with responsive management."""
         self.root.title("Invoice Manager - Full Screen")
@@ -220,17 +257,23 @@ class FullScreenLoginApp:
         
         try:
             if logo_path.exists():
-                logo_img = Image.open(logo_path)
-                logo_img = logo_img.resize(size, Image.Resampling.LANCZOS)
-                self.logo_image = ImageTk.PhotoImage(logo_img)
-                
+                # Text logo stands in until the scaled image is ready
                 logo_label = tk.Label(
                     parent,
-                    image=self.logo_image,
-                    bg=COLORS["background"]
+                    text="INVOICE\nMANAGER",
+                    font=('Arial', 32, 'bold'),
+                    fg=COLORS["brand_purple"],
+                    bg=COLORS["background"],
+                    justify=tk.CENTER
                 )
                 logo_label.pack()
-                print("Logo loaded successfully")
+                
+                def show_logo(photo):
+                    self.logo_image = photo
+                    if logo_label.winfo_exists():
+                        logo_label.configure(image=photo, text="")
+                
+                self.image_cache.request_photo(logo_label, logo_path, size, show_logo)
             else:
                 # Fallback text logo
                 logo_label = tk.Label(
@@ -270,13 +313,14 @@ class FullScreenLoginApp:
                 width = parent.winfo_width() or 1200
                 height = parent.winfo_height() or 800
                 
-                bg_img = Image.open(bg_path)
-                bg_img = bg_img.resize((width, height), Image.Resampling.LANCZOS)
-                self.bg_photo = ImageTk.PhotoImage(bg_img)
+                def show_background(photo):
+                    self.bg_photo = photo
+                    if parent.winfo_exists():
+                        bg_label = tk.Label(parent, image=photo)
+                        bg_label.place(x=0, y=0, relwidth=1, relheight=1)
+                        bg_label.lower()
                 
-                bg_label = tk.Label(parent, image=self.bg_photo)
-                bg_label.place(x=0, y=0, relwidth=1, relheight=1)
-                print("Background image loaded")
+                self.image_cache.request_photo(parent, bg_path, (width, height), show_background)
         except Exception as e:
             print(f"Error loading background image: {e}")
     
@@ -299,23 +343,10 @@ class FullScreenLoginApp:
         }
         
         try:
-            if button_paths['login'].exists():
-                login_img = Image.open(button_paths['login'])
-                self.login_image = ImageTk.PhotoImage(login_img)
-                print("Login button image loaded")
-            
-            if button_paths['login_pressed'].exists():
-                login_pressed_img = Image.open(button_paths['login_pressed'])
-                self.login_pressed_image = ImageTk.PhotoImage(login_pressed_img)
-                
-            if button_paths['create'].exists():
-                create_img = Image.open(button_paths['create'])
-                self.create_image = ImageTk.PhotoImage(create_img)
-                
-            if button_paths['create_pressed'].exists():
-                create_pressed_img = Image.open(button_paths['create_pressed'])
-                self.create_pressed_image = ImageTk.PhotoImage(create_pressed_img)
-                
+            self.login_image = self.image_cache.photo(button_paths['login'])
+            self.login_pressed_image = self.image_cache.photo(button_paths['login_pressed'])
+            self.create_image = self.image_cache.photo(button_paths['create'])
+            self.create_pressed_image = self.image_cache.photo(button_paths['create_pressed'])
         except Exception as e:
             print(f"Error loading button images: {e}")
     
@@ -405,13 +436,14 @@ class FullScreenLoginApp:
             login_bg_path = ASSETS_DIR / 'login_bg.png'
             if login_bg_path.exists():
                 try:
-                    login_bg_img = Image.open(login_bg_path)
-                    self.login_bg_photo = ImageTk.PhotoImage(login_bg_img)
+                    self.login_bg_photo = self.image_cache.photo(login_bg_path)
+                    bg_width = self.login_bg_photo.width()
+                    bg_height = self.login_bg_photo.height()
                     
                     bg_canvas = tk.Canvas(
                         parent_frame,
-                        width=login_bg_img.width,
-                        height=login_bg_img.height,
+                        width=bg_width,
+                        height=bg_height,
                         bd=0,
                         highlightthickness=0
                     )
@@ -419,7 +451,7 @@ class FullScreenLoginApp:
                     bg_canvas.create_image(0, 0, anchor=tk.NW, image=self.login_bg_photo)
                     
                     # Create login form on canvas
-                    self.create_login_form_on_canvas(bg_canvas, login_bg_img.width, login_bg_img.height)
+                    self.create_login_form_on_canvas(bg_canvas, bg_width, bg_height)
                     return
                 except Exception as e:
                     print(f"Error loading login background: {e}")
@@ -690,7 +722,13 @@ class FullScreenLoginApp:
             self.register_btn.configure(image=self.create_image)
     
     def handle_login(self):
-        """Handle login attempt."""
+        """Handle login attempt.
+
+        Password verification is deliberately slow, so it runs on a worker
+        thread while the form shows a pending state.
+        """
+        if self._login_pending:
+            return
         email = self.email_var.get().strip()
         password = self.password_var.get()
         
@@ -704,25 +742,55 @@ class FullScreenLoginApp:
             self.password_entry.focus_set()
             return
         
-        try:
-            user = self.auth_service.login(email, password)
-            
-            if user:
-                self.current_user = user
-                self.show_main_application()
-            else:
-                messagebox.showerror(
-                    "Login Failed", 
-                    "Invalid email or password. Please try again."
-                )
-                self.password_var.set("")
-                self.password_entry.focus_set()
-        except Exception as e:
+        self.set_login_pending(True)
+        when_done(
+            self.root,
+            self.auth_service.login_async(email, password),
+            self.on_login_finished,
+            self.on_login_error,
+        )
+    
+    def set_login_pending(self, pending):
+        """Disable the login form while credentials are being checked."""
+        self._login_pending = pending
+        state = tk.DISABLED if pending else tk.NORMAL
+        for name in ("email_entry", "password_entry", "login_btn", "register_btn"):
+            widget = getattr(self, name, None)
+            try:
+                if widget is not None and widget.winfo_exists():
+                    widget.configure(state=state)
+            except tk.TclError:
+                pass
+        login_btn = getattr(self, "login_btn", None)
+        if login_btn is not None and not self.login_image:
+            try:
+                login_btn.configure(text="SIGNING IN..." if pending else "LOGIN")
+            except tk.TclError:
+                pass
+        self.root.configure(cursor="watch" if pending else "")
+    
+    def on_login_finished(self, user):
+        """Complete a background login on the UI thread."""
+        self.set_login_pending(False)
+        if user:
+            self.current_user = user
+            self.show_main_application()
+        else:
             messagebox.showerror(
-                "Login Error", 
-                f"An error occurred during login: {str(e)}"
+                "Login Failed", 
+                "Invalid email or password. Please try again."
             )
-            logging.error(f"Login error: {e}")
+            self.password_var.set("")
+            self.password_entry.focus_set()
+    
+    def on_login_error(self, error):
+        """Report an unexpected failure from a background login."""
+        self.set_login_pending(False)
+        messagebox.showerror(
+            "Login Error", 
+            f"An error occurred during login: {str(error)}"
+        )
+        logging.error(f"Login error: {error}")
     
     def handle_register(self):
         """Handle registration."""
@@ -853,15 +921,30 @@ class FullScreenLoginApp:
                 messagebox.showerror("Error", "Passwords do not match.")
                 return
             
-            try:
-                user = self.auth_service.register(email, password)
+            if create_btn["state"] == tk.DISABLED:
+                return
+            create_btn.configure(state=tk.DISABLED, text="CREATING...")
+            reg_dialog.configure(cursor="watch")
+            
+            def finished(result):
+                user, error = result
+                create_btn.configure(state=tk.NORMAL, text="CREATE ACCOUNT")
+                reg_dialog.configure(cursor="")
                 if user:
                     messagebox.showinfo("Success", "Account created successfully! You can now log in.")
                     reg_dialog.destroy()
                 else:
-                    messagebox.showerror("Error", "Failed to create account. Email may already be registered.")
-            except Exception as e:
-                messagebox.showerror("Error", f"Registration failed: {str(e)}")
+                    messagebox.showerror(
+                        "Error",
+                        error or "Failed to create account. Email may already be registered.",
+                    )
+            
+            def failed(error):
+                create_btn.configure(state=tk.NORMAL, text="CREATE ACCOUNT")
+                reg_dialog.configure(cursor="")
+                messagebox.showerror("Error", f"Registration failed: {str(error)}")
+            
+            when_done(reg_dialog, self.auth_service.register_async(email, password), finished, failed)
         
         create_btn = tk.Button(
             button_frame,
@@ -2,9 +2,11 @@
 
 from .table_widget import EnhancedTableWidget
 from .table_helpers import create_table_with_scrollbars, create_context_menu
+from .background import when_done
 
 __all__ = [
     "EnhancedTableWidget",
     "create_table_with_scrollbars",
     "create_context_menu",
+    "when_done",
 ]
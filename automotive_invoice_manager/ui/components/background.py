@@ -0,0 +1,42 @@
+"""Deliver results of background futures back on the Tk event loop."""
+
+from __future__ import annotations
+
+import logging
+import tkinter as tk
+from concurrent.futures import Future
+from typing import Any, Callable
+
+
+def when_done(
+    widget: tk.Misc,
+    future: Future,
+    on_success: Callable[[Any], None],
+    on_error: Callable[[BaseException], None] | None = None,
+    poll_ms: int = 30,
+) -> None:
+    """Call ``on_success(result)`` or ``on_error(exc)`` once ``future`` finishes.
+
+    Tk is not thread safe, so the future is polled with ``widget.after``
+    and the callbacks always run on the UI thread.  Polling stops silently
+    if ``widget`` is destroyed first.
+    """
+
+    def poll():
+        try:
+            if not widget.winfo_exists():
+                return
+        except tk.TclError:
+            return
+        if not future.done():
+            widget.after(poll_ms, poll)
+            return
+        error = future.exception()
+        if error is None:
+            on_success(future.result())
+        elif on_error is not None:
+            on_error(error)
+        else:
+            logging.error(f"Background task failed: {error}")
+
+    widget.after(poll_ms, poll)
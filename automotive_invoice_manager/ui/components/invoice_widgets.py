@@ -3,6 +3,8 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 
+from automotive_invoice_manager.backend.database.money import format_cents, invoice_cents
+
 try:
     from automotive_invoice_manager.ui.theme import COLORS
 except Exception:  # pragma: no cover - theme may not load in tests
@@ -64,6 +66,7 @@ class InvoiceListFrame(ttk.Frame):
         self.per_page = 10
         self.search_var = tk.StringVar()
         self.status_var = tk.StringVar()
+        self.include_archive_var = tk.BooleanVar(value=False)
         self._build_widgets()
         self.load_data()
 
@@ -80,6 +83,12 @@ class InvoiceListFrame(ttk.Frame):
             values=statuses,
             state="readonly",
         ).pack(side=tk.LEFT)
+        ttk.Checkbutton(
+            search_frame,
+            text="Include archive",
+            variable=self.include_archive_var,
+            command=self.on_filter,
+        ).pack(side=tk.LEFT, padx=5)
         ttk.Button(search_frame, text="Filter", command=self.on_filter).pack(
             side=tk.LEFT, padx=5
         )
@@ -273,14 +282,12 @@ class InvoiceFormDialog(tk.Toplevel):
         self._recalculate_total()
 
     def _recalculate_total(self):
-        total = 0
-        for desc, hours, rate, parts, tax in self.line_items:
-            try:
-                base = float(hours.get()) * float(rate.get()) + float(parts.get())
-                total += base * (1 + float(tax.get()) / 100)
-            except ValueError:
-                continue
-        self.total_var.set(f"{total:.2f}")
+        lines = [
+            {"hours": hours.get(), "rate": rate.get(), "parts": parts.get(), "tax": tax.get()}
+            for desc, hours, rate, parts, tax in self.line_items
+        ]
+        # Lines that do not parse are skipped
+        self.total_var.set(format_cents(invoice_cents(lines)[0], symbol=""))
 
     def _populate_fields(self):
         # Populate existing invoice data
@@ -331,11 +338,12 @@ class InvoiceFormDialog(tk.Toplevel):
 class InvoiceDetailWindow(tk.Toplevel):
     """Display an invoice in read-only mode."""
 
-    def __init__(self, parent, invoice_service, invoice_id, *, show_actions=True):
+    def __init__(self, parent, invoice_service, invoice_id, *, show_actions=True, invoice=None):
         super().__init__(parent)
         self.invoice_service = invoice_service
         self.invoice_id = invoice_id
-        self.invoice = invoice_service.get_invoice(invoice_id)
+        # ``invoice`` may be passed in when it was already loaded (prefetched)
+        self.invoice = invoice or invoice_service.get_invoice(invoice_id)
         self.show_actions = show_actions
         self._build_widgets()
 
@@ -2,10 +2,16 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+from automotive_invoice_manager.ui.components.background import when_done
 from automotive_invoice_manager.ui.components.table_helpers import (
     create_table_with_scrollbars,
     create_context_menu,
 )
+from automotive_invoice_manager.services.base_service import get_executor
+from automotive_invoice_manager.services.customer_sort import (
+    CUSTOMER_ROW_LIMIT,
+    CustomerColumnStore,
+)
 import logging
 from datetime import datetime
 
@@ -46,6 +52,7 @@ class CustomerListFrame(ttk.Frame):
         # Sort state
         self.sort_column = "name"
         self.sort_reverse = False
+        self.row_store = None
 
         self.setup_ui()
         self.load_customers()
@@ -95,6 +102,12 @@ class CustomerListFrame(ttk.Frame):
             side=tk.LEFT, padx=2
         )
 
+        self.import_button = ttk.Button(action_frame, text="Import", command=self.import_customers)
+        self.import_button.pack(side=tk.LEFT, padx=2)
+
+        self.duplicates_button = ttk.Button(action_frame, text="Find Duplicates", command=self.find_duplicates)
+        self.duplicates_button.pack(side=tk.LEFT, padx=2)
+
         # Search frame
         search_frame = ttk.Frame(header_frame)
         search_frame.pack(fill=tk.X, pady=(10, 0))
@@ -149,7 +162,7 @@ class CustomerListFrame(ttk.Frame):
             from tkinter import filedialog
             
             # Get all customers
-            customers = self.customer_service.get_all_customers(self.user.id)
+            customers = self.customer_service.get_all_customers(self.user.id, include_details=True)
             
             if not customers:
                 messagebox.showinfo("Export", "No customers to export.")
@@ -190,6 +203,106 @@ class CustomerListFrame(ttk.Frame):
             logging.error(f"Error exporting customers: {e}")
             messagebox.showerror("Export Error", f"Failed to export customers: {e}")
 
+    def import_customers(self):
+        """Import customers from a CSV file on the worker pool, optionally as a dry run."""
+        from tkinter import filedialog
+
+        filename = filedialog.askopenfilename(
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            title="Import Customers",
+        )
+        if not filename:
+            return
+        dry_run = messagebox.askyesnocancel(
+            "Import Customers",
+            "Check the file first without saving anything (dry run)?\n\n"
+            "Yes: dry run only    No: import now",
+        )
+        if dry_run is None:
+            return
+
+        # Written by the worker after each batch, read by the polling below
+        latest = {}
+        future = get_executor().submit(
+            self.customer_service.import_customers,
+            self.user.id,
+            filename,
+            dry_run=dry_run,
+            progress=lambda report: latest.update(rows=report.rows, rate=report.rows_per_second),
+        )
+        self.import_button.configure(state=tk.DISABLED)
+
+        def show_progress():
+            if future.done():
+                return
+            if latest:
+                self.status_callback(
+                    f"Importing customers: {latest['rows']:,} rows ({latest['rate']:,.0f} rows/s)"
+                )
+            self.after(250, show_progress)
+
+        show_progress()
+        when_done(self, future, self._import_finished, self._import_failed)
+
+    def _import_finished(self, report):
+        self.import_button.configure(state=tk.NORMAL)
+        verb = "Would import" if report.dry_run else "Imported"
+        headline = (
+            f"{verb} {report.imported:,} of {report.rows:,} rows ({report.rows_per_second:,.0f} rows/s)"
+        )
+        summary = f"{headline}.\nDuplicates skipped: {report.duplicates:,}\nInvalid rows: {report.invalid:,}"
+        self.status_callback(headline)
+        if not report.dry_run and report.imported:
+            self.load_customers(self.current_search)
+        if not report.errors:
+            messagebox.showinfo("Import Customers", summary)
+            return
+        if messagebox.askyesno("Import Customers", f"{summary}\n\nSave the per-row error report?"):
+            from tkinter import filedialog
+
+            path = filedialog.asksaveasfilename(
+                defaultextension=".csv",
+                filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+                title="Save Import Errors",
+            )
+            if path:
+                report.write_errors(path)
+
+    def _import_failed(self, error):
+        self.import_button.configure(state=tk.NORMAL)
+        logging.error(f"Error importing customers: {error}")
+        messagebox.showerror("Import Error", f"Failed to import customers: {error}")
+        self.status_callback("Customer import failed")
+
+    def find_duplicates(self):
+        """Scan for duplicate customers on the worker pool and list the candidates."""
+        future = get_executor().submit(self.customer_service.find_duplicate_customers, self.user.id)
+        self.duplicates_button.configure(state=tk.DISABLED)
+        self.status_callback("Looking for duplicate customers...")
+        when_done(self, future, self._duplicates_found, self._duplicates_failed)
+
+    def _duplicates_found(self, scan):
+        self.duplicates_button.configure(state=tk.NORMAL)
+        self.status_callback(f"Found {len(scan.pairs)} possible duplicate customer(s)")
+        if not scan.pairs:
+            messagebox.showinfo("Find Duplicates", f"No duplicates found among {scan.customers:,} customers.")
+            return
+        from automotive_invoice_manager.ui.customers.duplicate_dialog import DuplicateCustomersDialog
+
+        DuplicateCustomersDialog(
+            self.winfo_toplevel(),
+            self.customer_service,
+            self.user,
+            scan,
+            on_merged=lambda: self.load_customers(self.current_search),
+        )
+
+    def _duplicates_failed(self, error):
+        self.duplicates_button.configure(state=tk.NORMAL)
+        logging.error(f"Error finding duplicate customers: {error}")
+        messagebox.showerror("Find Duplicates", f"Failed to look for duplicates: {error}")
+        self.status_callback("Duplicate search failed")
+
     def setup_customer_table(self, parent):
         """Setup the customer data table with scrollbars."""
         columns = ("name", "email", "phone", "invoices", "total_billed", "created")
@@ -240,12 +353,18 @@ class CustomerListFrame(ttk.Frame):
         try:
             self.status_callback("Loading customers...")
 
-            # Get customers from service
-            customers = self.customer_service.search_customers(
+            # Get customer rows (with invoice statistics) from service; one
+            # extra row tells whether the result was cut off at the limit
+            customers = self.customer_service.search_customer_rows(
                 user_id=self.user.id,
                 search_term=search_term,
                 sort_by=self.sort_column,
                 sort_desc=self.sort_reverse,
+                limit=CUSTOMER_ROW_LIMIT + 1,
+            )
+            self.row_store = CustomerColumnStore(
+                customers[:CUSTOMER_ROW_LIMIT],
+                complete=len(customers) <= CUSTOMER_ROW_LIMIT,
             )
 
             # Clear existing items
@@ -253,30 +372,17 @@ class CustomerListFrame(ttk.Frame):
                 self.customer_tree.delete(item)
 
             # Add customers to tree
-            for customer in customers:
-                # Get customer statistics (invoice count and total billed)
-                stats = self.customer_service.get_customer_stats(customer.id)
-
-                values = (
-                    customer.name,
-                    customer.email or "",
-                    customer.phone or "",
-                    stats.get("invoice_count", 0),
-                    f"${stats.get('total_billed', 0):.2f}",
-                    customer.created_at.strftime("%Y-%m-%d"),
-                )
-
-                self.customer_tree.insert(
-                    "",
-                    tk.END,
-                    iid=str(customer.id),
-                    values=values,
-                )
+            store = self.row_store
+            for iid, values in zip(store.iids, store.values):
+                self.customer_tree.insert("", tk.END, iid=iid, values=values)
 
             # Update results info
-            count = len(customers)
+            count = len(store)
             search_text = f" matching '{search_term}'" if search_term else ""
-            self.results_var.set(f"{count} customer(s){search_text}")
+            if store.complete:
+                self.results_var.set(f"{count} customer(s){search_text}")
+            else:
+                self.results_var.set(f"First {count} customer(s){search_text}")
 
             self.status_callback(f"Loaded {count} customers")
 
@@ -321,7 +427,14 @@ class CustomerListFrame(ttk.Frame):
             self.sort_column = column
             self.sort_reverse = False
 
-        self.load_customers(self.current_search)
+        store = self.row_store
+        if store is None or not store.can_sort(column):
+            self.load_customers(self.current_search)
+            return
+
+        # Reorder the existing items in place instead of re-querying
+        for index, iid in enumerate(store.order(column, self.sort_reverse)):
+            self.customer_tree.move(iid, "", index)
 
     def refresh_data(self, callback=None):
         """Enhanced refresh that forces database reload."""
@@ -0,0 +1,108 @@
+"""Review and merge the possible duplicate customers found by a scan."""
+
+import logging
+import tkinter as tk
+from tkinter import messagebox, ttk
+
+from automotive_invoice_manager.services.base_service import get_executor
+from automotive_invoice_manager.ui.components.background import when_done
+from automotive_invoice_manager.ui.components.table_helpers import create_table_with_scrollbars
+
+
+class DuplicateCustomersDialog(tk.Toplevel):
+    """List of duplicate candidates; each pair can be merged into either customer."""
+
+    def __init__(self, parent, customer_service, user, scan, *, on_merged=None):
+        super().__init__(parent)
+        self.customer_service = customer_service
+        self.user = user
+        self.pairs = {str(index): pair for index, pair in enumerate(scan.pairs)}
+        self.on_merged = on_merged or (lambda: None)
+        self.title("Possible Duplicate Customers")
+        self.geometry("760x420")
+        self.transient(parent)
+        self._build_widgets(scan)
+
+    def _build_widgets(self, scan):
+        ttk.Label(
+            self,
+            text=(
+                f"{len(scan.pairs)} possible duplicate(s) among {scan.customers:,} customers "
+                f"({scan.compared:,} of {scan.all_pairs:,} pairs compared in {scan.elapsed:.2f}s)"
+            ),
+        ).pack(fill=tk.X, padx=10, pady=(10, 5))
+
+        table_frame = ttk.Frame(self)
+        table_frame.pack(fill=tk.BOTH, expand=True, padx=10)
+        self.pair_tree = create_table_with_scrollbars(
+            table_frame,
+            columns=("score", "first", "second", "matches"),
+            column_configs={
+                "score": ("Score", 60, tk.CENTER),
+                "first": ("Customer", 240, tk.W),
+                "second": ("Possible Duplicate", 240, tk.W),
+                "matches": ("Same", 100, tk.W),
+            },
+            selectmode="browse",
+        )
+        for iid, pair in self.pairs.items():
+            self.pair_tree.insert(
+                "",
+                tk.END,
+                iid=iid,
+                values=(f"{pair.score:.0%}", pair.first_name, pair.second_name, ", ".join(pair.reasons)),
+            )
+
+        action_frame = ttk.Frame(self)
+        action_frame.pack(fill=tk.X, padx=10, pady=10)
+        self.merge_buttons = [
+            ttk.Button(action_frame, text="Keep Customer", command=lambda: self.merge(keep_first=True)),
+            ttk.Button(action_frame, text="Keep Duplicate", command=lambda: self.merge(keep_first=False)),
+        ]
+        for button in self.merge_buttons:
+            button.pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(action_frame, text="Close", command=self.destroy).pack(side=tk.RIGHT)
+
+    def merge(self, keep_first=True):
+        """Merge the selected pair on the worker pool, keeping one of its customers."""
+        selection = self.pair_tree.selection()
+        if len(selection) != 1:
+            messagebox.showwarning("Merge Customers", "Please select one pair to merge.", parent=self)
+            return
+        pair = self.pairs[selection[0]]
+        customers = [(pair.first_id, pair.first_name), (pair.second_id, pair.second_name)]
+        (keep_id, keep_name), (drop_id, drop_name) = customers if keep_first else customers[::-1]
+        if not messagebox.askyesno(
+            "Merge Customers",
+            f"Move all invoices of '{drop_name}' to '{keep_name}' and delete '{drop_name}'?\n\n"
+            "This action cannot be undone.",
+            parent=self,
+        ):
+            return
+
+        future = get_executor().submit(self.customer_service.merge_customers, self.user.id, keep_id, [drop_id])
+        for button in self.merge_buttons:
+            button.configure(state=tk.DISABLED)
+        when_done(
+            self,
+            future,
+            lambda moved: self._merged(drop_id, drop_name, moved),
+            self._merge_failed,
+        )
+
+    def _merged(self, drop_id, drop_name, moved):
+        for button in self.merge_buttons:
+            button.configure(state=tk.NORMAL)
+        # Every pair with the deleted customer is gone
+        for iid, pair in list(self.pairs.items()):
+            if drop_id in (pair.first_id, pair.second_id):
+                del self.pairs[iid]
+                self.pair_tree.delete(iid)
+        messagebox.showinfo("Merge Customers", f"Merged '{drop_name}' ({moved} invoice(s) moved).", parent=self)
+        self.on_merged()
+
+    def _merge_failed(self, error):
+        for button in self.merge_buttons:
+            button.configure(state=tk.NORMAL)
+        logging.error(f"Error merging customers: {error}")
+        messagebox.showerror("Merge Error", f"Failed to merge customers: {error}", parent=self)
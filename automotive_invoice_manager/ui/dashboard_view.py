@@ -195,34 +195,33 @@ class DashboardView(tk.Frame):
         """Gather statistics with individual error handling for each stat."""
         stats_data = {}
         
-        # Customer count
-        try:
-            customers = self.customer_service.search_customers(
-                user_id=self.user.id, search_term=""
-            )
-            stats_data['customer_count'] = len(customers)
-        except Exception as e:
-            logger.error(f"Error getting customer count: {e}")
-            stats_data['customer_count'] = "Error"
-
-        # Invoice statistics
-        try:
-            stats_data['invoice_count'] = self.invoice_service.get_invoice_count(self.user.id)
-        except Exception as e:
-            logger.error(f"Error getting invoice count: {e}")
-            stats_data['invoice_count'] = "Error"
-
-        try:
-            stats_data['pending'] = self.invoice_service.get_pending_count(self.user.id)
-        except Exception as e:
-            logger.error(f"Error getting pending count: {e}")
-            stats_data['pending'] = "Error"
-
-        try:
-            stats_data['overdue'] = self.invoice_service.get_overdue_count(self.user.id)
-        except Exception as e:
-            logger.error(f"Error getting overdue count: {e}")
-            stats_data['overdue'] = "Error"
+        # One session and commit for all the queries below
+        with self.customer_service.unit_of_work():
+            # Customer count
+            try:
+                stats_data['customer_count'] = self.customer_service.get_customer_count(self.user.id)
+            except Exception as e:
+                logger.error(f"Error getting customer count: {e}")
+                stats_data['customer_count'] = "Error"
+
+            # Invoice statistics
+            try:
+                stats_data['invoice_count'] = self.invoice_service.get_invoice_count(self.user.id)
+            except Exception as e:
+                logger.error(f"Error getting invoice count: {e}")
+                stats_data['invoice_count'] = "Error"
+
+            try:
+                stats_data['pending'] = self.invoice_service.get_pending_count(self.user.id)
+            except Exception as e:
+                logger.error(f"Error getting pending count: {e}")
+                stats_data['pending'] = "Error"
+
+            try:
+                stats_data['overdue'] = self.invoice_service.get_overdue_count(self.user.id)
+            except Exception as e:
+                logger.error(f"Error getting overdue count: {e}")
+                stats_data['overdue'] = "Error"
 
         return stats_data
 
@@ -0,0 +1,328 @@
+"""Two-level cache for scaled UI images (login screen, logo previews).
+
+Scaled variants are keyed by ``(path, mtime, file size, target size,
+resample)``.  The first level is an in-memory LRU of ``PhotoImage`` objects
+so repeated screens (e.g. the login screen after a logout) do no image work
+at all.  The second level is a directory of pre-scaled PNGs so a relaunch
+skips decoding and resizing the full-resolution originals.  Variants that are
+in neither level are produced on the shared service worker pool.
+
+Preview thumbnails of arbitrary (possibly huge) files are keyed by content
+digest instead, so browsing the same photo from two folders decodes it once.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Callable, Hashable, NamedTuple
+
+from PIL import Image
+
+from automotive_invoice_manager.services.base_service import get_executor
+from automotive_invoice_manager.utils.config import Config
+from automotive_invoice_manager.utils.images import file_digest
+
+from .components.background import when_done
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESAMPLE = Image.Resampling.LANCZOS
+
+
+class ImageKey(NamedTuple):
+    """Identity of one scaled variant of a source image."""
+
+    path: str
+    mtime_ns: int
+    file_size: int
+    size: tuple[int, int] | None
+    resample: int
+
+    @property
+    def source_digest(self) -> str:
+        return hashlib.sha1(self.path.encode("utf-8")).hexdigest()[:16]
+
+    @property
+    def variant_name(self) -> str:
+        stamp = hashlib.sha1(f"{self.mtime_ns}:{self.file_size}".encode()).hexdigest()[:12]
+        width, height = self.size or (0, 0)
+        return f"{self.source_digest}_{stamp}_{width}x{height}_{self.resample}.png"
+
+
+class ImageCache:
+    """In-memory ``PhotoImage`` LRU backed by an on-disk variant cache.
+
+    ``load_image`` and ``load_thumbnail`` are thread safe and never touch Tk;
+    the ``*_photo``/``request_*`` methods create ``PhotoImage`` objects and
+    must run on the UI thread.
+    """
+
+    def __init__(self, cache_dir: str | os.PathLike | None = None, max_photos: int = 32) -> None:
+        self.cache_dir = Path(cache_dir or Config.IMAGE_CACHE_DIR)
+        self.max_photos = max_photos
+        self._photos: OrderedDict[Hashable, object] = OrderedDict()
+        self._pending: dict[Hashable, Future] = {}
+        self._digests: dict[tuple, str] = {}
+        self._lock = threading.Lock()
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "decodes": 0}
+
+    @staticmethod
+    def key(path, size=None, resample=DEFAULT_RESAMPLE) -> ImageKey | None:
+        """Return the cache key for ``path`` or None if the file is missing."""
+        try:
+            resolved = Path(path).resolve()
+            stat = resolved.stat()
+        except OSError:
+            return None
+        size = tuple(int(v) for v in size) if size else None
+        return ImageKey(str(resolved), stat.st_mtime_ns, stat.st_size, size, int(resample))
+
+    # -- PIL level (any thread) -------------------------------------------
+
+    def load_image(self, path, size=None, resample=DEFAULT_RESAMPLE) -> Image.Image:
+        """Return ``path`` scaled to ``size``, using the disk cache when possible."""
+        key = self.key(path, size, resample)
+        if key is None:
+            raise FileNotFoundError(path)
+        return self._load(key)
+
+    def _load(self, key: ImageKey) -> Image.Image:
+        if key.size is not None:
+            cached = self._read_variant(key)
+            if cached is not None:
+                self.stats["disk_hits"] += 1
+                return cached
+        self.stats["decodes"] += 1
+        with Image.open(key.path) as source:
+            image = source
+            if key.size is not None:
+                if image.mode not in ("RGB", "RGBA"):
+                    image = image.convert("RGBA")
+                image = image.resize(key.size, key.resample)
+            else:
+                image.load()
+                image = image.copy()
+        if key.size is not None:
+            self._write_variant(key, image)
+        return image
+
+    def _read_variant(self, key: ImageKey) -> Image.Image | None:
+        variant = self.cache_dir / key.variant_name
+        if not variant.exists():
+            return None
+        try:
+            with Image.open(variant) as cached:
+                cached.load()
+                return cached.copy()
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cached image {variant}: {e}")
+            variant.unlink(missing_ok=True)
+            return None
+
+    def _write_variant(self, key: ImageKey, image: Image.Image) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as handle:
+                image.save(handle, format="PNG", compress_level=1)
+            os.replace(tmp, self.cache_dir / key.variant_name)
+        except Exception as e:
+            logger.warning(f"Could not write image cache entry for {key.path}: {e}")
+            return
+        # Variants of an older version of the same file can never hit again.
+        stamp = key.variant_name.split("_")[1]
+        for stale in self.cache_dir.glob(f"{key.source_digest}_*.png"):
+            if stale.name.split("_")[1] != stamp:
+                stale.unlink(missing_ok=True)
+
+    def digest(self, path) -> str:
+        """Return the content digest of ``path``, memoized by mtime and size."""
+        stat = os.stat(path)
+        memo_key = (str(Path(path).resolve()), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._digests.get(memo_key)
+        if cached is None:
+            cached = file_digest(path)
+            with self._lock:
+                self._digests[memo_key] = cached
+        return cached
+
+    def _known_digest(self, path) -> str | None:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        with self._lock:
+            return self._digests.get((str(Path(path).resolve()), stat.st_mtime_ns, stat.st_size))
+
+    def load_thumbnail(self, path, max_size: int) -> tuple[str, Image.Image]:
+        """Return ``(digest, thumbnail)`` fitting in ``max_size`` pixels square.
+
+        JPEGs are decoded in draft mode (DCT scaling), so only as many pixels
+        as the preview needs are ever produced.
+        """
+        digest = self.digest(path)
+        variant = self.cache_dir / f"thumb_{digest}_{max_size}.png"
+        if variant.exists():
+            try:
+                with Image.open(variant) as cached:
+                    cached.load()
+                    self.stats["disk_hits"] += 1
+                    return digest, cached.copy()
+            except Exception as e:
+                logger.warning(f"Discarding unreadable thumbnail {variant}: {e}")
+                variant.unlink(missing_ok=True)
+        self.stats["decodes"] += 1
+        with Image.open(path) as source:
+            source.draft("RGB", (max_size, max_size))
+            image = source if source.mode in ("RGB", "RGBA") else source.convert("RGBA")
+            image.thumbnail((max_size, max_size), DEFAULT_RESAMPLE)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as handle:
+                image.save(handle, format="PNG", compress_level=1)
+            os.replace(tmp, variant)
+        except Exception as e:
+            logger.warning(f"Could not write thumbnail for {path}: {e}")
+        return digest, image
+
+    # -- Tk level (UI thread only) ----------------------------------------
+
+    def _remember(self, key: Hashable, image: Image.Image):
+        from PIL import ImageTk
+
+        photo = self._photos.get(key)
+        if photo is None:
+            photo = ImageTk.PhotoImage(image)
+            self._photos[key] = photo
+            while len(self._photos) > self.max_photos:
+                self._photos.popitem(last=False)
+        self._photos.move_to_end(key)
+        return photo
+
+    def photo(self, path, size=None, resample=DEFAULT_RESAMPLE):
+        """Return a ``PhotoImage`` for ``path``, decoding synchronously on a miss."""
+        key = self.key(path, size, resample)
+        if key is None:
+            return None
+        if key in self._photos:
+            self.stats["memory_hits"] += 1
+            self._photos.move_to_end(key)
+            return self._photos[key]
+        return self._remember(key, self._load(key))
+
+    def peek_photo(self, path, size=None, resample=DEFAULT_RESAMPLE):
+        """Return a ``PhotoImage`` only if it is cached in memory or on disk."""
+        key = self.key(path, size, resample)
+        if key is None:
+            return None
+        if key in self._photos:
+            self.stats["memory_hits"] += 1
+            self._photos.move_to_end(key)
+            return self._photos[key]
+        if key.size is None:
+            return None
+        cached = self._read_variant(key)
+        if cached is None:
+            return None
+        self.stats["disk_hits"] += 1
+        return self._remember(key, cached)
+
+    def request_photo(
+        self,
+        widget,
+        path,
+        size,
+        callback: Callable[[object], None],
+        resample=DEFAULT_RESAMPLE,
+    ):
+        """Deliver a ``PhotoImage`` to ``callback`` on the UI thread.
+
+        Cached variants are returned (and passed to ``callback``) immediately;
+        otherwise the variant is decoded on the worker pool, ``None`` is
+        returned and ``callback`` runs once it is ready.
+        """
+        photo = self.peek_photo(path, size, resample)
+        if photo is not None:
+            callback(photo)
+            return photo
+        key = self.key(path, size, resample)
+        if key is None:
+            return None
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                future = get_executor().submit(self._load, key)
+                self._pending[key] = future
+                future.add_done_callback(lambda _f, k=key: self._forget_pending(k))
+
+        def deliver(image):
+            callback(self._remember(key, image))
+
+        when_done(
+            widget,
+            future,
+            deliver,
+            lambda e: logger.error(f"Error loading image {path}: {e}"),
+        )
+        return None
+
+    def request_thumbnail(
+        self,
+        widget,
+        path,
+        max_size: int,
+        callback: Callable[[object], None],
+        on_error: Callable[[BaseException], None] | None = None,
+    ):
+        """Like :meth:`request_photo` for a preview thumbnail of any file.
+
+        Hashing and decoding both run on the worker pool; only a thumbnail
+        already held in memory is delivered synchronously.
+        """
+        digest = self._known_digest(path)
+        memory_key = ("thumb", digest, max_size)
+        if digest is not None and memory_key in self._photos:
+            self.stats["memory_hits"] += 1
+            self._photos.move_to_end(memory_key)
+            callback(self._photos[memory_key])
+            return self._photos[memory_key]
+
+        def deliver(result):
+            digest, image = result
+            callback(self._remember(("thumb", digest, max_size), image))
+
+        when_done(
+            widget,
+            get_executor().submit(self.load_thumbnail, path, max_size),
+            deliver,
+            on_error or (lambda e: logger.error(f"Error loading preview {path}: {e}")),
+        )
+        return None
+
+    def _forget_pending(self, key: ImageKey) -> None:
+        with self._lock:
+            self._pending.pop(key, None)
+
+    def clear_memory(self) -> None:
+        """Drop all cached ``PhotoImage`` objects."""
+        self._photos.clear()
+
+
+_default_cache: ImageCache | None = None
+
+
+def get_image_cache() -> ImageCache:
+    """Return the process-wide :class:`ImageCache`."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ImageCache()
+    return _default_cache
@@ -24,6 +24,7 @@ except ImportError:
             self.delete(0, tk.END)
             self.insert(0, date_obj.strftime('%Y-%m-%d'))
 
+from automotive_invoice_manager.backend.database.money import format_cents, invoice_cents, line_item_cents
 from automotive_invoice_manager.ui.theme import COLORS, FONTS
 
 logger = logging.getLogger(__name__)
@@ -39,7 +40,8 @@ class InvoiceFormDialog(tk.Toplevel):
             parent: Parent window
             invoice_service: Service for invoice operations
             user: Current user object
-            customers: List of customer objects
+            customers: List of customer objects (default: names from the
+                service's shared customer index)
             invoice: Invoice to edit (None for new invoice)
         """
         super().__init__(parent)
@@ -49,6 +51,10 @@ class InvoiceFormDialog(tk.Toplevel):
         self.invoice_service = invoice_service
         self.user = user
         self.customers = customers or []
+        if customers:
+            self.customer_names = [c.name for c in customers]
+        else:
+            self.customer_names = invoice_service.customer_index.names(user.id)
         self.invoice = invoice
         self.result = None
         
@@ -123,7 +129,7 @@ class InvoiceFormDialog(tk.Toplevel):
         self.customer_combo = ttk.Combobox(
             header_frame, 
             textvariable=self.customer_var,
-            values=[c.name for c in self.customers],
+            values=self.customer_names,
             state="readonly",
             width=30
         )
@@ -150,7 +156,8 @@ class InvoiceFormDialog(tk.Toplevel):
         status_combo = ttk.Combobox(
             header_frame,
             textvariable=self.status_var,
-            values=["draft", "sent", "paid", "overdue"],
+            # Sent invoices become overdue automatically past their due date
+            values=["draft", "sent", "paid"],
             state="readonly",
             width=15
         )
@@ -304,27 +311,20 @@ class InvoiceFormDialog(tk.Toplevel):
         self.calculate_totals()
 
     def calculate_totals(self, *args):
-        """Calculate line totals and grand total."""
-        grand_total = 0.0
+        """Calculate line totals and grand total in integer cents."""
+        values = []
         
         for item in self.line_items:
+            line = {name: item[name].get() or 0 for name in ('hours', 'rate', 'parts', 'tax')}
             try:
-                hours = float(item['hours'].get() or 0)
-                rate = float(item['rate'].get() or 0)
-                parts = float(item['parts'].get() or 0)
-                tax = float(item['tax'].get() or 0)
-                
-                # Calculate line total: (hours * rate + parts) * (1 + tax/100)
-                subtotal = (hours * rate) + parts
-                line_total = subtotal * (1 + tax / 100)
-                
-                item['total'].set(f"{line_total:.2f}")
-                grand_total += line_total
-                
-            except ValueError:
+                # Line total: (hours * rate + parts) * (1 + tax/100)
+                item['total'].set(format_cents(line_item_cents(line), symbol=""))
+                values.append(line)
+            except (ValueError, ArithmeticError):
                 item['total'].set("0.00")
         
-        self.total_var.set(f"{grand_total:.2f}")
+        # Rounded once over all lines, like the stored invoice total
+        self.total_var.set(format_cents(invoice_cents(values)[0], symbol=""))
 
     def populate_form(self):
         """Populate form with existing invoice data."""
@@ -409,8 +409,10 @@ class InvoiceFormDialog(tk.Toplevel):
                     'tax': float(item['tax'].get() or 0)
                 })
         
+        customer = self.customer_var.get()
         return {
-            'customer': self.customer_var.get(),
+            'customer': customer,
+            'customer_id': self.invoice_service.customer_index.resolve(self.user.id, customer),
             'invoice_number': self.invoice_number_var.get().strip() if self.invoice_number_var.get().strip() else None,
             'issued_date': self.issued_date_entry.get_date(),
             'due_date': self.due_date_entry.get_date(),
@@ -1,8 +1,14 @@
 # automotive_invoice_manager/ui/invoices/invoice_list.py - FIXED VERSION
 
 from tkinter import ttk, messagebox
+import logging
 import tkinter as tk
 
+from automotive_invoice_manager.services.base_service import get_executor
+from automotive_invoice_manager.services.invoice_prefetch import InvoicePrefetcher
+from automotive_invoice_manager.services.invoice_search import InvoiceSearchCache
+
+from ..components.background import when_done
 from ..components.invoice_widgets import (
     InvoiceListFrame as _BaseList,
     InvoiceDetailWindow,
@@ -19,9 +25,21 @@ except ImportError:
     except ImportError:
         INVOICE_FORM_AVAILABLE = False
 
+# Pause after the last keystroke before the list is searched.
+SEARCH_DEBOUNCE_MS = 250
+
 
 class InvoiceListFrame(_BaseList):
-    """Invoice list with search, filters and pagination."""
+    """Invoice list with live search, filters and pagination.
+
+    Typing searches after a short pause.  While the term only grows, matches
+    are narrowed from the previous result in memory (see
+    :class:`InvoiceSearchCache`) and paged locally; other searches run on
+    the worker pool and responses to superseded searches are dropped.
+
+    Neighbouring pages and the selected invoice are prefetched in the
+    background (see :class:`InvoicePrefetcher`).
+    """
 
     def __init__(
         self,
@@ -34,33 +52,70 @@ class InvoiceListFrame(_BaseList):
         self.user = user
         self.customer_service = customer_service
         self.status_callback = status_callback or (lambda _msg: None)
+        self._search_cache = InvoiceSearchCache()
+        self._local_rows = None  # search result paged in memory, if any
+        self._search_job = None
+        self._search_token = 0
+        self._prefetcher = InvoicePrefetcher(invoice_service)
+        self._ids_by_number = {}
         super().__init__(parent, invoice_service)
+        self.search_var.trace_add("write", lambda *_: self._schedule_search())
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.bind("<Destroy>", self._on_destroy)
         # refresh when child dialogs signal updates
         self.bind("<<InvoiceUpdated>>", lambda e: self.load_data())
         self.bind("<<InvoiceDeleted>>", lambda e: self.load_data())
 
-    def load_data(self):
-        search = self.search_var.get()
-        status = (
+    def _status_filter(self):
+        return (
             self.status_var.get().lower()
             if self.status_var.get() and self.status_var.get() != "All"
             else None
         )
-        items, total_pages = self.invoice_service.get_invoices(
-            self.user.id,
-            page=self.current_page,
-            per_page=self.per_page,
-            search=search,
-            status=status,
+
+    def load_data(self):
+        """Reload the current page from the database, dropping cached search results."""
+        self._search_cache.clear()
+        self._prefetcher.cancel()
+        self._local_rows = None
+        self._search_token += 1  # a search still in flight is now stale
+        self._load_page()
+
+    def _load_page(self, use_prefetched=False):
+        if self._local_rows is not None:
+            start = (self.current_page - 1) * self.per_page
+            total_pages = max(1, (len(self._local_rows) + self.per_page - 1) // self.per_page)
+            self._render(self._local_rows[start:start + self.per_page], total_pages)
+            return
+        filters = (self.search_var.get(), self._status_filter(), self.include_archive_var.get())
+        page = None
+        if use_prefetched:
+            page = self._prefetcher.get_page(self.user.id, filters, self.current_page, self.per_page)
+        if page is None:
+            page = self.invoice_service.get_invoice_rows(
+                self.user.id,
+                page=self.current_page,
+                per_page=self.per_page,
+                search=filters[0],
+                status=filters[1],
+                include_archive=filters[2],
+            )
+        items, total_pages = page
+        self._render(items, total_pages)
+        self._prefetcher.prefetch_pages(
+            self.user.id, filters, self.current_page, total_pages, self.per_page
         )
+
+    def _render(self, items, total_pages):
         self.tree.delete(*self.tree.get_children())
+        self._ids_by_number = {inv.invoice_number: inv.id for inv in items}
         for inv in items:
             self.tree.insert(
                 "",
                 tk.END,
                 values=(
                     inv.invoice_number,
-                    inv.customer.name,
+                    inv.customer_name,
                     inv.issued_date,
                     inv.status,
                     f"{inv.total:.2f}",
@@ -75,12 +130,76 @@ class InvoiceListFrame(_BaseList):
             state=(tk.NORMAL if self.current_page < self.total_pages else tk.DISABLED)
         )
 
+    def _schedule_search(self):
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(SEARCH_DEBOUNCE_MS, self.on_filter)
+
+    def on_filter(self):
+        """Search with the current term and filters, from memory when possible."""
+        self._search_job = None
+        self.current_page = 1
+        self._search_token += 1
+        self._prefetcher.cancel()
+        token = self._search_token
+        term = self.search_var.get()
+        filters = (self._status_filter(), self.include_archive_var.get())
+
+        rows = self._search_cache.narrow(term, filters)
+        if rows is not None:
+            self._local_rows = rows
+            self._load_page()
+            return
+
+        def finished(result):
+            if token != self._search_token:
+                return  # superseded by a later keystroke or refresh
+            rows, truncated = result
+            self._search_cache.store(term, filters, rows, truncated)
+            # Too many matches to hold: page them from the database instead.
+            self._local_rows = None if truncated else rows
+            self._load_page()
+
+        when_done(
+            self,
+            get_executor().submit(
+                self.invoice_service.search_invoice_rows, self.user.id, term, filters[0], filters[1]
+            ),
+            finished,
+            lambda e: self.status_callback(f"Search failed: {e}"),
+        )
+
+    def on_prev(self):
+        if self.current_page > 1:
+            self.current_page -= 1
+            self._load_page(use_prefetched=True)
+
+    def on_next(self):
+        if self.current_page < getattr(self, "total_pages", 1):
+            self.current_page += 1
+            self._load_page(use_prefetched=True)
+
+    def _on_select(self, _event=None):
+        for item in self.tree.selection():
+            invoice_id = self._ids_by_number.get(str(self.tree.item(item, "values")[0]))
+            if invoice_id is not None:
+                self._prefetcher.prefetch_detail(invoice_id)
+
+    def _on_destroy(self, event):
+        if event.widget is self:
+            logging.debug(f"Invoice list prefetch hit rates: {self._prefetcher.hit_rate()}")
+            self._prefetcher.cancel()
+
     def handle_open_detail(self, invoice_number):
-        inv = self.invoice_service.get_invoice_by_number(self.user.id, invoice_number)
+        invoice_id = self._ids_by_number.get(str(invoice_number))
+        if invoice_id is None:
+            found = self.invoice_service.get_invoice_by_number(self.user.id, invoice_number)
+            invoice_id = found.id if found else None
+        inv = self._prefetcher.get_detail(invoice_id) if invoice_id is not None else None
         if not inv:
             messagebox.showerror("Error", "Invoice not found")
             return
-        InvoiceDetailWindow(self, self.invoice_service, inv.id)
+        InvoiceDetailWindow(self, self.invoice_service, inv.id, invoice=inv)
 
     def new_invoice(self):
         """Create a new invoice with correct parameters."""
@@ -89,9 +208,7 @@ class InvoiceListFrame(_BaseList):
             return
             
         try:
-            customers = self.customer_service.get_all_customers(self.user.id)
-            
-            if not customers:
+            if not self.invoice_service.customer_index.names(self.user.id):
                 result = messagebox.askyesno(
                     "No Customers", 
                     "You need at least one customer to create an invoice.\n\nWould you like to create a customer first?"
@@ -102,12 +219,11 @@ class InvoiceListFrame(_BaseList):
                         self.main_interface.new_customer()
                 return
             
-            # FIXED: Use correct parameter order: parent, invoice_service, user, customers
+            # Customer names come from the service's shared index
             dialog = InvoiceFormDialog(
                 self, 
                 self.invoice_service, 
-                self.user,
-                customers
+                self.user
             )
             result = dialog.show()
             
@@ -124,15 +240,12 @@ class InvoiceListFrame(_BaseList):
             return
             
         try:
-            customers = self.customer_service.get_all_customers(self.user.id)
-            
             # FIXED: Use correct parameter order: parent, invoice_service, user, customers, invoice
             dialog = InvoiceFormDialog(
                 self, 
                 self.invoice_service, 
                 self.user,
-                customers, 
-                invoice
+                invoice=invoice
             )
             result = dialog.show()
             
@@ -9,12 +9,17 @@ import logging
 
 try:
     from PIL import Image, ImageTk
+    from ..utils.images import inspect_image, validate_image
+    from ..utils.logo_assets import prepare_logo
+    from .image_cache import get_image_cache
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
 
 from .theme import COLORS, FONTS
 from .tooltips import add_tooltip
+from .components.background import when_done
+from ..services.base_service import get_executor
 
 # Add missing color if not defined
 if 'muted' not in COLORS:
@@ -35,6 +40,8 @@ class LogoTab(tk.Frame):
         self.main_interface = main_interface
         self.current_logo_path = None
         self.preview_image = None
+        # Bumped on every reload so late previews for a stale file are dropped
+        self._preview_token = 0
         
         # Define assets directory path and default logo
         self.assets_dir = Path(__file__).parent.parent / "assets"
@@ -396,14 +403,31 @@ class LogoTab(tk.Frame):
                 self.status_label.config(text="Import cancelled", fg=COLORS["muted"])
                 return
             
-            # Validate the selected file
-            if not self.validate_image_file(file_path):
-                return
+            # Validate in the background, then import
+            self.status_label.config(text="⏳ Checking image...", fg=COLORS["text"])
+            self.clear_import_btn.config(state="disabled", text="⏳ IMPORTING...")
+            self.validate_image_file(
+                file_path,
+                lambda info: self._import_logo_file(file_path),
+                self._reset_import_button,
+            )
             
-            # Show import progress
+        except Exception as e:
+            logger.error(f"Error importing logo: {e}")
+            self._reset_import_button()
+            messagebox.showerror("Import Error", f"Failed to import logo: {str(e)}")
+
+    def _reset_import_button(self):
+        """Re-enable the quick import button."""
+        self.clear_import_btn.config(
+            state="normal", 
+            text="📸 IMPORT NEW LOGO\n(Select & Apply Instantly)"
+        )
+
+    def _import_logo_file(self, file_path):
+        """Copy a validated image into the assets directory as the logo."""
+        try:
             self.status_label.config(text="⏳ Importing logo...", fg=COLORS["text"])
-            self.clear_import_btn.config(state="disabled", text="⏳ IMPORTING...")
-            self.update()
             
             # Create backup of current logo if it exists
             if self.logo_path.exists():
@@ -423,6 +447,9 @@ class LogoTab(tk.Frame):
             self.path_label.config(fg=COLORS["muted"])
             self.upload_btn.config(state="disabled")
             
+            # Build the print derivative used by PDFs, off the UI thread
+            self.prepare_print_logo()
+            
             # Reload preview
             self.load_current_logo()
             
@@ -525,6 +552,39 @@ QUICK REFERENCE:
         text_widget.insert(tk.END, instructions_text)
         text_widget.configure(state=tk.DISABLED)  # Make read-only
 
+    def _request_preview(self, logo_path, logo_source, placeholder):
+        """Decode the preview thumbnail on a worker and swap it in when ready."""
+        self._preview_token += 1
+        token = self._preview_token
+
+        def show(photo):
+            if token != self._preview_token or not placeholder.winfo_exists():
+                return
+            self.preview_image = photo
+            placeholder.configure(image=photo, text="")
+
+        def failed(error):
+            if token != self._preview_token or not placeholder.winfo_exists():
+                return
+            logger.error(f"Error loading image: {error}")
+            placeholder.configure(
+                text=f"📷\n\n{logo_source}\n\n{logo_path.name}\n\n(Preview not available)",
+                fg=COLORS["text"],
+            )
+
+        # Max 250x250 for column view
+        get_image_cache().request_thumbnail(placeholder, logo_path, 250, show, failed)
+
+    def prepare_print_logo(self):
+        """Pre-scale the new logo for PDF output in the background."""
+        if not PIL_AVAILABLE or not self.logo_path.exists():
+            return
+        def report(future):
+            if future.exception() is not None:
+                logger.error(f"Error preparing print logo: {future.exception()}")
+
+        get_executor().submit(prepare_logo, self.logo_path).add_done_callback(report)
+
     def load_current_logo(self):
         """Load and display the current logo in left column preview."""
         # Clear any existing preview
@@ -544,54 +604,30 @@ QUICK REFERENCE:
                 logo_source = "Default Logo"
             
             if logo_to_display and PIL_AVAILABLE:
+                file_size = logo_to_display.stat().st_size
+                if file_size > 1024 * 1024:  # > 1MB
+                    size_str = f"{file_size / (1024 * 1024):.1f} MB"
+                else:
+                    size_str = f"{file_size / 1024:.1f} KB"
+                
                 try:
-                    # Load and resize image for preview
-                    img = Image.open(logo_to_display)
-                    
-                    # Calculate preview size (max 250x250 for column view)
-                    max_size = 250
-                    img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
-                    
-                    self.preview_image = ImageTk.PhotoImage(img)
-                    
-                    # Center the logo in the preview frame
-                    logo_label = tk.Label(
-                        self.preview_frame,
-                        image=self.preview_image,
-                        bg=COLORS["section"]
-                    )
-                    logo_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
-                    
-                    # Show original dimensions
-                    original_img = Image.open(logo_to_display)
-                    dimensions = f"{original_img.width}x{original_img.height}"
-                    file_size = logo_to_display.stat().st_size
-                    if file_size > 1024 * 1024:  # > 1MB
-                        size_str = f"{file_size / (1024 * 1024):.1f} MB"
-                    else:
-                        size_str = f"{file_size / 1024:.1f} KB"
-                    
+                    # Header only - no pixel data is decoded here
+                    dimensions = inspect_image(logo_to_display).dimensions
                     info_text = f"{logo_source}\n{logo_to_display.name}\n{dimensions} | {size_str}"
-
                 except Exception as e:
-                    logger.error(f"Error loading image: {e}")
-                    fallback_label = tk.Label(
-                        self.preview_frame,
-                        text=f"📷\n\n{logo_source}\n\n{logo_to_display.name}\n\n(Preview not available)",
-                        font=('Arial', 10),
-                        fg=COLORS["text"],
-                        bg=COLORS["section"],
-                        justify=tk.CENTER
-                    )
-                    fallback_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
-                    
-                    file_size = logo_to_display.stat().st_size
-                    if file_size > 1024 * 1024:  # > 1MB
-                        size_str = f"{file_size / (1024 * 1024):.1f} MB"
-                    else:
-                        size_str = f"{file_size / 1024:.1f} KB"
-                    
+                    logger.error(f"Error reading image header: {e}")
                     info_text = f"{logo_source}\n{logo_to_display.name}\n{size_str}"
+                
+                loading_label = tk.Label(
+                    self.preview_frame,
+                    text="⏳\n\nLoading preview...",
+                    font=('Arial', 10),
+                    fg=COLORS["muted"],
+                    bg=COLORS["section"],
+                    justify=tk.CENTER
+                )
+                loading_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
+                self._request_preview(logo_to_display, logo_source, loading_label)
 
             else:
                 # No logo file exists anywhere
@@ -669,7 +705,7 @@ QUICK REFERENCE:
                 self.selected_file_path = file_path
                 self.file_path_var.set(os.path.basename(file_path))
                 self.path_label.config(fg=COLORS["text"])
-                self.upload_btn.config(state="normal")
+                self.upload_btn.config(state="disabled")
                 
                 # Show file info
                 file_size = os.path.getsize(file_path)
@@ -683,14 +719,18 @@ QUICK REFERENCE:
                     fg=COLORS["text"]
                 )
                 
-                # Quick validation
-                if self.validate_image_file(file_path):
+                # Quick validation (runs in the background)
+                def ready(info):
+                    if self.selected_file_path != file_path:
+                        return
+                    details = f"{size_str}, {info.dimensions}" if info else size_str
                     self.status_label.config(
-                        text=f"✅ Ready to upload: {os.path.basename(file_path)} ({size_str})",
+                        text=f"✅ Ready to upload: {os.path.basename(file_path)} ({details})",
                         fg=COLORS["text"]
                     )
-                else:
-                    self.upload_btn.config(state="disabled")
+                    self.upload_btn.config(state="normal")
+                
+                self.validate_image_file(file_path, ready)
             else:
                 self.status_label.config(text="No file selected", fg=COLORS["muted"])
                 
@@ -704,13 +744,20 @@ QUICK REFERENCE:
             messagebox.showerror("No File Selected", "Please browse and select an image file first.")
             return
         
+        # Validate file again (in the background) before replacing the logo
+        file_path = self.selected_file_path
+        self.status_label.config(text="⏳ Checking image...", fg=COLORS["text"])
+        self.upload_btn.config(state="disabled")
+        self.validate_image_file(
+            file_path,
+            lambda info: self._apply_selected_logo(file_path),
+            lambda: self.upload_btn.config(state="normal"),
+        )
+
+    def _apply_selected_logo(self, file_path):
+        """Copy the validated selected file into the assets directory."""
         try:
             self.status_label.config(text="⏳ Uploading logo...", fg=COLORS["text"])
-            self.update()
-            
-            # Validate file again
-            if not self.validate_image_file(self.selected_file_path):
-                return
             
             # Create backup of current logo if it exists
             if self.logo_path.exists():
@@ -722,7 +769,7 @@ QUICK REFERENCE:
             self.assets_dir.mkdir(exist_ok=True)
             
             # Copy new logo to assets directory
-            shutil.copy2(self.selected_file_path, self.logo_path)
+            shutil.copy2(file_path, self.logo_path)
             
             # Clear selection
             self.selected_file_path = None
@@ -730,6 +777,9 @@ QUICK REFERENCE:
             self.path_label.config(fg=COLORS["muted"])
             self.upload_btn.config(state="disabled")
             
+            # Build the print derivative used by PDFs, off the UI thread
+            self.prepare_print_logo()
+            
             # Reload preview
             self.load_current_logo()
             
@@ -777,41 +827,52 @@ QUICK REFERENCE:
             logger.error(f"Error resetting logo: {e}")
             self.status_label.config(text=f"❌ Error resetting logo: {e}", fg=COLORS["danger"])
 
-    def validate_image_file(self, file_path):
-        """Validate the selected image file."""
+    def validate_image_file(self, file_path, on_valid, on_invalid=None):
+        """Validate the selected image file without blocking the UI.
+
+        The image is verified on a worker thread; ``on_valid(info)`` then runs
+        on the UI thread (``info`` is ``None`` without PIL).  On failure an
+        error is shown and ``on_invalid()`` is called.
+        """
+        def reject(title, message):
+            messagebox.showerror(title, message)
+            if on_invalid:
+                on_invalid()
+
         try:
             if not os.path.exists(file_path):
-                messagebox.showerror("File Error", "Selected file does not exist.")
-                return False
+                reject("File Error", "Selected file does not exist.")
+                return
             
             # Check file size (10MB limit)
             file_size = os.path.getsize(file_path)
             if file_size > 10 * 1024 * 1024:  # 10MB
-                messagebox.showerror("File Too Large", "File size must be less than 10MB.\n\nPlease select a smaller image.")
-                return False
+                reject("File Too Large", "File size must be less than 10MB.\n\nPlease select a smaller image.")
+                return
             
-            # Check if it's a valid image using PIL
-            if PIL_AVAILABLE:
-                try:
-                    with Image.open(file_path) as img:
-                        img.verify()  # Verify it's a valid image
-                    return True
-                except Exception as e:
-                    messagebox.showerror("Invalid Image", f"Selected file is not a valid image:\n{str(e)}")
-                    return False
-            else:
+            if not PIL_AVAILABLE:
                 # Basic extension check if PIL not available
                 valid_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.bmp'}
                 file_ext = Path(file_path).suffix.lower()
                 if file_ext not in valid_extensions:
-                    messagebox.showerror("Invalid File", "Please select a valid image file (PNG, JPG, GIF, BMP).")
-                    return False
-                return True
+                    reject("Invalid File", "Please select a valid image file (PNG, JPG, GIF, BMP).")
+                    return
+                on_valid(None)
+                return
+            
+            def failed(error):
+                if isinstance(error, ValueError):
+                    reject("Invalid Image", str(error))
+                else:
+                    logger.error(f"Error validating image: {error}")
+                    reject("Validation Error", f"Error validating image file:\n{str(error)}")
+            
+            # Check if it's a valid image using PIL
+            when_done(self, get_executor().submit(validate_image, file_path), on_valid, failed)
                 
         except Exception as e:
             logger.error(f"Error validating image: {e}")
-            messagebox.showerror("Validation Error", f"Error validating image file:\n{str(e)}")
-            return False
+            reject("Validation Error", f"Error validating image file:\n{str(e)}")
 
     def upload_logo(self):
         """Legacy method - now redirects to clear import."""
@@ -163,6 +163,7 @@ class TabbedMainInterface:
             from automotive_invoice_manager.ui.dashboard_view import DashboardView
             from automotive_invoice_manager.ui.customer_tab import CustomerTab  
             from automotive_invoice_manager.ui.invoice_tab import InvoiceTab
+            from automotive_invoice_manager.ui.reports_tab import ReportsTab
             from automotive_invoice_manager.ui.logo_tab import LogoTab
             from automotive_invoice_manager.ui.help_tab import HelpTab
 
@@ -197,7 +198,14 @@ class TabbedMainInterface:
                 self.create_fallback_tab("invoices", "📄 Invoices")
 
             # Create reports tab
-            self.create_reports_tab()
+            try:
+                self.reports_tab = ReportsTab(self.notebook, self)
+                self.notebook.add(self.reports_tab, text="📊 Reports")
+                self.tabs["reports"] = self.reports_tab
+                print("Reports tab created successfully")
+            except Exception as e:
+                logger.error(f"Error creating reports tab: {e}")
+                self.create_reports_tab()
             
             # NEW: Create logo tab
             try:
@@ -273,7 +281,7 @@ class TabbedMainInterface:
         ).pack(expand=True)
         
     def create_reports_tab(self):
-        """Create reports tab."""
+        """Create the placeholder reports tab used when ReportsTab fails to load."""
         reports_frame = tk.Frame(self.notebook, bg=COLORS['background'])
         self.notebook.add(reports_frame, text="📊 Reports")
         self.tabs['reports'] = reports_frame
@@ -318,6 +326,9 @@ class TabbedMainInterface:
                 self.refresh_customers()
             elif self.current_tab == "dashboard":
                 self.load_dashboard_data()
+            elif self.current_tab.endswith("reports") and hasattr(self.tabs.get("reports"), "load_data"):
+                # Cheap while no invoice changed: the report is cached
+                self.tabs["reports"].load_data()
         except Exception as e:
             logger.error(f"Error in tab change: {e}")
             self.status_var.set("Error switching tabs")
@@ -359,10 +370,8 @@ class TabbedMainInterface:
     def new_invoice(self):
         """Create a new invoice using the fixed invoice form dialog."""
         try:
-            # Get customers first
-            customers = self.customer_service.get_all_customers(self.user.id)
-            
-            if not customers:
+            # Customer names come from the invoice service's shared index
+            if not self.invoice_service.customer_index.names(self.user.id):
                 result = messagebox.askyesno(
                     "No Customers", 
                     "You need at least one customer to create an invoice.\n\nWould you like to create a customer first?"
@@ -374,12 +383,11 @@ class TabbedMainInterface:
             # Import the correct invoice form
             from automotive_invoice_manager.ui.invoices.invoice_form import InvoiceFormDialog
             
-            # Create dialog with correct parameters: parent, invoice_service, user, customers
+            # Create dialog with correct parameters: parent, invoice_service, user
             dialog = InvoiceFormDialog(
                 self.root,
                 self.invoice_service,
-                self.user,
-                customers
+                self.user
             )
             
             result = dialog.show()
@@ -0,0 +1,162 @@
+import tkinter as tk
+from tkinter import ttk
+import logging
+from datetime import date
+
+from automotive_invoice_manager.services.aging import BUCKET_LABELS
+from automotive_invoice_manager.services.base_service import get_executor
+
+from .components.background import when_done
+from .components.table_helpers import create_table_with_scrollbars
+from .theme import COLORS, FONTS
+
+logger = logging.getLogger(__name__)
+
+# Treeview id of the summary line under the customers
+TOTALS_IID = "totals"
+
+# Months shown in the revenue trend, the current one included
+TREND_MONTHS = 12
+
+
+def _money(amount) -> str:
+    return f"${amount:,.2f}" if amount else "-"
+
+
+def _months_back(today: date, months: int) -> date:
+    """First day of the month ``months`` before ``today``'s."""
+    index = today.year * 12 + today.month - 1 - months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+class ReportsTab(tk.Frame):
+    """Tab with the revenue breakdown and trend, payment statistics and the aging report."""
+
+    def __init__(self, parent, main_interface):
+        super().__init__(parent, bg=COLORS["background"])
+        self.main_interface = main_interface
+        self.user = main_interface.user
+        self.invoice_service = main_interface.invoice_service
+        self.as_of_var = tk.StringVar()
+        self.breakdown_var = tk.StringVar()
+        self.analytics_var = tk.StringVar()
+        self.setup_ui()
+        self.load_data()
+
+    def setup_ui(self) -> None:
+        header = tk.Frame(self, bg=COLORS["background"])
+        header.pack(fill=tk.X, padx=20, pady=(20, 10))
+
+        tk.Label(
+            header,
+            text="Accounts Receivable Aging",
+            font=FONTS["lg"],
+            fg=COLORS["text"],
+            bg=COLORS["background"],
+        ).pack(side=tk.LEFT)
+
+        ttk.Button(header, text="Refresh", command=self.load_data).pack(side=tk.RIGHT)
+        tk.Label(
+            header,
+            textvariable=self.as_of_var,
+            font=FONTS["base"],
+            fg=COLORS["text"],
+            bg=COLORS["background"],
+        ).pack(side=tk.RIGHT, padx=10)
+
+        tk.Label(
+            self,
+            textvariable=self.breakdown_var,
+            font=FONTS["base"],
+            fg=COLORS["text"],
+            bg=COLORS["background"],
+        ).pack(anchor=tk.W, padx=20, pady=(0, 5))
+        tk.Label(
+            self,
+            textvariable=self.analytics_var,
+            font=FONTS["base"],
+            fg=COLORS["text"],
+            bg=COLORS["background"],
+        ).pack(anchor=tk.W, padx=20, pady=(0, 10))
+
+        trend_frame = ttk.Frame(self)
+        trend_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=(0, 20), pady=(0, 20))
+        self.trend_tree = create_table_with_scrollbars(
+            trend_frame,
+            columns=("month", "invoices", "revenue"),
+            column_configs={
+                "month": ("Month", 90, tk.W),
+                "invoices": ("Paid", 60, tk.CENTER),
+                "revenue": ("Revenue", 110, tk.E),
+            },
+            selectmode="browse",
+        )
+
+        table_frame = ttk.Frame(self)
+        table_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
+
+        columns = ("customer", "invoices") + BUCKET_LABELS + ("total",)
+        column_configs = {
+            "customer": ("Customer", 220, tk.W),
+            "invoices": ("Open Invoices", 100, tk.CENTER),
+            **{label: (f"{label} days", 110, tk.E) for label in BUCKET_LABELS},
+            "total": ("Total Due", 120, tk.E),
+        }
+        self.tree = create_table_with_scrollbars(
+            table_frame,
+            columns=columns,
+            column_configs=column_configs,
+            selectmode="browse",
+        )
+
+    def load_data(self) -> None:
+        """Fetch the breakdown, analytics and (possibly cached) aging report on the worker pool."""
+        self.main_interface.status_var.set("Loading reports...")
+        when_done(self, get_executor().submit(self._gather), self._render, self._on_error)
+
+    def _gather(self):
+        today = date.today()
+        breakdown = self.invoice_service.get_revenue_breakdown(self.user.id, start=today.replace(month=1, day=1))
+        facts = self.invoice_service.get_invoice_facts(self.user.id)
+        analytics = (
+            facts.revenue_trend(start=_months_back(today, TREND_MONTHS - 1)),
+            facts.days_to_pay(),
+            facts.labor_rates(),
+        )
+        return breakdown, analytics, self.invoice_service.get_aging_report(self.user.id, today)
+
+    def _render(self, result) -> None:
+        breakdown, (trend, days_to_pay, labor_rates), report = result
+        self.breakdown_var.set(
+            f"Paid this year:  Labor {_money(breakdown['labor'])}   Parts {_money(breakdown['parts'])}"
+            f"   Tax collected {_money(breakdown['tax'])}   Total {_money(breakdown['total'])}"
+        )
+        self.analytics_var.set(self._analytics_text(days_to_pay, labor_rates))
+        for item in self.trend_tree.get_children():
+            self.trend_tree.delete(item)
+        for month, count, revenue in reversed(trend):
+            self.trend_tree.insert("", tk.END, values=(f"{month:%Y-%m}", count, _money(revenue)))
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+        for row in report.rows:
+            self.tree.insert("", tk.END, iid=str(row.customer_id), values=self._values(row))
+        self.tree.insert("", tk.END, iid=TOTALS_IID, values=self._values(report.totals))
+        self.as_of_var.set(f"As of {report.as_of:%Y-%m-%d}")
+        self.main_interface.status_var.set(f"Aging report: {len(report.rows)} customer(s) with open balances")
+
+    @staticmethod
+    def _analytics_text(days_to_pay, labor_rates) -> str:
+        if days_to_pay.count:
+            paid = f"Days to pay: {days_to_pay.mean:.1f} avg, {days_to_pay.percentiles[50]:.0f} median"
+        else:
+            paid = "Days to pay: -"
+        rates = "   ".join(f"p{pct} {_money(rate)}" for pct, rate in labor_rates.percentiles.items())
+        return f"{paid}      Labor rate:  {rates or '-'}"
+
+    @staticmethod
+    def _values(row) -> tuple:
+        return (row.customer_name, row.invoice_count, *map(_money, row.buckets), _money(row.total))
+
+    def _on_error(self, error) -> None:
+        logger.error(f"Error loading reports: {error}")
+        self.main_interface.status_var.set("Error loading reports")
@@ -6,3 +6,7 @@ class Config:
     DATABASE_URL = os.environ.get("DATABASE_URL", "sqlite:///invoices.db")
     WINDOW_SIZE = os.environ.get("WINDOW_SIZE", "1200x800")
     PDF_OUTPUT_DIR = os.environ.get("PDF_OUTPUT_DIR", "generated_pdfs")
+    IMAGE_CACHE_DIR = os.environ.get(
+        "IMAGE_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "automotive_invoice_manager", "images"),
+    )
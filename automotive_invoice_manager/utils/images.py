@@ -0,0 +1,65 @@
+"""Lightweight image inspection helpers (Pillow)."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from dataclasses import dataclass
+
+from PIL import Image
+
+# Largest logo file accepted for upload.
+MAX_IMAGE_BYTES = 10 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ImageInfo:
+    """Basic facts about an image file, read from its header."""
+
+    width: int
+    height: int
+    format: str | None
+    mode: str
+    file_size: int
+
+    @property
+    def dimensions(self) -> str:
+        return f"{self.width}x{self.height}"
+
+
+def inspect_image(path) -> ImageInfo:
+    """Return dimensions and format without decoding any pixel data."""
+    with Image.open(path) as img:
+        return ImageInfo(img.width, img.height, img.format, img.mode, os.path.getsize(path))
+
+
+def validate_image(path, max_bytes: int = MAX_IMAGE_BYTES) -> ImageInfo:
+    """Check that ``path`` is a readable image no larger than ``max_bytes``.
+
+    Raises ``ValueError`` with a user-facing message on failure.  The file is
+    structurally verified but its pixels are never decoded, so this is cheap
+    even for large photos (and safe to run on a worker thread).
+    """
+    if not os.path.exists(path):
+        raise ValueError("Selected file does not exist.")
+    if os.path.getsize(path) > max_bytes:
+        raise ValueError(
+            f"File size must be less than {max_bytes // (1024 * 1024)}MB.\n\n"
+            "Please select a smaller image."
+        )
+    try:
+        info = inspect_image(path)
+        with Image.open(path) as img:
+            img.verify()
+    except Exception as e:
+        raise ValueError(f"Selected file is not a valid image:\n{e}") from e
+    return info
+
+
+def file_digest(path, chunk_size: int = 1 << 20) -> str:
+    """Return the SHA-1 hex digest of a file's contents."""
+    digest = hashlib.sha1()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
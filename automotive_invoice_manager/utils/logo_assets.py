@@ -0,0 +1,112 @@
+"""Print-ready logo derivative shared by both PDF renderers.
+
+The uploaded ``assets/logo.png`` can be a multi-megabyte photo.  Instead of
+decoding and embedding it in every PDF, :func:`prepare_logo` runs once (at
+upload time) and writes a copy scaled to the invoice header box at print
+resolution and reduced to a 256-colour palette.  PDF code asks
+:func:`get_logo_asset` for that derivative, which only reads headers.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from PIL import Image
+
+from .config import Config
+from .images import file_digest
+
+logger = logging.getLogger(__name__)
+
+LOGO_PATH = Path(__file__).resolve().parent.parent / "assets" / "logo.png"
+
+# Logo box in the invoice header, in inches, and the resolution it is kept at.
+PRINT_BOX_IN = (2.0, 1.0)
+PRINT_DPI = 300
+
+_lock = threading.Lock()
+_assets: dict[tuple, "LogoAsset"] = {}
+
+
+@dataclass(frozen=True)
+class LogoAsset:
+    """A logo image file plus the size it should be drawn at."""
+
+    path: str
+    width_px: int
+    height_px: int
+    dpi: int = PRINT_DPI
+
+    @property
+    def width_pt(self) -> float:
+        return self.width_px * 72 / self.dpi
+
+    @property
+    def height_pt(self) -> float:
+        return self.height_px * 72 / self.dpi
+
+    @property
+    def uri(self) -> str:
+        return Path(self.path).as_uri()
+
+
+def _cache_dir() -> Path:
+    return Path(Config.IMAGE_CACHE_DIR) / "print"
+
+
+def prepare_logo(source=LOGO_PATH, cache_dir=None, dpi: int = PRINT_DPI) -> LogoAsset:
+    """Write (or reuse) the print derivative of ``source`` and describe it."""
+    cache_dir = Path(cache_dir or _cache_dir())
+    box = (round(PRINT_BOX_IN[0] * dpi), round(PRINT_BOX_IN[1] * dpi))
+    target = cache_dir / f"logo_{file_digest(source)[:16]}_{dpi}.png"
+    if target.exists():
+        with Image.open(target) as done:
+            return LogoAsset(str(target), done.width, done.height, dpi)
+
+    with Image.open(source) as img:
+        img.draft("RGB", box)
+        image = img.convert("RGBA") if img.mode not in ("RGB", "RGBA") else img.copy()
+    image.thumbnail(box, Image.Resampling.LANCZOS)
+
+    if image.mode == "RGBA" and image.getextrema()[3][0] == 255:
+        image = image.convert("RGB")  # fully opaque: drop the alpha channel
+    method = Image.Quantize.FASTOCTREE if image.mode == "RGBA" else Image.Quantize.MEDIANCUT
+    image = image.quantize(colors=256, method=method)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    with os.fdopen(fd, "wb") as handle:
+        image.save(handle, format="PNG", optimize=True, dpi=(dpi, dpi))
+    os.replace(tmp, target)
+    logger.info(f"Prepared print logo {target} ({image.width}x{image.height})")
+    return LogoAsset(str(target), image.width, image.height, dpi)
+
+
+def get_logo_asset(source=LOGO_PATH, cache_dir=None) -> LogoAsset | None:
+    """Return the print derivative for ``source``, or None if there is no logo.
+
+    The result is memoized per source mtime/size, so a batch of PDFs resolves
+    the logo once; the derivative is built here only if the upload-time step
+    did not run (e.g. a logo copied in by hand).
+    """
+    try:
+        stat = os.stat(source)
+    except OSError:
+        return None
+    key = (str(Path(source).resolve()), stat.st_mtime_ns, stat.st_size, str(cache_dir))
+    with _lock:
+        asset = _assets.get(key)
+        if asset is not None and os.path.exists(asset.path):
+            return asset
+        try:
+            asset = prepare_logo(source, cache_dir)
+        except Exception as e:
+            logger.error(f"Error preparing logo for PDF: {e}")
+            return None
+        _assets[key] = asset
+        return asset
@@ -7,11 +7,15 @@ import uuid
 import jinja2
 import weasyprint
 from .config import Config
+from .logo_assets import get_logo_asset
 
 TEMPLATE_DIR = os.path.join(
     os.path.dirname(os.path.dirname(__file__)), "templates", "pdf"
 )
 
+# Decoded images shared across renders, so a batch loads the logo once.
+_IMAGE_CACHE: dict = {}
+
 
 def render_invoice_html(invoice: "Invoice", template_name: str = "standard") -> str:
     """Render invoice HTML from Jinja2 template."""
@@ -21,7 +25,7 @@ def render_invoice_html(invoice: "Invoice", template_name: str = "standard") ->
     except jinja2.TemplateNotFound as exc:
         raise FileNotFoundError(f"Template '{template_name}' not found") from exc
     user = getattr(invoice.customer, "user", None)
-    return template.render(invoice=invoice, user=user)
+    return template.render(invoice=invoice, user=user, logo=get_logo_asset())
 
 
 def generate_pdf(
@@ -39,7 +43,7 @@ def generate_pdf(
         str: Path to the generated PDF file.
     """
     html = render_invoice_html(invoice, template_name)
-    pdf_bytes = weasyprint.HTML(string=html, base_url=TEMPLATE_DIR).write_pdf()
+    pdf_bytes = weasyprint.HTML(string=html, base_url=TEMPLATE_DIR).write_pdf(cache=_IMAGE_CACHE)
 
     base_dir = os.path.abspath(Config.PDF_OUTPUT_DIR)
     os.makedirs(base_dir, exist_ok=True)